@@ -26,6 +26,7 @@ sys.path.insert(0, os.path.abspath('../../project/taq_responses_trade_shift/taq_
 sys.path.insert(0, os.path.abspath('../../project/taq_statistics/taq_algorithms/'))
 sys.path.insert(0, os.path.abspath('../../project/taq_avg_spread/taq_algorithms/'))
 sys.path.insert(0, os.path.abspath('../../project/taq_avg_responses_physical/taq_algorithms/'))
+sys.path.insert(0, os.path.abspath('../../project/taq_pipeline/taq_algorithms/'))
 
 # -- Project information -----------------------------------------------------
 
@@ -3,13 +3,19 @@
 The functions in the module analyze the data from the NASDAQ stock market,
 computing the self- and cross-response functions.
 
+The responses are accumulated in fixed size histograms of trades per minute
+bins and time lags. The histograms of different days are merged adding them,
+so the memory used does not depend on the number of days analyzed.
+
 This script requires the following modules:
+    * multiprocessing
     * numpy
-    * pandas
-    * traceback
+    * pickle
     * taq_data_tools_responses_event_trades_minute
 
 The module contains the following functions:
+    * taq_trades_minute_histogram_responses_event_trades_minute_data - computes
+      the histogram of the responses in the trades per minute bins.
     * taq_self_response_day_responses_event_trades_minute_data - computes the
       self response of a day.
     * taq_self_response_year_responses_event_trades_minute_data - computes the
@@ -29,33 +35,99 @@ The module contains the following functions:
 # ----------------------------------------------------------------------------
 # Modules
 
+from itertools import product as iprod
+import multiprocessing as mp
 import numpy as np
-import os
-import pandas as pd
 import pickle
-import traceback
 
 import taq_data_tools_responses_event_trades_minute
 
 __tau__ = 1000
+# Trades per minute bins. The values from 1 to 10 are single bins and the
+# other values are the upper limit of the bin (i.e. 20 is the bin (10, 20])
+__bins__ = np.concatenate((np.arange(1, 11), np.arange(20, 101, 10),
+                           np.arange(200, 1001, 100),
+                           np.arange(2000, 10001, 1000)))
+
+# ----------------------------------------------------------------------------
+
+
+def taq_trades_minute_histogram_responses_event_trades_minute_data(
+        time_t, midpoint, trade_sign, taus):
+    """Computes the histogram of the responses in the trades per minute bins.
+
+    For every :math:`\\tau` the products of the midpoint price return and the
+    trade sign are accumulated in the bin of the trades per minute of their
+    minute. Only the sum, the number of products and the sum of squares of
+    every bin are kept.
+
+    :param time_t: numpy array with the time of every trade.
+    :param midpoint: numpy array with the midpoint price of every trade.
+    :param trade_sign: numpy array with the trade signs.
+    :param taus: list of integers greater than zero (i.e. [1, 10, 50]).
+    :return: numpy array -- The function returns an array with shape
+     (3, len(__bins__), len(taus)) with the sum, the number of products and
+     the sum of squares of every bin and tau.
+    """
+
+    histogram = np.zeros((3, len(__bins__), len(taus)))
+
+    for tau_idx, tau in enumerate(taus):
+
+        # Obtain the midpoint price return. Displace the numerator tau
+        # values to the right and compute the return
+        # Midpoint price returns
+        log_return_sec = (midpoint[tau + 1:]
+                          - midpoint[:-tau - 1]) \
+            / midpoint[:-tau - 1]
+
+        trade_sign_tau = trade_sign[:-tau - 1]
+        time_tau = time_t[:-tau - 1]
+        assert len(trade_sign_tau) == len(log_return_sec)
+
+        # Minutes during the open market considering opening at 9:40 and
+        # closing at 15:50. The first minute is not used
+        minute = (time_tau - 34800) // 60 + 1
+        condition = (minute >= 1) * (minute < 370)
+        minute = minute[condition].astype(int)
+        product = (log_return_sec * trade_sign_tau)[condition]
+
+        # Number of values in the minute of every product
+        trades_minute = np.bincount(minute, minlength=370)[minute]
+
+        # Bin of every product. The products out of the bins are not used
+        bin_idx = np.searchsorted(__bins__, trades_minute)
+        condition = bin_idx < len(__bins__)
+        bin_idx = bin_idx[condition]
+        product = product[condition]
+
+        histogram[0, :, tau_idx] = np.bincount(bin_idx, weights=product,
+                                               minlength=len(__bins__))
+        histogram[1, :, tau_idx] = np.bincount(bin_idx,
+                                               minlength=len(__bins__))
+        histogram[2, :, tau_idx] = np.bincount(bin_idx, weights=product ** 2,
+                                               minlength=len(__bins__))
+
+    return histogram
 
 # ----------------------------------------------------------------------------
 
 
 def taq_self_response_day_responses_event_trades_minute_data(ticker, date,
-                                                             tau):
+                                                            taus):
     """Computes the self response of a day.
 
     Using the midpoint price and trade signs of a ticker computes the self-
-    response during different trades per minute for a day. There is a constant
-    :math:`\\tau` that must be set in the parameters.
+    response during different trades per minute for a day. The responses
+    are computed for every :math:`\\tau` in the parameters.
 
     :param ticker: string of the abbreviation of the stock to be analized
      (i.e. 'AAPL').
     :param date: string with the date of the data to be extracted
      (i.e. '2008-01-02').
-    :param tau: integer great than zero (i.e. 10).
-    :return: tuple -- The function returns a tuple with positions.
+    :param taus: list of integers greater than zero (i.e. [1, 10, 50]).
+    :return: numpy array -- The function returns the histogram of the
+     responses.
     """
 
     date_sep = date.split('-')
@@ -92,78 +164,40 @@ def taq_self_response_day_responses_event_trades_minute_data(ticker, date,
         assert not np.sum(midpoint_i == 0)
         assert len(midpoint_i) == len(time_m)
 
-        # Array of the average of each tau. 10^3 s used by Wang
-        # List to save the tuples with the response and rates.
-        points = []
-
-        # Minutes during the open market considering opening at 9:40 and
-        # closing at 15:50
-        time_minutes = np.array(range(370))
-
-        # Calculating the midpoint price return and the self response function
+        # Midpoint price of the second of every trade
+        condition = (time_t >= time_m[0]) * (time_t <= time_m[-1])
         midpoint_t = 0. * trade_sign_i
-
-        # Filling with midpoint price values
-        for t_idx, t_val in enumerate(time_m):
-            condition = time_t == t_val
-            len_c = np.sum(condition)
-            midpoint_t[condition] = midpoint_i[t_idx] * np.ones(len_c)
+        midpoint_t[condition] = \
+            midpoint_i[time_t[condition].astype(int) - time_m[0]]
 
         assert not np.sum(midpoint_t == 0)
 
-        # Obtain the midpoint price return. Displace the numerator tau
-        # values to the right and compute the return
-        # Midpoint price returns
-        log_return_sec = (midpoint_t[tau + 1:]
-                          - midpoint_t[:-tau - 1]) \
-            / midpoint_t[:-tau - 1]
-
-        trade_sign_tau_ = trade_sign_i[:-tau - 1]
-        time_t = time_t[:- tau - 1]
-        assert len(trade_sign_tau_) == len(log_return_sec)
-
-        # Depending on the trades per minute value
-        for t_idx, t_val in enumerate(time_minutes):
-
-            if (t_idx):
-                # Select the values in each minute
-                condition = (time_t < 34800 + time_minutes[t_idx] * 60) \
-                 * (time_t >= 34800 + time_minutes[t_idx - 1] * 60)
-                trade_sign_tau = trade_sign_tau_[condition]
-                log_return = log_return_sec[condition]
-                trades_minute = np.sum(condition)
-
-                # Obtain the self response value
-                product = log_return * trade_sign_tau
-                points.extend([(trades_minute, i) for i in product])
-
-            else:
-                pass
-
-        return points
+        return taq_trades_minute_histogram_responses_event_trades_minute_data(
+            time_t, midpoint_t, trade_sign_i, taus)
 
     except FileNotFoundError as e:
         print('No data')
         print(e)
         print()
-        return None
+        return np.zeros((3, len(__bins__), len(taus)))
 
 # ----------------------------------------------------------------------------
 
 
 def taq_self_response_year_responses_event_trades_minute_data(ticker, year,
-                                                              tau):
+                                                             taus):
     """Computes the self response of a year.
 
     Using the taq_self_response_day_responses_event_trades_minute_data function
-    computes the self-response function for a year.
+    computes the self-response function for a year. The histograms of the
+    days are added as they are computed.
 
     :param ticker: string of the abbreviation of stock to be analized
      (i.e. 'AAPL').
     :param year: string of the year to be analized (i.e '2016').
-    :param tau: integer great than zero (i.e. 50).
-    :return: None – The function saves the data in a file and does not return
-     a value.
+    :param taus: list of integers greater than zero (i.e. [1, 10, 50]).
+    :return: numpy array -- The function returns the histogram of the
+     responses.
     """
 
     function_name = \
@@ -175,40 +209,38 @@ def taq_self_response_year_responses_event_trades_minute_data(ticker, year,
     dates = taq_data_tools_responses_event_trades_minute \
         .taq_bussiness_days(year)
 
-    points = []
+    histogram = np.zeros((3, len(__bins__), len(taus)))
 
-    for date in dates:
-
-        try:
-            points.extend(
-                taq_self_response_day_responses_event_trades_minute_data(
-                          ticker, date, tau))
-
-        except TypeError:
-            pass
+    # Parallel computation of the histograms of every day
+    with mp.Pool(processes=mp.cpu_count()) as pool:
+        for histogram_day in pool.starmap(
+                taq_self_response_day_responses_event_trades_minute_data,
+                iprod([ticker], dates, [taus])):
+            histogram += histogram_day
 
     # Saving data
     taq_data_tools_responses_event_trades_minute \
-        .taq_save_data('{}_tau_{}'.format(function_name, tau), points, ticker,
-                       ticker, year, '', '')
+        .taq_save_data(function_name, (list(taus), __bins__, histogram),
+                       ticker, ticker, year, '', '')
 
-    return None
+    return histogram
 
 # ----------------------------------------------------------------------------
 
 
 def taq_self_response_year_avg_responses_event_trades_minute_data(ticker, year,
-                                                                  tau):
+                                                                 tau):
     """Computes the average self response of a year.
 
-    Using the taq_self_response_day_responses_event_trades_minute_data function
+    Using the histogram of the
+    taq_self_response_year_responses_event_trades_minute_data function
     computes the average self-response function for a year.
 
     :param ticker: string of the abbreviation of stock to be analized
      (i.e. 'AAPL').
     :param year: string of the year to be analized (i.e '2016').
     :param tau: integer great than zero (i.e. 50).
-    :return: tuple -- The function returns a tuple with numpy arrays.
+    :return: tuple -- The function returns a tuple with lists.
     """
 
     function_name = \
@@ -218,67 +250,21 @@ def taq_self_response_year_avg_responses_event_trades_minute_data(ticker, year,
         .taq_function_header_print_data(function_name, ticker, ticker, year,
                                         '', '')
 
-    try:
-        # Load data
-        responses = pickle.load(open(''.join((
-                '../../taq_data/responses_event_trades_minute_data_{1}/taq'
-                + '_self_response_year_responses_event_trades_minute_data'
-                + '_tau_{2}/taq_self_response_year_responses_event_trades'
-                + '_minute_data_tau_{2}_{1}_{0}.pickle').split())
-                .format(ticker, year, tau), 'rb'))
-
-        responses.sort(key=lambda tup: tup[0])
-        res_list = [list(i) for i in zip(*responses)]
-        rate = np.asarray(res_list[0])
-        res = np.asarray(res_list[1])
-
-        res_avg = []
-        time = []
-        avg_num = len(res)
-
-        for i in range(1, 11):
-            condition = rate == i
-            if (np.sum(condition)):
-                res_avg.append(np.sum(res[condition]) / avg_num)
-                time.append(i)
-
-        inter1 = list(range(10, 101, 10))
-        for i, v in enumerate(inter1):
-            if (v == 10):
-                pass
-            else:
-                condition = (rate <= inter1[i]) \
-                            * (rate > inter1[i - 1])
-                if (np.sum(condition)):
-                    res_avg.append(np.sum(res[condition]) / avg_num)
-                    time.append(v)
-
-        inter2 = list(range(100, 1001, 100))
-        for i, v in enumerate(inter2):
-            if (v == 100):
-                pass
-            else:
-                condition = (rate <= inter2[i]) \
-                            * (rate > inter2[i-1])
-                if (np.sum(condition)):
-                    res_avg.append(np.sum(res[condition]) / avg_num)
-                    time.append(v)
-
-        inter3 = list(range(1000, 10001, 1000))
-        for i, v in enumerate(inter3):
-            if (v == 1000):
-                pass
-            else:
-                condition = (rate <= inter3[i]) \
-                            * (rate > inter3[i-1])
-                if (np.sum(condition)):
-                    res_avg.append(np.sum(res[condition]) / avg_num)
-                    time.append(v)
-
-    except TypeError as e:
-        print(e)
-        print(traceback.format_exc())
-        pass
+    # Load data
+    taus, bins, histogram = pickle.load(open(''.join((
+            '../../taq_data/responses_event_trades_minute_data_{1}/taq'
+            + '_self_response_year_responses_event_trades_minute_data'
+            + '/taq_self_response_year_responses_time_trades'
+            + '_minute_data_{1}_{0}.pickle').split())
+            .format(ticker, year), 'rb'))
+
+    res_sum, res_num, _ = histogram[:, :, taus.index(tau)]
+    avg_num = np.sum(res_num)
+
+    # Bins with values
+    condition = res_num > 0
+    time = list(bins[condition])
+    res_avg = list(res_sum[condition] / avg_num)
 
     assert len(res_avg) == len(time)
 
@@ -293,13 +279,13 @@ def taq_self_response_year_avg_responses_event_trades_minute_data(ticker, year,
 
 
 def taq_cross_response_day_responses_event_trades_minute_data(ticker_i,
-                                                              ticker_j, date,
-                                                              tau):
+                                                             ticker_j, date,
+                                                             taus):
     """Computes the cross response of a day.
 
     Using the midpoint price of ticker i and trade signs of ticker j computes
-    the cross-response during different event shifts for a day. There is a
-    constant :math:`\\tau` that most be set in the parameters.
+    the cross-response during different trades per minute for a day. The
+    responses are computed for every :math:`\\tau` in the parameters.
 
     :param ticker_i: string of the abbreviation of the stock to be analized
      (i.e. 'AAPL').
@@ -307,8 +293,9 @@ def taq_cross_response_day_responses_event_trades_minute_data(ticker_i,
      (i.e. 'AAPL').
     :param date: string with the date of the data to be extracted
      (i.e. '2008-01-02').
-    :param tau: integer great than zero (i.e. 50).
-    :return: tuple -- The function returns a tuple with positions.
+    :param taus: list of integers greater than zero (i.e. [1, 10, 50]).
+    :return: numpy array -- The function returns the histogram of the
+     responses.
     """
 
     date_sep = date.split('-')
@@ -353,81 +340,44 @@ def taq_cross_response_day_responses_event_trades_minute_data(ticker_i,
             assert not np.sum(midpoint_i == 0)
             assert len(midpoint_i) == len(time_m)
 
-            # List to save the tuples with the response and rates
-            points = []
-
-            # Minutes during the open market considering opening at 9:40 and
-            # closing at 15:50
-            time_minutes = np.array(range(370))
-
-            # Calculating the midpoint price return and the cross response
-            # function
+            # Midpoint price of ticker i in the second of every trade
+            condition = (time_t >= time_m[0]) * (time_t <= time_m[-1])
             midpoint_t = 0. * trade_sign_j
-
-            # Filling with midpoint price values
-            for t_idx, t_val in enumerate(time_m):
-                condition = time_t == t_val
-                len_c = np.sum(condition)
-                midpoint_t[condition] = midpoint_i[t_idx] * np.ones(len_c)
+            midpoint_t[condition] = \
+                midpoint_i[time_t[condition].astype(int) - time_m[0]]
 
             assert not np.sum(midpoint_t == 0)
 
-            # Obtain the midpoint price return. Displace the numerator tau
-            # values to the right and compute the return
-            # Midpoint price returns
-            log_return_sec = (midpoint_t[tau + 1:]
-                              - midpoint_t[:-tau - 1]) \
-                / midpoint_t[:-tau - 1]
-
-            trade_sign_tau_ = trade_sign_j[:-tau - 1]
-            time_t = time_t[:- tau - 1]
-            assert len(trade_sign_tau_) == len(log_return_sec)
-
-            # Depending on the trades per minute value
-            for t_idx, t_val in enumerate(time_minutes):
-
-                if (t_idx):
-                    # Select the values in each minute
-                    condition = (time_t < 34800 + time_minutes[t_idx] * 60) \
-                            * (time_t >= 34800 + time_minutes[t_idx - 1] * 60)
-                    trade_sign_tau = trade_sign_tau_[condition]
-                    log_return = log_return_sec[condition]
-                    trades_minute = np.sum(condition)
-
-                    # Obtain the self response value
-                    product = log_return * trade_sign_tau
-                    points.extend([(trades_minute, i) for i in product])
-
-                else:
-                    pass
-
-            return points
+            return \
+                taq_trades_minute_histogram_responses_event_trades_minute_data(
+                    time_t, midpoint_t, trade_sign_j, taus)
 
         except FileNotFoundError as e:
             print('No data')
             print(e)
             print()
-            return None
+            return np.zeros((3, len(__bins__), len(taus)))
 
 # ----------------------------------------------------------------------------
 
 
 def taq_cross_response_year_responses_event_trades_minute_data(ticker_i,
-                                                               ticker_j, year,
-                                                               tau):
+                                                              ticker_j, year,
+                                                              taus):
     """Computes the cross response of a year.
 
     Using the taq_cross_response_day_responses_event_trades_minutes_data
-    function computes the cross-response function for a year.
+    function computes the cross-response function for a year. The histograms
+    of the days are added as they are computed.
 
     :param ticker_i: string of the abbreviation of the stock to be analized
      (i.e. 'AAPL').
     :param ticker_j: string of the abbreviation of the stock to be analized
      (i.e. 'AAPL').
     :param year: string of the year to be analized (i.e '2016').
-    :param tau: integer great than zero (i.e. 50).
-    :return: None – The function saves the data in a file and does not return a
-     value.
+    :param taus: list of integers greater than zero (i.e. [1, 10, 50]).
+    :return: numpy array -- The function returns the histogram of the
+     responses.
     """
 
     if (ticker_i == ticker_j):
@@ -446,35 +396,33 @@ def taq_cross_response_year_responses_event_trades_minute_data(ticker_i,
         dates = taq_data_tools_responses_event_trades_minute \
             .taq_bussiness_days(year)
 
-        points = []
-
-        for date in dates:
-
-            try:
-                points.extend(
-                    taq_cross_response_day_responses_event_trades_minute_data(
-                              ticker_i, ticker_j, date, tau))
+        histogram = np.zeros((3, len(__bins__), len(taus)))
 
-            except TypeError:
-                pass
+        # Parallel computation of the histograms of every day
+        with mp.Pool(processes=mp.cpu_count()) as pool:
+            for histogram_day in pool.starmap(
+                    taq_cross_response_day_responses_event_trades_minute_data,
+                    iprod([ticker_i], [ticker_j], dates, [taus])):
+                histogram += histogram_day
 
         # Saving data
         taq_data_tools_responses_event_trades_minute \
-            .taq_save_data('{}_tau_{}'.format(function_name, tau), points,
+            .taq_save_data(function_name, (list(taus), __bins__, histogram),
                            ticker_i, ticker_j, year, '', '')
 
-        return None
+        return histogram
 
 # ----------------------------------------------------------------------------
 
 
 def taq_cross_response_year_avg_responses_event_trades_minute_data(ticker_i,
-                                                                   ticker_j,
-                                                                   year, tau):
+                                                                  ticker_j,
+                                                                  year, tau):
     """Computes the average cross response of a year.
 
-    Using the taq_cross_response_day_responses_event_trades_minute_data
-    function computes the average cross-response function for a year.
+    Using the histogram of the
+    taq_cross_response_year_responses_event_trades_minute_data function
+    computes the average cross-response function for a year.
 
     :param ticker_i: string of the abbreviation of the stock to be analized
      (i.e. 'AAPL').
@@ -482,7 +430,7 @@ def taq_cross_response_year_avg_responses_event_trades_minute_data(ticker_i,
      (i.e. 'AAPL').
     :param year: string of the year to be analized (i.e '2016').
     :param tau: integer great than zero (i.e. 50).
-    :return: tuple -- The function returns a tuple with numpy arrays.
+    :return: tuple -- The function returns a tuple with lists.
     """
 
     if (ticker_i == ticker_j):
@@ -498,67 +446,21 @@ def taq_cross_response_year_avg_responses_event_trades_minute_data(ticker_i,
             .taq_function_header_print_data(function_name, ticker_i, ticker_j,
                                             year, '', '')
 
-        try:
-            # Load data
-            responses = pickle.load(open(''.join((
-                    '../../taq_data/responses_event_trades_minute_data_{2}/taq'
-                    + '_cross_response_year_responses_event_trades_minute_data'
-                    + '_tau_{3}/taq_cross_response_year_responses_event_trades'
-                    + '_minute_data_tau_{3}_{2}_{0}i_{1}j.pickle').split())
-                    .format(ticker_i, ticker_j, year, tau), 'rb'))
-
-            responses.sort(key=lambda tup: tup[0])
-            res_list = [list(i) for i in zip(*responses)]
-            rate = np.asarray(res_list[0])
-            res = np.asarray(res_list[1])
-
-            res_avg = []
-            time = []
-            avg_num = len(res)
-
-            for i in range(1, 11):
-                condition = rate == i
-                if (np.sum(condition)):
-                    res_avg.append(np.sum(res[condition]) / avg_num)
-                    time.append(i)
-
-            inter1 = list(range(10, 101, 10))
-            for i, v in enumerate(inter1):
-                if (v == 10):
-                    pass
-                else:
-                    condition = (rate <= inter1[i]) \
-                                * (rate > inter1[i - 1])
-                    if (np.sum(condition)):
-                        res_avg.append(np.sum(res[condition]) / avg_num)
-                        time.append(v)
-
-            inter2 = list(range(100, 1001, 100))
-            for i, v in enumerate(inter2):
-                if (v == 100):
-                    pass
-                else:
-                    condition = (rate <= inter2[i]) \
-                                * (rate > inter2[i-1])
-                    if (np.sum(condition)):
-                        res_avg.append(np.sum(res[condition]) / avg_num)
-                        time.append(v)
-
-            inter3 = list(range(1000, 10001, 1000))
-            for i, v in enumerate(inter3):
-                if (v == 1000):
-                    pass
-                else:
-                    condition = (rate <= inter3[i]) \
-                                * (rate > inter3[i-1])
-                    if (np.sum(condition)):
-                        res_avg.append(np.sum(res[condition]) / avg_num)
-                        time.append(v)
-
-        except TypeError as e:
-            print(e)
-            print(traceback.format_exc())
-            pass
+        # Load data
+        taus, bins, histogram = pickle.load(open(''.join((
+                '../../taq_data/responses_event_trades_minute_data_{2}/taq'
+                + '_cross_response_year_responses_event_trades_minute_data'
+                + '/taq_cross_response_year_responses_time_trades'
+                + '_minute_data_{2}_{0}i_{1}j.pickle').split())
+                .format(ticker_i, ticker_j, year), 'rb'))
+
+        res_sum, res_num, _ = histogram[:, :, taus.index(tau)]
+        avg_num = np.sum(res_num)
+
+        # Bins with values
+        condition = res_num > 0
+        time = list(bins[condition])
+        res_avg = list(res_sum[condition] / avg_num)
 
         assert len(res_avg) == len(time)
 
@@ -579,14 +481,15 @@ def main():
 
     :return: None.
     """
-    ticker = 'AAPL'
     ticker_i = 'AAPL'
     ticker_j = 'MSFT'
     year = '2008'
     tau = 1000
 
-    # taq_self_response_year_avg_responses_event_trades_minute_data(ticker, year, tau)
-    taq_cross_response_year_avg_responses_event_trades_minute_data(ticker_i, ticker_j, year, tau)
+    taq_cross_response_year_responses_event_trades_minute_data(
+        ticker_i, ticker_j, year, [tau])
+    taq_cross_response_year_avg_responses_event_trades_minute_data(
+        ticker_i, ticker_j, year, tau)
 
     return None
 
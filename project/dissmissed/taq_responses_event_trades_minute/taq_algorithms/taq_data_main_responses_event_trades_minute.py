@@ -45,39 +45,34 @@ def taq_data_plot_generator(tickers, year, taus):
      a value.
     """
 
-    # Self-response
-    self_parameters = product(tickers, [year], taus)
-    # Cross-response
-    cross_parameters = product(tickers, tickers, [year], taus)
-
-    for self_ in self_parameters:
+    # Self-response. The histograms of all the taus are computed together
+    for ticker in tickers:
 
         taq_data_analysis_responses_event_trades_minute \
-            .taq_self_response_year_responses_event_trades_minute_data(*self_)
+            .taq_self_response_year_responses_event_trades_minute_data(
+                ticker, year, taus)
 
-    for self_ in self_parameters:
+    for self_ in product(tickers, [year], taus):
 
         taq_data_plot_responses_event_trades_minute \
             .taq_self_response_year_responses_event_trades_minute_plot(*self_)
 
-    for self_ in self_parameters:
-
         taq_data_analysis_responses_event_trades_minute \
             .taq_self_response_year_avg_responses_event_trades_minute_data(
                 *self_)
 
-    for cross in cross_parameters:
+    # Cross-response
+    for ticker_i, ticker_j in product(tickers, tickers):
 
         taq_data_analysis_responses_event_trades_minute \
-            .taq_cross_response_year_responses_event_trades_minute_data(*cross)
+            .taq_cross_response_year_responses_event_trades_minute_data(
+                ticker_i, ticker_j, year, taus)
 
-    for cross in cross_parameters:
+    for cross in product(tickers, tickers, [year], taus):
 
         taq_data_plot_responses_event_trades_minute \
             .taq_cross_response_year_responses_event_trades_minute_plot(*cross)
 
-    for cross in cross_parameters:
-
         taq_data_analysis_responses_event_trades_minute \
             .taq_cross_response_year_avg_responses_event_trades_minute_data(
                 *cross)
@@ -10,11 +10,11 @@ This script requires the following modules:
 
 The module contains the following functions:
     * taq_self_response_year_responses_event_trades_minute_plot - plots the
-      self- response for a year.
+      self- response of every trades per minute bin for a year.
     * taq_self_response_year_avg_responses_event_trades_minute_plot - plots
       the self- response average for a year.
     * taq_cross_response_year_responses_event_trades_minute_plot - plots the
-      cross- response for a year.
+      cross- response of every trades per minute bin for a year.
     * taq_cross_response_year_avg_responses_event_trades_minute_plot - plots
       the cross- response average for a year.
     * main - the main function of the script.
@@ -60,15 +60,22 @@ def taq_self_response_year_responses_event_trades_minute_plot(ticker, year,
         figure = plt.figure(figsize=(16, 9))
 
         # Load data
-        points = pickle.load(open(''.join((
-                            '../../taq_data/responses_event_trades_minute_data'
-                            + '_{1}/taq_self_response_year_responses_event'
-                            + '_trades_minute_data_tau_{2}/taq_self_response'
-                            + '_year_responses_event_trades_minute_data_tau'
-                            + '_{2}_{1}_{0}.pickle').split())
-                            .format(ticker, year, tau), 'rb'))
-
-        plt.scatter(*zip(*points), label=r'$\tau = {}$'.format(tau))
+        taus, bins, histogram = pickle.load(open(''.join((
+                '../../taq_data/responses_event_trades_minute_data_{1}'
+                + '/taq_self_response_year_responses_event_trades_minute'
+                + '_data/taq_self_response_year_responses_event_trades'
+                + '_minute_data_{1}_{0}.pickle').split())
+                .format(ticker, year), 'rb'))
+
+        # Average and standard deviation of every trades per minute bin
+        res_sum, res_num, res_sq = histogram[:, :, taus.index(tau)]
+        condition = res_num > 0
+        res_avg = res_sum[condition] / res_num[condition]
+        res_std = np.sqrt(np.maximum(
+            res_sq[condition] / res_num[condition] - res_avg ** 2, 0))
+
+        plt.errorbar(bins[condition], res_avg, yerr=res_std, fmt='o',
+                     label=r'$\tau = {}$'.format(tau))
 
         plt.legend(loc='best', fontsize=25)
         plt.title('Self-response event {}'.format(ticker), fontsize=40)
@@ -193,15 +200,22 @@ def taq_cross_response_year_responses_event_trades_minute_plot(ticker_i,
             figure = plt.figure(figsize=(16, 9))
 
             # Load data
-            points = pickle.load(open(''.join((
-                        '../../taq_data/responses_event_trades_minute_data_{2}'
-                        + '/taq_cross_response_year_responses_event_trades'
-                        + '_minute_data_tau_{3}/taq_cross_response_year'
-                        + '_responses_event_trades_minute_data_tau_{3}_{2}'
-                        + '_{0}i_{1}j.pickle').split())
-                        .format(ticker_i, ticker_j, year, tau), 'rb'))
-
-            plt.scatter(*zip(*points), label=r'$\tau = {}$'.format(tau))
+            taus, bins, histogram = pickle.load(open(''.join((
+                    '../../taq_data/responses_event_trades_minute_data_{2}'
+                    + '/taq_cross_response_year_responses_event_trades_minute'
+                    + '_data/taq_cross_response_year_responses_event_trades'
+                    + '_minute_data_{2}_{0}i_{1}j.pickle').split())
+                    .format(ticker_i, ticker_j, year), 'rb'))
+
+            # Average and standard deviation of every trades per minute bin
+            res_sum, res_num, res_sq = histogram[:, :, taus.index(tau)]
+            condition = res_num > 0
+            res_avg = res_sum[condition] / res_num[condition]
+            res_std = np.sqrt(np.maximum(
+                res_sq[condition] / res_num[condition] - res_avg ** 2, 0))
+
+            plt.errorbar(bins[condition], res_avg, yerr=res_std, fmt='o',
+                         label=r'$\tau = {}$'.format(tau))
 
             plt.legend(loc='best', fontsize=25)
             plt.title('Cross-response event {} - {}'.format(ticker_i,
@@ -6,13 +6,20 @@ depending on the spread.
 
 This script requires the following modules:
     * numpy
-    * pandas
-    * pickle
+    * os
+    * sys
     * taq_data_tools_avg_responses_physical
+    * taq_data_tools_pool
 
 The module contains the following functions:
     * taq_tickers_spread_data - obtains the tickers and the spread for the
       classification.
+    * taq_self_response_year_load_avg_responses_physical_data - loads the
+      self response of a ticker in a year.
+    * taq_self_response_year_stack_avg_responses_physical_data - loads the
+      self responses of several tickers in a year in one array.
+    * taq_self_response_bucket_avg_responses_physical_data - computes the
+      statistics of the self responses of groups of tickers.
     * taq_self_response_year_avg_responses_physical_data - computes the average
       self response for groups of tickers in a year.
     * main - the main function of the script.
@@ -24,109 +31,198 @@ The module contains the following functions:
 # Modules
 
 import numpy as np
-import pandas as pd
-import pickle
+import os
+import sys
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                             '..', '..', 'taq_pool', 'taq_algorithms'))
 import taq_data_tools_avg_responses_physical
+import taq_data_tools_pool
 
 __tau__ = 10000
 
 # ----------------------------------------------------------------------------
 
 
-def taq_tickers_spread_data(year):
+def taq_tickers_spread_data(year, edges=(0, 0.05, 0.10, 0.40),
+                            quantiles=None):
     """Obtains the tickers and the spread range for the classification.
 
+    The tickers are classified in groups depending on their average spread in
+    the year. The limits of the groups can be given as spread values (edges)
+    or as quantiles of the spread of all the tickers.
+
     :param year: string of the year to be analyzed (i.e. '2016').
-    :return: tuple -- The function returns a tuple with a numpy array and a
-     list.
+    :param edges: sequence with the spread limits of the groups. A ticker
+     belongs to a group if edges[k] <= spread < edges[k + 1]
+     (i.e. (0, 0.05, 0.10, 0.40)).
+    :param quantiles: sequence with the quantiles used as limits of the groups
+     (i.e. (0, 0.25, 0.5, 0.75, 1)). If it is not None, the edges are not
+     used. Default None.
+    :return: list -- The function returns a list with a tuple of tickers for
+     every group.
     """
 
     function_name = taq_tickers_spread_data.__name__
     taq_data_tools_avg_responses_physical \
         .taq_function_header_print_data(function_name, '', '', year, '', '')
 
-    try:
-        # load data
-        spread_data = pd.read_csv(
-            '../../taq_avg_spread/taq_avg_spread_2008_all.csv',
-            usecols=['Ticker', 'Avg_Spread'])
+    spread_data = taq_data_tools_avg_responses_physical \
+        .taq_spread_data(year)
+
+    if (quantiles is None):
         spread_data['Avg_Spread'] = np.round(spread_data['Avg_Spread'],
                                              decimals=2)
+        edges = np.asarray(edges, dtype=float)
+
+    else:
+        edges = np.quantile(spread_data['Avg_Spread'], quantiles)
+        # The largest spread is included in the last group
+        edges[-1] = np.nextafter(edges[-1], np.inf)
+
+    tickers = []
+
+    for low, high in zip(edges[:-1], edges[1:]):
+        group = spread_data[(spread_data['Avg_Spread'] >= low)
+                            & (spread_data['Avg_Spread'] < high)]
+        tickers.append(tuple(group['Ticker'].tolist()))
+
+    return tickers
 
-        tickers = []
-
-        g1 = spread_data[spread_data['Avg_Spread'] < 0.05]
-        tickers_g1 = tuple(g1['Ticker'].tolist())
-        g2 = spread_data[(spread_data['Avg_Spread'] >= 0.05)
-                         & (spread_data['Avg_Spread'] < 0.10)]
-        tickers_g2 = tuple(g2['Ticker'].tolist())
-        g3 = spread_data[(spread_data['Avg_Spread'] >= 0.10)
-                         & (spread_data['Avg_Spread'] < 0.40)]
-        tickers_g3 = tuple(g3['Ticker'].tolist())
-        # g4 = spread_data[(spread_data['Avg_Spread'] >= 0.09)
-        #                  & (spread_data['Avg_Spread'] < 0.15)]
-        # tickers_g4 = tuple(g4['Ticker'].tolist())
-        # g5 = spread_data[(spread_data['Avg_Spread'] >= 0.15)
-        #                  & (spread_data['Avg_Spread'] < 0.4)]
-        # tickers_g5 = tuple(g5['Ticker'].tolist())
-
-        tickers.append(tickers_g1)
-        tickers.append(tickers_g2)
-        tickers.append(tickers_g3)
-        # tickers.append(tickers_g4)
-        # tickers.append(tickers_g5)
-
-        return tickers
-
-    except FileNotFoundError as e:
+# ----------------------------------------------------------------------------
+
+
+def taq_self_response_year_load_avg_responses_physical_data(ticker, year):
+    """Loads the self-response of a ticker in a year.
+
+    :param ticker: string of the abbreviation of the stock to be analyzed
+     (i.e. 'AAPL').
+    :param year: string of the year to be analyzed (i.e '2016').
+    :return: numpy array -- The function returns the self-response. If there
+     is no data, the values are NaN.
+    """
+
+    response = taq_data_tools_pool \
+        .taq_store_query('taq_self_response_year_responses_physical_data',
+                         year, [ticker])[0]
+
+    if (np.isnan(response).all()):
         print('No data')
-        print(e)
         print()
-        raise Exception('Check the CSV file')
+        return np.full(__tau__, np.nan)
+
+    return response
 
 # ----------------------------------------------------------------------------
 
 
-def taq_self_response_year_avg_responses_physical_data(tickers, year):
-    """Computes the avg self-response for groups of tickers in a year.
+def taq_self_response_year_stack_avg_responses_physical_data(tickers, year):
+    """Loads the self-responses of several tickers in a year in one array.
 
-    Using the taq_self_response_day_avg_responses_physical_data function
-    computes the average of self-response functions for different tickers for a
-    year.
+    The self-responses of all the tickers are loaded with one read of the
+    results store of the taq_responses_physical module.
 
     :param tickers: list of the string abbreviation of the stocks to be
      analyzed (i.e. ['AAPL', 'MSFT']).
     :param year: string of the year to be analyzed (i.e '2016').
-    :return: tuple -- The function returns a tuple with numpy arrays.
+    :return: numpy array -- The function returns a 2D array with the
+     self-response of every ticker in a row.
     """
 
-    function_name = taq_self_response_year_avg_responses_physical_data.__name__
-    taq_data_tools_avg_responses_physical \
-        .taq_function_header_print_data(function_name, '', '', year, '', '')
+    responses_stack = taq_data_tools_pool \
+        .taq_store_query('taq_self_response_year_responses_physical_data',
+                         year, tickers)
+
+    return responses_stack
+
+# ----------------------------------------------------------------------------
+
+
+def taq_self_response_bucket_avg_responses_physical_data(responses_stack,
+                                                         tickers_stack,
+                                                         tickers):
+    """Computes the statistics of the self-responses of groups of tickers.
+
+    The self-responses of the tickers are taken from an array loaded with the
+    taq_self_response_year_stack_avg_responses_physical_data function, so
+    different groups of tickers can be analyzed without loading the data
+    again.
+
+    :param responses_stack: numpy 2D array with the self-response of every
+     ticker in a row.
+    :param tickers_stack: list of the string abbreviation of the stocks in
+     the rows of responses_stack (i.e. ['AAPL', 'MSFT']).
+    :param tickers: list with a tuple of tickers for every group.
+    :return: tuple -- The function returns a tuple with lists of numpy arrays
+     with the average, the median and the standard deviation of the
+     self-responses of every group.
+    """
+
+    row = {ticker: idx for idx, ticker in enumerate(tickers_stack)}
 
     results_avg = []
+    results_median = []
+    results_std = []
 
     for ticker in tickers:
-        sum_response = np.zeros(__tau__)
+        group = responses_stack[[row[tick] for tick in ticker]]
+        # Tickers without data are not taken into account, and the lags
+        # without data of a ticker are left out of the statistics of the lag
+        group = group[~np.isnan(group).all(axis=1)]
+
+        if (len(group)):
+            results_avg.append(np.nanmean(group, axis=0))
+            results_median.append(np.nanmedian(group, axis=0))
+            results_std.append(np.nanstd(group, axis=0))
 
-        for tick in ticker:
-            # Load data
-            response = pickle.load(open(
-                f'../../taq_data/responses_physical_data_{year}/taq_self'
-                + f'_response_year_responses_physical_data/taq_self_response'
-                + f'_year_responses_physical_data_{year}_{tick}.pickle', 'rb'))
+        else:
+            nan = np.full(responses_stack.shape[1], np.nan)
+            results_avg.append(nan)
+            results_median.append(nan)
+            results_std.append(nan)
 
-            sum_response += response
+    return (results_avg, results_median, results_std)
+
+# ----------------------------------------------------------------------------
+
+
+def taq_self_response_year_avg_responses_physical_data(tickers, year):
+    """Computes the avg self-response for groups of tickers in a year.
 
-        avg_response = sum_response / len(ticker)
-        results_avg.append(avg_response)
+    Using the taq_self_response_year_stack_avg_responses_physical_data and
+    the taq_self_response_bucket_avg_responses_physical_data functions
+    computes the average, the median and the standard deviation of the
+    self-response functions for different groups of tickers for a year.
+
+    :param tickers: list with a tuple of tickers for every group
+     (i.e. [('AAPL', 'MSFT'), ('GS', 'JPM')]).
+    :param year: string of the year to be analyzed (i.e '2016').
+    :return: tuple -- The function returns a tuple with numpy arrays.
+    """
+
+    function_name = taq_self_response_year_avg_responses_physical_data.__name__
+    taq_data_tools_avg_responses_physical \
+        .taq_function_header_print_data(function_name, '', '', year, '', '')
+
+    # The responses of all the groups are loaded at once
+    tickers_stack = sorted(set(tick for ticker in tickers for tick in ticker))
+    responses_stack = \
+        taq_self_response_year_stack_avg_responses_physical_data(
+            tickers_stack, year)
+
+    results_avg, results_median, results_std = \
+        taq_self_response_bucket_avg_responses_physical_data(
+            responses_stack, tickers_stack, tickers)
 
     results_avg = tuple(results_avg)
 
     # Saving data
     taq_data_tools_avg_responses_physical \
         .taq_save_data(function_name, results_avg, '', '', year, '', '')
+    taq_data_tools_avg_responses_physical \
+        .taq_save_data(f'{function_name}_stats',
+                       (results_avg, tuple(results_median),
+                        tuple(results_std)), '', '', year, '', '')
 
     return results_avg
 
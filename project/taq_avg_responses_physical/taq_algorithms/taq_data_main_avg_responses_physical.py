@@ -4,15 +4,14 @@ The functions in the module run the complete extraction, analysis and plot of
 the TAQ data.
 
 This script requires the following modules:
-    * itertools
-    * multiprocessing
-    * pandas
-    * pickle
     * taq_data_analysis_avg_responses_physical
     * taq_data_plot_avg_responses_physical
     * taq_data_tools_avg_responses_physical
 
 The module contains the following functions:
+    * taq_data_generator - generates all the analysis from the TAQ data.
+    * taq_plot_generator - generates all the plots from the analysis of the
+      TAQ data.
     * taq_data_plot_generator - generates all the analysis and plots from the
       TAQ data.
     * main - the main function of the script.
@@ -23,11 +22,6 @@ The module contains the following functions:
 # -----------------------------------------------------------------------------
 # Modules
 
-from itertools import product as iprod
-import multiprocessing as mp
-import pandas as pd
-import pickle
-
 import taq_data_analysis_avg_responses_physical
 import taq_data_plot_avg_responses_physical
 import taq_data_tools_avg_responses_physical
@@ -35,10 +29,9 @@ import taq_data_tools_avg_responses_physical
 # -----------------------------------------------------------------------------
 
 
-def taq_data_plot_generator(year):
-    """Generates all the analysis and plots from the TAQ data.
+def taq_data_generator(year):
+    """Generates all the analysis from the TAQ data.
 
-    :param div: integer of the number of divisions in the tickers (i.e. 5).
     :param year: string of the year to be analyzed (i.e '2016').
     :return: None -- The function saves the data in a file and does not return
      a value.
@@ -64,6 +57,19 @@ def taq_data_plot_generator(year):
     taq_data_analysis_avg_responses_physical \
         .taq_self_response_year_avg_responses_physical_data(tickers, year)
 
+    return None
+
+# -----------------------------------------------------------------------------
+
+
+def taq_plot_generator(year):
+    """Generates all the plots from the analysis of the TAQ data.
+
+    :param year: string of the year to be analyzed (i.e '2016').
+    :return: None -- The function saves the plots in files and does not
+     return a value.
+    """
+
     taq_data_plot_avg_responses_physical \
         .taq_self_response_year_avg_responses_physical_plot(year)
 
@@ -72,6 +78,22 @@ def taq_data_plot_generator(year):
 # -----------------------------------------------------------------------------
 
 
+def taq_data_plot_generator(year):
+    """Generates all the analysis and plots from the TAQ data.
+
+    :param year: string of the year to be analyzed (i.e '2016').
+    :return: None -- The function saves the data in a file and does not return
+     a value.
+    """
+
+    taq_data_generator(year)
+    taq_plot_generator(year)
+
+    return None
+
+# -----------------------------------------------------------------------------
+
+
 def main():
     """The main function of the script.
 
@@ -45,18 +45,15 @@ def taq_self_response_year_avg_responses_physical_plot(year):
                                             '')
 
         # Load data
-        resp_g1, resp_g2, resp_g3 = pickle.load(open(
+        responses = pickle.load(open(
             f'../../taq_data/avg_responses_physical_data_{year}/taq_self'
             + f'_response_year_avg_responses_physical_data/taq_self_response'
             + f'_year_avg_responses_physical_data_{year}_.pickle', 'rb'))
 
         figure = plt.figure(figsize=(16, 9))
 
-        plt.semilogx(resp_g1, linewidth=5, label=f'Group 1')
-        plt.semilogx(resp_g2, linewidth=5, label=f'Group 2')
-        plt.semilogx(resp_g3, linewidth=5, label=f'Group 3')
-        # plt.semilogx(resp_g4, linewidth=5, label=f'Group 4')
-        # plt.semilogx(resp_g5, linewidth=5, label=f'Group 5')
+        for g_idx, resp_g in enumerate(responses):
+            plt.semilogx(resp_g, linewidth=5, label=f'Group {g_idx + 1}')
 
         plt.legend(loc='best', fontsize=25)
         plt.title('Self-response', fontsize=40)
@@ -8,7 +8,8 @@ This script requires the following modules:
     * matplotlib
     * os
     * pandas
-    * pickle
+    * sys
+    * taq_data_tools_pool
 
 The module contains the following functions:
     * taq_save_data - saves computed data.
@@ -18,6 +19,7 @@ The module contains the following functions:
     * taq_start_folders - creates folders to save data and plots.
     * taq_initial_message - prints the initial message with basic information.
     * taq_business_days - creates a list of week days for a year.
+    * taq_spread_data - loads the average spread of the tickers in a year.
     * main - the main function of the script.
 
 .. moduleauthor:: Juan Camilo Henao Londono <www.github.com/juanhenao21>
@@ -29,7 +31,11 @@ The module contains the following functions:
 from matplotlib import pyplot as plt
 import os
 import pandas as pd
-import pickle
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                             '..', '..', 'taq_pool', 'taq_algorithms'))
+import taq_data_tools_pool
 
 # -----------------------------------------------------------------------------
 
@@ -69,16 +75,18 @@ def taq_save_data(function_name, data, ticker_i, ticker_j, year, month, day):
     # Cross-response data
     if (ticker_i != ticker_j):
 
-        pickle.dump(data, open(f'../../taq_data/avg_responses_physical_data'
-                    + f'_{year}/{function_name}/{function_name}_{year}{month}'
-                    + f'{day}_{ticker_i}i_{ticker_j}j.pickle', 'wb'))
+        file_name = ('../../taq_data/avg_responses_physical_data'
+                     + f'_{year}/{function_name}/{function_name}_{year}{month}'
+                     + f'{day}_{ticker_i}i_{ticker_j}j.pickle')
 
     # Self-response data
     else:
 
-        pickle.dump(data, open(f'../../taq_data/avg_responses_physical_data'
-                    + f'_{year}/{function_name}/{function_name}_{year}{month}'
-                    + f'{day}_{ticker_i}.pickle', 'wb'))
+        file_name = ('../../taq_data/avg_responses_physical_data'
+                     + f'_{year}/{function_name}/{function_name}_{year}{month}'
+                     + f'{day}_{ticker_i}.pickle')
+
+    taq_data_tools_pool.taq_atomic_dump(data, file_name)
 
     print('Data Saved')
     print()
@@ -275,6 +283,47 @@ def taq_bussiness_days(year):
 # -----------------------------------------------------------------------------
 
 
+def taq_spread_data(year):
+    """Loads the average spread of the tickers in a year.
+
+    The spread is obtained from the statistics table of every ticker and day
+    saved by the taq_statistics module. If the table does not exist, the
+    spread is loaded from the CSV file of the taq_avg_spread module.
+
+    :param year: string of the year to be analyzed (i.e '2008').
+    :return: DataFrame -- The function returns a pandas DataFrame with the
+     columns Ticker and Avg_Spread.
+    """
+
+    try:
+        stats_df = pd.read_csv(f'../../taq_data/statistics_data_{year}/taq'
+                               + f'_market_year_statistics_data_{year}.csv',
+                               usecols=['Ticker', 'Avg_Spread'],
+                               dtype={'Ticker': 'str'})
+        spread_data = stats_df.groupby('Ticker', as_index=False)[
+            'Avg_Spread'].mean()
+
+        return spread_data
+
+    except FileNotFoundError:
+        print('No statistics table. Using the taq_avg_spread CSV file')
+
+    try:
+        spread_data = pd.read_csv(
+            f'../../taq_avg_spread/taq_avg_spread_{year}_all.csv',
+            usecols=['Ticker', 'Avg_Spread'])
+
+        return spread_data
+
+    except FileNotFoundError as e:
+        print('No data')
+        print(e)
+        print()
+        raise Exception('Check the CSV file')
+
+# -----------------------------------------------------------------------------
+
+
 def main():
     """The main function of the script.
 
@@ -15,6 +15,7 @@ The module contains the following functions:
     * taq_initial_message - prints the initial message with basic information.
     * taq_business_days - creates a list of week days for a year.
     * taq_get_tickers_data - gets the available ticker names.
+    * taq_load_market_statistics - loads the statistics table of a year.
     * main - the main function of the script.
 
 .. moduleauthor:: Juan Camilo Henao Londono <www.github.com/juanhenao21>
@@ -136,6 +137,33 @@ def taq_get_tickers_data(year):
 # -----------------------------------------------------------------------------
 
 
+def taq_load_market_statistics(year):
+    """Loads the statistics table of a year from a CSV file.
+
+    The table is saved by the taq_market_year_statistics_data function of the
+    taq_statistics module.
+
+    :param year: string of the year to be analyzed (i.e '2016').
+    :return: DataFrame -- The function returns a pandas DataFrame with the
+     statistics of every ticker and day.
+    """
+
+    try:
+        stats_df = pd.read_csv(f'../../taq_data/statistics_data_{year}/taq'
+                               + f'_market_year_statistics_data_{year}.csv',
+                               dtype={'Ticker': 'str', 'Date': 'str'})
+
+        return stats_df
+
+    except FileNotFoundError as e:
+        print('No data')
+        print(e)
+        print()
+        raise Exception('Run the taq_statistics module')
+
+# -----------------------------------------------------------------------------
+
+
 def main():
     """The main function of the script.
 
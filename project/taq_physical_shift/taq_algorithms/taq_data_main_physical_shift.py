@@ -8,12 +8,18 @@ physical time scale from the TAQ Responses Physical module.
 This script requires the following modules:
     * itertools
     * multiprocessing
+    * os
     * pandas
+    * sys
     * taq_data_analysis_physical_shift
     * taq_data_plot_physical_shift
     * taq_data_tools_physical_shift
+    * taq_data_tools_pool
 
 The module contains the following functions:
+    * taq_data_generator - generates all the analysis from the TAQ data.
+    * taq_plot_generator - generates all the plots from the analysis of the
+      TAQ data.
     * taq_data_plot_generator - generates all the analysis and plots from the
       TAQ data.
     * main - the main function of the script.
@@ -26,17 +32,22 @@ The module contains the following functions:
 
 from itertools import product as iprod
 import multiprocessing as mp
+import os
 import pandas as pd
+import sys
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                             '..', '..', 'taq_pool', 'taq_algorithms'))
 import taq_data_analysis_physical_shift
 import taq_data_plot_physical_shift
 import taq_data_tools_physical_shift
+import taq_data_tools_pool
 
 # -----------------------------------------------------------------------------
 
 
-def taq_data_plot_generator(tickers, year, taus):
-    """Generates all the analysis and plots from the TAQ data.
+def taq_data_generator(tickers, year, taus):
+    """Generates all the analysis from the TAQ data.
 
     :param tickers: list of the string abbreviation of the stocks to be
      analyzed (i.e. ['AAPL', 'MSFT']).
@@ -46,6 +57,10 @@ def taq_data_plot_generator(tickers, year, taus):
      a value.
     """
 
+    # The days of the year functions keep their checkpoints until the
+    # year results are saved
+    taq_data_tools_pool.taq_checkpoint_tasks(taq_data_analysis_physical_shift)
+
     # Specific functions
     # Self-response
     for ticker in tickers:
@@ -70,14 +85,33 @@ def taq_data_plot_generator(tickers, year, taus):
                 .taq_cross_response_year_physical_shift_data(ticks[0],
                                                              ticks[1], year,
                                                              tau)
+
+    return None
+
+# -----------------------------------------------------------------------------
+
+
+def taq_plot_generator(tickers, year, taus):
+    """Generates all the plots from the analysis of the TAQ data.
+
+    :param tickers: list of the string abbreviation of the stocks to be
+     analyzed (i.e. ['AAPL', 'MSFT']).
+    :param year: string of the year to be analyzed (i.e '2016').
+    :param taus: list of integers great than zero (i.e. [1, 10, 50]).
+    :return: None -- The function saves the plots in files and does not
+     return a value.
+    """
+
+    workers = taq_data_tools_pool.taq_workers()
+
     # Parallel computing
-    with mp.Pool(processes=mp.cpu_count()) as pool:
+    with mp.Pool(processes=workers) as pool:
         # Plot
         pool.starmap(taq_data_plot_physical_shift
                      .taq_self_response_year_avg_physical_shift_plot,
                      iprod(tickers, [year], [taus]))
     # Parallel computing
-    with mp.Pool(processes=mp.cpu_count()) as pool:
+    with mp.Pool(processes=workers) as pool:
         # Plot
         pool.starmap(taq_data_plot_physical_shift
                      .taq_cross_response_year_avg_physical_shift_plot,
@@ -88,6 +122,25 @@ def taq_data_plot_generator(tickers, year, taus):
 # -----------------------------------------------------------------------------
 
 
+def taq_data_plot_generator(tickers, year, taus):
+    """Generates all the analysis and plots from the TAQ data.
+
+    :param tickers: list of the string abbreviation of the stocks to be
+     analyzed (i.e. ['AAPL', 'MSFT']).
+    :param year: string of the year to be analyzed (i.e '2016').
+    :param taus: list of integers great than zero (i.e. [1, 10, 50]).
+    :return: None -- The function saves the data in a file and does not return
+     a value.
+    """
+
+    taq_data_generator(tickers, year, taus)
+    taq_plot_generator(tickers, year, taus)
+
+    return None
+
+# -----------------------------------------------------------------------------
+
+
 def main():
     """The main function of the script.
 
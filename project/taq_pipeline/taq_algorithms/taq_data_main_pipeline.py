@@ -0,0 +1,702 @@
+'''TAQ data main module.
+
+The functions in the module run the complete analysis of all the taq_*
+modules as a pipeline. Every module is a stage with its inputs, outputs and
+the stages it depends on. A stage only runs again when its parameters, its
+code or the content of its inputs change, and the stages that do not depend
+on each other run in parallel.
+
+This script requires the following modules:
+    * argparse
+    * concurrent
+    * os
+    * subprocess
+    * sys
+    * taq_data_tools_pipeline
+
+The module contains the following functions:
+    * taq_stages_pipeline_data - declares the stages of the pipeline.
+    * taq_select_pipeline_data - selects the stages of the pipeline to be run.
+    * taq_plan_pipeline_data - prints the plan of a run of the pipeline.
+    * taq_run_stage_pipeline_data - runs a stage of the pipeline.
+    * taq_run_pipeline_data - runs the stages of the pipeline that changed.
+    * taq_arguments_pipeline_data - reads the arguments of the command line.
+    * main - the main function of the script.
+
+.. moduleauthor:: Juan Camilo Henao Londono <www.github.com/juanhenao21>
+'''
+
+# -----------------------------------------------------------------------------
+# Modules
+
+import argparse
+from concurrent import futures
+import os
+import subprocess
+import sys
+
+import taq_data_tools_pipeline
+
+# -----------------------------------------------------------------------------
+
+
+def taq_stages_pipeline_data(tickers, year, taus=(1, 10, 100, 1000),
+                             shifts=(10, 100), tau=1000,
+                             taus_p=tuple(range(10, 101, 10)),
+                             extract=False):
+    """Declares the stages of the pipeline.
+
+    Every stage has the module where it runs, its phase ('extract',
+    'preprocess', 'analyze' or 'plot'), the functions it calls with their
+    parameters, the files and folders it reads and writes and the stages
+    that must finish before it. The paths are relative to the taq_algorithms
+    folders. The analysis stages computed by ticker and pair of tickers also
+    have their tickers, so their tasks finished in a previous run are
+    skipped.
+
+    :param tickers: list of the string abbreviation of the stocks to be
+     analyzed (i.e. ['AAPL', 'MSFT']).
+    :param year: string of the year to be analyzed (i.e '2016').
+    :param taus: list of integers greater than zero used in the shift
+     modules (i.e. [1, 10, 100, 1000]).
+    :param shifts: list of integers greater than zero used in the responses
+     shift modules (i.e. [10, 100]).
+    :param tau: integer greater than zero used in the short and long
+     responses (i.e. 1000).
+    :param taus_p: list of integers greater than zero used in the short and
+     long responses (i.e. [10, 20, 30]).
+    :param extract: bool to add the extraction of the original data to the
+     pipeline (default False).
+    :return: dictionary -- The function returns a dictionary with the stages.
+    """
+
+    tickers = list(tickers)
+    taus = list(taus)
+    shifts = list(shifts)
+    taus_p = list(taus_p)
+
+    data = '../../taq_data'
+    hdf5 = f'{data}/hdf5_daily_data_{year}'
+    physical = f'{data}/responses_physical_data_{year}'
+    trade = f'{data}/responses_trade_data_{year}'
+    statistics = f'{data}/statistics_data_{year}'
+    catalog = f'{data}/catalog_data_{year}'
+
+    stages = {
+        'catalog': {
+            'module': 'taq_responses_physical',
+            'phase': 'preprocess',
+            'calls': [('taq_data_analysis_responses_physical',
+                       'taq_catalog_data', (year,))],
+            'inputs': [hdf5],
+            'outputs': [catalog],
+            'deps': [],
+        },
+        'responses_physical': {
+            'module': 'taq_responses_physical',
+            'phase': 'analyze',
+            'calls': [('taq_data_main_responses_physical',
+                       'taq_data_generator', (tickers, year))],
+            'inputs': [hdf5, catalog],
+            'outputs': [physical],
+            'deps': ['catalog'],
+        },
+        'statistics': {
+            'module': 'taq_statistics',
+            'phase': 'analyze',
+            'calls': [('taq_data_main_statistics', 'taq_data_generator',
+                       (tickers, year))],
+            'inputs': [hdf5, catalog],
+            'outputs': [statistics],
+            'deps': ['catalog'],
+        },
+        'avg_spread': {
+            'module': 'taq_avg_spread',
+            'phase': 'analyze',
+            'calls': [('taq_data_main_avg_spread', 'taq_data_generator',
+                       (tickers, year))],
+            'inputs': [statistics],
+            'outputs': [f'../../taq_avg_spread/taq_avg_spread_{year}.csv'],
+            'deps': ['statistics'],
+        },
+        'avg_responses_physical': {
+            'module': 'taq_avg_responses_physical',
+            'phase': 'analyze',
+            'calls': [('taq_data_main_avg_responses_physical',
+                       'taq_data_generator', (year,))],
+            'inputs': [physical, statistics],
+            'outputs': [f'{data}/avg_responses_physical_data_{year}'],
+            'deps': ['responses_physical', 'statistics'],
+        },
+        'physical_shift': {
+            'module': 'taq_physical_shift',
+            'phase': 'analyze',
+            'calls': [('taq_data_main_physical_shift', 'taq_data_generator',
+                       (tickers, year, taus))],
+            'inputs': [physical],
+            'outputs': [f'{data}/physical_shift_data_{year}'],
+            'deps': ['responses_physical'],
+        },
+        'responses_physical_shift': {
+            'module': 'taq_responses_physical_shift',
+            'phase': 'analyze',
+            'calls': [('taq_data_main_responses_physical_shift',
+                       'taq_data_generator', (tickers, year, shifts))],
+            'inputs': [physical],
+            'outputs': [f'{data}/responses_physical_shift_data_{year}'],
+            'deps': ['responses_physical'],
+        },
+        'responses_physical_short_long': {
+            'module': 'taq_responses_physical_short_long',
+            'phase': 'analyze',
+            'calls': [('taq_data_main_responses_physical_short_long',
+                       'taq_data_generator', (tickers, year, tau, taus_p))],
+            'inputs': [physical],
+            'outputs': [f'{data}/responses_physical_short_long_data_{year}'],
+            'deps': ['responses_physical'],
+        },
+        'responses_trade': {
+            'module': 'taq_responses_trade',
+            'phase': 'analyze',
+            'calls': [('taq_data_main_responses_trade', 'taq_data_generator',
+                       (tickers, year))],
+            'inputs': [hdf5, physical],
+            'outputs': [trade],
+            'deps': ['responses_physical'],
+        },
+        'trade_shift': {
+            'module': 'taq_trade_shift',
+            'phase': 'analyze',
+            'calls': [('taq_data_main_trade_shift', 'taq_data_generator',
+                       (tickers, year, taus))],
+            'inputs': [physical, trade],
+            'outputs': [f'{data}/trade_shift_data_{year}'],
+            'deps': ['responses_physical', 'responses_trade'],
+        },
+        'responses_trade_shift': {
+            'module': 'taq_responses_trade_shift',
+            'phase': 'analyze',
+            'calls': [('taq_data_main_responses_trade_shift',
+                       'taq_data_generator', (tickers, year, shifts))],
+            'inputs': [physical, trade],
+            'outputs': [f'{data}/responses_trade_shift_data_{year}'],
+            'deps': ['responses_physical', 'responses_trade'],
+        },
+        'responses_activity': {
+            'module': 'taq_responses_activity',
+            'phase': 'analyze',
+            'calls': [('taq_data_main_responses_activity',
+                       'taq_data_generator', (tickers, year))],
+            'inputs': [physical, trade],
+            'outputs': [f'{data}/responses_activity_data_{year}'],
+            'deps': ['responses_physical', 'responses_trade'],
+        },
+    }
+
+    # Stages with tasks of a ticker or a pair of tickers in a year
+    for name in ('responses_physical', 'physical_shift',
+                 'responses_physical_shift', 'responses_physical_short_long',
+                 'responses_trade', 'trade_shift', 'responses_trade_shift',
+                 'responses_activity'):
+        stages[name]['tickers'] = tickers
+
+    # The plots of a module run in their own stage after its analysis, so
+    # they can run in other job
+    plots = {
+        'responses_physical': (tickers, year),
+        'avg_responses_physical': (year,),
+        'physical_shift': (tickers, year, taus),
+        'responses_physical_shift': (tickers, year, shifts),
+        'responses_physical_short_long': (tickers, year, tau, taus_p),
+        'responses_trade': (tickers, year),
+        'trade_shift': (tickers, year, taus),
+        'responses_trade_shift': (tickers, year, shifts),
+        'responses_activity': (tickers, year),
+    }
+
+    for name, args in plots.items():
+        stages[f'{name}_plot'] = {
+            'module': f'taq_{name}',
+            'phase': 'plot',
+            'calls': [(f'taq_data_main_{name}', 'taq_plot_generator', args)],
+            'inputs': stages[name]['outputs'],
+            'outputs': [f'../../taq_plot/{name}_plot_{year}'],
+            'deps': [name],
+        }
+
+    if (extract):
+        stages['extract'] = {
+            'module': 'taq_responses_physical',
+            'phase': 'extract',
+            'calls': [('taq_data_analysis_responses_physical',
+                       'taq_build_from_scratch', (tickers, year)),
+                      ('taq_data_analysis_responses_physical',
+                       'taq_daily_data_extract', (tickers, year))],
+            'inputs': [f'{data}/original_year_data_{year}'],
+            'outputs': [hdf5],
+            'deps': [],
+        }
+        stages['catalog']['deps'].append('extract')
+
+    return stages
+
+# -----------------------------------------------------------------------------
+
+
+def taq_select_pipeline_data(stages, phases=None, names=None):
+    """Selects the stages of the pipeline to be run.
+
+    :param stages: dictionary with the stages of the pipeline.
+    :param phases: list of the phases to be run ('extract', 'preprocess',
+     'analyze' or 'plot'). None selects all the phases (default None).
+    :param names: list of the names of the stages to be run (i.e.
+     ['responses_physical', 'statistics']). The plots of a stage are
+     selected with its name. None selects all the stages (default None).
+    :return: list -- The function returns a list with the names of the
+     selected stages.
+    """
+
+    return [name for name, stage in stages.items()
+            if (phases is None or stage['phase'] in phases)
+            and (names is None or name in names
+                 or name[:-len('_plot')] in names
+                 and stage['phase'] == 'plot')]
+
+# -----------------------------------------------------------------------------
+
+
+def taq_plan_pipeline_data(stages, year, selected=None, force=False):
+    """Prints the plan of a run of the pipeline without running it.
+
+    The stages are listed in the order they can run. A stage runs when it
+    is selected and it changed, its outputs do not exist or a stage it
+    depends on runs. The hashes of the files read for the plan are saved in
+    the state of the pipeline.
+
+    :param stages: dictionary with the stages of the pipeline.
+    :param year: string of the year to be analyzed (i.e '2016').
+    :param selected: list with the names of the stages to be run. None runs
+     all the stages (default None).
+    :param force: bool to run all the stages (default False).
+    :return: dictionary -- The function returns a dictionary with the plan
+     ('run', 'up to date', 'blocked', 'external' or 'missing') of every
+     stage.
+    """
+
+    function_name = taq_plan_pipeline_data.__name__
+    taq_data_tools_pipeline \
+        .taq_function_header_print_data(function_name, 'all', year)
+
+    state = taq_data_tools_pipeline.taq_load_state(year)
+    selected = set(stages if selected is None else selected)
+    plan = {}
+    pending = dict(stages)
+
+    while (pending):
+
+        ready = [name for name, stage in pending.items()
+                 if all(dep in plan or dep not in stages
+                        for dep in stage['deps'])]
+
+        if (not ready):
+            # Circular dependencies
+            for name in pending:
+                plan[name] = 'blocked'
+            break
+
+        for name in ready:
+            stage = pending.pop(name)
+            deps = [plan.get(dep, 'missing') for dep in stage['deps']]
+
+            if (name not in selected):
+                exist = taq_data_tools_pipeline.taq_outputs_exist(stage)
+                plan[name] = 'external' if exist else 'missing'
+            elif (any(dep in ('blocked', 'missing') for dep in deps)):
+                plan[name] = 'blocked'
+            elif (force or 'run' in deps
+                    or not taq_data_tools_pipeline.taq_outputs_exist(stage)
+                    or state['stages'].get(name)
+                    != taq_data_tools_pipeline
+                    .taq_stage_hash(stage, state['files'])):
+                plan[name] = 'run'
+            else:
+                plan[name] = 'up to date'
+
+            print(f'{name} ({stage["phase"]}): {plan[name]}')
+            if (plan[name] == 'run'):
+                for module, function, args in stage['calls']:
+                    print(f'    {module}.{function}{args!r}')
+
+    # The hashes of the files read for the plan are saved, so the run does
+    # not read the files again. The state is loaded again to keep the
+    # stages finished by a run in the meantime
+    files = state['files']
+    state = taq_data_tools_pipeline.taq_load_state(year)
+    state['files'].update(files)
+    taq_data_tools_pipeline.taq_save_state(state, year)
+
+    return plan
+
+# -----------------------------------------------------------------------------
+
+
+def taq_run_stage_pipeline_data(name, stage, year, workers, cpus,
+                                memory=None, tasks=None):
+    """Runs a stage of the pipeline.
+
+    The functions of the stage run in a new process in the taq_algorithms
+    folder of its module, in the same way as running the main module of the
+    stage. With the hashes of the tasks of the stage, the year functions of
+    a ticker or a pair of tickers of its analysis module skip the tasks
+    finished in a previous run. The workers, CPUs and memory of the stage
+    are set in the environment of the process. The BLAS and OpenMP libraries
+    read their number of threads when NumPy is imported, so the threads of
+    every worker are also set in the environment of the process, unless they
+    are already set.
+
+    :param name: string of the name of the stage (i.e. 'responses_physical').
+    :param stage: dictionary with the description of the stage.
+    :param year: string of the year to be analyzed (i.e '2016').
+    :param workers: integer with the number of workers of the stage.
+    :param cpus: integer with the number of CPUs of the stage.
+    :param memory: integer with the memory of the stage in MB. None uses the
+     memory limit of the stage (default None).
+    :param tasks: string of the path of the file with the hashes of the
+     tasks of the stage. None computes all the tasks (default None).
+    :return: int -- The function returns the exit code of the process.
+    """
+
+    tools = f'taq_data_tools_{stage["module"][4:]}'
+    analysis = f'taq_data_analysis_{stage["module"][4:]}'
+
+    code = [f'import {tools}',
+            f'if hasattr({tools}, "taq_start_folders"):',
+            f'    {tools}.taq_start_folders({year!r})']
+    if (tasks is not None):
+        code.extend(['import taq_data_tools_pool',
+                     f'import {analysis}',
+                     f'taq_data_tools_pool.taq_journal_tasks({analysis})'])
+    for module, function, args in stage['calls']:
+        code.append(f'import {module}')
+        code.append(f'{module}.{function}(*{args!r})')
+
+    env = dict(os.environ)
+    env['TAQ_WORKERS'] = str(workers)
+    env['TAQ_CPUS'] = str(cpus)
+    if (memory is not None):
+        env['TAQ_MEMORY_LIMIT'] = str(memory)
+    if (tasks is not None):
+        env['TAQ_TASKS'] = tasks
+    threads = str(max(1, cpus // workers))
+    for variable in ('OMP_NUM_THREADS', 'OPENBLAS_NUM_THREADS',
+                     'MKL_NUM_THREADS'):
+        env.setdefault(variable, threads)
+
+    print(f'Running the stage {name}')
+
+    return subprocess.run(
+        [sys.executable, '-c', '\n'.join(code)],
+        cwd=f'../../{stage["module"]}/taq_algorithms', env=env).returncode
+
+# -----------------------------------------------------------------------------
+
+
+def taq_run_pipeline_data(stages, year, processes=4, force=False,
+                          selected=None, workers=None, memory=None):
+    """Runs the stages of the pipeline that changed.
+
+    A stage runs when all the stages it depends on finished. Before running,
+    its hash is compared with the hash of its last successful run, and the
+    stage is skipped when they are equal and its outputs exist. In other
+    case, the tasks of a ticker or a pair of tickers of the stage that did
+    not change are skipped. The stages that depend on a stage that failed do
+    not run. The stages that are not selected run in other jobs, so they are
+    only used when their outputs exist.
+
+    The workers, CPUs and memory of the node are split between the stages
+    running at the same time. A stage gets its part of the free resources
+    when it starts, split between the stages that can still run with it (up
+    to the number of processes), and a stage waits until a running stage
+    returns its resources when all the workers are used, so the stages
+    together do not use more than the limits.
+
+    :param stages: dictionary with the stages of the pipeline.
+    :param year: string of the year to be analyzed (i.e '2016').
+    :param processes: integer with the number of stages that can run at the
+     same time (default 4).
+    :param force: bool to run all the stages (default False).
+    :param selected: list with the names of the stages to be run. None runs
+     all the stages (default None).
+    :param workers: integer with the number of workers of all the stages.
+     None uses the TAQ_WORKERS environment variable or the number of CPUs
+     (default None).
+    :param memory: integer with the memory of all the stages in MB. None uses
+     the TAQ_MEMORY_LIMIT environment variable or three quarters of the
+     memory of the node (default None).
+    :return: dictionary -- The function returns a dictionary with the state
+     ('skipped', 'done', 'failed', 'blocked', 'external' or 'missing') of
+     every stage.
+    """
+
+    function_name = taq_run_pipeline_data.__name__
+    taq_data_tools_pipeline \
+        .taq_function_header_print_data(function_name, 'all', year)
+
+    state = taq_data_tools_pipeline.taq_load_state(year)
+    result = {}
+    selected = set(stages if selected is None else selected)
+    pending = {name: stage for name, stage in stages.items()
+               if name in selected}
+    running = {}
+    hashes = {}
+
+    # Free resources of the node
+    workers, memory = taq_data_tools_pipeline \
+        .taq_node_resources(workers, memory)
+    free = {'workers': workers, 'cpus': max(os.cpu_count(), workers),
+            'memory': memory}
+
+    for name in set(stages) - selected:
+        if (taq_data_tools_pipeline.taq_outputs_exist(stages[name])):
+            result[name] = 'external'
+        else:
+            result[name] = 'missing'
+
+    with futures.ThreadPoolExecutor(max_workers=processes) as executor:
+
+        while (pending or running):
+
+            # Stages with all their dependencies finished
+            ready = [name for name, stage in pending.items()
+                     if all(result.get(dep) in ('skipped', 'done',
+                                                'external')
+                            for dep in stage['deps'])]
+            blocked = [name for name, stage in pending.items()
+                       if any(result.get(dep) in ('failed', 'blocked',
+                                                  'missing')
+                              for dep in stage['deps'])]
+
+            for name in blocked:
+                print(f'Stage {name} blocked')
+                result[name] = 'blocked'
+                del pending[name]
+
+            skipped = []
+            starts = []
+
+            for name in ready:
+                stage = pending[name]
+                if (name not in hashes):
+                    hashes[name] = taq_data_tools_pipeline \
+                        .taq_stage_hash(stage, state['files'])
+
+                if (not force
+                        and state['stages'].get(name) == hashes[name]
+                        and taq_data_tools_pipeline.taq_outputs_exist(stage)):
+                    print(f'Stage {name} up to date')
+                    result[name] = 'skipped'
+                    skipped.append(name)
+                    del pending[name]
+                else:
+                    starts.append(name)
+
+            # Every stage gets its share of the free resources when it
+            # starts, split between the stages that can still run with it,
+            # so a stage starting alone does not take the resources of the
+            # stages that start later
+            slots = min(processes - len(running), len(pending))
+            starts = starts[:min(slots, free['workers'])]
+            if (starts):
+                share = {key: value if value is None
+                         else max(1, value // slots)
+                         for key, value in free.items()}
+
+            for name in starts:
+                stage = pending.pop(name)
+                tasks = None
+                if ('tickers' in stage):
+                    tasks = taq_data_tools_pipeline.taq_save_tasks(
+                        name, taq_data_tools_pipeline
+                        .taq_stage_tasks(stage, state['files']), year, force)
+
+                future = executor.submit(taq_run_stage_pipeline_data,
+                                         name, stage, year,
+                                         share['workers'], share['cpus'],
+                                         share['memory'], tasks)
+                running[future] = (name, share)
+                for key, value in share.items():
+                    if (value is not None):
+                        free[key] -= value
+
+            if (skipped or blocked):
+                continue
+
+            if (not running):
+                # Dependencies that are not stages of the pipeline
+                for name in pending:
+                    print(f'Stage {name} blocked')
+                    result[name] = 'blocked'
+                break
+
+            finished, _ = futures.wait(running,
+                                       return_when=futures.FIRST_COMPLETED)
+
+            for future in finished:
+                name, share = running.pop(future)
+                for key, value in share.items():
+                    if (value is not None):
+                        free[key] += value
+
+                if (future.result() == 0):
+                    result[name] = 'done'
+                    state['stages'][name] = hashes[name]
+                else:
+                    print(f'Stage {name} failed')
+                    result[name] = 'failed'
+                    state['stages'].pop(name, None)
+
+                taq_data_tools_pipeline.taq_save_state(state, year)
+
+    taq_data_tools_pipeline.taq_save_state(state, year)
+
+    return result
+
+# -----------------------------------------------------------------------------
+
+
+def taq_arguments_pipeline_data(argv=None):
+    """Reads the arguments of the command line.
+
+    :param argv: list of strings with the arguments. None uses the arguments
+     of the script (default None).
+    :return: Namespace -- The function returns the arguments.
+    """
+
+    parser = argparse.ArgumentParser(
+        description='Runs the stages of the TAQ analysis pipeline.')
+    parser.add_argument('--tickers', nargs='+', default=['AAPL', 'GOOG'],
+                        help='stocks to be analyzed')
+    parser.add_argument('--universe',
+                        help='file with a stock per line, used instead of '
+                        + '--tickers')
+    parser.add_argument('--years', nargs='+', default=['2008'],
+                        help='years or ranges of years (i.e. 2008 '
+                        + '2010-2012)')
+    parser.add_argument('--phases', nargs='+', default=['preprocess',
+                                                         'analyze', 'plot'],
+                        choices=['extract', 'preprocess', 'analyze', 'plot'],
+                        help='phases of the stages to be run')
+    parser.add_argument('--stages', nargs='+',
+                        help='names of the stages to be run (i.e. '
+                        + 'responses_physical statistics)')
+    parser.add_argument('--taus', nargs='+', type=int,
+                        default=[1, 10, 100, 1000],
+                        help='taus of the shift modules')
+    parser.add_argument('--shifts', nargs='+', type=int, default=[10, 100],
+                        help='shifts of the responses shift modules')
+    parser.add_argument('--tau', type=int, default=1000,
+                        help='tau of the short and long responses')
+    parser.add_argument('--taus-p', nargs='+', type=int,
+                        default=list(range(10, 101, 10)),
+                        help="tau' of the short and long responses")
+    parser.add_argument('--executor',
+                        choices=['processes', 'threads', 'serial'],
+                        help='executor of the year functions')
+    parser.add_argument('--workers', type=int,
+                        help='workers of the pools, split between the stages '
+                        + 'running at the same time')
+    parser.add_argument('--memory', type=int,
+                        help='memory of the running tasks in MB, split '
+                        + 'between the stages running at the same time and '
+                        + 'used to limit the tasks running at the same time '
+                        + 'and the chunks of the extraction')
+    parser.add_argument('--cache', type=int,
+                        help='memory of the cache of day arrays of every '
+                        + 'worker in MB')
+    parser.add_argument('--processes', type=int, default=4,
+                        help='stages running at the same time')
+    parser.add_argument('--force', action='store_true',
+                        help='run the stages that did not change')
+    parser.add_argument('--dry-run', action='store_true',
+                        help='print the plan without running it')
+
+    return parser.parse_args(argv)
+
+# -----------------------------------------------------------------------------
+
+
+def main():
+    """The main function of the script.
+
+    The main function runs the stages of the pipeline selected in the
+    command line for every year. For example, the analysis of the stocks of
+    a file in a large node and the plots in other job:
+
+        python3 taq_data_main_pipeline.py --universe stocks.txt \\
+            --years 2008-2010 --phases preprocess analyze --workers 32 \\
+            --memory 65536
+        python3 taq_data_main_pipeline.py --universe stocks.txt \\
+            --years 2008-2010 --phases plot
+
+    :return: None.
+    """
+
+    args = taq_arguments_pipeline_data()
+
+    # Tickers and years to analyze
+    if (args.universe):
+        tickers = taq_data_tools_pipeline.taq_read_tickers(args.universe)
+    else:
+        tickers = args.tickers
+    years = taq_data_tools_pipeline.taq_years(args.years)
+
+    # The paths of the stages are relative to this folder
+    os.chdir(os.path.dirname(os.path.abspath(__file__)))
+
+    # The stages run in new processes with the executor and the cache limit.
+    # The workers and the memory are split between the running stages
+    if (args.executor):
+        os.environ['TAQ_EXECUTOR'] = args.executor
+    if (args.cache):
+        os.environ['TAQ_CACHE_LIMIT'] = str(args.cache)
+
+    # Initial message
+    taq_data_tools_pipeline.taq_initial_message()
+
+    failed = False
+
+    for year in years:
+
+        stages = taq_stages_pipeline_data(tickers, year, args.taus,
+                                          args.shifts, args.tau, args.taus_p,
+                                          extract='extract' in args.phases)
+        selected = taq_select_pipeline_data(stages, args.phases, args.stages)
+
+        # Basic folders
+        taq_data_tools_pipeline.taq_start_folders(year)
+
+        if (args.dry_run):
+            taq_plan_pipeline_data(stages, year, selected, args.force)
+            continue
+
+        # Run analysis
+        result = taq_run_pipeline_data(stages, year, args.processes,
+                                       args.force, selected, args.workers,
+                                       args.memory)
+
+        for name, status in result.items():
+            print(f'{year} {name}: {status}')
+            failed = failed or status in ('failed', 'blocked')
+
+    print('Ay vamos!!!')
+
+    if (failed):
+        sys.exit(1)
+
+    return None
+
+# -----------------------------------------------------------------------------
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,496 @@
+'''TAQ data tools module.
+
+The functions in the module do small repetitive tasks, that are used along the
+whole implementation. These tools improve the way the tasks are standardized
+in the modules that use them.
+
+This script requires the following modules:
+    * glob
+    * hashlib
+    * json
+    * os
+    * re
+
+The module contains the following functions:
+    * taq_file_hash - computes the hash of the content of a file.
+    * taq_paths_hash - computes the hash of the content of files and folders.
+    * taq_tickers_hash - computes the hash of the files of every ticker.
+    * taq_stage_code - returns the code files of a stage of the pipeline.
+    * taq_stage_hash - computes the hash of a stage of the pipeline.
+    * taq_stage_tasks - computes the hashes of the tasks of a stage.
+    * taq_save_tasks - saves the hashes of the tasks of a stage.
+    * taq_outputs_exist - checks the outputs of a stage.
+    * taq_load_state - loads the state of the pipeline.
+    * taq_save_state - saves the state of the pipeline.
+    * taq_read_tickers - reads the stocks of a universe file.
+    * taq_years - reads the years and ranges of years of the command line.
+    * taq_node_resources - returns the workers and the memory of the node.
+    * taq_function_header_print_data - prints info about the function running.
+    * taq_start_folders - creates folders to save data.
+    * taq_initial_message - prints the initial message with basic information.
+    * main - the main function of the script.
+
+.. moduleauthor:: Juan Camilo Henao Londono <www.github.com/juanhenao21>
+'''
+
+# -----------------------------------------------------------------------------
+# Modules
+
+import glob
+import hashlib
+import json
+import os
+import re
+
+# -----------------------------------------------------------------------------
+
+
+def taq_file_hash(path, cache):
+    """Computes the hash of the content of a file.
+
+    The hash of a file is only computed again when its size or modification
+    time changes, so a file is read once while it is not modified.
+
+    :param path: string of the path of the file.
+    :param cache: dictionary with the size, modification time and hash of the
+     files already read. It is updated with the file.
+    :return: string -- The function returns the hexadecimal sha256 hash of the
+     file.
+    """
+
+    stat = os.stat(path)
+    key = [stat.st_size, stat.st_mtime_ns]
+
+    if (path in cache and cache[path][:2] == key):
+        return cache[path][2]
+
+    file_hash = hashlib.sha256()
+    with open(path, 'rb') as file:
+        for block in iter(lambda: file.read(2 ** 20), b''):
+            file_hash.update(block)
+
+    cache[path] = key + [file_hash.hexdigest()]
+
+    return cache[path][2]
+
+# -----------------------------------------------------------------------------
+
+
+def taq_paths_hash(paths, cache):
+    """Computes the hash of the content of files and folders.
+
+    The folders are walked and all their files are used. A path that does not
+    exist changes the hash in the same way as an empty one.
+
+    :param paths: list of strings of the paths of files or folders.
+    :param cache: dictionary with the size, modification time and hash of the
+     files already read.
+    :return: string -- The function returns the hexadecimal sha256 hash of the
+     paths.
+    """
+
+    paths_hash = hashlib.sha256()
+
+    for path in paths:
+
+        paths_hash.update(path.encode())
+
+        if (os.path.isdir(path)):
+            files = sorted(glob.glob(f'{path}/**', recursive=True))
+        elif (os.path.isfile(path)):
+            files = [path]
+        else:
+            paths_hash.update(b'missing')
+            files = []
+
+        for file in files:
+            if (os.path.isfile(file)):
+                paths_hash.update(file.encode())
+                paths_hash.update(taq_file_hash(file, cache).encode())
+
+    return paths_hash.hexdigest()
+
+# -----------------------------------------------------------------------------
+
+
+def taq_tickers_hash(paths, tickers, cache):
+    """Computes the hash of the files of every ticker and pair of tickers.
+
+    The tickers of a file are read from its name (i.e.
+    taq_AAPL_quotes_2008-01-02.h5 or taq_data_2008_AAPLi_MSFTj.pickle). The
+    files without tickers, as the catalog, are built from the files of the
+    tickers, so they are not used.
+
+    :param paths: list of strings of the paths of files or folders.
+    :param tickers: list of the string abbreviation of the stocks (i.e.
+     ['AAPL', 'MSFT']).
+    :param cache: dictionary with the size, modification time and hash of the
+     files already read.
+    :return: dictionary -- The function returns a dictionary with the
+     hexadecimal sha256 hash of the files of every ticker and pair of tickers
+     (i.e. keys 'AAPL' and 'AAPL MSFT', with the tickers sorted).
+    """
+
+    tickers = set(tickers)
+    hashes = {}
+
+    for path in paths:
+
+        if (os.path.isdir(path)):
+            files = sorted(glob.glob(f'{path}/**', recursive=True))
+        else:
+            files = [path]
+
+        for file in files:
+            if (not os.path.isfile(file)):
+                continue
+
+            names = set()
+            for token in re.split(r'[_.]', os.path.basename(file)):
+                if (token in tickers):
+                    names.add(token)
+                elif (token[:-1] in tickers and token[-1:] in ('i', 'j')):
+                    names.add(token[:-1])
+
+            if (names):
+                key = ' '.join(sorted(names))
+                hashes.setdefault(key, hashlib.sha256())
+                hashes[key].update(file.encode())
+                hashes[key].update(taq_file_hash(file, cache).encode())
+
+    return {key: value.hexdigest() for key, value in hashes.items()}
+
+# -----------------------------------------------------------------------------
+
+
+def taq_stage_code(stage):
+    """Returns the code files of a stage of the pipeline.
+
+    The plot stages use the main, tools and plot modules of their module and
+    the other stages use the main, tools and analysis modules. All the
+    stages use the taq_pool module imported by the tools.
+
+    :param stage: dictionary with the description of the stage.
+    :return: list -- The function returns a list with the paths of the code
+     files of the stage.
+    """
+
+    if (stage['phase'] == 'plot'):
+        kinds = ('main', 'tools', 'plot')
+    else:
+        kinds = ('main', 'tools', 'analysis')
+
+    return [f'../../{stage["module"]}/taq_algorithms/taq_data_{kind}'
+            + f'_{stage["module"][4:]}.py' for kind in kinds] \
+        + ['../../taq_pool/taq_algorithms/taq_data_tools_pool.py']
+
+# -----------------------------------------------------------------------------
+
+
+def taq_stage_hash(stage, cache):
+    """Computes the hash of a stage of the pipeline.
+
+    The hash depends on the functions and parameters of the stage (i.e. the
+    tickers, tau, shifts and tau'), the code files of the stage and the
+    content of its inputs.
+
+    :param stage: dictionary with the description of the stage.
+    :param cache: dictionary with the size, modification time and hash of the
+     files already read.
+    :return: string -- The function returns the hexadecimal sha256 hash of the
+     stage.
+    """
+
+    stage_hash = hashlib.sha256()
+    stage_hash.update(repr(stage['calls']).encode())
+    stage_hash.update(taq_paths_hash(taq_stage_code(stage), cache).encode())
+    stage_hash.update(taq_paths_hash(stage['inputs'], cache).encode())
+
+    return stage_hash.hexdigest()
+
+# -----------------------------------------------------------------------------
+
+
+def taq_stage_tasks(stage, cache):
+    """Computes the hashes of the tasks of a stage.
+
+    The tasks of a stage are the computations of a ticker or a pair of
+    tickers in a year. The hash of a task depends on the code files and the
+    parameters of the stage without its tickers, which are in the base hash,
+    and on the content of the input files of the tickers of the task, so
+    adding a ticker to the stage does not change the tasks of the other
+    tickers.
+
+    :param stage: dictionary with the description of the stage.
+    :param cache: dictionary with the size, modification time and hash of the
+     files already read.
+    :return: dictionary -- The function returns a dictionary with the tickers
+     of the stage, the base hash and the hash of the files of every ticker
+     and pair of tickers.
+    """
+
+    calls = [(module, function,
+              tuple(None if arg == stage['tickers'] else arg for arg in args))
+             for module, function, args in stage['calls']]
+
+    base_hash = hashlib.sha256()
+    base_hash.update(repr(calls).encode())
+    base_hash.update(taq_paths_hash(taq_stage_code(stage), cache).encode())
+
+    return {'names': stage['tickers'],
+            'base': base_hash.hexdigest(),
+            'tickers': taq_tickers_hash(stage['inputs'], stage['tickers'],
+                                        cache)}
+
+# -----------------------------------------------------------------------------
+
+
+def taq_save_tasks(name, tasks, year, force=False):
+    """Saves the hashes of the tasks of a stage.
+
+    The tasks finished by the stage are recorded in a journal next to the
+    hashes, so they are skipped in the next runs while their hashes do not
+    change.
+
+    :param name: string of the name of the stage (i.e. 'responses_physical').
+    :param tasks: dictionary with the hashes of the tasks of the stage.
+    :param year: string of the year to be analyzed (i.e '2016').
+    :param force: bool to remove the journal, so all the tasks run (default
+     False).
+    :return: string -- The function returns the path of the file with the
+     hashes.
+    """
+
+    path = f'../../taq_data/pipeline_data_{year}/taq_tasks_{name}_{year}'
+    tasks = dict(tasks, journal=f'{path}_journal.txt')
+
+    if (force and os.path.isfile(tasks['journal'])):
+        os.remove(tasks['journal'])
+
+    with open(f'{path}.json.tmp', 'w') as file:
+        json.dump(tasks, file)
+    os.replace(f'{path}.json.tmp', f'{path}.json')
+
+    return f'{path}.json'
+
+# -----------------------------------------------------------------------------
+
+
+def taq_outputs_exist(stage):
+    """Checks the outputs of a stage.
+
+    :param stage: dictionary with the description of the stage.
+    :return: bool -- The function returns True if all the output files and
+     folders of the stage exist and the folders are not empty.
+    """
+
+    for path in stage['outputs']:
+        if (os.path.isdir(path)):
+            if (not os.listdir(path)):
+                return False
+        elif (not os.path.isfile(path)):
+            return False
+
+    return True
+
+# -----------------------------------------------------------------------------
+
+
+def taq_load_state(year):
+    """Loads the state of the pipeline.
+
+    :param year: string of the year to be analyzed (i.e '2016').
+    :return: dictionary -- The function returns a dictionary with the hash of
+     the stages that finished and the hash of the files already read.
+    """
+
+    try:
+        with open(f'../../taq_data/pipeline_data_{year}/taq_pipeline_state'
+                  + f'_{year}.json', 'r') as file:
+            return json.load(file)
+
+    except FileNotFoundError:
+        return {'stages': {}, 'files': {}}
+
+# -----------------------------------------------------------------------------
+
+
+def taq_save_state(state, year):
+    """Saves the state of the pipeline.
+
+    The state is written in a temporary file that replaces the old state, so
+    an interrupted run does not leave a truncated state.
+
+    :param state: dictionary with the hash of the stages that finished and the
+     hash of the files already read.
+    :param year: string of the year to be analyzed (i.e '2016').
+    :return: None -- The function saves the state in a file and does not
+     return a value.
+    """
+
+    path = f'../../taq_data/pipeline_data_{year}/taq_pipeline_state_{year}' \
+        + '.json'
+
+    with open(f'{path}.tmp', 'w') as file:
+        json.dump(state, file)
+    os.replace(f'{path}.tmp', path)
+
+    return None
+
+# -----------------------------------------------------------------------------
+
+
+def taq_read_tickers(path):
+    """Reads the stocks of a universe file.
+
+    The file has a stock per line. The empty lines and the lines starting
+    with '#' are not used.
+
+    :param path: string of the path of the file.
+    :return: list -- The function returns a list with the string abbreviation
+     of the stocks (i.e. ['AAPL', 'MSFT']).
+    """
+
+    with open(path, 'r') as file:
+        lines = [line.strip() for line in file]
+
+    return [line for line in lines if line and not line.startswith('#')]
+
+# -----------------------------------------------------------------------------
+
+
+def taq_years(items):
+    """Reads the years and ranges of years of the command line.
+
+    :param items: list of strings of years or ranges of years (i.e. ['2008',
+     '2010-2012']).
+    :return: list -- The function returns a list with the string of every
+     year (i.e. ['2008', '2010', '2011', '2012']).
+    """
+
+    years = []
+
+    for item in items:
+        first, _, last = item.partition('-')
+        for year in range(int(first), int(last or first) + 1):
+            if (str(year) not in years):
+                years.append(str(year))
+
+    return years
+
+# -----------------------------------------------------------------------------
+
+
+def taq_node_resources(workers=None, memory=None):
+    """Returns the workers and the memory of the node.
+
+    The values not given are read from the TAQ_WORKERS and TAQ_MEMORY_LIMIT
+    environment variables, and when they are not set, the number of CPUs and
+    three quarters of the memory of the node are used, as in the pools of the
+    stages.
+
+    :param workers: integer with the number of workers (default None).
+    :param memory: integer with the memory in MB (default None).
+    :return: tuple -- The function returns a tuple with the number of workers
+     and the memory in MB, or None when the memory of the node is unknown.
+    """
+
+    workers = workers or int(os.environ.get('TAQ_WORKERS', 0)) \
+        or os.cpu_count()
+    memory = memory or int(os.environ.get('TAQ_MEMORY_LIMIT', 0)) or None
+
+    if (memory is None):
+        try:
+            memory = os.sysconf('SC_PHYS_PAGES') \
+                * os.sysconf('SC_PAGE_SIZE') * 3 // 4 // 2 ** 20
+
+        except (AttributeError, OSError, ValueError):
+            pass
+
+    return workers, memory
+
+# -----------------------------------------------------------------------------
+
+
+def taq_function_header_print_data(function_name, stage, year):
+    """Prints a header of a function that generates data when it is running.
+
+    :param function_name: name of the function that generates the data.
+    :param stage: string of the name of the stage (i.e. 'responses_physical').
+    :param year: string of the year to be analyzed (i.e '2016').
+    :return: None -- The function prints a message and does not return a
+     value.
+    """
+
+    print('TAQ data')
+    print(function_name)
+    print(f'Processing the stage {stage} of the year {year}.')
+
+    return None
+
+# -----------------------------------------------------------------------------
+
+
+def taq_start_folders(year):
+    """Creates the initial folders to save the data.
+
+    :param year: string of the year to be analyzed (i.e '2016').
+    :return: None -- The function creates folders and does not return a value.
+    """
+
+    try:
+        os.mkdir(f'../../taq_data/pipeline_data_{year}')
+        print('Folder to save data created')
+        print()
+
+    except FileExistsError as e:
+        print('Folder exists. The folder was not created')
+        print(e)
+
+    return None
+
+# -----------------------------------------------------------------------------
+
+
+def taq_initial_message():
+    """Prints the initial message with basic information.
+
+    :return: None -- The function prints a message and does not return a value.
+    """
+
+    print()
+    print('#####################')
+    print('TAQ Analysis Pipeline')
+    print('#####################')
+    print('AG Guhr')
+    print('Faculty of Physics')
+    print('University of Duisburg-Essen')
+    print('Author: Juan Camilo Henao Londono')
+    print('More information in:')
+    print('* https://juanhenao21.github.io/')
+    print('* https://github.com/juanhenao21/financial_response_spread_year')
+    print('* https://financial-response-spread-year.readthedocs.io/en/latest/')
+    print()
+
+    return None
+
+# -----------------------------------------------------------------------------
+
+
+def main():
+    """The main function of the script.
+
+    The main function is used to test the functions in the script.
+
+    :return: None.
+    """
+
+    pass
+
+    return None
+
+# -----------------------------------------------------------------------------
+
+
+if __name__ == '__main__':
+    main()
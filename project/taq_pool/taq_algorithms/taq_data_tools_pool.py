@@ -0,0 +1,1187 @@
+'''TAQ data pool module.
+
+The functions in the module run the days of the year functions of all the
+taq_* modules. They set the executor and the memory limit of the pools,
+dispatch the tasks from the largest to the smallest within the memory budget
+and read the catalog of the tick store used to plan the tasks. The modules
+that run the pools import them, so all the modules share the same pools. The
+pipeline also uses them to skip the tasks of a ticker or a pair of tickers
+finished in a previous run, and to keep the checkpoints of the days of a
+year function until it saves its results.
+
+This script requires the following modules:
+    * contextlib
+    * functools
+    * hashlib
+    * inspect
+    * itertools
+    * json
+    * multiprocessing
+    * numpy
+    * os
+    * pandas
+    * pickle
+    * queue
+    * threading
+    * threadpoolctl
+    * types
+
+The module contains the following functions:
+    * taq_executor - sets the executor of the year functions.
+    * taq_memory_size - sets the memory limit of the tasks of the pools.
+    * taq_memory_limit - returns the memory limit of the tasks of the pools.
+    * taq_memory_budget - returns the memory of the running tasks of a pool.
+    * taq_blas_threads - sets the number of threads of the BLAS libraries.
+    * taq_atomic_dump - saves data in a file replaced in one step.
+    * taq_checkpoint_name - finds the checkpoint of a task.
+    * taq_checkpoint_journal - reads the finished tasks of a checkpoints
+      folder.
+    * taq_checkpoint_call - computes a task and saves its checkpoint.
+    * taq_checkpoint_map - loads the finished tasks of a list of tasks.
+    * taq_checkpoint_clear - removes the checkpoints of finished tasks.
+    * taq_serial_starmap - computes a function for every tuple of arguments.
+    * taq_task_data - finds the tickers and the date of a task.
+    * taq_task_cost - estimates the cost of a task from the size of its data.
+    * taq_task_memory - estimates the peak memory of a task.
+    * taq_indexed_task - computes a task and returns it with its index.
+    * taq_starmap - computes the tasks from the largest to the smallest.
+    * taq_workers - returns the number of workers of the pools.
+    * taq_pool - opens a pool with the executor of the year functions.
+    * taq_read_hdf - reads a HDF5 file.
+    * taq_business_days - creates a list of week days for a year.
+    * taq_load_catalog - loads the catalog of the tick store of a year.
+    * taq_catalog_days - lists the days with data of a ticker.
+    * taq_catalog_dates - lists the days with data of a group of tickers.
+    * taq_store_load - loads the results store of a function in a year.
+    * taq_store_pickle - loads the year result of a pair from its pickle file.
+    * taq_store_query - loads the year results of several tickers or pairs in
+      one array.
+    * taq_task_hash - computes the hash of a task of the pipeline.
+    * taq_task_done - checks if a task finished in a previous run.
+    * taq_task_record - records a finished task in the journal.
+    * taq_journal_task - skips the finished tasks of a year function.
+    * taq_journal_tasks - skips the finished tasks of a module.
+    * taq_checkpoint_task - keeps the checkpoints of the days of a year
+      function until it finishes.
+    * taq_checkpoint_tasks - keeps the checkpoints of the days of the year
+      functions of a module.
+    * main - the main function of the script.
+
+.. moduleauthor:: Juan Camilo Henao Londono <www.github.com/juanhenao21>
+'''
+
+# -----------------------------------------------------------------------------
+# Modules
+
+from contextlib import contextmanager, nullcontext
+from functools import partial, wraps
+import hashlib
+import inspect
+from itertools import combinations
+import json
+import multiprocessing as mp
+from multiprocessing.pool import ThreadPool
+import numpy as np
+import os
+import pandas as pd
+import pickle
+import queue
+import threading
+from types import SimpleNamespace
+
+try:
+    from threadpoolctl import threadpool_limits
+except ImportError:
+    threadpool_limits = None
+
+# Executor of the year functions ('processes', 'threads' or 'serial'),
+# number of workers and number of CPUs split between the workers and their
+# threads (TAQ_CPUS, set by the pipeline for the stages running at the same
+# time). None uses the number of CPUs
+__executor__ = {'executor': os.environ.get('TAQ_EXECUTOR', 'processes'),
+                'workers': int(os.environ.get('TAQ_WORKERS', 0)) or None,
+                'cpus': int(os.environ.get('TAQ_CPUS', 0)) or None}
+
+# Memory limit of the running tasks of the pools in bytes (TAQ_MEMORY_LIMIT
+# environment variable in MB). None uses three quarters of the memory of the
+# node
+__memory__ = {'limit': int(os.environ.get('TAQ_MEMORY_LIMIT', 0)) * 2 ** 20
+              or None}
+# Estimated peak memory in bytes of a row of quotes and trades of a day, with
+# the 64 bits columns, the date index and the copies made by the filters,
+# and of the day arrays of a ticker
+__row_bytes__ = {'quotes': 144, 'trades': 96}
+__day_bytes__ = 2 ** 20
+# The HDF5 library is not thread safe, so all the modules of a process use
+# the same lock
+__hdf5_lock__ = threading.Lock()
+
+# Catalog of the tick store of every year with the modification time of its
+# file and the number of rows and estimated memory of every ticker and date
+__catalog__ = {}
+
+# Results stores of the year functions of the responses_physical module with
+# the modification time of their files
+__store__ = {}
+
+# Checkpoints of the days computed by the pools of the year function running
+# in a thread. The tasks are None when the checkpoints are not used
+__checkpoint__ = threading.local()
+
+# Hashes of the tasks of the stage of the pipeline running the module
+# (TAQ_TASKS environment variable with the path of their file) and tasks
+# recorded in its journal. None computes all the tasks
+__tasks__ = {'path': os.environ.get('TAQ_TASKS'), 'hashes': None,
+             'done': None}
+
+# -----------------------------------------------------------------------------
+
+
+def taq_executor(executor, workers=None):
+    """Sets the executor of the year functions.
+
+    The days of the year functions run in a pool of processes, a pool of
+    threads or one after the other in the current thread. The NumPy
+    functions release the GIL, so the threads avoid starting processes and
+    copying the arguments and results of every day. The executor can also be
+    set with the TAQ_EXECUTOR and TAQ_WORKERS environment variables.
+
+    :param executor: string of the executor ('processes', 'threads' or
+     'serial').
+    :param workers: integer with the number of processes or threads. None
+     uses the number of CPUs (default None).
+    :return: None -- The function sets the executor and does not return a
+     value.
+    """
+
+    assert executor in ('processes', 'threads', 'serial')
+
+    __executor__['executor'] = executor
+    __executor__['workers'] = workers
+
+    return None
+
+# -----------------------------------------------------------------------------
+
+
+def taq_memory_size(limit):
+    """Sets the memory limit of the tasks of the pools.
+
+    The running tasks of a pool use at most the limit, using the estimated
+    memory of every task. The limit can also be set with the
+    TAQ_MEMORY_LIMIT environment variable in MB.
+
+    :param limit: integer with the memory in bytes (i.e. 2 ** 34). None uses
+     three quarters of the memory of the node.
+    :return: None -- The function sets the limit and does not return a value.
+    """
+
+    __memory__['limit'] = limit
+
+    return None
+
+# -----------------------------------------------------------------------------
+
+
+def taq_memory_limit():
+    """Returns the memory limit of the tasks of the pools.
+
+    :return: int -- The function returns the memory limit in bytes, or None
+     when the limit is not set and the memory of the node is unknown.
+    """
+
+    if (__memory__['limit'] is not None):
+        return __memory__['limit']
+
+    try:
+        return os.sysconf('SC_PHYS_PAGES') * os.sysconf('SC_PAGE_SIZE') \
+            * 3 // 4
+
+    except (AttributeError, OSError, ValueError):
+        return None
+
+# -----------------------------------------------------------------------------
+
+
+def taq_memory_budget(workers, cache=0):
+    """Returns the memory of the running tasks of a pool.
+
+    The caches of day arrays of the workers are not part of the tasks, so
+    their limits are taken from the memory limit. Every process has its own
+    cache and the threads share the cache of their process.
+
+    :param workers: integer with the number of workers of the pool.
+    :param cache: integer with the memory limit in bytes of the cache of a
+     process (default 0).
+    :return: int -- The function returns the memory budget in bytes, or None
+     when the memory is not limited.
+    """
+
+    limit = taq_memory_limit()
+
+    if (limit is None):
+        return None
+
+    caches = workers if __executor__['executor'] == 'processes' else 1
+
+    return max(0, limit - caches * cache)
+
+# -----------------------------------------------------------------------------
+
+
+def taq_blas_threads(threads):
+    """Sets the number of threads of the BLAS and OpenMP libraries.
+
+    The libraries of the process are limited with threadpoolctl, so the
+    workers of a pool and the threads of the libraries do not use more
+    threads than CPUs. Without threadpoolctl, the libraries use the
+    OMP_NUM_THREADS, OPENBLAS_NUM_THREADS and MKL_NUM_THREADS environment
+    variables read when NumPy is imported, which the pipeline sets for every
+    stage.
+
+    :param threads: integer with the number of threads of the libraries.
+    :return: The function returns the threadpoolctl limits or a context
+     that does nothing when threadpoolctl is not installed.
+    """
+
+    if (threadpool_limits is None):
+        return nullcontext()
+
+    return threadpool_limits(limits=threads)
+
+# -----------------------------------------------------------------------------
+
+
+def taq_atomic_dump(data, file_name, form='pickle'):
+    """Saves data in a file replaced in one step.
+
+    The data is written in a temporary file of the process and thread that
+    replaces the old file, so an interrupted run does not leave a truncated
+    file and the writers of the same file do not use the same temporary file.
+
+    :param data: data to be saved. A pandas DataFrame for the 'csv' form and
+     a string for the 'text' form.
+    :param file_name: string of the path of the file.
+    :param form: string with the format of the file ('pickle', 'csv' or
+     'text', default 'pickle').
+    :return: None -- The function saves the data in a file and does not return
+     a value.
+    """
+
+    assert form in ('pickle', 'csv', 'text')
+
+    temp_name = f'{file_name}.{os.getpid()}.{threading.get_ident()}.tmp'
+
+    if (form == 'csv'):
+        data.to_csv(temp_name, index=False)
+
+    elif (form == 'text'):
+        with open(temp_name, 'w') as file:
+            file.write(data)
+
+    else:
+        with open(temp_name, 'wb') as file:
+            pickle.dump(data, file)
+
+    os.replace(temp_name, file_name)
+
+    return None
+
+# -----------------------------------------------------------------------------
+
+
+def taq_checkpoint_name(function, args, date):
+    """Finds the checkpoint of a task.
+
+    The checkpoints of a day function are in a folder of the year of the
+    task, with the hash of the arguments of the task as name.
+
+    :param function: day function of the task.
+    :param args: tuple with the arguments of the task (i.e. ('AAPL',
+     '2008-01-02')).
+    :param date: integer with the position of the argument with the date of
+     the task (i.e. 1).
+    :return: tuple -- The function returns a tuple with the folder and the
+     name of the checkpoint.
+    """
+
+    folder = f'../../taq_data/taq_checkpoints_{args[date][:4]}/' \
+        + f'{function.__name__}'
+    key = hashlib.sha1(pickle.dumps(args, protocol=4)).hexdigest()
+
+    return (folder, key)
+
+# -----------------------------------------------------------------------------
+
+
+def taq_checkpoint_journal(folder):
+    """Reads the finished tasks of a checkpoints folder.
+
+    :param folder: string of the path of the checkpoints folder.
+    :return: set -- The function returns a set with the names of the
+     checkpoints of the finished tasks.
+    """
+
+    try:
+        with open(f'{folder}/journal.txt', 'r') as journal:
+            # A line cut by an interrupted run is not a finished task
+            return set(line.strip() for line in journal
+                       if line.endswith('\n'))
+
+    except FileNotFoundError:
+        return set()
+
+# -----------------------------------------------------------------------------
+
+
+def taq_checkpoint_call(function, folder, key, *args):
+    """Computes a task and saves its checkpoint.
+
+    :param function: day function of the task.
+    :param folder: string of the path of the checkpoints folder.
+    :param key: string of the name of the checkpoint.
+    :param args: arguments of the function.
+    :return: The function returns the result of the function.
+    """
+
+    result = function(*args)
+
+    taq_atomic_dump(result, f'{folder}/{key}.pickle')
+
+    # The task is recorded after its result is saved
+    with open(f'{folder}/journal.txt', 'a') as journal:
+        journal.write(f'{key}\n')
+
+    return result
+
+# -----------------------------------------------------------------------------
+
+
+def taq_checkpoint_map(function, args_prod, date=None):
+    """Loads the finished tasks of a list of tasks.
+
+    When a year function keeps the checkpoints of its days, the tasks with a
+    date finished in a previous run are loaded from their checkpoints and the
+    other tasks save their checkpoints when they finish.
+
+    :param function: day function of the tasks.
+    :param args_prod: list of tuples with the arguments of the function.
+    :param date: integer with the position of the argument with the date of
+     the tasks (default None).
+    :return: tuple -- The function returns a tuple with a dictionary with the
+     result of every finished task (index keys) and a list with the function
+     that computes every task.
+    """
+
+    tasks = getattr(__checkpoint__, 'tasks', None)
+
+    if (tasks is None or date is None):
+        return ({}, [function] * len(args_prod))
+
+    results = {}
+    functions = []
+    journals = {}
+
+    for index, args in enumerate(args_prod):
+        folder, key = taq_checkpoint_name(function, args, date)
+        tasks.append((folder, key))
+
+        if (folder not in journals):
+            os.makedirs(folder, exist_ok=True)
+            journals[folder] = taq_checkpoint_journal(folder)
+
+        if (key in journals[folder]):
+            with open(f'{folder}/{key}.pickle', 'rb') as file:
+                results[index] = pickle.load(file)
+        functions.append(partial(taq_checkpoint_call, function, folder, key))
+
+    if (results):
+        print(f'{len(results)} tasks of {function.__name__} finished in a '
+              + 'previous run')
+
+    return (results, functions)
+
+# -----------------------------------------------------------------------------
+
+
+def taq_checkpoint_clear(tasks):
+    """Removes the checkpoints of finished tasks.
+
+    The checkpoints of other tasks in the same folders are kept, so the runs
+    of other year functions can still continue from them.
+
+    :param tasks: list of tuples with the folder and the name of the
+     checkpoint of every task.
+    :return: None -- The function removes files and does not return a value.
+    """
+
+    folders = {}
+    for folder, key in tasks:
+        folders.setdefault(folder, set()).add(key)
+
+    for folder, keys in folders.items():
+
+        for key in keys:
+            try:
+                os.remove(f'{folder}/{key}.pickle')
+
+            except FileNotFoundError:
+                pass
+
+        remaining = taq_checkpoint_journal(folder) - keys
+
+        if (remaining):
+            taq_atomic_dump(''.join(f'{key}\n' for key in sorted(remaining)),
+                            f'{folder}/journal.txt', form='text')
+
+        else:
+            try:
+                os.remove(f'{folder}/journal.txt')
+                os.rmdir(folder)
+                # The folder of the year is removed with its last folder
+                os.rmdir(os.path.dirname(folder))
+
+            except OSError:
+                pass
+
+    return None
+
+# -----------------------------------------------------------------------------
+
+
+def taq_serial_starmap(function, args_prod, tickers=(), date=None,
+                       data='raw'):
+    """Computes a function for every tuple of arguments in the current thread.
+
+    The tasks run in the order of the arguments, so the model of their data
+    is not used. The tasks finished in a previous run of the year function
+    are loaded from their checkpoints.
+
+    :param function: function to be computed.
+    :param args_prod: iterable of tuples with the arguments of the function.
+    :param tickers: tuple with the positions of the arguments with the
+     tickers of the tasks (default ()).
+    :param date: integer with the position of the argument with the date of
+     the tasks (default None).
+    :param data: string with the data loaded by the tasks ('raw' or
+     'arrays', default 'raw').
+    :return: list -- The function returns a list with the results.
+    """
+
+    args_prod = list(args_prod)
+    results, functions = taq_checkpoint_map(function, args_prod, date)
+
+    return [results[index] if index in results
+            else functions[index](*args)
+            for index, args in enumerate(args_prod)]
+
+# -----------------------------------------------------------------------------
+
+
+def taq_task_data(args, tickers=(), date=None):
+    """Finds the tickers and the date of a task.
+
+    The positions of the tickers and the date in the arguments are given by
+    the caller. An argument with tickers is a ticker, a list of tickers or a
+    list of pairs of tickers.
+
+    :param args: tuple with the arguments of the task (i.e. ('AAPL',
+     '2008-01-02')).
+    :param tickers: tuple with the positions of the arguments with the
+     tickers of the task (i.e. (0,)). Default ().
+    :param date: integer with the position of the argument with the date of
+     the task (i.e. 1). None when the task does not have a date (default
+     None).
+    :return: tuple -- The function returns a tuple with the set of tickers and
+     the date of the task, or an empty set and None when the task does not
+     have a date.
+    """
+
+    if (date is None):
+        return (set(), None)
+
+    names = set()
+
+    for index in tickers:
+        items = [args[index]] if isinstance(args[index], str) else args[index]
+        for item in items:
+            # The data of a ticker is counted once in the tasks with pairs of
+            # tickers
+            names.update([item] if isinstance(item, str) else item)
+
+    return (names, args[date])
+
+# -----------------------------------------------------------------------------
+
+
+def taq_task_cost(args, tickers=(), date=None):
+    """Estimates the cost of a task from the size of its data.
+
+    The cost is the number of quotes and trades of the tickers of the task in
+    its date in the catalog of the year. Without a catalog, the cost is the
+    size of the quotes and trades files, which grows with their number of
+    rows. A day without data and a task without a date cost zero.
+
+    :param args: tuple with the arguments of the task (i.e. ('AAPL',
+     '2008-01-02')).
+    :param tickers: tuple with the positions of the arguments with the
+     tickers of the task (i.e. (0,)). Default ().
+    :param date: integer with the position of the argument with the date of
+     the task (i.e. 1). None when the task does not have a date (default
+     None).
+    :return: int -- The function returns the number of rows or the size in
+     bytes of the data of the task.
+    """
+
+    tickers, date = taq_task_data(args, tickers, date)
+
+    if (date is None):
+        return 0
+
+    if (taq_load_catalog(date[:4]) is not None):
+        rows = __catalog__[date[:4]][2]
+        return sum(rows.get((ticker, date), 0) for ticker in tickers)
+
+    cost = 0
+
+    for ticker in tickers:
+        for data_type in ('quotes', 'trades'):
+            path = f'../../taq_data/hdf5_daily_data_{date[:4]}/taq_{ticker}' \
+                + f'_{data_type}_{date}.h5'
+            if (os.path.isfile(path)):
+                cost += os.path.getsize(path)
+
+    return cost
+
+# -----------------------------------------------------------------------------
+
+
+def taq_task_memory(args, tickers=(), date=None, data='raw'):
+    """Estimates the peak memory of a task from the size of its data.
+
+    The tasks that load the quotes and trades of a day ('raw') use, for every
+    ticker, the memory of its quotes and trades in the date, from the number
+    of rows in the catalog of the year and the bytes of a row of every type,
+    and the memory of its day arrays. Without a catalog, the columns use
+    about the size of the files, and the copies made while the data is
+    filtered triple it. The tasks that only load the arrays of a day saved by
+    other functions ('arrays') use the memory of the day arrays of every
+    ticker.
+
+    :param args: tuple with the arguments of the task (i.e. ('AAPL',
+     '2008-01-02')).
+    :param tickers: tuple with the positions of the arguments with the
+     tickers of the task (i.e. (0,)). Default ().
+    :param date: integer with the position of the argument with the date of
+     the task (i.e. 1). None when the task does not have a date (default
+     None).
+    :param data: string with the data loaded by the task ('raw' or 'arrays',
+     default 'raw').
+    :return: int -- The function returns the estimated memory in bytes of the
+     task.
+    """
+
+    assert data in ('raw', 'arrays')
+
+    names, day = taq_task_data(args, tickers, date)
+
+    if (day is None):
+        return 0
+
+    if (data == 'arrays'):
+        return __day_bytes__ * len(names)
+
+    if (taq_load_catalog(day[:4]) is not None):
+        memory = __catalog__[day[:4]][3]
+        return sum(memory.get((ticker, day), 0) + __day_bytes__
+                   for ticker in names)
+
+    return 3 * taq_task_cost(args, tickers, date) + __day_bytes__ * len(names)
+
+# -----------------------------------------------------------------------------
+
+
+def taq_indexed_task(task):
+    """Computes a task and returns its result with its index.
+
+    :param task: tuple with the index of the task, the function and the
+     tuple of arguments of the function.
+    :return: tuple -- The function returns a tuple with the index and the
+     result of the task.
+    """
+
+    index, function, args = task
+
+    return (index, function(*args))
+
+# -----------------------------------------------------------------------------
+
+
+def taq_starmap(pool, workers, budget, function, args_prod, tickers=(),
+                date=None, data='raw'):
+    """Computes a function for every tuple of arguments in a pool.
+
+    The tasks are sent to the workers from the largest to the smallest
+    estimated cost, one at a time, so an idle worker takes the next task and
+    the short tasks fill the end of the run. A task is only sent when the
+    estimated memory of the running tasks and the task fits in the memory
+    budget, or when no task is running, so the workers wait instead of
+    running out of memory. The cost and memory of the tasks are estimated
+    with the model of their data given by the caller: the positions of their
+    tickers and date in the arguments and the data they load. The tasks
+    finished in a previous run of the year function are loaded from their
+    checkpoints. The results are returned in the order of the arguments.
+
+    :param pool: pool of processes or threads.
+    :param workers: integer with the number of workers of the pool.
+    :param budget: integer with the memory of the running tasks in bytes.
+     None does not limit the memory.
+    :param function: function to be computed.
+    :param args_prod: iterable of tuples with the arguments of the function.
+    :param tickers: tuple with the positions of the arguments with the
+     tickers of the tasks (i.e. (0, 1)). Default ().
+    :param date: integer with the position of the argument with the date of
+     the tasks (i.e. 2). None when the tasks do not have a date, so they are
+     sent in their order and use no memory of the budget (default None).
+    :param data: string with the data loaded by the tasks. 'raw' for the
+     quotes and trades of a day and 'arrays' for the arrays of a day saved by
+     other functions (default 'raw').
+    :return: list -- The function returns a list with the results.
+    """
+
+    args_prod = list(args_prod)
+    finished, functions = taq_checkpoint_map(function, args_prod, date)
+    costs = [taq_task_cost(args, tickers, date) for args in args_prod]
+    # The sort is stable, so the tasks with the same cost keep their order
+    order = sorted(range(len(args_prod)), key=costs.__getitem__, reverse=True)
+
+    if (budget is None):
+        memory = [0] * len(args_prod)
+    else:
+        memory = [taq_task_memory(args, tickers, date, data)
+                  for args in args_prod]
+
+    results = [finished.get(index) for index in range(len(args_prod))]
+    # The next task is the last one of the pending tasks
+    pending = [index for index in order[::-1] if index not in finished]
+    running = {}
+    done = queue.Queue()
+
+    while (pending or running):
+
+        while (pending and len(running) < workers):
+            index = pending[-1]
+            if (running and budget is not None
+                    and sum(running.values()) + memory[index] > budget):
+                break
+
+            pending.pop()
+            running[index] = memory[index]
+            pool.apply_async(taq_indexed_task,
+                             ((index, functions[index], args_prod[index]),),
+                             callback=done.put, error_callback=done.put)
+
+        task = done.get()
+        # The errors of the tasks are raised in the current process
+        if (not isinstance(task, tuple)):
+            raise task
+
+        index, result = task
+        results[index] = result
+        del running[index]
+
+    return results
+
+# -----------------------------------------------------------------------------
+
+
+def taq_workers():
+    """Returns the number of workers of the pools.
+
+    :return: int -- The function returns the number of workers of the
+     executor, or the number of CPUs when it is not set.
+    """
+
+    return __executor__['workers'] or mp.cpu_count()
+
+# -----------------------------------------------------------------------------
+
+
+@contextmanager
+def taq_pool(workers=None, cache=0):
+    """Opens a pool with the executor of the year functions.
+
+    The pool has a starmap method in all the executors. In the pools of
+    processes and threads, the starmap method is the taq_starmap function,
+    so the largest tasks run first within the memory budget. The CPUs are
+    split between the workers of the pool and the BLAS and OpenMP threads of
+    every worker.
+
+    :param workers: integer with the number of processes or threads. None
+     uses the number of workers of the executor (default None).
+    :param cache: integer with the memory limit in bytes of the cache of day
+     arrays of a process, taken from the memory budget (default 0).
+    :return: The function returns a context with the pool.
+    """
+
+    executor = __executor__['executor']
+    workers = workers or taq_workers()
+    threads = max(1, (__executor__['cpus'] or mp.cpu_count()) // workers)
+    budget = taq_memory_budget(workers, cache)
+
+    if (executor == 'serial'):
+        yield SimpleNamespace(starmap=taq_serial_starmap)
+
+    elif (executor == 'threads'):
+        with taq_blas_threads(threads), ThreadPool(workers) as pool:
+            yield SimpleNamespace(starmap=partial(taq_starmap, pool,
+                                                  workers, budget))
+
+    else:
+        with mp.Pool(processes=workers, initializer=taq_blas_threads,
+                     initargs=(threads,)) as pool:
+            yield SimpleNamespace(starmap=partial(taq_starmap, pool,
+                                                  workers, budget))
+
+# -----------------------------------------------------------------------------
+
+
+def taq_read_hdf(path, **kwargs):
+    """Reads a HDF5 file.
+
+    The HDF5 library is not thread safe, so the threads of a pool read the
+    files one at a time.
+
+    :param path: string of the path of the file.
+    :param kwargs: parameters of the pandas read_hdf function.
+    :return: pandas DataFrame.
+    """
+
+    with __hdf5_lock__:
+        return pd.read_hdf(path, **kwargs)
+
+# -----------------------------------------------------------------------------
+
+
+def taq_bussiness_days(year):
+    """Generates a list with the dates of the bussiness days in a year
+
+    :param year: string of the year to be analyzed (i.e '2008').
+    :return: list.
+    """
+
+    init_date = f'01/01/{year}'
+    last_date = f'12/31/{year}'
+
+    # Use only the bussiness days
+    dt = pd.date_range(start=init_date, end=last_date, freq='B')
+    dt_df = dt.to_frame(index=False)
+    date_list = dt_df[0].astype(str).tolist()
+
+    return date_list
+
+# -----------------------------------------------------------------------------
+
+
+def taq_load_catalog(year):
+    """Loads the catalog of the tick store of a year.
+
+    The catalog is built with the taq_catalog_data function of the
+    taq_responses_physical module. It is read again only when its file
+    changes.
+
+    :param year: string of the year to be analyzed (i.e '2016').
+    :return: pandas DataFrame -- The function returns the catalog with the
+     ticker, date, type, number of rows, size in bytes and first and last
+     second of every file of the tick store, or None if the year does not
+     have a catalog.
+    """
+
+    path = f'../../taq_data/catalog_data_{year}/taq_catalog_data_{year}.csv'
+
+    try:
+        mtime = os.stat(path).st_mtime_ns
+
+    except FileNotFoundError:
+        return None
+
+    if (year not in __catalog__ or __catalog__[year][0] != mtime):
+        catalog_df = pd.read_csv(path, dtype={'Ticker': str, 'Date': str,
+                                              'Type': str})
+        keys = [catalog_df['Ticker'], catalog_df['Date']]
+        rows = catalog_df['Rows'].groupby(keys).sum().to_dict()
+        memory = (catalog_df['Rows']
+                  * catalog_df['Type'].map(__row_bytes__).fillna(0)) \
+            .groupby(keys).sum().to_dict()
+        __catalog__[year] = (mtime, catalog_df, rows, memory)
+
+    return __catalog__[year][1]
+
+# -----------------------------------------------------------------------------
+
+
+def taq_catalog_days(ticker, year):
+    """Lists the days with data of a ticker in a year.
+
+    The days are taken from the catalog of the year, so the market holidays
+    and the days without quotes and trades of the ticker are not used.
+    Without a catalog, all the business days of the year are used.
+
+    :param ticker: string of the abbreviation of the stock to be analyzed
+     (i.e. 'AAPL').
+    :param year: string of the year to be analyzed (i.e '2016').
+    :return: list -- The function returns a list with the sorted dates.
+    """
+
+    catalog_df = taq_load_catalog(year)
+
+    if (catalog_df is None):
+        return taq_bussiness_days(year)
+
+    days = catalog_df[(catalog_df['Ticker'] == ticker)
+                      & (catalog_df['Rows'] > 0)]
+
+    return sorted(set(days['Date']))
+
+# -----------------------------------------------------------------------------
+
+
+def taq_catalog_dates(tickers, year, every=True):
+    """Lists the days with data of a group of tickers in a year.
+
+    :param tickers: list of the string abbreviation of the stocks to be
+     analyzed (i.e. ['AAPL', 'MSFT']).
+    :param year: string of the year to be analyzed (i.e '2016').
+    :param every: bool to use the days with data of every ticker. False uses
+     the days with data of any of the tickers (default True).
+    :return: list -- The function returns a list with the sorted dates.
+    """
+
+    days = [set(taq_catalog_days(ticker, year)) for ticker in tickers]
+
+    if (not days):
+        return []
+
+    if (every):
+        return sorted(set.intersection(*days))
+    else:
+        return sorted(set.union(*days))
+
+# -----------------------------------------------------------------------------
+
+
+def taq_store_load(function_name, year):
+    """Loads the results store of a function in a year.
+
+    The store is read again only when its file changes.
+
+    :param function_name: name of the function that generates the data.
+    :param year: string of the year to be analyzed (i.e '2016').
+    :return: dictionary -- The function returns a dictionary with the keys,
+     the index and the data of the store, or None if the function does not
+     have a store.
+    """
+
+    path = f'../../taq_data/responses_physical_data_{year}/taq_store/' \
+        + f'{function_name}_{year}.pickle'
+
+    try:
+        mtime = os.stat(path).st_mtime_ns
+
+    except FileNotFoundError:
+        return None
+
+    if (__store__.get((function_name, year), (None,))[0] != mtime):
+        with open(path, 'rb') as file:
+            __store__[(function_name, year)] = (mtime, pickle.load(file))
+
+    return __store__[(function_name, year)][1]
+
+# -----------------------------------------------------------------------------
+
+
+def taq_store_pickle(function_name, key, year):
+    """Loads the year result of a pair of tickers from its pickle file.
+
+    :param function_name: name of the function that generates the data.
+    :param key: tuple (ticker_i, ticker_j) of the pair of tickers.
+    :param year: string of the year to be analyzed (i.e '2016').
+    :return: numpy array -- The function returns the result, or an empty
+     array if there is no data.
+    """
+
+    ticker_i, ticker_j = key
+    name = ticker_i if ticker_i == ticker_j else f'{ticker_i}i_{ticker_j}j'
+
+    try:
+        with open(f'../../taq_data/responses_physical_data_{year}/'
+                  + f'{function_name}/{function_name}_{year}_{name}.pickle',
+                  'rb') as file:
+            return np.asarray(pickle.load(file), dtype=float)
+
+    except FileNotFoundError:
+        return np.array([])
+
+# -----------------------------------------------------------------------------
+
+
+def taq_store_query(function_name, year, keys, frame=False):
+    """Loads the year results of a list of tickers or pairs in one array.
+
+    The results are taken from the results store of the function. The keys
+    that are not in the store are loaded from their pickle files, so the
+    results saved before the store existed can also be used.
+
+    :param function_name: name of the function that generates the data
+     (i.e. 'taq_cross_response_year_responses_physical_data').
+    :param year: string of the year to be analyzed (i.e '2016').
+    :param keys: list of tickers (i.e. ['AAPL', 'MSFT']) for the self
+     results or tuples (ticker_i, ticker_j) for the cross results (i.e.
+     [('AAPL', 'MSFT')]).
+    :param frame: bool to return a pandas DataFrame with a row for every pair
+     of tickers (default False).
+    :return: numpy array -- The function returns a 2D array with the result
+     of every key in a row. The rows of the keys without data are NaN.
+    """
+
+    keys = [(key, key) if isinstance(key, str) else tuple(key)
+            for key in keys]
+
+    store = taq_store_load(function_name, year)
+    index = {} if store is None else store['index']
+
+    rows = [row for row, key in enumerate(keys) if key in index]
+    missing = {row: taq_store_pickle(function_name, keys[row], year)
+               for row, key in enumerate(keys) if key not in index}
+
+    width = max([np.size(value) for value in missing.values()]
+                + ([] if store is None else [store['data'].shape[1]]),
+                default=0)
+    data = np.full((len(keys), width), np.nan)
+
+    if (rows):
+        data[rows, :store['data'].shape[1]] = \
+            store['data'][[index[keys[row]] for row in rows]]
+    for row, value in missing.items():
+        data[row, :np.size(value)] = np.ravel(value)
+
+    if (frame):
+        return pd.DataFrame(data, index=pd.MultiIndex.from_tuples(
+            keys, names=['Ticker_i', 'Ticker_j']))
+
+    return data
+
+# -----------------------------------------------------------------------------
+
+
+def taq_task_hash(function_name, args):
+    """Computes the hash of a task of the pipeline.
+
+    The hash depends on the base hash of the stage, the function and its
+    arguments and the hash of the files of the tickers of the task, given by
+    the pipeline in the file of the TAQ_TASKS environment variable.
+
+    :param function_name: name of the function of the task.
+    :param args: tuple with the arguments of the task. The tickers of the
+     stage in the arguments are the tickers of the task.
+    :return: string -- The function returns the hexadecimal sha256 hash of the
+     task, or None when the module does not run in a stage of the pipeline.
+    """
+
+    if (__tasks__['path'] is None):
+        return None
+
+    if (__tasks__['hashes'] is None):
+        with open(__tasks__['path'], 'r') as file:
+            __tasks__['hashes'] = json.load(file)
+
+        try:
+            with open(__tasks__['hashes']['journal'], 'r') as journal:
+                __tasks__['done'] = set(line.strip() for line in journal)
+
+        except FileNotFoundError:
+            __tasks__['done'] = set()
+
+    hashes = __tasks__['hashes']
+    tickers = sorted(set(arg for arg in args
+                         if isinstance(arg, str) and arg in hashes['names']))
+
+    task_hash = hashlib.sha256(hashes['base'].encode())
+    task_hash.update(pickle.dumps((function_name, args), protocol=4))
+    for size in range(1, len(tickers) + 1):
+        for names in combinations(tickers, size):
+            key = ' '.join(names)
+            task_hash.update(f'{key} {hashes["tickers"].get(key)}'.encode())
+
+    return task_hash.hexdigest()
+
+# -----------------------------------------------------------------------------
+
+
+def taq_task_done(task_hash):
+    """Checks if a task finished in a previous run.
+
+    :param task_hash: string of the hash of the task, or None.
+    :return: bool -- The function returns True if the task is recorded in the
+     journal of the stage.
+    """
+
+    return task_hash is not None and task_hash in __tasks__['done']
+
+# -----------------------------------------------------------------------------
+
+
+def taq_task_record(task_hash):
+    """Records a finished task in the journal.
+
+    :param task_hash: string of the hash of the task, or None.
+    :return: None -- The function records the task in the journal of the
+     stage and does not return a value.
+    """
+
+    if (task_hash is None):
+        return None
+
+    with open(__tasks__['hashes']['journal'], 'a') as journal:
+        journal.write(f'{task_hash}\n')
+    __tasks__['done'].add(task_hash)
+
+    return None
+
+# -----------------------------------------------------------------------------
+
+
+def taq_journal_task(function):
+    """Skips the finished tasks of a year function.
+
+    :param function: year function that computes and saves the task of a
+     ticker or a pair of tickers.
+    :return: function -- The function returns a function that only computes
+     the task when it did not finish in a previous run.
+    """
+
+    @wraps(function)
+    def task(*args, **kwargs):
+
+        task_hash = taq_task_hash(function.__name__,
+                                  args + tuple(sorted(kwargs.items())))
+
+        if (taq_task_done(task_hash)):
+            print(f'{function.__name__}{args[:2]} finished in a previous '
+                  + 'run')
+            return None
+
+        result = function(*args, **kwargs)
+        taq_task_record(task_hash)
+
+        return result
+
+    return task
+
+# -----------------------------------------------------------------------------
+
+
+def taq_journal_tasks(module):
+    """Skips the finished tasks of a module.
+
+    The year functions of a ticker or a pair of tickers of the module (with
+    ticker or ticker_i as first parameter) are replaced with the
+    taq_journal_task function, so a task finished in a previous run of the
+    stage is not computed again. The results of the year functions are saved
+    in files, so the skipped tasks return None.
+
+    :param module: analysis module of a stage of the pipeline.
+    :return: None -- The function replaces the year functions of the module
+     and does not return a value.
+    """
+
+    for name, function in list(vars(module).items()):
+        if (inspect.isfunction(function)
+                and function.__module__ == module.__name__
+                and '_year_' in name
+                and list(inspect.signature(function).parameters)[:1]
+                in (['ticker'], ['ticker_i'])):
+            setattr(module, name, taq_journal_task(function))
+
+    return None
+
+# -----------------------------------------------------------------------------
+
+
+def taq_checkpoint_task(function):
+    """Keeps the checkpoints of the days of a year function until it finishes.
+
+    The days computed by the pools of the year function save their
+    checkpoints, so an interrupted run continues from the last finished day.
+    When the year function returns, its results are saved, so the
+    checkpoints of its days are removed. The checkpoints of an interrupted
+    year function are kept.
+
+    :param function: year function that computes its days in the pools.
+    :return: function -- The function returns a function that keeps the
+     checkpoints of the days of the year function.
+    """
+
+    @wraps(function)
+    def task(*args, **kwargs):
+
+        outer = getattr(__checkpoint__, 'tasks', None)
+        __checkpoint__.tasks = []
+
+        try:
+            result = function(*args, **kwargs)
+            taq_checkpoint_clear(__checkpoint__.tasks)
+
+        finally:
+            __checkpoint__.tasks = outer
+
+        return result
+
+    task.checkpoint = True
+
+    return task
+
+# -----------------------------------------------------------------------------
+
+
+def taq_checkpoint_tasks(module):
+    """Keeps the checkpoints of the days of the year functions of a module.
+
+    The year functions of the module (with _year_ in their name) are
+    replaced with the taq_checkpoint_task function. The functions already
+    replaced are not replaced again.
+
+    :param module: analysis module.
+    :return: None -- The function replaces the year functions of the module
+     and does not return a value.
+    """
+
+    for name, function in list(vars(module).items()):
+        if (inspect.isfunction(function)
+                and function.__module__ == module.__name__
+                and '_year_' in name
+                and not getattr(function, 'checkpoint', False)):
+            setattr(module, name, taq_checkpoint_task(function))
+
+    return None
+
+# -----------------------------------------------------------------------------
+
+
+def main():
+    """The main function of the script.
+
+    The main function is used to test the functions in the script.
+
+    :return: None.
+    """
+
+    pass
+
+    return None
+
+# -----------------------------------------------------------------------------
+
+
+if __name__ == '__main__':
+    main()
@@ -4,14 +4,21 @@ The functions in the module analyze the data from the NASDAQ stock market,
 computing the self- and cross-response functions.
 
 This script requires the following modules:
+    * hashlib
     * itertools
-    * multiprocessing
     * numpy
+    * os
     * pandas
     * pickle
+    * sys
+    * taq_data_tools_pool
     * taq_data_tools_responses_activity
 
 The module contains the following functions:
+    * taq_trades_count_responses_activity_data - counts the number of trades
+      per second.
+    * taq_response_lags_responses_activity_data - computes the numerator of
+      the response for all the time lags.
     * taq_self_response_day_responses_activity_data - computes the self
       response of a day.
     * taq_self_response_year_responses_activity_data_data - computes the
@@ -20,6 +27,18 @@ The module contains the following functions:
       response of a day.
     * taq_cross_response_year_responses_activity_data_data - computes the
       cross-response of a year.
+    * taq_responses_day_responses_activity_data - computes the self and cross
+      responses of several tickers in a day.
+    * taq_responses_year_responses_activity_data - computes the self and
+      cross responses of several tickers in a year.
+    * taq_trades_minute_responses_activity_data - obtains the number of
+      trades per minute of every second of a day.
+    * taq_activity_edges_responses_activity_data - computes the trades per
+      minute quantiles of a year.
+    * taq_response_day_buckets_responses_activity_data - computes the activity
+      conditioned response of a day.
+    * taq_response_year_buckets_responses_activity_data - computes the
+      activity conditioned response of a year.
     * main - the main function of the script.
 
 .. moduleauthor:: Juan Camilo Henao Londono <www.github.com/juanhenao21>
@@ -28,15 +47,29 @@ The module contains the following functions:
 # ----------------------------------------------------------------------------
 # Modules
 
+import hashlib
 from itertools import product as iprod
-import multiprocessing as mp
 import numpy as np
+import os
 import pandas as pd
 import pickle
+import sys
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                             '..', '..', 'taq_pool', 'taq_algorithms'))
+import taq_data_tools_pool
 import taq_data_tools_responses_activity
 
 __tau__ = 1000
+# Number of rows of weighted trade signs transformed at the same time
+__fft_rows__ = 64
+# Trades per minute edges of the activity conditioned responses. As the bins
+# of the dismissed trades-minute modules, the edges are every value from 1 to
+# 10, the tens from 20 to 100, the hundreds from 200 to 1000 and the
+# thousands from 2000 to 10000, so there are 36 buckets
+__activity_edges__ = tuple(np.concatenate(
+    (np.arange(1, 11), np.arange(20, 101, 10), np.arange(200, 1001, 100),
+     np.arange(2000, 10001, 1000))))
 
 # ----------------------------------------------------------------------------
 
@@ -72,12 +105,11 @@ def taq_trades_count_responses_activity_data(ticker, date):
 
         # Open market time [34801, 57000]
         full_time = np.array(range(34801, 57001))
-        trades_count = np.zeros(len(full_time))
 
         # Count the number of trades in every second
-        for t_idx, t_val in enumerate(full_time):
-            condition = t_val == t
-            trades_count[t_idx] = len(trade_sign_i[condition])
+        condition = (t >= full_time[0]) & (t <= full_time[-1])
+        trades_count = np.bincount(t[condition] - full_time[0],
+                                   minlength=len(full_time)).astype(float)
 
         # Save data
         taq_data_tools_responses_activity \
@@ -95,6 +127,57 @@ def taq_trades_count_responses_activity_data(ticker, date):
 # ----------------------------------------------------------------------------
 
 
+def taq_response_lags_responses_activity_data(midpoint, weighted_sign, tau):
+    """Computes the numerator of the response for all the time lags.
+
+    The response of a time lag :math:`\\tau` is the sum of the midpoint price
+    returns multiplied by the weighted trade signs. The sum is split in a
+    correlation between the weighted trade signs divided by the midpoint
+    price and the midpoint price, computed for all the time lags at once with
+    the fast Fourier transform, and a cumulative sum. The midpoint price is
+    centered in its average value to keep the precision of the correlation.
+    The transform of the midpoint price is computed once for all the rows of
+    weighted trade signs.
+
+    :param midpoint: numpy array with the midpoint price of every second.
+    :param weighted_sign: numpy array with the trade sign multiplied by the
+     number of trades of every second. A two dimensional array computes one
+     numerator per row.
+    :param tau: integer greater than zero (i.e. 1000).
+    :return: numpy array -- The function returns the numerator of the
+     response for the time lags 1 to tau.
+    """
+
+    length = len(midpoint)
+    center = np.mean(midpoint)
+    lags = np.arange(1, tau + 1)
+
+    # Size of the transform to avoid the circular correlation
+    n_fft = 2 ** int(np.ceil(np.log2(2 * length)))
+    midpoint_fft = np.fft.rfft(midpoint - center, n_fft)
+
+    # The rows are transformed in blocks to bound the memory
+    sign = np.reshape(weighted_sign / midpoint, (-1, length))
+    correlation = np.zeros((len(sign), tau))
+    for start in range(0, len(sign), __fft_rows__):
+        block = slice(start, start + __fft_rows__)
+        correlation[block] = np.fft.irfft(
+            np.conj(np.fft.rfft(sign[block], n_fft)) * midpoint_fft,
+            n_fft)[:, lags]
+    correlation = np.reshape(correlation, np.shape(weighted_sign)[:-1]
+                             + (tau,))
+
+    # Sum of the centered term of the first length - lag seconds
+    centered_sum = np.cumsum(weighted_sign * (center - midpoint) / midpoint,
+                             axis=-1)
+    centered_sum = np.concatenate(
+        (np.zeros(centered_sum.shape[:-1] + (1,)), centered_sum), axis=-1)
+
+    return correlation + centered_sum[..., length - lags]
+
+# ----------------------------------------------------------------------------
+
+
 def taq_self_response_day_responses_activity_data(ticker, date):
     """Computes the self-response of a day.
 
@@ -132,32 +215,14 @@ def taq_self_response_day_responses_activity_data(ticker, date):
         assert len(midpoint) == len(trade_sign)
         assert len(midpoint) == len(trade_count)
 
-        # Array of the average of each tau. 10^3 s is used in the paper
-        self_response_tau = np.zeros(__tau__)
-        num = np.zeros(__tau__)
+        # Number of trades in the first length - tau_idx - 1 seconds
+        trades_sum = np.concatenate(([0], np.cumsum(trade_count)))
+        num = trades_sum[len(trade_count) - np.arange(1, __tau__ + 1)]
 
         # Calculating the midpoint price return and the self response function
-
-        # Depending on the tau value
-        for tau_idx in range(__tau__):
-
-            trade_sign_tau = trade_sign[:-tau_idx - 1]
-            trade_count_tau = trade_count[:-tau_idx - 1]
-            trade_count_len = np.sum(trade_count_tau)
-            num[tau_idx] = trade_count_len
-            # Obtain the midpoint price return. Displace the numerator tau
-            # values to the right and compute the return
-
-            # midpoint price returns
-
-            log_return_sec = (midpoint[tau_idx + 1:]
-                              - midpoint[:-tau_idx - 1]) \
-                / midpoint[:-tau_idx - 1]
-
-            # Obtain the self response value
-            if (trade_count_len != 0):
-                product = log_return_sec * trade_sign_tau * trade_count_tau
-                self_response_tau[tau_idx] = np.sum(product)
+        # for all the tau values
+        self_response_tau = taq_response_lags_responses_activity_data(
+            midpoint, trade_sign * trade_count, __tau__)
 
         return (self_response_tau, num)
 
@@ -189,16 +254,23 @@ def taq_self_response_year_responses_activity_data(ticker, year):
         .taq_function_header_print_data(function_name, ticker, ticker, year,
                                         '', '')
 
-    dates = taq_data_tools_responses_activity.taq_bussiness_days(year)
+    dates = taq_data_tools_pool.taq_catalog_dates([ticker], year)
 
     self_values = []
     args_prod = iprod([ticker], dates)
 
     # Parallel computation of the self-responses. Every result is appended to
     # a list
-    with mp.Pool(processes=mp.cpu_count()) as pool:
+    with taq_data_tools_pool.taq_pool() as pool:
         self_values.append(pool.starmap(
-            taq_self_response_day_responses_activity_data, args_prod))
+            taq_self_response_day_responses_activity_data, args_prod,
+            tickers=(0,), date=1, data='arrays'))
+
+    # A ticker without days with data has no trades, so the averages are NaN as
+    # in the days without data
+    if (not dates):
+        zeros = np.zeros(__tau__)
+        self_values[0].append((zeros, zeros))
 
     # To obtain the total self-response, I sum over all the self-response
     # values and all the amount of trades (averaging values)
@@ -263,31 +335,14 @@ def taq_cross_response_day_responses_activity_data(ticker_i, ticker_j, date):
             assert len(midpoint_i) == len(trade_sign_j)
             assert len(midpoint_i) == len(trade_count_j)
 
-            # Array of the average of each tau. 10^3 s is used in the paper
-            cross_response_tau = np.zeros(__tau__)
-            num = np.zeros(__tau__)
+            # Number of trades in the first length - tau_idx - 1 seconds
+            trades_sum = np.concatenate(([0], np.cumsum(trade_count_j)))
+            num = trades_sum[len(trade_count_j) - np.arange(1, __tau__ + 1)]
 
             # Calculating the midpoint return and the cross response function
-
-            # Depending on the tau value
-            for tau_idx in range(__tau__):
-
-                trade_sign_tau = trade_sign_j[:-tau_idx - 1]
-                trade_count_tau = trade_count_j[:-tau_idx - 1]
-                trade_count_len = np.sum(trade_count_tau)
-                num[tau_idx] = trade_count_len
-                # Obtain the midpoint price return. Displace the numerator tau
-                # values to the right and compute the return
-
-                log_return_i_sec = (midpoint_i[tau_idx + 1:]
-                                    - midpoint_i[:-tau_idx - 1]) \
-                    / midpoint_i[:-tau_idx - 1]
-
-                # Obtain the cross response value
-                if (trade_count_len != 0):
-                    product = log_return_i_sec * trade_sign_tau \
-                        * trade_count_tau
-                    cross_response_tau[tau_idx] = np.sum(product)
+            # for all the tau values
+            cross_response_tau = taq_response_lags_responses_activity_data(
+                midpoint_i, trade_sign_j * trade_count_j, __tau__)
 
             return (cross_response_tau, num)
 
@@ -327,16 +382,24 @@ def taq_cross_response_year_responses_activity_data(ticker_i, ticker_j, year):
             .taq_function_header_print_data(function_name, ticker_i, ticker_j,
                                             year, '', '')
 
-        dates = taq_data_tools_responses_activity.taq_bussiness_days(year)
+        dates = taq_data_tools_pool \
+            .taq_catalog_dates([ticker_i, ticker_j], year)
 
         cross_values = []
         args_prod = iprod([ticker_i], [ticker_j], dates)
 
         # Parallel computation of the cross-responses. Every result is appended
         # to a list
-        with mp.Pool(processes=mp.cpu_count()) as pool:
+        with taq_data_tools_pool.taq_pool() as pool:
             cross_values.append(pool.starmap(
-                taq_cross_response_day_responses_activity_data, args_prod))
+                taq_cross_response_day_responses_activity_data, args_prod,
+                tickers=(0, 1), date=2, data='arrays'))
+
+        # A pair of tickers without days with data has no trades, so the
+        # averages are NaN as in the days without data
+        if (not dates):
+            zeros = np.zeros(__tau__)
+            cross_values[0].append((zeros, zeros))
 
         # To obtain the total cross-response, I sum over all the cross-response
         # values and all the amount of trades (averaging values)
@@ -355,6 +418,402 @@ def taq_cross_response_year_responses_activity_data(ticker_i, ticker_j, year):
 # ----------------------------------------------------------------------------
 
 
+def taq_responses_day_responses_activity_data(tickers, date):
+    """Computes the self- and cross-responses of several tickers in a day.
+
+    Loads the midpoint price, trade signs and number of trades of every
+    ticker once and computes the self-response of every ticker and the
+    cross-response of every pair of tickers for a day. The responses of the
+    midpoint price of a ticker to the trades of all the tickers are computed
+    in one call, so the transform of every midpoint price is computed once.
+
+    :param tickers: list of the string abbreviation of the stocks to be
+     analyzed (i.e. ['AAPL', 'MSFT']).
+    :param date: string with the date of the data to be extracted
+     (i.e. '2008-01-02').
+    :return: numpy array -- The function returns an array with shape
+     (len(tickers), len(tickers), 2, __tau__). The element [i, j] has the
+     response of the midpoint price of ticker i to the trades of ticker j and
+     the number of trades.
+    """
+
+    date_sep = date.split('-')
+
+    year = date_sep[0]
+    month = date_sep[1]
+    day = date_sep[2]
+
+    responses = np.zeros((len(tickers), len(tickers), 2, __tau__))
+
+    midpoints = []
+    weighted_signs = []
+    nums = []
+
+    for ticker in tickers:
+
+        try:
+            # Load data
+            midpoint = pickle.load(open(
+                    f'../../taq_data/responses_physical_data_{year}/taq'
+                    + '_midpoint_physical_data/taq_midpoint_physical_data'
+                    + f'_midpoint_{year}{month}{day}_{ticker}.pickle', 'rb'))
+            _, _, trade_sign = pickle.load(open(
+                    f'../../taq_data/responses_physical_data_{year}/taq_trade'
+                    + '_signs_physical_data/taq_trade_signs_physical_data'
+                    + f'_{year}{month}{day}_{ticker}.pickle', 'rb'))
+            _, trade_count = pickle.load(open(
+                    f'../../taq_data/responses_activity_data_{year}/taq'
+                    + '_trades_count_responses_activity_data/taq_trades'
+                    + f'_count_responses_activity_data_{year}{month}{day}'
+                    + f'_{ticker}.pickle', 'rb'))
+
+            assert len(midpoint) == len(trade_sign)
+            assert len(midpoint) == len(trade_count)
+
+            trades_sum = np.concatenate(([0], np.cumsum(trade_count)))
+
+            midpoints.append(midpoint)
+            weighted_signs.append(trade_sign * trade_count)
+            nums.append(trades_sum[len(trade_count)
+                                   - np.arange(1, __tau__ + 1)])
+
+        except FileNotFoundError as e:
+            print('No data')
+            print(e)
+            print()
+            midpoints.append(None)
+            weighted_signs.append(None)
+            nums.append(None)
+
+    # Tickers with data
+    valid = [idx for idx, value in enumerate(midpoints) if value is not None]
+
+    if (not valid):
+        return responses
+
+    weighted_signs = np.vstack([weighted_signs[idx] for idx in valid])
+    nums = np.vstack([nums[idx] for idx in valid])
+
+    # Midpoint price of ticker i and trades of every ticker j
+    for i_idx in valid:
+
+        responses[i_idx, valid, 0] = \
+            taq_response_lags_responses_activity_data(
+                midpoints[i_idx], weighted_signs, __tau__)
+        responses[i_idx, valid, 1] = nums
+
+    return responses
+
+# ----------------------------------------------------------------------------
+
+
+def taq_responses_year_responses_activity_data(tickers, year):
+    """Computes the self- and cross-responses of several tickers in a year.
+
+    Using the taq_responses_day_responses_activity_data function computes the
+    self-response of every ticker and the cross-response of every pair of
+    tickers for a year. The results are saved in the same files as the
+    taq_self_response_year_responses_activity_data and the
+    taq_cross_response_year_responses_activity_data functions.
+
+    :param tickers: list of the string abbreviation of the stocks to be
+     analyzed (i.e. ['AAPL', 'MSFT']).
+    :param year: string of the year to be analyzed (i.e '2016').
+    :return: numpy array -- The function returns an array with shape
+     (len(tickers), len(tickers), __tau__) with the responses.
+    """
+
+    function_name = taq_responses_year_responses_activity_data.__name__
+    taq_data_tools_responses_activity \
+        .taq_function_header_print_data(function_name, '', '', year, '', '')
+
+    dates = taq_data_tools_pool \
+        .taq_catalog_dates(tickers, year, every=False)
+
+    args_prod = iprod([tickers], dates)
+
+    # Parallel computation of the responses
+    with taq_data_tools_pool.taq_pool() as pool:
+        values = pool.starmap(taq_responses_day_responses_activity_data,
+                              args_prod, tickers=(0,), date=1, data='arrays')
+
+    # The tickers without days with data have no trades, so the averages are
+    # NaN as in the days without data
+    if (not dates):
+        values = [np.zeros((len(tickers), len(tickers), 2, __tau__))]
+
+    # To obtain the total responses, I sum over all the response values and
+    # all the amount of trades (averaging values)
+    values_final = np.sum(values, axis=0)
+    responses_val = values_final[:, :, 0] / values_final[:, :, 1]
+
+    # Saving data with the names of the self- and cross-response functions
+    self_name = taq_self_response_year_responses_activity_data.__name__
+    cross_name = taq_cross_response_year_responses_activity_data.__name__
+
+    for i_idx, j_idx in iprod(range(len(tickers)), repeat=2):
+
+        ticker_i = tickers[i_idx]
+        ticker_j = tickers[j_idx]
+        save_name = self_name if ticker_i == ticker_j else cross_name
+
+        taq_data_tools_responses_activity \
+            .taq_save_data(save_name, responses_val[i_idx, j_idx], ticker_i,
+                           ticker_j, year, '', '')
+
+    return responses_val
+
+# ----------------------------------------------------------------------------
+
+
+def taq_trades_minute_responses_activity_data(ticker, date):
+    """Obtains the number of trades per minute of every second of a day.
+
+    Using the data obtained with the taq_trades_count_responses_activity_data
+    function, assigns to every second the number of trades in the minute of
+    the second.
+
+    :param ticker: string of the abbreviation of the stock to be analyzed
+     (i.e. 'AAPL').
+    :param date: string with the date of the data to be extracted
+     (i.e. '2008-01-02').
+    :return: tuple -- The function returns a tuple with numpy arrays of the
+     number of trades per second and the number of trades per minute of every
+     second.
+    """
+
+    date_sep = date.split('-')
+
+    year = date_sep[0]
+    month = date_sep[1]
+    day = date_sep[2]
+
+    full_time, trade_count = pickle.load(open(
+            f'../../taq_data/responses_activity_data_{year}/taq_trades_count'
+            + '_responses_activity_data/taq_trades_count_responses_activity'
+            + f'_data_{year}{month}{day}_{ticker}.pickle', 'rb'))
+
+    # The 370 minutes of the open market time start at 34800 s = 9h40. The
+    # last second (57000 s = 15h50) is taken in the last minute
+    minute = np.minimum((full_time - 34800) // 60, 369)
+    trades_minute = np.bincount(minute, weights=trade_count)[minute]
+
+    return (trade_count, trades_minute)
+
+# ----------------------------------------------------------------------------
+
+
+def taq_activity_edges_responses_activity_data(ticker, year, quantiles):
+    """Computes the trades per minute quantiles of a year.
+
+    The quantiles are computed over the trades per minute of every second
+    with trades of the year, so the buckets of every day are the same.
+
+    :param ticker: string of the abbreviation of the stock to be analyzed
+     (i.e. 'AAPL').
+    :param year: string of the year to be analyzed (i.e '2016').
+    :param quantiles: sequence of the quantiles in [0, 1] used as edges of
+     the buckets (i.e. (0, 0.25, 0.5, 0.75, 1)).
+    :return: numpy array -- The function returns the edges of the buckets,
+     or None if the ticker has no data in the year.
+    """
+
+    dates = taq_data_tools_pool.taq_catalog_dates([ticker], year)
+
+    activity = []
+
+    for date in dates:
+
+        try:
+            trade_count, trades_minute = \
+                taq_trades_minute_responses_activity_data(ticker, date)
+            activity.append(trades_minute[trade_count > 0])
+
+        except FileNotFoundError as e:
+            print('No data')
+            print(e)
+            print()
+
+    if (not activity):
+        print('No data')
+        print()
+        return None
+
+    edges = np.quantile(np.concatenate(activity), quantiles)
+    # The last edge is closed
+    edges[-1] += 1
+
+    return edges
+
+# ----------------------------------------------------------------------------
+
+
+def taq_response_day_buckets_responses_activity_data(ticker_i, ticker_j,
+                                                     date, edges):
+    """Computes the activity conditioned response of a day.
+
+    Every second is assigned to the bucket of the trades per minute of ticker
+    j and the response of the midpoint price of ticker i to the trades of
+    ticker j is computed for every bucket and all the time lags in one pass.
+    When ticker_i and ticker_j are the same, the self-response is computed.
+
+    :param ticker_i: string of the abbreviation of the stock to be analyzed
+     (i.e. 'AAPL').
+    :param ticker_j: string of the abbreviation of the stock to be analyzed
+     (i.e. 'AAPL').
+    :param date: string with the date of the data to be extracted
+     (i.e. '2008-01-02').
+    :param edges: sequence of the edges of the trades per minute buckets.
+     The bucket k has the seconds with trades per minute in
+     [edges[k], edges[k + 1]).
+    :return: numpy array -- The function returns an array with shape
+     (2, len(edges) - 1, __tau__) with the numerator of the response and the
+     number of trades of every bucket.
+    """
+
+    date_sep = date.split('-')
+
+    year = date_sep[0]
+    month = date_sep[1]
+    day = date_sep[2]
+
+    n_buckets = len(edges) - 1
+    responses = np.zeros((2, n_buckets, __tau__))
+
+    try:
+        # Load data
+        midpoint_i = pickle.load(open(
+                f'../../taq_data/responses_physical_data_{year}/taq_midpoint'
+                + '_physical_data/taq_midpoint_physical_data_midpoint'
+                + f'_{year}{month}{day}_{ticker_i}.pickle', 'rb'))
+        _, _, trade_sign_j = pickle.load(open(
+                f'../../taq_data/responses_physical_data_{year}/taq_trade'
+                + '_signs_physical_data/taq_trade_signs_physical_data'
+                + f'_{year}{month}{day}_{ticker_j}.pickle', 'rb'))
+        trade_count_j, trades_minute_j = \
+            taq_trades_minute_responses_activity_data(ticker_j, date)
+
+        assert len(midpoint_i) == len(trade_sign_j)
+        assert len(midpoint_i) == len(trade_count_j)
+
+    except FileNotFoundError as e:
+        print('No data')
+        print(e)
+        print()
+        return responses
+
+    length = len(midpoint_i)
+    lags = np.arange(1, __tau__ + 1)
+
+    # Bucket of every second. Seconds out of the edges are not used
+    bucket = np.digitize(trades_minute_j, edges) - 1
+    condition = (bucket >= 0) & (bucket < n_buckets)
+    seconds = np.arange(length)[condition]
+
+    # One row of weighted trade signs and trades per bucket
+    weighted_sign = np.zeros((n_buckets, length))
+    weighted_sign[bucket[condition], seconds] = \
+        (trade_sign_j * trade_count_j)[condition]
+    trade_count = np.zeros((n_buckets, length))
+    trade_count[bucket[condition], seconds] = trade_count_j[condition]
+
+    responses[0] = taq_response_lags_responses_activity_data(
+        midpoint_i, weighted_sign, __tau__)
+
+    # Number of trades in the first length - tau_idx - 1 seconds
+    trades_sum = np.cumsum(trade_count, axis=1)
+    responses[1] = np.concatenate(
+        (np.zeros((n_buckets, 1)), trades_sum), axis=1)[:, length - lags]
+
+    return responses
+
+# ----------------------------------------------------------------------------
+
+
+def taq_response_year_buckets_responses_activity_data(ticker_i, ticker_j,
+                                                      year, edges=None,
+                                                      quantiles=None):
+    """Computes the activity conditioned response of a year.
+
+    Using the taq_response_day_buckets_responses_activity_data function
+    computes the response of every trades per minute bucket for a year. The
+    buckets are given by the edges or by the quantiles of the trades per
+    minute of ticker j in the year.
+
+    :param ticker_i: string of the abbreviation of the stock to be analyzed
+     (i.e. 'AAPL').
+    :param ticker_j: string of the abbreviation of the stock to be analyzed
+     (i.e. 'AAPL').
+    :param year: string of the year to be analyzed (i.e '2016').
+    :param edges: sequence of the edges of the trades per minute buckets
+     (default __activity_edges__).
+    :param quantiles: sequence of the quantiles in [0, 1] used as edges of
+     the buckets (i.e. (0, 0.25, 0.5, 0.75, 1)). If it is given, the edges
+     are not used.
+    :return: tuple -- The function returns a tuple with numpy arrays of the
+     response and the number of trades of every bucket and the edges, or None
+     if the quantiles can not be computed.
+    """
+
+    function_name = taq_response_year_buckets_responses_activity_data \
+        .__name__
+    taq_data_tools_responses_activity \
+        .taq_function_header_print_data(function_name, ticker_i, ticker_j,
+                                        year, '', '')
+
+    if (quantiles is not None):
+        edges = taq_activity_edges_responses_activity_data(ticker_j, year,
+                                                           quantiles)
+        if (edges is None):
+            return None
+        # Every set of quantiles and every set of edges is saved in its own
+        # file
+        save_name = f'{function_name}_quantiles_' \
+            + hashlib.sha1(np.asarray(quantiles, dtype=float).tobytes()) \
+            .hexdigest()[:10]
+    elif (edges is None):
+        edges = __activity_edges__
+        save_name = function_name
+    else:
+        save_name = f'{function_name}_edges_' \
+            + hashlib.sha1(np.asarray(edges, dtype=float).tobytes()) \
+            .hexdigest()[:10]
+
+    edges = np.asarray(edges, dtype=float)
+
+    dates = taq_data_tools_pool \
+        .taq_catalog_dates([ticker_i, ticker_j], year)
+
+    args_prod = iprod([ticker_i], [ticker_j], dates, [edges])
+
+    # Parallel computation of the responses of every bucket
+    with taq_data_tools_pool.taq_pool() as pool:
+        values = pool.starmap(
+            taq_response_day_buckets_responses_activity_data, args_prod,
+            tickers=(0, 1), date=2, data='arrays')
+
+    # A pair of tickers without days with data has no trades, so the averages
+    # are NaN as in the days without data
+    if (not dates):
+        values = [np.zeros((2, len(edges) - 1, __tau__))]
+
+    # To obtain the total response, I sum over all the response values and
+    # all the amount of trades of every bucket (averaging values)
+    values_final = np.sum(values, axis=0)
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        responses_val = values_final[0] / values_final[1]
+
+    # Saving data
+    taq_data_tools_responses_activity \
+        .taq_save_data(save_name, (responses_val, values_final[1], edges),
+                       ticker_i, ticker_j, year, '', '')
+
+    return (responses_val, values_final[1], edges)
+
+# ----------------------------------------------------------------------------
+
+
 def main():
     """The main function of the script.
 
@@ -5,13 +5,19 @@ The functions in the module run the complete analysis and plot of the TAQ data.
 This script requires the following modules:
     * itertools
     * multiprocessing
+    * os
     * pandas
     * pickle
+    * sys
     * taq_data_analysis_responses_activity
     * taq_data_plot_responses_activity
+    * taq_data_tools_pool
     * taq_data_tools_responses_activity
 
 The module contains the following functions:
+    * taq_data_generator - generates all the analysis from the TAQ data.
+    * taq_plot_generator - generates all the plots from the analysis of the
+      TAQ data.
     * taq_data_plot_generator - generates all the analysis and plots from the
       TAQ data.
     * main - the main function of the script.
@@ -24,18 +30,23 @@ The module contains the following functions:
 
 from itertools import product as iprod
 import multiprocessing as mp
+import os
 import pandas as pd
 import pickle
+import sys
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                             '..', '..', 'taq_pool', 'taq_algorithms'))
 import taq_data_analysis_responses_activity
 import taq_data_plot_responses_activity
+import taq_data_tools_pool
 import taq_data_tools_responses_activity
 
 # -----------------------------------------------------------------------------
 
 
-def taq_data_plot_generator(tickers, year):
-    """Generates all the analysis and plots from the TAQ data.
+def taq_data_generator(tickers, year):
+    """Generates all the analysis from the TAQ data.
 
     :param tickers: list of the string abbreviation of the stocks to be
      analyzed (i.e. ['AAPL', 'MSFT']).
@@ -44,49 +55,85 @@ def taq_data_plot_generator(tickers, year):
      a value.
     """
 
-    date_list = taq_data_tools_responses_activity.taq_bussiness_days(year)
+    # The days of the year functions keep their checkpoints until the
+    # year results are saved
+    taq_data_tools_pool \
+        .taq_checkpoint_tasks(taq_data_analysis_responses_activity)
+
+    # Only the days with data of each ticker
+    args_prod = [(ticker, date) for ticker in tickers
+                 for date in taq_data_tools_pool
+                 .taq_catalog_days(ticker, year)]
 
     # Parallel computing
-    with mp.Pool(processes=mp.cpu_count()) as pool:
+    with taq_data_tools_pool.taq_pool() as pool:
         # Basic functions
         pool.starmap(taq_data_analysis_responses_activity
                      .taq_trades_count_responses_activity_data,
-                     iprod(tickers, date_list))
+                     args_prod)
 
     # Specific functions
-    # Self-response
+    # Self- and cross-response. Every day is loaded once for all the tickers
+    taq_data_analysis_responses_activity \
+        .taq_responses_year_responses_activity_data(tickers, year)
+
+    # Activity conditioned self-response
     for ticker in tickers:
 
         taq_data_analysis_responses_activity \
-            .taq_self_response_year_responses_activity_data(ticker, year)
+            .taq_response_year_buckets_responses_activity_data(ticker, ticker,
+                                                               year)
 
-    ticker_prod = iprod(tickers, tickers)
-    # ticker_prod = [('AAPL', 'MSFT'), ('MSFT', 'AAPL'),
-    #                ('GS', 'JPM'), ('JPM', 'GS'),
-    #                ('CVX', 'XOM'), ('XOM', 'CVX'),
-    #                ('GOOG', 'MA'), ('MA', 'GOOG'),
-    #                ('CME', 'GS'), ('GS', 'CME'),
-    #                ('RIG', 'APA'), ('APA', 'RIG')]
+    return None
 
-    # Cross-response
-    for ticks in ticker_prod:
+# -----------------------------------------------------------------------------
 
-        taq_data_analysis_responses_activity \
-            .taq_cross_response_year_responses_activity_data(ticks[0],
-                                                             ticks[1], year)
+
+def taq_plot_generator(tickers, year):
+    """Generates all the plots from the analysis of the TAQ data.
+
+    :param tickers: list of the string abbreviation of the stocks to be
+     analyzed (i.e. ['AAPL', 'MSFT']).
+    :param year: string of the year to be analyzed (i.e '2016').
+    :return: None -- The function saves the plots in files and does not
+     return a value.
+    """
+
+    workers = taq_data_tools_pool.taq_workers()
 
     # Parallel computing
-    with mp.Pool(processes=mp.cpu_count()) as pool:
+    with mp.Pool(processes=workers) as pool:
         # Plot
         pool.starmap(taq_data_plot_responses_activity
                      .taq_self_response_year_avg_plot,
                      iprod(tickers, [year]))
     # Parallel computing
-    with mp.Pool(processes=mp.cpu_count()) as pool:
+    with mp.Pool(processes=workers) as pool:
         # Plot
         pool.starmap(taq_data_plot_responses_activity
                      .taq_cross_response_year_avg_plot,
                      iprod(tickers, tickers, [year]))
+        pool.starmap(taq_data_plot_responses_activity
+                     .taq_response_year_buckets_plot,
+                     [(ticker, ticker, year) for ticker in tickers])
+
+    return None
+
+# -----------------------------------------------------------------------------
+
+
+def taq_data_plot_generator(tickers, year):
+    """Generates all the analysis and plots from the TAQ data.
+
+    :param tickers: list of the string abbreviation of the stocks to be
+     analyzed (i.e. ['AAPL', 'MSFT']).
+    :param year: string of the year to be analyzed (i.e '2016').
+    :return: None -- The function saves the data in a file and does not return
+     a value.
+    """
+
+    taq_data_generator(tickers, year)
+    taq_plot_generator(tickers, year)
 
     return None
 
@@ -13,6 +13,8 @@ The module contains the following functions:
       year.
     * taq_cross_response_year_avg_plot - plots the cross-response average for a
       year.
+    * taq_response_year_buckets_plot - plots the activity conditioned response
+      for a year.
     * main - the main function of the script.
 
 .. moduleauthor:: Juan Camilo Henao Londono <www.github.com/juanhenao21>
@@ -141,6 +143,71 @@ def taq_cross_response_year_avg_plot(ticker_i, ticker_j, year):
 # ----------------------------------------------------------------------------
 
 
+def taq_response_year_buckets_plot(ticker_i, ticker_j, year):
+    """Plots the activity conditioned response for a year.
+
+    :param ticker_i: string of the abbreviation of the stock to be analyzed
+     (i.e. 'AAPL')
+    :param ticker_j: string of the abbreviation of the stock to be analyzed
+     (i.e. 'AAPL')
+    :param year: string of the year to be analyzed (i.e '2008')
+    :return: None -- The function saves the plot in a file and does not return
+     a value.
+    """
+
+    try:
+        function_name = taq_response_year_buckets_plot.__name__
+        taq_data_tools_responses_activity \
+            .taq_function_header_print_plot(function_name, ticker_i,
+                                            ticker_j, year, '', '')
+
+        if (ticker_i == ticker_j):
+            file_ticker = f'{ticker_i}'
+        else:
+            file_ticker = f'{ticker_i}i_{ticker_j}j'
+
+        responses, trades, edges = pickle.load(open(
+                        f'../../taq_data/responses_activity_data_{year}'
+                        + '/taq_response_year_buckets_responses_activity'
+                        + '_data/taq_response_year_buckets_responses'
+                        + f'_activity_data_{year}_{file_ticker}.pickle',
+                        'rb'))
+
+        figure = plt.figure(figsize=(16, 9))
+        for b_idx in range(len(responses)):
+            # Buckets without trades
+            if (trades[b_idx, 0] == 0):
+                continue
+            plt.semilogx(responses[b_idx], linewidth=3,
+                         label=f'[{edges[b_idx]:g}, {edges[b_idx + 1]:g})')
+        plt.legend(loc='best', fontsize=15, ncol=2,
+                   title='Trades per minute')
+        plt.title(f'Response {ticker_i} - {ticker_j}', fontsize=40)
+        plt.xlabel(r'$\tau \, [s]$', fontsize=35)
+        plt.ylabel(r'$R_{ij}(\tau)$', fontsize=35)
+        plt.xticks(fontsize=25)
+        plt.yticks(fontsize=25)
+        plt.xlim(1, 1000)
+        plt.ticklabel_format(style='sci', axis='y', scilimits=(0, 0))
+        plt.grid(True)
+        plt.tight_layout()
+
+        # Plotting
+        taq_data_tools_responses_activity \
+            .taq_save_plot(function_name, figure, ticker_i, ticker_j, year,
+                           '')
+
+        return None
+
+    except FileNotFoundError as e:
+        print('No data')
+        print(e)
+        print()
+        return None
+
+# ----------------------------------------------------------------------------
+
+
 def main():
     """The main function of the script.
 
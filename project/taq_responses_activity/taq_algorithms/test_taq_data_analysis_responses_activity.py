@@ -0,0 +1,232 @@
+''' TAQ data analysis tests.
+
+The tests check the vectorized functions of the
+taq_data_analysis_responses_activity module against the loops of the
+original implementation on synthetic days.
+
+This script requires the following modules:
+    * numpy
+    * os
+    * pickle
+    * pytest
+    * sys
+    * taq_data_analysis_responses_activity
+
+The module contains the following functions:
+    * taq_synthetic_day - saves the data of a synthetic day.
+    * taq_folder - runs a test from a folder with the layout of the project.
+    * test_taq_response_lags_responses_activity_data - checks the responses
+      of all the time lags against the loop over the time lags.
+    * test_taq_trades_count_responses_activity_data - checks the number of
+      trades per second against the loop over the seconds.
+    * test_taq_trades_minute_responses_activity_data - checks the number of
+      trades per minute against the loop over the seconds.
+    * test_taq_responses_day_responses_activity_data - checks the responses
+      of several tickers against the self- and cross-responses of a day.
+
+.. moduleauthor:: Juan Camilo Henao Londono <www.github.com/juanhenao21>
+'''
+
+# ----------------------------------------------------------------------------
+# Modules
+
+import numpy as np
+import os
+import pickle
+import pytest
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import taq_data_analysis_responses_activity as analysis
+
+# ----------------------------------------------------------------------------
+
+
+def taq_synthetic_day(path, ticker, date, seed):
+    """Saves the data of a synthetic day.
+
+    Saves the trade signs of the trades, and the midpoint price, trade signs
+    and number of trades of every second of a day in the folders read by the
+    functions of the module.
+
+    :param path: pathlib path of the folder with the taq_data folder.
+    :param ticker: string of the abbreviation of the stock (i.e. 'AAPL').
+    :param date: string with the date of the day (i.e. '2008-01-02').
+    :param seed: integer used to seed the random generator (i.e. 0).
+    :return: None -- The function saves the data in files and does not
+     return a value.
+    """
+
+    year, month, day = date.split('-')
+    rng = np.random.default_rng(seed)
+    length = 22200
+
+    # Trades inside and outside the open market time
+    t = np.sort(rng.integers(34700, 57100, 5000))
+    sign = rng.choice([-1., 1.], len(t))
+
+    midpoint = 100 + np.cumsum(rng.normal(0, 0.01, length))
+    trade_sign = rng.choice([-1., 0., 1.], length, p=[0.3, 0.4, 0.3])
+    trade_count = np.abs(trade_sign) * rng.integers(1, 5, length)
+
+    files = {
+        f'responses_trade_data_{year}/taq_trade_signs_trade_data/taq_trade'
+        + f'_signs_trade_data_{year}{month}{day}_{ticker}.pickle':
+        (t, t, sign),
+        f'responses_physical_data_{year}/taq_midpoint_physical_data/taq'
+        + f'_midpoint_physical_data_midpoint_{year}{month}{day}_{ticker}'
+        + '.pickle':
+        midpoint,
+        f'responses_physical_data_{year}/taq_trade_signs_physical_data/taq'
+        + f'_trade_signs_physical_data_{year}{month}{day}_{ticker}.pickle':
+        (None, None, trade_sign),
+        f'responses_activity_data_{year}/taq_trades_count_responses_activity'
+        + '_data/taq_trades_count_responses_activity_data'
+        + f'_{year}{month}{day}_{ticker}.pickle':
+        (np.arange(34801, 57001), trade_count),
+    }
+
+    for name, data in files.items():
+        file_name = path / 'taq_data' / name
+        file_name.parent.mkdir(parents=True, exist_ok=True)
+        pickle.dump(data, open(file_name, 'wb'))
+
+    return None
+
+# ----------------------------------------------------------------------------
+
+
+@pytest.fixture
+def taq_folder(tmp_path, monkeypatch):
+    """Runs a test from a folder with the layout of the project.
+
+    :param tmp_path: pytest fixture with a temporary folder.
+    :param monkeypatch: pytest fixture to change the working directory.
+    :return: pathlib path -- The function returns the temporary folder.
+    """
+
+    (tmp_path / 'project' / 'taq_algorithms').mkdir(parents=True)
+    monkeypatch.chdir(tmp_path / 'project' / 'taq_algorithms')
+
+    return tmp_path
+
+# ----------------------------------------------------------------------------
+
+
+@pytest.mark.parametrize('rows', [None, 3])
+def test_taq_response_lags_responses_activity_data(rows):
+    """Checks the responses of all the time lags against the loop.
+
+    :param rows: integer with the number of rows of weighted trade signs.
+     None uses a one dimensional array.
+    """
+
+    rng = np.random.default_rng(0)
+    length = 5000
+    tau = 1000
+
+    midpoint = 100 + np.cumsum(rng.normal(0, 0.01, length))
+    shape = (length,) if rows is None else (rows, length)
+    weighted_sign = rng.choice([-1., 0., 1.], shape) \
+        * rng.integers(1, 5, shape)
+
+    response = analysis.taq_response_lags_responses_activity_data(
+        midpoint, weighted_sign, tau)
+
+    expected = np.zeros(shape[:-1] + (tau,))
+    for tau_idx in range(tau):
+        expected[..., tau_idx] = np.sum(
+            ((midpoint[tau_idx + 1:] - midpoint[:-tau_idx - 1])
+             / midpoint[:-tau_idx - 1]) * weighted_sign[..., :-tau_idx - 1],
+            axis=-1)
+
+    assert np.allclose(response, expected, rtol=1e-9, atol=1e-12)
+
+# ----------------------------------------------------------------------------
+
+
+def test_taq_trades_count_responses_activity_data(taq_folder):
+    """Checks the number of trades per second against the loop.
+
+    :param taq_folder: fixture with the folder of the synthetic data.
+    """
+
+    taq_synthetic_day(taq_folder, 'AAA', '2008-01-02', 0)
+    (taq_folder / 'taq_data' / 'responses_activity_data_2008').mkdir(
+        exist_ok=True)
+
+    full_time, trades_count = analysis \
+        .taq_trades_count_responses_activity_data('AAA', '2008-01-02')
+
+    t, _, trade_sign = pickle.load(open(
+        taq_folder / 'taq_data' / 'responses_trade_data_2008'
+        / 'taq_trade_signs_trade_data'
+        / 'taq_trade_signs_trade_data_20080102_AAA.pickle', 'rb'))
+
+    expected = np.zeros(len(full_time))
+    for t_idx, t_val in enumerate(full_time):
+        expected[t_idx] = len(trade_sign[t_val == t])
+
+    assert np.array_equal(full_time, np.arange(34801, 57001))
+    assert np.array_equal(trades_count, expected)
+
+# ----------------------------------------------------------------------------
+
+
+def test_taq_trades_minute_responses_activity_data(taq_folder):
+    """Checks the number of trades per minute against the loop.
+
+    :param taq_folder: fixture with the folder of the synthetic data.
+    """
+
+    taq_synthetic_day(taq_folder, 'AAA', '2008-01-02', 0)
+
+    trade_count, trades_minute = analysis \
+        .taq_trades_minute_responses_activity_data('AAA', '2008-01-02')
+
+    # The minutes start at 34800 s and the last second is in the last minute
+    full_time = np.arange(34801, 57001)
+    expected = np.zeros(len(full_time))
+    for t_idx, t_val in enumerate(full_time):
+        minute_idx = min((t_val - 34800) // 60, 369)
+        start = 34800 + 60 * minute_idx
+        end = 57001 if minute_idx == 369 else start + 60
+        minute = (full_time >= start) & (full_time < end)
+        expected[t_idx] = np.sum(trade_count[minute])
+
+    assert np.array_equal(trades_minute, expected)
+
+# ----------------------------------------------------------------------------
+
+
+def test_taq_responses_day_responses_activity_data(taq_folder):
+    """Checks the responses of several tickers against the pairwise ones.
+
+    One of the tickers has no data in the day, so its pairs are zero.
+
+    :param taq_folder: fixture with the folder of the synthetic data.
+    """
+
+    tickers = ['AAA', 'BBB', 'CCC']
+    for seed, ticker in enumerate(tickers[:2]):
+        taq_synthetic_day(taq_folder, ticker, '2008-01-02', seed)
+
+    responses = analysis.taq_responses_day_responses_activity_data(
+        tickers, '2008-01-02')
+
+    for i_idx, ticker_i in enumerate(tickers):
+        for j_idx, ticker_j in enumerate(tickers):
+
+            if (ticker_i == ticker_j):
+                expected = analysis \
+                    .taq_self_response_day_responses_activity_data(
+                        ticker_i, '2008-01-02')
+            else:
+                expected = analysis \
+                    .taq_cross_response_day_responses_activity_data(
+                        ticker_i, ticker_j, '2008-01-02')
+
+            assert np.allclose(responses[i_idx, j_idx], expected,
+                               rtol=1e-9, atol=1e-12)
+
+# ----------------------------------------------------------------------------
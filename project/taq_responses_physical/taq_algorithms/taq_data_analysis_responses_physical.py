@@ -7,6 +7,7 @@ the `paper
 <https://link.springer.com/content/pdf/10.1140/epjb/e2016-60818-y.pdf>`_.
 
 This script requires the following modules:
+    * glob
     * itertools
     * multiprocessing
     * numpy
@@ -14,16 +15,51 @@ This script requires the following modules:
     * pandas
     * pickle
     * subprocess
+    * sys
+    * taq_data_tools_pool
     * taq_data_tools_responses_physical
 
 The module contains the following functions:
     * taq_build_from_scratch - extract data to daily CSV files.
     * taq_data_extract - extracts the data for every day in a year.
     * taq_daily_data_extract - parallelize the taq_data_extract function.
+    * taq_catalog_file_data - reads the number of rows, size and time range
+      of a file of the tick store.
+    * taq_catalog_data - builds the catalog of the tick store of a year.
     * taq_midpoint_trade_data - computes the midpoint price of every trade.
     * taq_midpoint_physical_data - computes the midpoint price of every second.
+    * taq_midpoint_physical_policy_data - loads the midpoint price of every
+      second for a sampling policy.
     * taq_trade_signs_trade_data - computes the trade signs of every trade.
     * taq_trade_signs_physical_data - computes the trade signs of every second.
+    * taq_trade_signs_physical_load_data - loads the trade signs of every
+      second.
+    * taq_events_physical_data - computes the midpoint price changes and
+      trade signs of every bin.
+    * taq_events_physical_load_data - loads the midpoint price changes and
+      trade signs of every bin.
+    * taq_response_kernel_responses_physical_data - computes the response of
+      a day from the arrays of a day.
+    * taq_correlator_kernel_responses_physical_data - computes the trade sign
+      correlator of a day from the arrays of a day.
+    * taq_sparse_response_kernel_responses_physical_data - computes the
+      response of a day from the events of a day.
+    * taq_sparse_correlator_kernel_responses_physical_data - computes the
+      trade sign correlator of a day from the events of a day.
+    * taq_checkpoint_day_responses_physical_data - computes a task of a day
+      and saves its result as a checkpoint.
+    * taq_checkpoint_date_responses_physical_data - computes the tasks of the
+      pairs of tickers in a day.
+    * taq_checkpoint_pairs_responses_physical_data - computes the tasks of
+      every day of one or more years for pairs of tickers.
+    * taq_checkpoint_year_responses_physical_data - computes the tasks of
+      every day of a year that are not finished.
+    * taq_years_pairs_responses_physical_data - computes the average over
+      every year of several years for pairs of tickers.
+    * taq_year_pairs_responses_physical_data - computes the average over a
+      year of pairs of tickers.
+    * taq_zeros_responses_physical_data - returns the result of a day without
+      data.
     * taq_self_response_day_responses_physical_data - computes the self
       response of a day.
     * taq_self_response_year_responses_physical_data - computes the self
@@ -32,6 +68,8 @@ The module contains the following functions:
       response of a day.
     * taq_cross_response_year_responses_physical_data - computes the cross
       response of a year.
+    * taq_cross_response_sweep_responses_physical_data - computes the cross
+      response of a year for all the pairs of tickers.
     * taq_trade_sign_self_correlator_day_responses_physical_data - computes the
       trade sign self correlator of a day.
     * taq_trade_sign_self_correlator_year_responses_physical_data - computes
@@ -40,6 +78,36 @@ The module contains the following functions:
       the trade sign cross correlator of a day.
     * taq_trade_sign_cross_correlator_year_responses_physical_data - computes
       the trade sign cross correlator of a year.
+    * taq_trade_sign_cross_correlator_sweep_responses_physical_data -
+      computes the trade sign cross correlator of a year for all the pairs.
+    * taq_years_tasks_responses_physical_data - lists the tasks of the year
+      functions of the responses and correlators.
+    * taq_years_responses_physical_data - computes the responses and
+      correlators of several years.
+    * taq_range_responses_physical_data - computes a response or correlator
+      over a range of dates.
+    * taq_bootstrap_kernel_responses_physical_data - computes the bootstrap
+      band of a year from its partial sums.
+    * taq_bootstrap_pair_responses_physical_data - computes the bootstrap band
+      of a year of a pair of tickers.
+    * taq_bootstrap_year_responses_physical_data - computes the bootstrap
+      bands of a response or correlator of a year.
+    * taq_shared_plan_responses_physical_data - plans the workers and the
+      memory of the responses and correlators of a year in shared memory.
+    * taq_shared_cube_responses_physical_data - loads the midpoint prices and
+      trade signs of a year in shared memory.
+    * taq_shared_rows_responses_physical_data - computes the responses and
+      correlators of a range of tickers and days.
+    * taq_shared_year_responses_physical_data - computes the responses and
+      correlators of a year in shared memory.
+    * taq_online_start_responses_physical_data - starts the online estimator
+      of the responses and correlators.
+    * taq_online_update_responses_physical_data - updates the online
+      estimator with the data of a second.
+    * taq_online_curves_responses_physical_data - returns the current
+      responses and correlators of the online estimator.
+    * taq_online_replay_responses_physical_data - replays the midpoint prices
+      and trade signs of days in time order.
     * main - the main function of the script.
 
 .. moduleauthor:: Juan Camilo Henao Londono <www.github.com/juanhenao21>
@@ -48,6 +116,7 @@ The module contains the following functions:
 # ----------------------------------------------------------------------------
 # Modules
 
+import glob
 from itertools import product as iprod
 import multiprocessing as mp
 import numpy as np
@@ -55,10 +124,15 @@ import os
 import pandas as pd
 import pickle
 import subprocess
+import sys
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                             '..', '..', 'taq_pool', 'taq_algorithms'))
+import taq_data_tools_pool
 import taq_data_tools_responses_physical
 
 __tau__ = 1000
+__midpoint_policies__ = ('last', 'mean', 'time_weighted', 'median')
 
 # ----------------------------------------------------------------------------
 
@@ -131,18 +205,21 @@ def taq_build_from_scratch(tickers, year):
 # -----------------------------------------------------------------------------
 
 
-def taq_data_extract(ticker, type, year):
+def taq_data_extract(ticker, type, year, chunksize=10 ** 7):
     """Extracts the data for every day in a year.
 
     Extracts the trades and quotes (TAQ) data for a day from a CSV file with
     the information of a whole year. The time range for each day is from 9:30
-    to 16:00, that means, the open market time.
+    to 16:00, that means, the open market time. The CSV file is read in
+    chunks of rows.
 
     :param ticker: string of the abbreviation of the stock to be analyzed
      (i.e. 'AAPL').
     :param type: string with the type of the data to be extracted
      (i.e. 'trades' or 'quotes').
     :param year: string of the year to be analyzed (i.e. '2016').
+    :param chunksize: integer with the number of rows of a chunk (default
+     10 ** 7).
     :return: None -- The function extracts the data and does not return a
      value.
     """
@@ -155,7 +232,6 @@ def taq_data_extract(ticker, type, year):
     try:
 
         df = pd.DataFrame()
-        chunksize = 10 ** 7
 
         date_list = taq_data_tools_responses_physical.taq_bussiness_days(year)
 
@@ -247,7 +323,9 @@ def taq_data_extract(ticker, type, year):
 def taq_daily_data_extract(tickers, year):
     """ Extracts data to daily CSV files.
 
-    Extract and filter the data for every day of a year in HDF5 files.
+    Extract and filter the data for every day of a year in HDF5 files and
+    builds the catalog of the files. The rows of the chunks of the CSV files
+    are set by the memory limit of the tasks.
 
     :param tickers: list of the string abbreviation of the stocks to be
      analyzed (i.e. ['AAPL', 'MSFT']).
@@ -258,12 +336,18 @@ def taq_daily_data_extract(tickers, year):
 
     # Extract daily data
     print('Extracting daily data')
-    # Parallel computing
-    with mp.Pool(processes=mp.cpu_count()) as pool:
-        pool.starmap(taq_data_extract, iprod(tickers, ['quotes'], [year]))
-    # Parallel computing
-    with mp.Pool(processes=mp.cpu_count()) as pool:
-        pool.starmap(taq_data_extract, iprod(tickers, ['trades'], [year]))
+    # Every process reads a CSV file, and the chunks of all the processes fit
+    # in the memory limit
+    workers = min(taq_data_tools_pool.taq_workers(),
+                  len(tickers)) or 1
+
+    for data_type in ('quotes', 'trades'):
+        chunksize = taq_data_tools_responses_physical \
+            .taq_chunk_size(data_type, workers)
+        # Parallel computing
+        with mp.Pool(processes=workers) as pool:
+            pool.starmap(taq_data_extract,
+                         iprod(tickers, [data_type], [year], [chunksize]))
 
     # Delete CSV folder
     # Obtain the absolute path of the current file and split it
@@ -274,11 +358,75 @@ def taq_daily_data_extract(tickers, year):
     # Remove CSV folder
     subprocess.call(f'rm -r {f_path}', shell=True)
 
+    # The tasks of the year are planned with the new files
+    taq_catalog_data(year)
+
     return None
 
 # -----------------------------------------------------------------------------
 
 
+def taq_catalog_file_data(path):
+    """Reads the number of rows, size and time range of a tick store file.
+
+    :param path: string of the path of a HDF5 file of the tick store (i.e.
+     '../../taq_data/hdf5_daily_data_2008/taq_AAPL_quotes_2008-01-02.h5').
+    :return: tuple -- The function returns a tuple with the ticker, date,
+     type, number of rows, size in bytes and first and last second of the
+     file.
+    """
+
+    # The files are named taq_{ticker}_{type}_{date}.h5
+    ticker, data_type, date = os.path.basename(path)[4:-3].rsplit('_', 2)
+
+    time = taq_data_tools_pool \
+        .taq_read_hdf(path, key=data_type, columns=['Time'])['Time']
+
+    return (ticker, date, data_type, len(time), os.path.getsize(path),
+            time.min(), time.max())
+
+# ----------------------------------------------------------------------------
+
+
+def taq_catalog_data(year):
+    """Builds the catalog of the tick store of a year.
+
+    The catalog has a row with the ticker, date, type, number of rows, size
+    in bytes and first and last second of every HDF5 file of the tick store.
+    The taq_* modules use it to plan only the tasks of the days with data of
+    the tickers, instead of the tasks of every business day of the year
+    (i.e. the market holidays), and to sort the tasks by their number of
+    rows. The catalog is built again after the extraction of the data.
+
+    :param year: string of the year to be analyzed (i.e '2016').
+    :return: DataFrame -- The function returns a pandas DataFrame with the
+     catalog.
+    """
+
+    function_name = taq_catalog_data.__name__
+    taq_data_tools_responses_physical \
+        .taq_function_header_print_data(function_name, '', '', year, '', '')
+
+    paths = sorted(glob.glob(f'../../taq_data/hdf5_daily_data_{year}/taq_*'
+                             + '_*_*.h5'))
+
+    # Parallel reading of the files
+    with taq_data_tools_responses_physical.taq_pool() as pool:
+        files = pool.starmap(taq_catalog_file_data,
+                             [(path,) for path in paths])
+
+    catalog_df = pd.DataFrame(files, columns=['Ticker', 'Date', 'Type', 'Rows',
+                                              'Bytes', 'Time_Start',
+                                              'Time_End'])
+
+    # Saving data
+    taq_data_tools_responses_physical.taq_save_catalog(catalog_df, year)
+
+    return catalog_df
+
+# ----------------------------------------------------------------------------
+
+
 def taq_midpoint_trade_data(ticker, date):
     """Computes the midpoint price of every trade.
 
@@ -307,10 +455,11 @@ def taq_midpoint_trade_data(ticker, date):
         abs_path = os.path.abspath(__file__).split('/')
         # Take the path from the start to the project folder
         root_path = '/'.join(abs_path[:abs_path.index('project') + 1])
-        data_quotes_trade = pd.read_hdf(root_path
-                                        + f'/taq_data/hdf5_daily_data_{year}/'
-                                        + f'taq_{ticker}_quotes_{date}.h5',
-                                        key='/quotes')
+        data_quotes_trade = taq_data_tools_pool \
+            .taq_read_hdf(root_path
+                          + f'/taq_data/hdf5_daily_data_{year}/'
+                          + f'taq_{ticker}_quotes_{date}.h5',
+                          key='/quotes')
 
         time_q = data_quotes_trade['Time'].to_numpy()
         bid_q = data_quotes_trade['Bid'].to_numpy()
@@ -343,11 +492,18 @@ def taq_midpoint_physical_data(ticker, date):
     every second. To fill the time spaces when nothing happens I replicate the
     last value calculated until a change in the price happens.
 
+    The midpoint price of a second can be sampled with different policies
+    (see __midpoint_policies__): the last midpoint price of the second (used
+    in the paper), the arithmetic mean, the time weighted mean and the median
+    of the midpoint prices in the second. All the policies are computed from
+    the same sorted quotes and saved side by side, so the responses can be
+    computed with every policy without loading the TAQ data again.
+
     :param ticker: string of the abbreviation of the stock to be analyzed
      (i.e. 'AAPL').
     :param date: string with the date of the data to be extracted
      (i.e. '2008-01-02').
-    :return: numpy array.
+    :return: tuple -- The function returns a tuple with numpy arrays.
     """
 
     date_sep = date.split('-')
@@ -366,31 +522,47 @@ def taq_midpoint_physical_data(ticker, date):
         # Reproducing the paper time values. In the results the time interval
         # for the midpoint is [34800, 56999]
         full_time = np.array(range(34800, 57000))
-        midpoint = 0. * full_time
-
-        # Select the last midpoint price of every second. If there is no
-        # midpoint price in a second, takes the value of the previous second
-        for t_idx, t_val in enumerate(full_time):
 
-            condition = time_q == t_val
-            if (np.sum(condition)):
-                midpoint[t_idx] = midpoint_trade[condition][-1]
-
-            else:
-                midpoint[t_idx] = midpoint[t_idx - 1]
-
-        # Prevent zero values in dates when the first seconds does not have a
-        # midpoint price value
-        t_pos = 34800
-        while (not np.sum(time_q == t_pos)):
-            t_pos -= 1
-        m_pos = 0
-        condition_2 = time_q == t_pos
-        while (not midpoint[m_pos]):
-            midpoint[m_pos] = midpoint_trade[condition_2][-1]
-            m_pos += 1
-
-        assert not np.sum(midpoint == 0)
+        # A stable sort keeps the order of the quotes inside every second, so
+        # the last quote of a second is still the last one after sorting
+        order = np.argsort(time_q, kind='stable')
+        time_s = time_q[order]
+        midpoint_s = midpoint_trade[order]
+
+        # Position of the first and last quote of every second with quotes
+        start = np.concatenate(([0], np.flatnonzero(np.diff(time_s)) + 1))
+        end = np.append(start[1:], len(time_s))
+        quotes_sec = end - start
+        time_sec = time_s[start]
+
+        midpoint_sum = np.add.reduceat(midpoint_s, start)
+        midpoint_last = midpoint_s[end - 1]
+        midpoint_mean = midpoint_sum / quotes_sec
+        # The quotes of a second are assumed to be equally spaced in the
+        # second. The midpoint price of the previous second holds until the
+        # first quote arrives, and every quote holds until the next one
+        midpoint_prev = np.concatenate(([midpoint_mean[0]],
+                                        midpoint_last[:-1]))
+        midpoint_time_w = (midpoint_prev + midpoint_sum) / (quotes_sec + 1)
+        # Sorting the quotes of every second by price gives the median
+        midpoint_p = midpoint_trade[np.lexsort((midpoint_trade, time_q))]
+        midpoint_median = (midpoint_p[start + (quotes_sec - 1) // 2]
+                           + midpoint_p[start + quotes_sec // 2]) / 2
+
+        # Select the value of the last second with quotes. If there is no
+        # midpoint price in a second, takes the value of the previous second.
+        # This also prevents zero values in dates when the first seconds does
+        # not have a midpoint price value
+        sec_idx = np.searchsorted(time_sec, full_time, side='right') - 1
+        sec_idx[sec_idx < 0] = 0
+
+        midpoint_policies = np.vstack((midpoint_last[sec_idx],
+                                       midpoint_mean[sec_idx],
+                                       midpoint_time_w[sec_idx],
+                                       midpoint_median[sec_idx]))
+        midpoint = midpoint_policies[__midpoint_policies__.index('last')]
+
+        assert not np.sum(midpoint_policies == 0)
 
         # Saving data
         if (not os.path.isdir(f'../../taq_data/responses_physical_data_{year}'
@@ -404,14 +576,22 @@ def taq_midpoint_physical_data(ticker, date):
             except FileExistsError:
                 print('Folder exists. The folder was not created')
 
-        pickle.dump(midpoint / 10000,
-                    open(f'../../taq_data/responses_physical_data_{year}/'
-                         + f'{function_name}/{function_name}_midpoint_'
-                         + f'{year}{month}{day}_{ticker}.pickle', 'wb'))
-        pickle.dump(full_time,
-                    open(f'../../taq_data/responses_physical_data_{year}/'
-                         + f'{function_name}/{function_name}_time.pickle',
-                         'wb'))
+        taq_data_tools_pool.taq_atomic_dump(
+            midpoint / 10000,
+            f'../../taq_data/responses_physical_data_{year}/'
+            + f'{function_name}/{function_name}_midpoint_'
+            + f'{year}{month}{day}_{ticker}.pickle')
+        taq_data_tools_pool.taq_atomic_dump(
+            midpoint_policies / 10000,
+            f'../../taq_data/responses_physical_data_{year}/'
+            + f'{function_name}/{function_name}_policies_'
+            + f'{year}{month}{day}_{ticker}.pickle')
+        # The seconds are the same for every ticker and day, so they are only
+        # saved by the first task
+        time_name = f'../../taq_data/responses_physical_data_{year}/' \
+            + f'{function_name}/{function_name}_time.pickle'
+        if (not os.path.isfile(time_name)):
+            taq_data_tools_pool.taq_atomic_dump(full_time, time_name)
 
         print('Data saved')
         print()
@@ -427,6 +607,53 @@ def taq_midpoint_physical_data(ticker, date):
 # ----------------------------------------------------------------------------
 
 
+def taq_midpoint_physical_policy_data(ticker, date, policy='last'):
+    """Loads the midpoint price of every second for a sampling policy.
+
+    Loads the midpoint prices saved by the taq_midpoint_physical_data function
+    for one of the sampling policies in __midpoint_policies__. The prices are
+    kept in the cache of day arrays of the process.
+
+    :param ticker: string of the abbreviation of the stock to be analyzed
+     (i.e. 'AAPL').
+    :param date: string with the date of the data to be extracted
+     (i.e. '2008-01-02').
+    :param policy: string with the sampling policy of the midpoint price
+     (i.e. 'last', 'mean', 'time_weighted' or 'median'). Default 'last'.
+    :return: numpy array.
+    """
+
+    date_sep = date.split('-')
+
+    year = date_sep[0]
+    month = date_sep[1]
+    day = date_sep[2]
+
+    assert policy in __midpoint_policies__
+
+    def loader():
+
+        if (policy == 'last'):
+            return pickle.load(open(
+                f'../../taq_data/responses_physical_data_{year}/taq_midpoint'
+                + '_physical_data/taq_midpoint_physical_data_midpoint'
+                + f'_{year}{month}{day}_{ticker}.pickle', 'rb'))
+
+        midpoint_policies = pickle.load(open(
+                f'../../taq_data/responses_physical_data_{year}/taq_midpoint'
+                + '_physical_data/taq_midpoint_physical_data_policies'
+                + f'_{year}{month}{day}_{ticker}.pickle', 'rb'))
+
+        return midpoint_policies[__midpoint_policies__.index(policy)]
+
+    midpoint = taq_data_tools_responses_physical \
+        .taq_cache_data(f'midpoint_{policy}', ticker, date, loader)
+
+    return midpoint
+
+# ----------------------------------------------------------------------------
+
+
 def taq_trade_signs_trade_data(ticker, date):
     """Computes the trade signs of every trade.
 
@@ -460,10 +687,11 @@ def taq_trade_signs_trade_data(ticker, date):
         abs_path = os.path.abspath(__file__).split('/')
         # Take the path from the start to the project folder
         root_path = '/'.join(abs_path[:abs_path.index('project') + 1])
-        data_trades_trade = pd.read_hdf(root_path
-                                        + f'/taq_data/hdf5_daily_data_{year}/'
-                                        + f'taq_{ticker}_trades_{date}.h5',
-                                        key='/trades')
+        data_trades_trade = taq_data_tools_pool \
+            .taq_read_hdf(root_path
+                          + f'/taq_data/hdf5_daily_data_{year}/'
+                          + f'taq_{ticker}_trades_{date}.h5',
+                          key='/trades')
 
         time_t = data_trades_trade['Time'].to_numpy()
         ask_t = data_trades_trade['Ask'].to_numpy()
@@ -571,17 +799,17 @@ def taq_trade_signs_physical_data(ticker, date):
 # ----------------------------------------------------------------------------
 
 
-def taq_self_response_day_responses_physical_data(ticker, date):
-    """Computes the self-response of a day.
+def taq_trade_signs_physical_load_data(ticker, date):
+    """Loads the trade signs of every second.
 
-    Using the midpoint price and trade signs of a ticker computes the self-
-    response during different time lags (:math:`\\tau`) for a day.
+    Loads the trade signs saved by the taq_trade_signs_physical_data function.
+    The signs are kept in the cache of day arrays of the process.
 
     :param ticker: string of the abbreviation of the stock to be analyzed
      (i.e. 'AAPL').
     :param date: string with the date of the data to be extracted
      (i.e. '2008-01-02').
-    :return: tuple -- The function returns a tuple with numpy arrays.
+    :return: numpy array.
     """
 
     date_sep = date.split('-')
@@ -590,114 +818,145 @@ def taq_self_response_day_responses_physical_data(ticker, date):
     month = date_sep[1]
     day = date_sep[2]
 
-    try:
-        # Load data
-        midpoint = pickle.load(open(
-                f'../../taq_data/responses_physical_data_{year}/taq_midpoint'
-                + f'_physical_data/taq_midpoint_physical_data_midpoint'
-                + f'_{year}{month}{day}_{ticker}.pickle', 'rb'))
+    def loader():
+
         _, _, trade_sign = pickle.load(open(
                 f'../../taq_data/responses_physical_data_{year}/taq_trade'
-                + f'_signs_physical_data/taq_trade_signs_physical_data'
+                + '_signs_physical_data/taq_trade_signs_physical_data'
                 + f'_{year}{month}{day}_{ticker}.pickle', 'rb'))
 
-        assert len(midpoint) == len(trade_sign)
-
-        # Array of the average of each tau. 10^3 s is used in the paper
-        self_response_tau = np.zeros(__tau__)
-        num = np.zeros(__tau__)
+        return trade_sign
 
-        # Calculating the midpoint price return and the self response function
+    trade_sign = taq_data_tools_responses_physical \
+        .taq_cache_data('trade_sign', ticker, date, loader)
 
-        # Depending on the tau value
-        for tau_idx in range(__tau__):
+    return trade_sign
 
-            trade_sign_tau = trade_sign[:-tau_idx - 1]
-            trade_sign_no_0_len = len(trade_sign_tau[trade_sign_tau != 0])
-            num[tau_idx] = trade_sign_no_0_len
-            # Obtain the midpoint price return. Displace the numerator tau
-            # values to the right and compute the return
-
-            # Midpoint price returns
-            log_return_sec = (midpoint[tau_idx + 1:]
-                              - midpoint[:-tau_idx - 1]) \
-                / midpoint[:-tau_idx - 1]
+# ----------------------------------------------------------------------------
 
-            # Obtain the self response value
-            if (trade_sign_no_0_len != 0):
-                product = log_return_sec * trade_sign_tau
-                self_response_tau[tau_idx] = np.sum(product)
 
-        return (self_response_tau, num)
+def taq_events_physical_data(ticker, date, resolution=1):
+    """Computes the midpoint price changes and trade signs of every bin.
 
-    except FileNotFoundError as e:
-        print('No data')
-        print(e)
-        print()
-        zeros = np.zeros(__tau__)
-        return (zeros, zeros)
+    The day from 9h40 to 15h50 is split in bins of the resolution. As in the
+    taq_midpoint_physical_data and taq_trade_signs_physical_data functions,
+    the midpoint price of a bin is the last midpoint price before the end of
+    the bin, and the trade sign of a bin (Eq. 2) uses the trades of the next
+    bin. Only the bins where the midpoint price changes and the bins with a
+    trade sign different to zero are saved, so the size of the data grows
+    with the number of events and not with the number of bins. With a
+    resolution of 1 s, the events give the same arrays of every second.
 
-# ----------------------------------------------------------------------------
+    :param ticker: string of the abbreviation of the stock to be analyzed
+     (i.e. 'AAPL').
+    :param date: string with the date of the data to be extracted
+     (i.e. '2008-01-02').
+    :param resolution: float with the length in seconds of the bins, between
+     0.001 and 1 (default 1).
+    :return: tuple -- The function returns a tuple with numpy arrays with the
+     bins (row 0) and values (row 1) of the midpoint price changes and of the
+     trade signs.
+    """
 
+    date_sep = date.split('-')
 
-def taq_self_response_year_responses_physical_data(ticker, year):
-    """Computes the self-response of a year.
+    year = date_sep[0]
+    month = date_sep[1]
+    day = date_sep[2]
 
-    Using the taq_self_response_day_responses_physical_data function computes
-    the self-response function for a year.
+    function_name = taq_events_physical_data.__name__
+    resolution_name = taq_data_tools_responses_physical \
+        .taq_resolution_name(resolution)
 
-    :param ticker: string of the abbreviation of stock to be analyzed
-     (i.e. 'AAPL').
-    :param year: string of the year to be analyzed (i.e '2016').
-    :return: tuple -- The function returns a tuple with numpy arrays.
-    """
+    try:
+        # Calculate the values of the midpoint price and the trade signs for
+        # all the events
+        time_q, midpoint_trade = taq_midpoint_trade_data(ticker, date)
+        (time_t, _,
+         identified_trades) = taq_trade_signs_trade_data(ticker, date)
 
-    function_name = taq_self_response_year_responses_physical_data.__name__
-    taq_data_tools_responses_physical \
-        .taq_function_header_print_data(function_name, ticker, ticker, year,
-                                        '', '')
+        # 34800 s = 9h40 - 57000 s = 15h50
+        bins = int(round((57000 - 34800) / resolution))
+
+        # Last midpoint price of every bin with quotes. The quotes before
+        # 9h40 are in the first bin
+        bin_q = np.floor((time_q - 34800) / resolution).astype(int)
+        order = np.argsort(bin_q, kind='stable')
+        bin_q = np.maximum(bin_q[order], 0)
+        midpoint_s = midpoint_trade[order]
+        last = np.append(np.flatnonzero(np.diff(bin_q)), len(bin_q) - 1)
+        last = last[bin_q[last] < bins]
+        midpoint_bin = bin_q[last]
+        midpoint_val = midpoint_s[last] / 10000
+
+        # Days without quotes before 15h50
+        if (not len(midpoint_bin)):
+            print('No data')
+            print()
+            return None
+
+        # The bins before the first quote take its value. Only the changes
+        # of the midpoint price are kept
+        midpoint_bin[0] = 0
+        change = np.concatenate(([True], np.diff(midpoint_val) != 0))
+        midpoint = np.vstack((midpoint_bin[change], midpoint_val[change]))
+
+        # Implementation of Eq. 2. Trade sign in each bin with trades
+        bin_t = np.floor((time_t - 34800) / resolution).astype(int) - 1
+        condition = (bin_t >= 0) & (bin_t < bins)
+        sign_bin, sign_inv = np.unique(bin_t[condition], return_inverse=True)
+        sign_val = np.sign(np.bincount(sign_inv,
+                                       weights=identified_trades[condition]))
+        trade_sign = np.vstack((sign_bin[sign_val != 0],
+                                sign_val[sign_val != 0]))
 
-    dates = taq_data_tools_responses_physical.taq_bussiness_days(year)
+        # Saving data
+        if (not os.path.isdir(f'../../taq_data/responses_physical_data_{year}'
+                              + f'/{function_name}/')):
 
-    self_values = []
-    args_prod = iprod([ticker], dates)
+            try:
+                os.mkdir(f'../../taq_data/responses_physical_data_{year}/'
+                         + f'{function_name}/')
+                print('Folder to save data created')
 
-    # Parallel computation of the self-responses. Every result is appended to
-    # a list
-    with mp.Pool(processes=mp.cpu_count()) as pool:
-        self_values.append(pool.starmap(
-            taq_self_response_day_responses_physical_data, args_prod))
+            except FileExistsError:
+                print('Folder exists. The folder was not created')
 
-    # To obtain the total self-response, I sum over all the self-response
-    # values and all the amount of trades (averaging values)
-    self_v_final = np.sum(self_values[0], axis=0)
+        taq_data_tools_pool.taq_atomic_dump(
+            (midpoint, trade_sign),
+            f'../../taq_data/responses_physical_data_{year}/'
+            + f'{function_name}/{function_name}{resolution_name}_'
+            + f'{year}{month}{day}_{ticker}.pickle')
 
-    self_response_val = self_v_final[0] / self_v_final[1]
-    self_response_avg = self_v_final[1]
+        print('Data saved')
+        print()
 
-    # Saving data
-    taq_data_tools_responses_physical \
-        .taq_save_data(function_name, self_response_val, ticker, ticker, year,
-                       '', '')
+        return (midpoint, trade_sign)
 
-    return (self_response_val, self_response_avg)
+    except TypeError as e:
+        print('Type Error')
+        print(e)
+        print()
+        return None
 
 # ----------------------------------------------------------------------------
 
 
-def taq_cross_response_day_responses_physical_data(ticker_i, ticker_j, date):
-    """Computes the cross-response of a day.
+def taq_events_physical_load_data(ticker, date, resolution):
+    """Loads the midpoint price changes and trade signs of every bin.
 
-    Using the midpoint price of ticker i and trade signs of ticker j computes
-    the cross-response during different time lags (:math:`\\tau`) for a day.
+    Loads the events saved by the taq_events_physical_data function. The
+    events are kept in the cache of day arrays of the process.
 
-    :param ticker_i: string of the abbreviation of the stock to be analyzed
-     (i.e. 'AAPL').
-    :param ticker_j: string of the abbreviation of the stock to be analyzed
+    :param ticker: string of the abbreviation of the stock to be analyzed
      (i.e. 'AAPL').
     :param date: string with the date of the data to be extracted
      (i.e. '2008-01-02').
-    :return: tuple -- The function returns a tuple with numpy arrays.
+    :param resolution: float with the length in seconds of the bins, between
+     0.001 and 1.
+    :return: tuple -- The function returns a tuple with numpy arrays with the
+     bins (row 0) and values (row 1) of the midpoint price changes and of the
+     trade signs.
     """
 
     date_sep = date.split('-')
@@ -706,302 +965,1208 @@ def taq_cross_response_day_responses_physical_data(ticker_i, ticker_j, date):
     month = date_sep[1]
     day = date_sep[2]
 
-    if (ticker_i == ticker_j):
+    resolution_name = taq_data_tools_responses_physical \
+        .taq_resolution_name(resolution)
 
-        # Self-response
-        return None
+    def loader(index):
 
-    else:
-        try:
-            # Load data
-            midpoint_i = pickle.load(open(
-                    f'../../taq_data/responses_physical_data_{year}/taq'
-                    + f'_midpoint_physical_data/taq_midpoint_physical_data'
-                    + f'_midpoint_{year}{month}{day}_{ticker_i}.pickle', 'rb'))
-            _, _, trade_sign_j = pickle.load(open(
-                    f'../../taq_data/responses_physical_data_{year}/taq_trade_'
-                    + f'signs_physical_data/taq_trade_signs_physical_data'
-                    + f'_{year}{month}{day}_{ticker_j}.pickle', 'rb'))
+        return pickle.load(open(
+            f'../../taq_data/responses_physical_data_{year}/taq_events'
+            + f'_physical_data/taq_events_physical_data{resolution_name}'
+            + f'_{year}{month}{day}_{ticker}.pickle', 'rb'))[index]
 
-            assert len(midpoint_i) == len(trade_sign_j)
+    midpoint = taq_data_tools_responses_physical \
+        .taq_cache_data(f'midpoint_events{resolution_name}', ticker, date,
+                        lambda: loader(0))
+    trade_sign = taq_data_tools_responses_physical \
+        .taq_cache_data(f'trade_sign_events{resolution_name}', ticker, date,
+                        lambda: loader(1))
 
-            # Array of the average of each tau. 10^3 s is used in the paper
-            cross_response_tau = np.zeros(__tau__)
-            num = np.zeros(__tau__)
+    return (midpoint, trade_sign)
 
-            # Calculating the midpoint return and the cross response function
+# ----------------------------------------------------------------------------
 
-            # Depending on the tau value
-            for tau_idx in range(__tau__):
 
-                trade_sign_tau = 1 * trade_sign_j[:-tau_idx - 1]
-                trade_sign_no_0_len = len(trade_sign_tau[trade_sign_tau != 0])
-                num[tau_idx] = trade_sign_no_0_len
-                # Obtain the midpoint price return. Displace the numerator tau
-                # values to the right and compute the return
+def taq_response_kernel_responses_physical_data(midpoint, trade_sign,
+                                                taus=None, windows=None):
+    """Computes the response of a day from the arrays of a day.
+
+    The self- and cross-response of a day use the midpoint prices of the
+    ticker i and the trade signs of the ticker j (the same ticker in the
+    self-response) for different time lags (:math:`\\tau`). The time lags
+    longer than the day have no trades. With time of day windows, the sums
+    and the amount of trades of every window, keyed by the second of the
+    trade sign, are taken from the cumulative sums of the same products of
+    the whole day.
+
+    :param midpoint: numpy array with the midpoint price of every second.
+    :param trade_sign: numpy array with the trade sign of every second.
+    :param taus: numpy array with the time lags in seconds. None uses every
+     time lag from 1 to 1000 s (default None).
+    :param windows: numpy array with the start seconds of the time of day
+     windows, generated with the taq_window_grid function of the tools. None
+     uses the whole day (default None).
+    :return: tuple -- The function returns a tuple with numpy arrays with the
+     sum of the response and the amount of trades of each time lag. With
+     windows, the arrays have a row for the whole day and a row for every
+     window.
+    """
 
-                # Midpoint price returns
-                log_return_i_sec = (midpoint_i[tau_idx + 1:]
-                                    - midpoint_i[:-tau_idx - 1]) \
-                    / midpoint_i[:-tau_idx - 1]
+    # Time lags of the response. 10^3 s is used in the paper
+    if (taus is None):
+        taus = range(1, __tau__ + 1)
 
-                # Obtain the cross response value
-                if (trade_sign_no_0_len != 0):
-                    product = log_return_i_sec * trade_sign_tau
-                    cross_response_tau[tau_idx] = np.sum(product)
+    rows = 1 if windows is None else len(windows) + 1
 
-            return (cross_response_tau, num)
+    # Array of the average of each tau
+    response_tau = np.zeros((rows, len(taus)))
+    num = np.zeros((rows, len(taus)))
 
-        except FileNotFoundError as e:
-            print('No data')
-            print(e)
-            print()
-            zeros = np.zeros(__tau__)
-            return (zeros, zeros)
+    if (windows is not None):
+        # Limits of the windows in the day (the trade sign k is the one of
+        # the second 34801 + k) and cumulative amount of trades
+        edges = np.clip(np.append(windows - 34801, len(trade_sign)), 0,
+                        len(trade_sign))
+        trades = np.concatenate(([0], np.cumsum(trade_sign != 0)))
 
-# ----------------------------------------------------------------------------
+    # Calculating the midpoint price return and the response function
 
+    # Depending on the tau value
+    for tau_idx, tau in enumerate(taus):
 
-def taq_cross_response_year_responses_physical_data(ticker_i, ticker_j, year):
-    """Computes the cross-response of a year.
+        trade_sign_tau = trade_sign[:-tau]
+        trade_sign_no_0_len = len(trade_sign_tau[trade_sign_tau != 0])
+        num[0, tau_idx] = trade_sign_no_0_len
+        # Obtain the midpoint price return. Displace the numerator tau
+        # values to the right and compute the return
 
-    Using the taq_cross_response_day_responses_physical_data function computes
-    the cross-response function for a year.
+        # Midpoint price returns
+        log_return_sec = (midpoint[tau:] - midpoint[:-tau]) / midpoint[:-tau]
 
-    :param ticker_i: string of the abbreviation of the stock to be analyzed
-     (i.e. 'AAPL').
-    :param ticker_j: string of the abbreviation of the stock to be analyzed
-     (i.e. 'AAPL').
-    :param year: string of the year to be analyzed (i.e '2016').
-    :return: tuple -- The function returns a tuple with numpy arrays.
+        # Obtain the response value
+        if (trade_sign_no_0_len != 0):
+            product = log_return_sec * trade_sign_tau
+            response_tau[0, tau_idx] = np.sum(product)
+
+            if (windows is not None):
+                limits = np.minimum(edges, len(product))
+                response_tau[1:, tau_idx] = np.diff(np.concatenate(
+                    ([0], np.cumsum(product)))[limits])
+
+        if (windows is not None):
+            num[1:, tau_idx] = np.diff(
+                trades[np.minimum(edges, len(trade_sign_tau))])
+
+    if (windows is None):
+        return (response_tau[0], num[0])
+
+    return (response_tau, num)
+
+# ----------------------------------------------------------------------------
+
+
+def taq_correlator_kernel_responses_physical_data(trade_sign_i, trade_sign_j,
+                                                  taus=None, windows=None):
+    """Computes the trade sign correlator of a day from the arrays of a day.
+
+    The self- and cross-correlator of a day use the trade signs of the ticker
+    i and the ticker j (the same ticker in the self-correlator) for different
+    time lags (:math:`\\tau`). The time lags longer than the day have no
+    trades. With time of day windows, the sums and the amount of trades of
+    every window, keyed by the second of the trade sign of the ticker j, are
+    taken from the cumulative sums of the same products of the whole day.
+
+    :param trade_sign_i: numpy array with the trade sign of every second of
+     the ticker i.
+    :param trade_sign_j: numpy array with the trade sign of every second of
+     the ticker j.
+    :param taus: numpy array with the time lags in seconds. None uses every
+     time lag from 1 to 1000 s (default None).
+    :param windows: numpy array with the start seconds of the time of day
+     windows, generated with the taq_window_grid function of the tools. None
+     uses the whole day (default None).
+    :return: tuple -- The function returns a tuple with numpy arrays with the
+     sum of the correlator and the amount of trades of each time lag. With
+     windows, the arrays have a row for the whole day and a row for every
+     window.
     """
 
-    if (ticker_i == ticker_j):
+    # Time lags of the correlator. 10^3 s is used in the paper
+    if (taus is None):
+        taus = range(1, __tau__ + 1)
 
-        # Self-response
-        return None
+    rows = 1 if windows is None else len(windows) + 1
 
-    else:
-        function_name = taq_cross_response_year_responses_physical_data \
-            .__name__
-        taq_data_tools_responses_physical \
-            .taq_function_header_print_data(function_name, ticker_i, ticker_j,
-                                            year, '', '')
+    # Array of the average of each tau
+    correlator = np.zeros((rows, len(taus)))
+    num = np.zeros((rows, len(taus)))
 
-        dates = taq_data_tools_responses_physical.taq_bussiness_days(year)
+    if (windows is not None):
+        # Limits of the windows in the day (the trade sign k is the one of
+        # the second 34801 + k) and cumulative amount of trades
+        edges = np.clip(np.append(windows - 34801, len(trade_sign_j)), 0,
+                        len(trade_sign_j))
+        trades = np.concatenate(([0], np.cumsum(trade_sign_j != 0)))
 
-        cross_values = []
-        args_prod = iprod([ticker_i], [ticker_j], dates)
+    # Calculating the trade sign correlator
 
-        # Parallel computation of the cross-responses. Every result is appended
-        # to a list
-        with mp.Pool(processes=mp.cpu_count()) as pool:
-            cross_values.append(pool.starmap(
-                taq_cross_response_day_responses_physical_data, args_prod))
+    # Depending on the tau value
+    for tau_idx, tau in enumerate(taus):
 
-        # To obtain the total cross-response, I sum over all the cross-response
-        # values and all the amount of trades (averaging values)
-        cross_v_final = np.sum(cross_values[0], axis=0)
+        trade_sign_tau = 1 * trade_sign_j[:-tau]
+        trade_sign_no_0_len = len(trade_sign_tau[trade_sign_tau != 0])
+        num[0, tau_idx] = trade_sign_no_0_len
 
-        cross_response_val = cross_v_final[0] / cross_v_final[1]
-        cross_response_avg = cross_v_final[1]
+        trade_sign_product = trade_sign_i[tau:] * trade_sign_j[:-tau]
 
-        # Saving data
-        taq_data_tools_responses_physical \
-            .taq_save_data(function_name, cross_response_val, ticker_i,
-                           ticker_j, year, '', '')
+        correlator[0, tau_idx] = np.sum(trade_sign_product)
 
-        return (cross_response_val, cross_response_avg)
+        if (windows is not None):
+            limits = np.minimum(edges, len(trade_sign_product))
+            correlator[1:, tau_idx] = np.diff(np.concatenate(
+                ([0], np.cumsum(trade_sign_product)))[limits])
+            num[1:, tau_idx] = np.diff(trades[limits])
 
-# ----------------------------------------------------------------------------
+    if (windows is None):
+        return (correlator[0], num[0])
 
+    return (correlator, num)
 
-def taq_trade_sign_self_correlator_day_responses_physical_data(ticker, date):
-    """Computes the trade sign self-correlator of a year.
+# ----------------------------------------------------------------------------
 
-    Using the trade signs of a ticker computes the self-correlator during
-    different time lags (:math:`\\tau`) for a day.
 
-    :param ticker: string of the abbreviation of the stock to be analyzed
-     (i.e. 'AAPL').
-    :param date: string with the date of the data to be extracted
-     (i.e. '2008-01-02').
-    :return: tuple -- The function returns a tuple with numpy arrays.
+def taq_sparse_response_kernel_responses_physical_data(midpoint, trade_sign,
+                                                       resolution, taus=None,
+                                                       windows=None):
+    """Computes the response of a day from the events of a day.
+
+    Computes the same response of the
+    taq_response_kernel_responses_physical_data function from the midpoint
+    price changes and the trade signs different to zero of the
+    taq_events_physical_data function. For every time lag, the midpoint
+    prices are only searched for the bins with trades, so the cost grows
+    with the number of trades and not with the number of bins.
+
+    :param midpoint: numpy array with the bins (row 0) and values (row 1) of
+     the midpoint price changes.
+    :param trade_sign: numpy array with the bins (row 0) and values (row 1)
+     of the trade signs different to zero.
+    :param resolution: float with the length in seconds of the bins.
+    :param taus: numpy array with the time lags in bins. None uses every time
+     lag from 1 to 1000 bins (default None).
+    :param windows: numpy array with the start seconds of the time of day
+     windows, generated with the taq_window_grid function of the tools. None
+     uses the whole day (default None).
+    :return: tuple -- The function returns a tuple with numpy arrays with the
+     sum of the response and the amount of trades of each time lag. With
+     windows, the arrays have a row for the whole day and a row for every
+     window.
     """
 
-    date_sep = date.split('-')
+    if (taus is None):
+        taus = range(1, __tau__ + 1)
 
-    year = date_sep[0]
-    month = date_sep[1]
-    day = date_sep[2]
+    bins = int(round((57000 - 34800) / resolution))
+    rows = 1 if windows is None else len(windows) + 1
 
-    try:
-        # Load data
-        _, _, trade_sign_i = pickle.load(open(
-                f'../../taq_data/responses_physical_data_{year}/taq_trade'
-                + f'_signs_physical_data/taq_trade_signs_physical_data'
-                + f'_{year}{month}{day}_{ticker}.pickle', 'rb'))
+    # Array of the average of each tau
+    response_tau = np.zeros((rows, len(taus)))
+    num = np.zeros((rows, len(taus)))
 
-        # Array of the average of each tau. 10^3 s is used in the paper.
-        self_correlator = np.zeros(__tau__)
-        num = np.zeros(__tau__)
+    if (windows is not None):
+        # Position of the first trade sign of every window (the trade sign
+        # of the bin k is the one of the time 34800 + (k + 1) * resolution)
+        edges = np.searchsorted(trade_sign[0], np.append(
+            np.round((windows - 34800) / resolution) - 1, bins))
 
-        # Calculating the trade sign cross-correlator
+    # Midpoint price of the bin of every trade sign
+    price = midpoint[1][np.searchsorted(midpoint[0], trade_sign[0],
+                                        side='right') - 1]
 
-        # Depending on the tau value
-        for tau_idx in range(__tau__):
+    for tau_idx, tau in enumerate(taus):
 
-            trade_sign_tau = trade_sign_i[:-tau_idx - 1]
-            trade_sign_no_0_len = len(trade_sign_tau[trade_sign_tau != 0])
-            num[tau_idx] = trade_sign_no_0_len
+        # The trade signs with a bin tau bins later in the day
+        trades = np.searchsorted(trade_sign[0], bins - tau)
+        num[0, tau_idx] = trades
 
-            trade_sign_product = (trade_sign_i[tau_idx + 1:]
-                                  * trade_sign_i[:-tau_idx - 1])
+        price_tau = midpoint[1][np.searchsorted(
+            midpoint[0], trade_sign[0][:trades] + tau, side='right') - 1]
 
-            self_correlator[tau_idx] = np.sum(trade_sign_product)
+        # Midpoint price returns
+        log_return_sec = (price_tau - price[:trades]) / price[:trades]
+        product = log_return_sec * trade_sign[1][:trades]
 
-        return (self_correlator, num)
+        response_tau[0, tau_idx] = np.sum(product)
 
-    except FileNotFoundError as e:
-        print('No data')
-        print(e)
-        print()
-        zeros = np.zeros(__tau__)
-        return (zeros, zeros)
+        if (windows is not None):
+            limits = np.minimum(edges, trades)
+            response_tau[1:, tau_idx] = np.diff(np.concatenate(
+                ([0], np.cumsum(product)))[limits])
+            num[1:, tau_idx] = np.diff(limits)
 
-# ----------------------------------------------------------------------------
+    if (windows is None):
+        return (response_tau[0], num[0])
 
+    return (response_tau, num)
 
-def taq_trade_sign_self_correlator_year_responses_physical_data(ticker, year):
-    """Computes the trade sign self-correlator of a year.
+# ----------------------------------------------------------------------------
 
-    Using the taq_trade_sign_self_correlator_day_responses_physical_data
-    function computes the self-correlator function for a year.
 
-    :param ticker: string of the abbreviation of the stock to be analyzed
-     (i.e. 'AAPL').
-    :param year: string of the year to be analyzed (i.e '2016').
-    :return: tuple -- The function returns a tuple with numpy arrays.
+def taq_sparse_correlator_kernel_responses_physical_data(trade_sign_i,
+                                                         trade_sign_j,
+                                                         resolution,
+                                                         taus=None,
+                                                         windows=None):
+    """Computes the trade sign correlator of a day from the events of a day.
+
+    Computes the same correlator of the
+    taq_correlator_kernel_responses_physical_data function from the trade
+    signs different to zero of the taq_events_physical_data function. For
+    every time lag, the trade signs of the ticker i are only searched for
+    the bins with trades of the ticker j.
+
+    :param trade_sign_i: numpy array with the bins (row 0) and values (row 1)
+     of the trade signs different to zero of the ticker i.
+    :param trade_sign_j: numpy array with the bins (row 0) and values (row 1)
+     of the trade signs different to zero of the ticker j.
+    :param resolution: float with the length in seconds of the bins.
+    :param taus: numpy array with the time lags in bins. None uses every time
+     lag from 1 to 1000 bins (default None).
+    :param windows: numpy array with the start seconds of the time of day
+     windows, generated with the taq_window_grid function of the tools. None
+     uses the whole day (default None).
+    :return: tuple -- The function returns a tuple with numpy arrays with the
+     sum of the correlator and the amount of trades of each time lag. With
+     windows, the arrays have a row for the whole day and a row for every
+     window.
     """
 
-    function_name = \
-        taq_trade_sign_self_correlator_year_responses_physical_data.__name__
-    taq_data_tools_responses_physical \
-        .taq_function_header_print_data(function_name, ticker, ticker, year,
-                                        '', '')
+    if (taus is None):
+        taus = range(1, __tau__ + 1)
 
-    dates = taq_data_tools_responses_physical.taq_bussiness_days(year)
+    bins = int(round((57000 - 34800) / resolution))
+    rows = 1 if windows is None else len(windows) + 1
 
-    self_values = []
-    args_prod = iprod([ticker], dates)
+    # Array of the average of each tau
+    correlator = np.zeros((rows, len(taus)))
+    num = np.zeros((rows, len(taus)))
 
-    # Parallel computation of the self-correlator. Every result is appended to
-    # a list
-    with mp.Pool(processes=mp.cpu_count()) as pool:
-        self_values.append(pool.starmap(
-            taq_trade_sign_self_correlator_day_responses_physical_data,
-            args_prod))
+    if (windows is not None):
+        # Position of the first trade sign of the ticker j of every window
+        # (the trade sign of the bin k is the one of the time 34800 + (k + 1)
+        # * resolution)
+        edges = np.searchsorted(trade_sign_j[0], np.append(
+            np.round((windows - 34800) / resolution) - 1, bins))
 
-    # To obtain the total self-correlator, I sum over all the self-correlator
-    # values and all the amount of trades (averaging values)
-    self_v_final = np.sum(self_values[0], axis=0)
+    for tau_idx, tau in enumerate(taus):
 
-    self_correlator_val = self_v_final[0] / self_v_final[1]
-    self_correlator_avg = self_v_final[1]
+        trades = np.searchsorted(trade_sign_j[0], bins - tau)
+        num[0, tau_idx] = trades
 
-    # Saving data
-    taq_data_tools_responses_physical \
-        .taq_save_data(function_name, self_correlator_val, ticker, ticker,
-                       year, '', '')
+        if (windows is not None):
+            limits = np.minimum(edges, trades)
+            num[1:, tau_idx] = np.diff(limits)
 
-    return (self_correlator_val, self_correlator_avg)
+        if (not trades or not trade_sign_i.shape[1]):
+            continue
 
-# ----------------------------------------------------------------------------
+        # Trade signs of the ticker i tau bins after the trade signs of the
+        # ticker j
+        bin_tau = trade_sign_j[0][:trades] + tau
+        pos = np.minimum(np.searchsorted(trade_sign_i[0], bin_tau),
+                         trade_sign_i.shape[1] - 1)
+        same = trade_sign_i[0][pos] == bin_tau
+        product = trade_sign_i[1][pos] * trade_sign_j[1][:trades] * same
 
+        correlator[0, tau_idx] = np.sum(product)
 
-def taq_trade_sign_cross_correlator_day_responses_physical_data(ticker_i,
-                                                                ticker_j,
-                                                                date):
-    """Computes the trade sign cross-correlator of a day.
+        if (windows is not None):
+            correlator[1:, tau_idx] = np.diff(np.concatenate(
+                ([0], np.cumsum(product)))[limits])
 
-    Using the trade signs of ticker i and trade signs of ticker j computes the
-    cross-correlator during different time lags (:math:`\\tau`) for a day.
+    if (windows is None):
+        return (correlator[0], num[0])
 
+    return (correlator, num)
+
+# ----------------------------------------------------------------------------
+
+
+def taq_checkpoint_day_responses_physical_data(function_name, day_function,
+                                               ticker_i, ticker_j, date, args,
+                                               keep=True):
+    """Computes a task of a day and saves its result as a checkpoint.
+
+    :param function_name: name used to save the checkpoint.
+    :param day_function: function that computes the task of the day.
     :param ticker_i: string of the abbreviation of the stock to be analyzed
      (i.e. 'AAPL').
     :param ticker_j: string of the abbreviation of the stock to be analyzed
      (i.e. 'AAPL').
     :param date: string with the date of the data to be extracted
-     (i.e. '2008-01-02).
-    :return: tuple -- The function returns a tuple with numpy arrays.
+     (i.e. '2008-01-02').
+    :param args: tuple with the parameters of the day_function.
+    :param keep: bool to save the result of the day_function in the
+     checkpoint. When it is False, only the finished task is recorded
+     (default True).
+    :return: The function returns the result of the day_function.
     """
 
-    date_sep = date.split('-')
+    result = day_function(*args)
 
-    year = date_sep[0]
-    month = date_sep[1]
-    day = date_sep[2]
+    taq_data_tools_responses_physical \
+        .taq_checkpoint_save_data(function_name, result if keep else None,
+                                  ticker_i, ticker_j, date)
 
-    if (ticker_i == ticker_j):
+    return result
 
-        # Self-response
-        return None
+# ----------------------------------------------------------------------------
 
-    else:
-        try:
-            # Load data
-            _, _, trade_sign_i = pickle.load(open(
-                    f'../../taq_data/responses_physical_data_{year}/taq_trade_'
-                    + f'signs_physical_data/taq_trade_signs_physical_data'
-                    + f'_{year}{month}{day}_{ticker_i}.pickle', 'rb'))
-            _, _, trade_sign_j = pickle.load(open(
-                    f'../../taq_data/responses_physical_data_{year}/taq_trade_'
-                    + f'signs_physical_data/taq_trade_signs_physical_data'
-                    + f'_{year}{month}{day}_{ticker_j}.pickle', 'rb'))
 
-            # Array of the average of each tau. 10^3 s used by Wang
-            cross_correlator = np.zeros(__tau__)
-            num = np.zeros(__tau__)
+def taq_checkpoint_date_responses_physical_data(function_name, day_function,
+                                                pairs, date, params, keep,
+                                                collect=True):
+    """Computes the tasks of the pairs of tickers in a day.
 
-            # Calculating the trade sign cross-correlator
+    The tasks of a day run one after the other in the same process, so the
+    day arrays of a ticker are loaded once and used from the cache of the
+    process by the other pairs.
 
-            # Depending on the tau value
-            for tau_idx in range(__tau__):
+    :param function_name: name used to save the checkpoints.
+    :param day_function: function that computes the task of a day.
+    :param pairs: list of tuples (ticker_i, ticker_j) of the pairs of
+     tickers to be analyzed (i.e. [('AAPL', 'MSFT')]).
+    :param date: string with the date of the data to be extracted
+     (i.e. '2008-01-02').
+    :param params: tuple with the other parameters of the day_function.
+    :param keep: bool to save the results of the day_function in the
+     checkpoints.
+    :param collect: bool to return the results of the day_function. When it
+     is False, the results are None, so they are not sent to the parent
+     process (default True).
+    :return: tuple -- The function returns a tuple with the list of the
+     results of the pairs and a dictionary with the hits, misses and
+     evictions of the cache in the day.
+    """
 
-                trade_sign_tau = 1 * trade_sign_j[:-tau_idx - 1]
-                trade_sign_no_0_len = len(trade_sign_tau[trade_sign_tau != 0])
-                num[tau_idx] = trade_sign_no_0_len
+    start = taq_data_tools_responses_physical.taq_cache_thread_stats()
+    results = []
 
-                trade_sign_product = (trade_sign_i[tau_idx + 1:]
-                                      * trade_sign_j[:-tau_idx - 1])
+    for ticker_i, ticker_j in pairs:
 
-                cross_correlator[tau_idx] = np.sum(trade_sign_product)
+        if (ticker_i == ticker_j):
+            tickers = (ticker_i,)
+        else:
+            tickers = (ticker_i, ticker_j)
 
-            return (cross_correlator, num)
+        result = taq_checkpoint_day_responses_physical_data(
+            function_name, day_function, ticker_i, ticker_j, date,
+            tickers + (date,) + tuple(params), keep)
+        results.append(result if collect else None)
 
-        except FileNotFoundError as e:
-            print('No data')
-            print(e)
-            print()
-            zeros = np.zeros(__tau__)
-            return (zeros, zeros)
+    end = taq_data_tools_responses_physical.taq_cache_thread_stats()
+
+    return (results, {key: end[key] - start[key] for key in end})
 
 # ----------------------------------------------------------------------------
 
 
-def taq_trade_sign_cross_correlator_year_responses_physical_data(ticker_i,
-                                                                 ticker_j,
-                                                                 year):
-    """Computes the trade sign-cross correlator of a year.
+def taq_checkpoint_pairs_responses_physical_data(function_name, day_function,
+                                                 pairs, years, params=(),
+                                                 keep=True, data='arrays',
+                                                 collect=True):
+    """Computes the tasks of every day of one or more years for pairs.
+
+    Only the days with data of the two tickers of a pair in the catalogs of
+    the years are used. The days recorded in the journals of the function
+    are loaded from their checkpoints and the other days of all the years
+    are computed in the same pool. The tasks are grouped by day and the
+    pairs of a day are sorted by ticker, so the arrays of a ticker in a day
+    are loaded once in a process. The day_function is called with (ticker,
+    date, \\*params) when ticker_i and ticker_j are the same and with
+    (ticker_i, ticker_j, date, \\*params) in other case. The checkpoints of
+    every day are saved in the folder of its year. Without collecting the
+    results, the parent process only keeps the days of every pair, so the
+    results of all the days of all the pairs are not in memory at the same
+    time.
+
+    :param function_name: name used to save the checkpoints.
+    :param day_function: function that computes the task of a day.
+    :param pairs: list of tuples (ticker_i, ticker_j) of the pairs of
+     tickers to be analyzed (i.e. [('AAPL', 'MSFT'), ('MSFT', 'AAPL')]).
+    :param years: string of the year (i.e '2016') or list of strings of the
+     years (i.e. ['2008', '2009']) to be analyzed.
+    :param params: tuple with the other parameters of the day_function.
+    :param keep: bool to save the results of the day_function in the
+     checkpoints (default True).
+    :param data: string with the data loaded by the day_function, used to
+     estimate the memory of the tasks. 'raw' for the quotes and trades of a
+     day and 'arrays' for the arrays of every second of a day (default
+     'arrays').
+    :param collect: bool to return the results of the days. When it is
+     False, the results are None and the results of the days are read from
+     the checkpoints (default True).
+    :return: dictionary -- The function returns a dictionary with the result
+     of every day with data (date keys) for each pair.
+    """
 
-    Using the taq_trade_sign_cross_correlator_day_responses_physical_data
-    function computes the cross-correlator function for a year.
+    years = [years] if isinstance(years, str) else list(years)
+
+    journal = set().union(*(taq_data_tools_responses_physical
+                            .taq_journal_data(function_name, year)
+                            for year in years))
+
+    pairs = sorted(set(pairs))
+
+    # Only the days with data of the two tickers of a pair are computed
+    days = {ticker: set(date for year in years
+                        for date in taq_data_tools_pool
+                        .taq_catalog_days(ticker, year))
+            for ticker in set(ticker for pair in pairs for ticker in pair)}
+    pair_days = {pair: sorted(days[pair[0]] & days[pair[1]])
+                 for pair in pairs}
+    dates = sorted(set().union(*pair_days.values()))
+
+    args_prod = []
+    for date in dates:
+        date_pairs = [pair for pair in pairs
+                      if date in days[pair[0]] and date in days[pair[1]]
+                      and pair + (date,) not in journal]
+        if (date_pairs):
+            args_prod.append((function_name, day_function, date_pairs, date,
+                              tuple(params), keep, collect))
+
+    finished = sum(len(pair_dates) for pair_dates in pair_days.values()) \
+        - sum(len(args[2]) for args in args_prod)
+    print(f'{finished} tasks finished in a previous run')
+
+    # Parallel computation of the days that are not finished
+    with taq_data_tools_responses_physical.taq_pool() as pool:
+        results = pool.starmap(taq_checkpoint_date_responses_physical_data,
+                               args_prod, tickers=(2,), date=3, data=data)
+
+    print('Cache of day arrays: '
+          + f'{sum(result[1]["hits"] for result in results)} hits, '
+          + f'{sum(result[1]["misses"] for result in results)} misses, '
+          + f'{sum(result[1]["evictions"] for result in results)} evictions')
+
+    computed = {}
+    for args, result in zip(args_prod, results):
+        for pair, value in zip(args[2], result[0]):
+            computed[pair + (args[3],)] = value
+
+    # All the tasks are finished, so their checkpoints are removed when the
+    # run finishes
+    taq_data_tools_responses_physical \
+        .taq_checkpoint_finished(function_name,
+                                 [pair + (date,) for pair in pairs
+                                  for date in pair_days[pair]])
+
+    if (not keep or not collect):
+        return {pair: {date: computed.get(pair + (date,))
+                       for date in pair_days[pair]}
+                for pair in pairs}
+
+    return {pair: {date: computed[pair + (date,)] if pair + (date,) in computed
+                   else taq_data_tools_responses_physical
+                   .taq_checkpoint_load_data(function_name, *pair, date)
+                   for date in pair_days[pair]}
+            for pair in pairs}
+
+# ----------------------------------------------------------------------------
+
+
+def taq_checkpoint_year_responses_physical_data(function_name, day_function,
+                                                ticker_i, ticker_j, year,
+                                                params=(), keep=True,
+                                                data='arrays', collect=True):
+    """Computes the tasks of every day of a year that are not finished.
+
+    Using the taq_checkpoint_pairs_responses_physical_data function computes
+    the tasks of a pair of tickers.
+
+    :param function_name: name used to save the checkpoints.
+    :param day_function: function that computes the task of a day.
+    :param ticker_i: string of the abbreviation of the stock to be analyzed
+     (i.e. 'AAPL').
+    :param ticker_j: string of the abbreviation of the stock to be analyzed
+     (i.e. 'AAPL').
+    :param year: string of the year to be analyzed (i.e '2016').
+    :param params: tuple with the other parameters of the day_function.
+    :param keep: bool to save the results of the day_function in the
+     checkpoints (default True).
+    :param data: string with the data loaded by the day_function ('raw' or
+     'arrays', default 'arrays').
+    :param collect: bool to return the results of the days. When it is
+     False, the results are None (default True).
+    :return: list -- The function returns a list with the result of every
+     day.
+    """
+
+    return list(taq_checkpoint_pairs_responses_physical_data(
+        function_name, day_function, [(ticker_i, ticker_j)], year, params,
+        keep, data, collect)[(ticker_i, ticker_j)].values())
+
+# ----------------------------------------------------------------------------
+
+
+def taq_years_pairs_responses_physical_data(function_name, day_function,
+                                            pairs, years, params=()):
+    """Computes the average over every year of several years for pairs.
+
+    The pairs of a year finished in a previous run are loaded from their
+    checkpoints, and the pairs finished in a previous run of the stage of the
+    pipeline that did not change are loaded from their partial sums. The
+    days of the other pairs of all the years are computed
+    together with the taq_checkpoint_pairs_responses_physical_data
+    function without collecting their results, so the parent process does
+    not keep the days of all the pairs. The cumulative sums of a pair are
+    accumulated from the checkpoints of its days, one pair at a time, and
+    the sum of the values of every day of a year is divided by the sum of
+    the amount of trades (averaging values). The data stays
+    partitioned by year: the results of a year are saved in its folder and
+    in the results store of the function of the year. The cumulative sums of
+    the values and trades of the days of every pair are also saved as the
+    partial sums of the year, so the averages over other date ranges are
+    computed from them without the days.
+
+    :param function_name: name used to save the data and the checkpoints.
+    :param day_function: function that computes the task of a day.
+    :param pairs: list of tuples (ticker_i, ticker_j) of the pairs of
+     tickers to be analyzed (i.e. [('AAPL', 'MSFT'), ('MSFT', 'AAPL')]).
+    :param years: list of strings of the years to be analyzed (i.e.
+     ['2008', '2009']).
+    :param params: tuple with the other parameters of the day_function. The
+     last three parameters are the time lags, the resolution and the time of
+     day windows.
+    :return: dictionary -- The function returns a dictionary with a
+     dictionary of a tuple of numpy arrays for each pair for every year.
+    """
+
+    results = {}
+    pending = {}
+
+    for year in years:
+
+        journal = taq_data_tools_responses_physical \
+            .taq_journal_data(function_name, year)
+
+        # Finished in a previous run
+        results[year] = {pair: taq_data_tools_responses_physical
+                         .taq_checkpoint_load_data(function_name, *pair, year)
+                         for pair in pairs if pair + (year,) in journal}
+
+        # Finished in a previous run of the stage of the pipeline
+        for pair in pairs:
+            task_hash = taq_data_tools_pool \
+                .taq_task_hash(function_name, pair + (year,) + tuple(params))
+            if (pair in results[year]
+                    or not taq_data_tools_pool
+                    .taq_task_done(task_hash)):
+                continue
+
+            partial = taq_data_tools_responses_physical \
+                .taq_partial_load(function_name, *pair, year)
+            if (partial is not None):
+                v_final = partial[1][-1]
+                results[year][pair] = (v_final[0] / v_final[1], v_final[1])
+
+        pending[year] = [pair for pair in pairs
+                         if pair not in results[year]]
+
+        # The checkpoints of the year of the pairs are removed when the run
+        # finishes
+        taq_data_tools_responses_physical \
+            .taq_checkpoint_finished(function_name,
+                                     [pair + (year,) for pair in pairs])
+
+    years = [year for year in years if pending[year]]
+    if (not years):
+        return results
+
+    values = taq_checkpoint_pairs_responses_physical_data(
+        function_name, day_function,
+        set(pair for year in years for pair in pending[year]), years, params,
+        collect=False)
+
+    taus, _, windows = params[-3:]
+    zeros = np.array(taq_zeros_responses_physical_data(taus, windows))
+
+    for year in years:
+
+        for ticker_i, ticker_j in pending[year]:
+
+            dates = sorted(date for date in values[(ticker_i, ticker_j)]
+                           if date[:4] == year)
+
+            # Cumulative sums of the days, with a row of zeros before the
+            # first day. A pair without days with data has no trades, so its
+            # averages are NaN as in the days without data
+            sums = np.zeros((len(dates) + 1,) + zeros.shape)
+            for idx, date in enumerate(dates):
+                sums[idx + 1] = sums[idx] + taq_data_tools_responses_physical \
+                    .taq_checkpoint_load_data(function_name, ticker_i,
+                                              ticker_j, date)
+
+            v_final = sums[-1]
+
+            val = v_final[0] / v_final[1]
+            avg = v_final[1]
+
+            # Saving data
+            taq_data_tools_responses_physical \
+                .taq_save_data(function_name, val, ticker_i, ticker_j, year,
+                               '', '')
+            taq_data_tools_responses_physical \
+                .taq_partial_save(function_name, (dates, sums), ticker_i,
+                                  ticker_j, year)
+            taq_data_tools_responses_physical \
+                .taq_checkpoint_save_data(function_name, (val, avg), ticker_i,
+                                          ticker_j, year)
+            taq_data_tools_pool \
+                .taq_task_record(taq_data_tools_pool
+                                 .taq_task_hash(function_name,
+                                                (ticker_i, ticker_j, year)
+                                                + tuple(params)))
+
+            results[year][(ticker_i, ticker_j)] = (val, avg)
+
+        # The results of all the pairs are also saved in the store of the
+        # function, so they can be loaded with one read
+        taq_data_tools_responses_physical \
+            .taq_store_save(function_name,
+                            {pair: value[0]
+                             for pair, value in results[year].items()},
+                            year)
+
+    return results
+
+# ----------------------------------------------------------------------------
+
+
+def taq_year_pairs_responses_physical_data(function_name, day_function,
+                                           pairs, year, params=()):
+    """Computes the average over a year of pairs of tickers.
+
+    Using the taq_years_pairs_responses_physical_data function computes the
+    average of the pairs in a year.
+
+    :param function_name: name used to save the data and the checkpoints.
+    :param day_function: function that computes the task of a day.
+    :param pairs: list of tuples (ticker_i, ticker_j) of the pairs of
+     tickers to be analyzed (i.e. [('AAPL', 'MSFT'), ('MSFT', 'AAPL')]).
+    :param year: string of the year to be analyzed (i.e '2016').
+    :param params: tuple with the other parameters of the day_function.
+    :return: dictionary -- The function returns a dictionary with a tuple of
+     numpy arrays for each pair.
+    """
+
+    return taq_years_pairs_responses_physical_data(
+        function_name, day_function, pairs, [year], params)[year]
+
+# ----------------------------------------------------------------------------
+
+
+def taq_zeros_responses_physical_data(taus=None, windows=None):
+    """Returns the result of a day without data.
+
+    :param taus: numpy array with the time lags in seconds. None uses every
+     time lag from 1 to 1000 s (default None).
+    :param windows: numpy array with the start seconds of the time of day
+     windows. None uses the whole day (default None).
+    :return: tuple -- The function returns a tuple with numpy arrays of zeros
+     with the shape of the sum and the amount of trades of a day.
+    """
+
+    zeros = np.zeros(__tau__ if taus is None else len(taus))
+
+    if (windows is not None):
+        zeros = np.zeros((len(windows) + 1, len(zeros)))
+
+    return (zeros, zeros)
+
+# ----------------------------------------------------------------------------
+
+
+def taq_self_response_day_responses_physical_data(ticker, date,
+                                                  policy='last', taus=None,
+                                                  resolution=None,
+                                                  windows=None):
+    """Computes the self-response of a day.
+
+    Using the midpoint price and trade signs of a ticker computes the self-
+    response during different time lags (:math:`\\tau`) for a day.
+
+    :param ticker: string of the abbreviation of the stock to be analyzed
+     (i.e. 'AAPL').
+    :param date: string with the date of the data to be extracted
+     (i.e. '2008-01-02').
+    :param policy: string with the sampling policy of the midpoint price
+     (i.e. 'last', 'mean', 'time_weighted' or 'median'). Default 'last'.
+    :param taus: numpy array with the time lags in seconds, generated with
+     the taq_tau_grid function of the tools. None uses every time lag from 1
+     to 1000 s (default None).
+    :param resolution: float with the length in seconds of the bins of the
+     day, between 0.001 and 1, computed from the events of the day. The time
+     lags are in bins. None uses the midpoint prices and trade signs of every
+     second (default None).
+    :param windows: numpy array with the start seconds of the time of day
+     windows, generated with the taq_window_grid function of the tools. The
+     results have a row for the whole day and a row for every window. None
+     uses the whole day (default None).
+    :return: tuple -- The function returns a tuple with numpy arrays.
+    """
+
+    try:
+        if (resolution is not None):
+            # Events of the day. The bins use the last midpoint price
+            assert policy == 'last'
+            midpoint, trade_sign = taq_events_physical_load_data(ticker, date,
+                                                                 resolution)
+
+            return taq_sparse_response_kernel_responses_physical_data(
+                midpoint, trade_sign, resolution, taus, windows)
+
+        # Load data
+        midpoint = taq_midpoint_physical_policy_data(ticker, date, policy)
+        trade_sign = taq_trade_signs_physical_load_data(ticker, date)
+
+        assert len(midpoint) == len(trade_sign)
+
+        return taq_response_kernel_responses_physical_data(
+            midpoint, trade_sign, taus, windows)
+
+    except FileNotFoundError as e:
+        print('No data')
+        print(e)
+        print()
+        return taq_zeros_responses_physical_data(taus, windows)
+
+# ----------------------------------------------------------------------------
+
+
+def taq_self_response_year_responses_physical_data(ticker, year,
+                                                   policy='last', taus=None,
+                                                   resolution=None,
+                                                   windows=None):
+    """Computes the self-response of a year.
+
+    Using the taq_self_response_day_responses_physical_data function computes
+    the self-response function for a year.
+
+    :param ticker: string of the abbreviation of stock to be analyzed
+     (i.e. 'AAPL').
+    :param year: string of the year to be analyzed (i.e '2016').
+    :param policy: string with the sampling policy of the midpoint price
+     (i.e. 'last', 'mean', 'time_weighted' or 'median'). Default 'last'.
+    :param taus: numpy array with the time lags in seconds, generated with
+     the taq_tau_grid function of the tools. None uses every time lag from 1
+     to 1000 s (default None).
+    :param resolution: float with the length in seconds of the bins of the
+     day, between 0.001 and 1, computed from the events of the day. The time
+     lags are in bins. None uses the midpoint prices and trade signs of every
+     second (default None).
+    :param windows: numpy array with the start seconds of the time of day
+     windows, generated with the taq_window_grid function of the tools. The
+     results have a row for the whole day and a row for every window. None
+     uses the whole day (default None).
+    :return: tuple -- The function returns a tuple with numpy arrays.
+    """
+
+    function_name = taq_self_response_year_responses_physical_data.__name__
+    taq_data_tools_responses_physical \
+        .taq_function_header_print_data(function_name, ticker, ticker, year,
+                                        '', '')
+
+    if (policy != 'last'):
+        function_name = f'{function_name}_policy_{policy}'
+    function_name += taq_data_tools_responses_physical.taq_tau_name(taus) \
+        + taq_data_tools_responses_physical.taq_resolution_name(resolution) \
+        + taq_data_tools_responses_physical.taq_window_name(windows)
+
+    # Parallel computation of the self-responses of the days that are not
+    # finished. To obtain the total self-response, I sum over all the
+    # self-response values and all the amount of trades (averaging values)
+    self_response = taq_year_pairs_responses_physical_data(
+        function_name, taq_self_response_day_responses_physical_data,
+        [(ticker, ticker)], year, (policy, taus, resolution, windows))[(ticker,
+                                                               ticker)]
+
+    return self_response
+
+# ----------------------------------------------------------------------------
+
+
+def taq_cross_response_day_responses_physical_data(ticker_i, ticker_j, date,
+                                                   policy='last', taus=None,
+                                                   resolution=None,
+                                                   windows=None):
+    """Computes the cross-response of a day.
+
+    Using the midpoint price of ticker i and trade signs of ticker j computes
+    the cross-response during different time lags (:math:`\\tau`) for a day.
+
+    :param ticker_i: string of the abbreviation of the stock to be analyzed
+     (i.e. 'AAPL').
+    :param ticker_j: string of the abbreviation of the stock to be analyzed
+     (i.e. 'AAPL').
+    :param date: string with the date of the data to be extracted
+     (i.e. '2008-01-02').
+    :param policy: string with the sampling policy of the midpoint price
+     (i.e. 'last', 'mean', 'time_weighted' or 'median'). Default 'last'.
+    :param taus: numpy array with the time lags in seconds, generated with
+     the taq_tau_grid function of the tools. None uses every time lag from 1
+     to 1000 s (default None).
+    :param resolution: float with the length in seconds of the bins of the
+     day, between 0.001 and 1, computed from the events of the day. The time
+     lags are in bins. None uses the midpoint prices and trade signs of every
+     second (default None).
+    :param windows: numpy array with the start seconds of the time of day
+     windows, generated with the taq_window_grid function of the tools. The
+     results have a row for the whole day and a row for every window. None
+     uses the whole day (default None).
+    :return: tuple -- The function returns a tuple with numpy arrays.
+    """
+
+    if (ticker_i == ticker_j):
+
+        # Self-response
+        return None
+
+    else:
+        try:
+            if (resolution is not None):
+                # Events of the day. The bins use the last midpoint price
+                assert policy == 'last'
+                midpoint_i, _ = taq_events_physical_load_data(ticker_i, date,
+                                                              resolution)
+                _, trade_sign_j = taq_events_physical_load_data(ticker_j,
+                                                                date,
+                                                                resolution)
+
+                return taq_sparse_response_kernel_responses_physical_data(
+                    midpoint_i, trade_sign_j, resolution, taus, windows)
+
+            # Load data
+            midpoint_i = taq_midpoint_physical_policy_data(ticker_i, date,
+                                                           policy)
+            trade_sign_j = taq_trade_signs_physical_load_data(ticker_j, date)
+
+            assert len(midpoint_i) == len(trade_sign_j)
+
+            return taq_response_kernel_responses_physical_data(
+                midpoint_i, trade_sign_j, taus, windows)
+
+        except FileNotFoundError as e:
+            print('No data')
+            print(e)
+            print()
+            return taq_zeros_responses_physical_data(taus, windows)
+
+# ----------------------------------------------------------------------------
+
+
+def taq_cross_response_year_responses_physical_data(ticker_i, ticker_j, year,
+                                                    policy='last', taus=None,
+                                                    resolution=None,
+                                                    windows=None):
+    """Computes the cross-response of a year.
+
+    Using the taq_cross_response_day_responses_physical_data function computes
+    the cross-response function for a year.
+
+    :param ticker_i: string of the abbreviation of the stock to be analyzed
+     (i.e. 'AAPL').
+    :param ticker_j: string of the abbreviation of the stock to be analyzed
+     (i.e. 'AAPL').
+    :param year: string of the year to be analyzed (i.e '2016').
+    :param policy: string with the sampling policy of the midpoint price
+     (i.e. 'last', 'mean', 'time_weighted' or 'median'). Default 'last'.
+    :param taus: numpy array with the time lags in seconds, generated with
+     the taq_tau_grid function of the tools. None uses every time lag from 1
+     to 1000 s (default None).
+    :param resolution: float with the length in seconds of the bins of the
+     day, between 0.001 and 1, computed from the events of the day. The time
+     lags are in bins. None uses the midpoint prices and trade signs of every
+     second (default None).
+    :param windows: numpy array with the start seconds of the time of day
+     windows, generated with the taq_window_grid function of the tools. The
+     results have a row for the whole day and a row for every window. None
+     uses the whole day (default None).
+    :return: tuple -- The function returns a tuple with numpy arrays.
+    """
+
+    if (ticker_i == ticker_j):
+
+        # Self-response
+        return None
+
+    else:
+        function_name = taq_cross_response_year_responses_physical_data \
+            .__name__
+        taq_data_tools_responses_physical \
+            .taq_function_header_print_data(function_name, ticker_i, ticker_j,
+                                            year, '', '')
+
+        if (policy != 'last'):
+            function_name = f'{function_name}_policy_{policy}'
+        function_name += taq_data_tools_responses_physical \
+            .taq_tau_name(taus) \
+            + taq_data_tools_responses_physical \
+            .taq_resolution_name(resolution) \
+            + taq_data_tools_responses_physical.taq_window_name(windows)
+
+        # Parallel computation of the cross-responses of the days that are not
+        # finished. To obtain the total cross-response, I sum over all the
+        # cross-response values and all the amount of trades (averaging
+        # values)
+        cross_response = taq_year_pairs_responses_physical_data(
+            function_name, taq_cross_response_day_responses_physical_data,
+            [(ticker_i, ticker_j)], year,
+            (policy, taus, resolution, windows))[(ticker_i, ticker_j)]
+
+        return cross_response
+
+# ----------------------------------------------------------------------------
+
+
+def taq_cross_response_sweep_responses_physical_data(tickers, year,
+                                                     policy='last',
+                                                     taus=None,
+                                                     resolution=None,
+                                                     windows=None):
+    """Computes the cross-response of a year for all the pairs of tickers.
+
+    The days of all the pairs are computed in the same pool and the pairs of
+    a day run in the same process, so the midpoint prices and trade signs of
+    a ticker are loaded once per day instead of once per pair. The results
+    are saved in the same files of the
+    taq_cross_response_year_responses_physical_data function.
+
+    :param tickers: list of the string abbreviation of the stocks to be
+     analyzed (i.e. ['AAPL', 'MSFT']).
+    :param year: string of the year to be analyzed (i.e '2016').
+    :param policy: string with the sampling policy of the midpoint price
+     (i.e. 'last', 'mean', 'time_weighted' or 'median'). Default 'last'.
+    :param taus: numpy array with the time lags in seconds, generated with
+     the taq_tau_grid function of the tools. None uses every time lag from 1
+     to 1000 s (default None).
+    :param resolution: float with the length in seconds of the bins of the
+     day, between 0.001 and 1, computed from the events of the day. The time
+     lags are in bins. None uses the midpoint prices and trade signs of every
+     second (default None).
+    :param windows: numpy array with the start seconds of the time of day
+     windows, generated with the taq_window_grid function of the tools. The
+     results have a row for the whole day and a row for every window. None
+     uses the whole day (default None).
+    :return: dictionary -- The function returns a dictionary with a tuple of
+     numpy arrays for each pair.
+    """
+
+    function_name = taq_cross_response_year_responses_physical_data.__name__
+    taq_data_tools_responses_physical \
+        .taq_function_header_print_data(function_name, 'all', 'all', year,
+                                        '', '')
+
+    if (policy != 'last'):
+        function_name = f'{function_name}_policy_{policy}'
+    function_name += taq_data_tools_responses_physical.taq_tau_name(taus) \
+        + taq_data_tools_responses_physical.taq_resolution_name(resolution) \
+        + taq_data_tools_responses_physical.taq_window_name(windows)
+
+    pairs = [(ticker_i, ticker_j) for ticker_i, ticker_j
+             in iprod(tickers, tickers) if ticker_i != ticker_j]
+
+    return taq_year_pairs_responses_physical_data(
+        function_name, taq_cross_response_day_responses_physical_data, pairs,
+        year, (policy, taus, resolution, windows))
+
+# ----------------------------------------------------------------------------
+
+
+def taq_trade_sign_self_correlator_day_responses_physical_data(
+        ticker, date, taus=None, resolution=None, windows=None):
+    """Computes the trade sign self-correlator of a year.
+
+    Using the trade signs of a ticker computes the self-correlator during
+    different time lags (:math:`\\tau`) for a day.
+
+    :param ticker: string of the abbreviation of the stock to be analyzed
+     (i.e. 'AAPL').
+    :param date: string with the date of the data to be extracted
+     (i.e. '2008-01-02').
+    :param taus: numpy array with the time lags in seconds, generated with
+     the taq_tau_grid function of the tools. None uses every time lag from 1
+     to 1000 s (default None).
+    :param resolution: float with the length in seconds of the bins of the
+     day, between 0.001 and 1, computed from the events of the day. The time
+     lags are in bins. None uses the midpoint prices and trade signs of every
+     second (default None).
+    :param windows: numpy array with the start seconds of the time of day
+     windows, generated with the taq_window_grid function of the tools. The
+     results have a row for the whole day and a row for every window. None
+     uses the whole day (default None).
+    :return: tuple -- The function returns a tuple with numpy arrays.
+    """
+
+    try:
+        if (resolution is not None):
+            # Events of the day
+            _, trade_sign_i = taq_events_physical_load_data(ticker, date,
+                                                            resolution)
+
+            return taq_sparse_correlator_kernel_responses_physical_data(
+                trade_sign_i, trade_sign_i, resolution, taus, windows)
+
+        # Load data
+        trade_sign_i = taq_trade_signs_physical_load_data(ticker, date)
+
+        return taq_correlator_kernel_responses_physical_data(
+            trade_sign_i, trade_sign_i, taus, windows)
+
+    except FileNotFoundError as e:
+        print('No data')
+        print(e)
+        print()
+        return taq_zeros_responses_physical_data(taus, windows)
+
+# ----------------------------------------------------------------------------
+
+
+def taq_trade_sign_self_correlator_year_responses_physical_data(
+        ticker, year, taus=None, resolution=None, windows=None):
+    """Computes the trade sign self-correlator of a year.
+
+    Using the taq_trade_sign_self_correlator_day_responses_physical_data
+    function computes the self-correlator function for a year.
+
+    :param ticker: string of the abbreviation of the stock to be analyzed
+     (i.e. 'AAPL').
+    :param year: string of the year to be analyzed (i.e '2016').
+    :param taus: numpy array with the time lags in seconds, generated with
+     the taq_tau_grid function of the tools. None uses every time lag from 1
+     to 1000 s (default None).
+    :param resolution: float with the length in seconds of the bins of the
+     day, between 0.001 and 1, computed from the events of the day. The time
+     lags are in bins. None uses the midpoint prices and trade signs of every
+     second (default None).
+    :param windows: numpy array with the start seconds of the time of day
+     windows, generated with the taq_window_grid function of the tools. The
+     results have a row for the whole day and a row for every window. None
+     uses the whole day (default None).
+    :return: tuple -- The function returns a tuple with numpy arrays.
+    """
+
+    function_name = \
+        taq_trade_sign_self_correlator_year_responses_physical_data.__name__
+    taq_data_tools_responses_physical \
+        .taq_function_header_print_data(function_name, ticker, ticker, year,
+                                        '', '')
+    function_name += taq_data_tools_responses_physical.taq_tau_name(taus) \
+        + taq_data_tools_responses_physical.taq_resolution_name(resolution) \
+        + taq_data_tools_responses_physical.taq_window_name(windows)
+
+    # Parallel computation of the self-correlator of the days that are not
+    # finished. To obtain the total self-correlator, I sum over all the
+    # self-correlator values and all the amount of trades (averaging values)
+    self_correlator = taq_year_pairs_responses_physical_data(
+        function_name,
+        taq_trade_sign_self_correlator_day_responses_physical_data,
+        [(ticker, ticker)], year, (taus, resolution, windows))[(ticker,
+                                                                ticker)]
+
+    return self_correlator
+
+# ----------------------------------------------------------------------------
+
+
+def taq_trade_sign_cross_correlator_day_responses_physical_data(
+        ticker_i, ticker_j, date, taus=None, resolution=None,
+        windows=None):
+    """Computes the trade sign cross-correlator of a day.
+
+    Using the trade signs of ticker i and trade signs of ticker j computes the
+    cross-correlator during different time lags (:math:`\\tau`) for a day.
+
+    :param ticker_i: string of the abbreviation of the stock to be analyzed
+     (i.e. 'AAPL').
+    :param ticker_j: string of the abbreviation of the stock to be analyzed
+     (i.e. 'AAPL').
+    :param date: string with the date of the data to be extracted
+     (i.e. '2008-01-02).
+    :param taus: numpy array with the time lags in seconds, generated with
+     the taq_tau_grid function of the tools. None uses every time lag from 1
+     to 1000 s (default None).
+    :param resolution: float with the length in seconds of the bins of the
+     day, between 0.001 and 1, computed from the events of the day. The time
+     lags are in bins. None uses the midpoint prices and trade signs of every
+     second (default None).
+    :param windows: numpy array with the start seconds of the time of day
+     windows, generated with the taq_window_grid function of the tools. The
+     results have a row for the whole day and a row for every window. None
+     uses the whole day (default None).
+    :return: tuple -- The function returns a tuple with numpy arrays.
+    """
+
+    if (ticker_i == ticker_j):
+
+        # Self-response
+        return None
+
+    else:
+        try:
+            if (resolution is not None):
+                # Events of the day
+                _, trade_sign_i = taq_events_physical_load_data(ticker_i,
+                                                                date,
+                                                                resolution)
+                _, trade_sign_j = taq_events_physical_load_data(ticker_j,
+                                                                date,
+                                                                resolution)
+
+                return taq_sparse_correlator_kernel_responses_physical_data(
+                    trade_sign_i, trade_sign_j, resolution, taus, windows)
+
+            # Load data
+            trade_sign_i = taq_trade_signs_physical_load_data(ticker_i, date)
+            trade_sign_j = taq_trade_signs_physical_load_data(ticker_j, date)
+
+            return taq_correlator_kernel_responses_physical_data(
+                trade_sign_i, trade_sign_j, taus, windows)
+
+        except FileNotFoundError as e:
+            print('No data')
+            print(e)
+            print()
+            return taq_zeros_responses_physical_data(taus, windows)
+
+# ----------------------------------------------------------------------------
+
+
+def taq_trade_sign_cross_correlator_year_responses_physical_data(
+        ticker_i, ticker_j, year, taus=None, resolution=None,
+        windows=None):
+    """Computes the trade sign-cross correlator of a year.
+
+    Using the taq_trade_sign_cross_correlator_day_responses_physical_data
+    function computes the cross-correlator function for a year.
 
     :param ticker_i: string of the abbreviation of the stock to be analyzed
      (i.e. 'AAPL').
     :param ticker_j: string of the abbreviation of the stock to be analyzed
      (i.e. 'AAPL').
     :param year: string of the year to be analyzed (i.e '2016').
+    :param taus: numpy array with the time lags in seconds, generated with
+     the taq_tau_grid function of the tools. None uses every time lag from 1
+     to 1000 s (default None).
+    :param resolution: float with the length in seconds of the bins of the
+     day, between 0.001 and 1, computed from the events of the day. The time
+     lags are in bins. None uses the midpoint prices and trade signs of every
+     second (default None).
+    :param windows: numpy array with the start seconds of the time of day
+     windows, generated with the taq_window_grid function of the tools. The
+     results have a row for the whole day and a row for every window. None
+     uses the whole day (default None).
     :return: tuple -- The function returns a tuple with numpy arrays.
     """
 
@@ -1017,33 +2182,906 @@ def taq_trade_sign_cross_correlator_year_responses_physical_data(ticker_i,
         taq_data_tools_responses_physical \
             .taq_function_header_print_data(function_name, ticker_i, ticker_j,
                                             year, '', '')
+        function_name += taq_data_tools_responses_physical \
+            .taq_tau_name(taus) \
+            + taq_data_tools_responses_physical \
+            .taq_resolution_name(resolution) \
+            + taq_data_tools_responses_physical.taq_window_name(windows)
+
+        # Parallel computation of the cross-correlator of the days that are
+        # not finished. To obtain the total cross-correlator, I sum over all
+        # the cross-correlator values and all the amount of trades
+        # (averaging values)
+        cross_correlator = taq_year_pairs_responses_physical_data(
+            function_name,
+            taq_trade_sign_cross_correlator_day_responses_physical_data,
+            [(ticker_i, ticker_j)], year,
+            (taus, resolution, windows))[(ticker_i, ticker_j)]
 
-        dates = taq_data_tools_responses_physical.taq_bussiness_days(year)
+        return cross_correlator
 
-        cross_values = []
-        args_prod = iprod([ticker_i], [ticker_j], dates)
+# ----------------------------------------------------------------------------
 
-        # Parallel computation of the cross-correlator. Every result is
-        # appended to a list
-        with mp.Pool(processes=mp.cpu_count()) as pool:
-            cross_values.append(pool.starmap(
-                taq_trade_sign_cross_correlator_day_responses_physical_data,
-                args_prod))
 
-        # To obtain the total cross-correlator, I sum over all the
-        # cross-correlator values and all the amount of trades
-        # (averaging values)
-        cross_v_final = np.sum(cross_values[0], axis=0)
+def taq_trade_sign_cross_correlator_sweep_responses_physical_data(
+        tickers, year, taus=None, resolution=None, windows=None):
+    """Computes the trade sign cross-correlator of a year for all the pairs.
 
-        cross_correlator_val = cross_v_final[0] / cross_v_final[1]
-        cross_correlator_avg = cross_v_final[1]
+    The days of all the pairs are computed in the same pool and the pairs of
+    a day run in the same process, so the trade signs of a ticker are loaded
+    once per day instead of once per pair. The results are saved in the same
+    files of the taq_trade_sign_cross_correlator_year_responses_physical_data
+    function.
 
-        # Saving data
+    :param tickers: list of the string abbreviation of the stocks to be
+     analyzed (i.e. ['AAPL', 'MSFT']).
+    :param year: string of the year to be analyzed (i.e '2016').
+    :param taus: numpy array with the time lags in seconds, generated with
+     the taq_tau_grid function of the tools. None uses every time lag from 1
+     to 1000 s (default None).
+    :param resolution: float with the length in seconds of the bins of the
+     day, between 0.001 and 1, computed from the events of the day. The time
+     lags are in bins. None uses the midpoint prices and trade signs of every
+     second (default None).
+    :param windows: numpy array with the start seconds of the time of day
+     windows, generated with the taq_window_grid function of the tools. The
+     results have a row for the whole day and a row for every window. None
+     uses the whole day (default None).
+    :return: dictionary -- The function returns a dictionary with a tuple of
+     numpy arrays for each pair.
+    """
+
+    function_name = \
+        taq_trade_sign_cross_correlator_year_responses_physical_data.__name__
+    taq_data_tools_responses_physical \
+        .taq_function_header_print_data(function_name, 'all', 'all', year,
+                                        '', '')
+    function_name += taq_data_tools_responses_physical.taq_tau_name(taus) \
+        + taq_data_tools_responses_physical.taq_resolution_name(resolution) \
+        + taq_data_tools_responses_physical.taq_window_name(windows)
+
+    pairs = [(ticker_i, ticker_j) for ticker_i, ticker_j
+             in iprod(tickers, tickers) if ticker_i != ticker_j]
+
+    return taq_year_pairs_responses_physical_data(
+        function_name,
+        taq_trade_sign_cross_correlator_day_responses_physical_data, pairs,
+        year, (taus, resolution, windows))
+
+# ----------------------------------------------------------------------------
+
+
+def taq_years_tasks_responses_physical_data(tickers, policy='last',
+                                            taus=None, resolution=None,
+                                            windows=None):
+    """Lists the tasks of the year functions of the responses and correlators.
+
+    :param tickers: list of the string abbreviation of the stocks to be
+     analyzed (i.e. ['AAPL', 'MSFT']).
+    :param policy: string with the sampling policy of the midpoint price
+     (i.e. 'last', 'mean', 'time_weighted' or 'median'). Default 'last'.
+    :param taus: numpy array with the time lags in seconds, generated with
+     the taq_tau_grid function of the tools. None uses every time lag from 1
+     to 1000 s (default None).
+    :param resolution: float with the length in seconds of the bins of the
+     day, between 0.001 and 1, computed from the events of the day. The time
+     lags are in bins. None uses the midpoint prices and trade signs of every
+     second (default None).
+    :param windows: numpy array with the start seconds of the time of day
+     windows, generated with the taq_window_grid function of the tools. The
+     results have a row for the whole day and a row for every window. None
+     uses the whole day (default None).
+    :return: dictionary -- The function returns a dictionary with a tuple
+     with the name used to save the data, the day function, the pairs of
+     tickers and the other parameters of the day function for the name of
+     every year function.
+    """
+
+    suffix = taq_data_tools_responses_physical.taq_tau_name(taus) \
+        + taq_data_tools_responses_physical.taq_resolution_name(resolution) \
+        + taq_data_tools_responses_physical.taq_window_name(windows)
+    policy_name = '' if policy == 'last' else f'_policy_{policy}'
+
+    self_pairs = [(ticker, ticker) for ticker in tickers]
+    cross_pairs = [(ticker_i, ticker_j) for ticker_i, ticker_j
+                   in iprod(tickers, tickers) if ticker_i != ticker_j]
+
+    tasks = {}
+
+    # Only the responses depend on the sampling policy
+    for year_function, day_function, pairs, name, params in [
+            (taq_self_response_year_responses_physical_data,
+             taq_self_response_day_responses_physical_data, self_pairs,
+             policy_name, (policy, taus, resolution, windows)),
+            (taq_cross_response_year_responses_physical_data,
+             taq_cross_response_day_responses_physical_data, cross_pairs,
+             policy_name, (policy, taus, resolution, windows)),
+            (taq_trade_sign_self_correlator_year_responses_physical_data,
+             taq_trade_sign_self_correlator_day_responses_physical_data,
+             self_pairs, '', (taus, resolution, windows)),
+            (taq_trade_sign_cross_correlator_year_responses_physical_data,
+             taq_trade_sign_cross_correlator_day_responses_physical_data,
+             cross_pairs, '', (taus, resolution, windows))]:
+
+        function_name = year_function.__name__ + name + suffix
+
+        tasks[year_function.__name__] = (function_name, day_function, pairs,
+                                         params)
+
+    return tasks
+
+# ----------------------------------------------------------------------------
+
+
+def taq_years_responses_physical_data(tickers, years, policy='last',
+                                      taus=None, resolution=None,
+                                      windows=None):
+    """Computes the responses and correlators of several years.
+
+    The days of all the years of a response or correlator are computed in
+    the same pool, so the workers do not wait for the last days of a year
+    before starting the next year. The results of every year are saved in
+    the same files of the year functions, and the partial sums of every
+    year are saved for the taq_range_responses_physical_data function.
+
+    :param tickers: list of the string abbreviation of the stocks to be
+     analyzed (i.e. ['AAPL', 'MSFT']).
+    :param years: list of strings of the years to be analyzed (i.e.
+     ['2008', '2009']).
+    :param policy: string with the sampling policy of the midpoint price
+     (i.e. 'last', 'mean', 'time_weighted' or 'median'). Default 'last'.
+    :param taus: numpy array with the time lags in seconds, generated with
+     the taq_tau_grid function of the tools. None uses every time lag from 1
+     to 1000 s (default None).
+    :param resolution: float with the length in seconds of the bins of the
+     day, between 0.001 and 1, computed from the events of the day. The time
+     lags are in bins. None uses the midpoint prices and trade signs of every
+     second (default None).
+    :param windows: numpy array with the start seconds of the time of day
+     windows, generated with the taq_window_grid function of the tools. The
+     results have a row for the whole day and a row for every window. None
+     uses the whole day (default None).
+    :return: dictionary -- The function returns a dictionary with the
+     results of every year for the name of every year function.
+    """
+
+    function_name = taq_years_responses_physical_data.__name__
+    taq_data_tools_responses_physical \
+        .taq_function_header_print_data(function_name, 'all', 'all',
+                                        f'{years[0]}-{years[-1]}', '', '')
+
+    tasks = taq_years_tasks_responses_physical_data(tickers, policy, taus,
+                                                    resolution, windows)
+
+    return {name: taq_years_pairs_responses_physical_data(
+                 save_name, day_function, pairs, years, params)
+            for name, (save_name, day_function, pairs, params)
+            in tasks.items()}
+
+# ----------------------------------------------------------------------------
+
+
+def taq_range_responses_physical_data(function_name, tickers, start, end,
+                                      policy='last', taus=None,
+                                      resolution=None, windows=None):
+    """Computes a response or correlator over a range of dates.
+
+    The range can span several years. The sums over the days of the range
+    in every year are taken from the partial sums of the year, so the days
+    are not computed again. Only the years without partial sums of a pair
+    are computed, and the years with the same missing pairs are computed
+    together.
+
+    :param function_name: name of the year function (i.e.
+     'taq_cross_response_year_responses_physical_data').
+    :param tickers: list of the string abbreviation of the stocks to be
+     analyzed (i.e. ['AAPL', 'MSFT']).
+    :param start: string with the first date of the range
+     (i.e. '2008-07-01').
+    :param end: string with the last date of the range (i.e. '2009-06-30').
+    :param policy: string with the sampling policy of the midpoint price
+     (i.e. 'last', 'mean', 'time_weighted' or 'median'). Default 'last'.
+    :param taus: numpy array with the time lags in seconds, generated with
+     the taq_tau_grid function of the tools. None uses every time lag from 1
+     to 1000 s (default None).
+    :param resolution: float with the length in seconds of the bins of the
+     day, between 0.001 and 1, computed from the events of the day. The time
+     lags are in bins. None uses the midpoint prices and trade signs of every
+     second (default None).
+    :param windows: numpy array with the start seconds of the time of day
+     windows, generated with the taq_window_grid function of the tools. The
+     results have a row for the whole day and a row for every window. None
+     uses the whole day (default None).
+    :return: dictionary -- The function returns a dictionary with a tuple of
+     numpy arrays with the average and the amount of trades for each pair.
+    """
+
+    taq_data_tools_responses_physical \
+        .taq_function_header_print_data(
+            taq_range_responses_physical_data.__name__, 'all', 'all',
+            f'{start}-{end}', '', '')
+
+    save_name, day_function, pairs, params = \
+        taq_years_tasks_responses_physical_data(
+            tickers, policy, taus, resolution, windows)[function_name]
+
+    years = [str(year) for year in range(int(start[:4]), int(end[:4]) + 1)]
+
+    partial = {(pair, year): taq_data_tools_responses_physical
+               .taq_partial_load(save_name, *pair, year)
+               for pair in pairs for year in years}
+
+    # The years with the same missing pairs are computed together
+    missing = {}
+    for year in years:
+        year_pairs = tuple(pair for pair in pairs
+                           if partial[(pair, year)] is None)
+        if (year_pairs):
+            missing.setdefault(year_pairs, []).append(year)
+
+    for year_pairs, missing_years in missing.items():
+        taq_years_pairs_responses_physical_data(
+            save_name, day_function, list(year_pairs), missing_years, params)
+        for pair, year in iprod(year_pairs, missing_years):
+            partial[(pair, year)] = taq_data_tools_responses_physical \
+                .taq_partial_load(save_name, *pair, year)
+
+    results = {}
+
+    for pair in pairs:
+
+        v_final = 0
+
+        # Sum of the days of the range in every year
+        for year in years:
+            dates, sums = partial[(pair, year)]
+            first = np.searchsorted(dates, start)
+            last = np.searchsorted(dates, end, side='right')
+            v_final = v_final + sums[last] - sums[first]
+
+        results[pair] = (v_final[0] / v_final[1], v_final[1])
+
+    return results
+
+# ----------------------------------------------------------------------------
+
+
+def taq_bootstrap_kernel_responses_physical_data(sums, resamples=1000,
+                                                 block=1, level=0.95,
+                                                 seed=0):
+    """Computes the bootstrap band of a year from its partial sums.
+
+    The days of the year are resampled with replacement in moving blocks of
+    consecutive days. The sum of every block is the difference of two rows
+    of the partial sums, and every resample is the sum of the blocks drawn,
+    so all the resamples are computed with one product of the number of
+    draws of every block and the sums of the blocks. The band is given by
+    the percentiles of the averages of the resamples for every time lag.
+
+    :param sums: numpy array with the cumulative sums of the values (row 0)
+     and the amount of trades (row 1) of the days, with a row of zeros before
+     the first day, as in the partial sums of the year.
+    :param resamples: integer with the number of resamples of the days
+     (default 1000).
+    :param block: integer with the number of consecutive days of a block. A
+     block of 5 days resamples whole weeks, keeping the correlation of the
+     days of a week (default 1).
+    :param level: float with the confidence level of the band (default
+     0.95).
+    :param seed: integer with the seed of the random numbers (default 0).
+    :return: tuple -- The function returns a tuple with numpy arrays with the
+     lower and upper limits of the band.
+    """
+
+    days = len(sums) - 1
+
+    # A year without days with data has no band
+    if (not days):
+        band = np.full(sums.shape[2:], np.nan)
+        return (band, band)
+
+    block = max(1, min(block, days))
+    # Enough blocks to cover the days of the year
+    draws = -(-days // block)
+
+    block_sums = (sums[block:] - sums[:-block]).reshape(days - block + 1, -1)
+
+    # Number of times that every block is drawn in every resample
+    rng = np.random.default_rng(seed)
+    starts = rng.integers(0, len(block_sums), (resamples, draws))
+    starts += len(block_sums) * np.arange(resamples)[:, None]
+    counts = np.bincount(starts.ravel(), minlength=resamples
+                         * len(block_sums)).reshape(resamples, -1)
+
+    values = (counts @ block_sums).reshape((resamples,) + sums.shape[1:])
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        avg = values[:, 0] / values[:, 1]
+
+    low, high = np.nanpercentile(avg, [50 * (1 - level), 50 * (1 + level)],
+                                 axis=0)
+
+    return (low, high)
+
+# ----------------------------------------------------------------------------
+
+
+def taq_bootstrap_pair_responses_physical_data(function_name, ticker_i,
+                                               ticker_j, year, resamples=1000,
+                                               block=1, level=0.95, seed=0):
+    """Computes the bootstrap band of a year of a pair of tickers.
+
+    Using the taq_bootstrap_kernel_responses_physical_data function computes
+    the band from the partial sums of the year of the pair, so the days are
+    not computed again.
+
+    :param function_name: name used to save the data of the year function.
+    :param ticker_i: string of the abbreviation of the stock to be analyzed
+     (i.e. 'AAPL').
+    :param ticker_j: string of the abbreviation of the stock to be analyzed
+     (i.e. 'AAPL').
+    :param year: string of the year to be analyzed (i.e '2016').
+    :param resamples: integer with the number of resamples of the days
+     (default 1000).
+    :param block: integer with the number of consecutive days of a block. A
+     block of 5 days resamples whole weeks, keeping the correlation of the
+     days of a week (default 1).
+    :param level: float with the confidence level of the band (default
+     0.95).
+    :param seed: integer with the seed of the random numbers (default 0).
+    :return: tuple -- The function returns a tuple with numpy arrays with the
+     lower and upper limits of the band.
+    """
+
+    _, sums = taq_data_tools_responses_physical \
+        .taq_partial_load(function_name, ticker_i, ticker_j, year)
+
+    band = taq_bootstrap_kernel_responses_physical_data(sums, resamples,
+                                                        block, level, seed)
+
+    # Saving data
+    taq_data_tools_responses_physical \
+        .taq_save_data(f'{function_name}_bootstrap', band, ticker_i, ticker_j,
+                       year, '', '')
+
+    return band
+
+# ----------------------------------------------------------------------------
+
+
+def taq_bootstrap_year_responses_physical_data(function_name, tickers, year,
+                                               resamples=1000, block=1,
+                                               level=0.95, seed=0,
+                                               policy='last', taus=None,
+                                               resolution=None, windows=None):
+    """Computes the bootstrap bands of a response or correlator of a year.
+
+    The bands of the pairs are computed in parallel from the partial sums of
+    the year saved by the year functions. Only the pairs without partial
+    sums are computed again.
+
+    :param function_name: name of the year function (i.e.
+     'taq_cross_response_year_responses_physical_data').
+    :param tickers: list of the string abbreviation of the stocks to be
+     analyzed (i.e. ['AAPL', 'MSFT']).
+    :param year: string of the year to be analyzed (i.e '2016').
+    :param resamples: integer with the number of resamples of the days
+     (default 1000).
+    :param block: integer with the number of consecutive days of a block. A
+     block of 5 days resamples whole weeks, keeping the correlation of the
+     days of a week (default 1).
+    :param level: float with the confidence level of the band (default
+     0.95).
+    :param seed: integer with the seed of the random numbers (default 0).
+    :param policy: string with the sampling policy of the midpoint price
+     (i.e. 'last', 'mean', 'time_weighted' or 'median'). Default 'last'.
+    :param taus: numpy array with the time lags in seconds, generated with
+     the taq_tau_grid function of the tools. None uses every time lag from 1
+     to 1000 s (default None).
+    :param resolution: float with the length in seconds of the bins of the
+     day, between 0.001 and 1, computed from the events of the day. The time
+     lags are in bins. None uses the midpoint prices and trade signs of every
+     second (default None).
+    :param windows: numpy array with the start seconds of the time of day
+     windows, generated with the taq_window_grid function of the tools. The
+     results have a row for the whole day and a row for every window. None
+     uses the whole day (default None).
+    :return: dictionary -- The function returns a dictionary with a tuple of
+     numpy arrays with the lower and upper limits of the band for each pair.
+    """
+
+    taq_data_tools_responses_physical \
+        .taq_function_header_print_data(
+            taq_bootstrap_year_responses_physical_data.__name__, 'all', 'all',
+            year, '', '')
+
+    save_name, day_function, pairs, params = \
+        taq_years_tasks_responses_physical_data(
+            tickers, policy, taus, resolution, windows)[function_name]
+
+    missing = [pair for pair in pairs
+               if taq_data_tools_responses_physical
+               .taq_partial_load(save_name, *pair, year) is None]
+    if (missing):
+        taq_years_pairs_responses_physical_data(save_name, day_function,
+                                                missing, [year], params)
+
+    # Parallel computation of the bands of the pairs
+    with taq_data_tools_responses_physical.taq_pool() as pool:
+        bands = pool.starmap(taq_bootstrap_pair_responses_physical_data,
+                             [(save_name, ticker_i, ticker_j, year, resamples,
+                               block, level, seed)
+                              for ticker_i, ticker_j in pairs])
+
+    return dict(zip(pairs, bands))
+
+# ----------------------------------------------------------------------------
+
+
+def taq_shared_plan_responses_physical_data(tickers, year, taus=None):
+    """Plans the workers and the memory of a year in shared memory.
+
+    The cube, the mask and the result in shared memory are dense arrays of
+    every ticker, day and second, so they must fit in the memory budget of
+    the pools. Every slot of the result has the sums of a range of days, and
+    the tasks of a slot are ranges of tickers.
+
+    :param tickers: list of the string abbreviation of the stocks to be
+     analyzed (i.e. ['AAPL', 'MSFT']).
+    :param year: string of the year to be analyzed (i.e '2016').
+    :param taus: numpy array with the time lags in seconds, generated with
+     the taq_tau_grid function of the tools. None uses every time lag from 1
+     to 1000 s (default None).
+    :return: tuple -- The function returns a tuple with the number of
+     workers, slots and ranges of tickers, and a bool that is True when the
+     shared memory fits in the memory budget.
+    """
+
+    tickers_num = len(tickers)
+    days_num = len(taq_data_tools_pool
+                   .taq_catalog_dates(tickers, year, every=False))
+    taus_num = __tau__ if taus is None else len(taus)
+
+    workers = taq_data_tools_pool.taq_workers()
+    slots = max(1, min(days_num, -(-2 * workers // tickers_num)))
+    rows_num = min(tickers_num, 2 * workers)
+
+    # Cube, mask and result of float64
+    size = 8 * (2 * tickers_num * days_num * 22200
+                + 2 * tickers_num * days_num
+                + slots * tickers_num * tickers_num * 4 * taus_num)
+    budget = taq_data_tools_pool.taq_memory_budget(workers)
+
+    return (workers, slots, rows_num, budget is None or size <= budget)
+
+# ----------------------------------------------------------------------------
+
+
+def taq_shared_cube_responses_physical_data(tickers, year, policy='last'):
+    """Loads the midpoint prices and trade signs of a year in shared memory.
+
+    The cube has the midpoint prices (index 0) and the trade signs (index 1)
+    of every ticker, day and second. The days are the days with data of any
+    of the tickers in the catalog of the year. The mask has a one for the
+    days with data of every ticker and series.
+
+    :param tickers: list of the string abbreviation of the stocks to be
+     analyzed (i.e. ['AAPL', 'MSFT']).
+    :param year: string of the year to be analyzed (i.e '2016').
+    :param policy: string with the sampling policy of the midpoint price
+     (i.e. 'last', 'mean', 'time_weighted' or 'median'). Default 'last'.
+    :return: tuple -- The function returns a tuple with the shared memory
+     blocks and the arrays of the cube and the mask.
+    """
+
+    dates = taq_data_tools_pool \
+        .taq_catalog_dates(tickers, year, every=False)
+
+    shared_cube, cube = taq_data_tools_responses_physical \
+        .taq_shared_create((2, len(tickers), len(dates), 22200))
+    shared_mask, mask = taq_data_tools_responses_physical \
+        .taq_shared_create((2, len(tickers), len(dates)))
+
+    for t_idx, ticker in enumerate(tickers):
+        for d_idx, date in enumerate(dates):
+
+            try:
+                cube[0, t_idx, d_idx] = \
+                    taq_midpoint_physical_policy_data(ticker, date, policy)
+                mask[0, t_idx, d_idx] = 1
+            except FileNotFoundError:
+                pass
+
+            try:
+                cube[1, t_idx, d_idx] = \
+                    taq_trade_signs_physical_load_data(ticker, date)
+                mask[1, t_idx, d_idx] = 1
+            except FileNotFoundError:
+                pass
+
+    return (shared_cube, cube, shared_mask, mask)
+
+# ----------------------------------------------------------------------------
+
+
+def taq_shared_rows_responses_physical_data(names, shapes, rows, days, slot,
+                                            taus=None):
+    """Computes the responses and correlators of a range of tickers and days.
+
+    The process attaches to the cube, the mask and the result in shared
+    memory. For every ticker i in the range of rows, every ticker j and
+    every day in the range of days, the sums of the response and the
+    correlator and the amount of trades are added to the slot of the result.
+    The ranges of rows of a slot do not overlap, so every task writes in its
+    own part of the result.
+
+    :param names: tuple with the names of the shared memory blocks of the
+     cube, the mask and the result.
+    :param shapes: tuple with the shapes of the cube, the mask and the
+     result.
+    :param rows: tuple with the first and last (not included) index of the
+     tickers i.
+    :param days: tuple with the first and last (not included) index of the
+     days.
+    :param slot: integer with the index of the slot of the result.
+    :param taus: numpy array with the time lags in seconds, generated with
+     the taq_tau_grid function of the tools. None uses every time lag from 1
+     to 1000 s (default None).
+    :return: None -- The function writes in the result and does not return a
+     value.
+    """
+
+    blocks = [taq_data_tools_responses_physical.taq_shared_attach(name, shape)
+              for name, shape in zip(names, shapes)]
+    cube = blocks[0][1]
+    mask = blocks[1][1]
+    result = blocks[2][1]
+
+    for d_idx in range(*days):
+        for t_i in range(*rows):
+            for t_j in range(cube.shape[1]):
+
+                if (not mask[1, t_j, d_idx]):
+                    continue
+
+                if (mask[0, t_i, d_idx]):
+                    result[slot, t_i, t_j, 0] += \
+                        taq_response_kernel_responses_physical_data(
+                            cube[0, t_i, d_idx], cube[1, t_j, d_idx], taus)
+
+                if (mask[1, t_i, d_idx]):
+                    result[slot, t_i, t_j, 1] += \
+                        taq_correlator_kernel_responses_physical_data(
+                            cube[1, t_i, d_idx], cube[1, t_j, d_idx], taus)
+
+    del cube, mask, result
+    for shared, _ in blocks:
+        shared.close()
+
+    return None
+
+# ----------------------------------------------------------------------------
+
+
+def taq_shared_year_responses_physical_data(tickers, year, policy='last',
+                                            taus=None):
+    """Computes the responses and correlators of a year in shared memory.
+
+    The midpoint prices and trade signs of all the tickers and days are
+    loaded once in shared memory with the
+    taq_shared_cube_responses_physical_data function. The tasks of the
+    processes are only ranges of tickers and days, and the processes write
+    the sums of the responses and correlators in a result in shared memory,
+    so the data is not copied to or from the processes. The self- and
+    cross-responses and correlators are saved in the same files and results
+    stores of the year functions. The checkpoints are not used. The workers
+    are the workers of the executor, and the data of the year must fit in
+    the memory budget of the pools.
+
+    :param tickers: list of the string abbreviation of the stocks to be
+     analyzed (i.e. ['AAPL', 'MSFT']).
+    :param year: string of the year to be analyzed (i.e '2016').
+    :param policy: string with the sampling policy of the midpoint price
+     (i.e. 'last', 'mean', 'time_weighted' or 'median'). Default 'last'.
+    :param taus: numpy array with the time lags in seconds, generated with
+     the taq_tau_grid function of the tools. None uses every time lag from 1
+     to 1000 s (default None).
+    :return: None -- The function saves the data in a file and does not return
+     a value.
+    """
+
+    function_name = taq_shared_year_responses_physical_data.__name__
+    taq_data_tools_responses_physical \
+        .taq_function_header_print_data(function_name, 'all', 'all', year,
+                                        '', '')
+
+    workers, slots, rows_num, fits = \
+        taq_shared_plan_responses_physical_data(tickers, year, taus)
+
+    if (not fits):
+        raise Exception('The data of the year does not fit in the memory'
+                        + ' budget')
+
+    shared_cube, cube, shared_mask, mask = \
+        taq_shared_cube_responses_physical_data(tickers, year, policy)
+    shared_result = None
+
+    try:
+        tickers_num = len(tickers)
+        days_num = mask.shape[2]
+
+        shared_result, result = taq_data_tools_responses_physical \
+            .taq_shared_create((slots, tickers_num, tickers_num, 2, 2,
+                                __tau__ if taus is None else len(taus)))
+
+        names = (shared_cube.name, shared_mask.name, shared_result.name)
+        shapes = (cube.shape, mask.shape, result.shape)
+
+        args_prod = [(names, shapes, (int(rows[0]), int(rows[-1]) + 1),
+                      (int(days[0]), int(days[-1]) + 1), slot, taus)
+                     for slot, days
+                     in enumerate(np.array_split(range(days_num), slots))
+                     for rows in np.array_split(range(tickers_num), rows_num)
+                     if len(days) and len(rows)]
+
+        # Parallel computation of the ranges of tickers and days
+        with taq_data_tools_responses_physical.taq_pool(workers) as pool:
+            pool.starmap(taq_shared_rows_responses_physical_data, args_prod)
+
+        # To obtain the total responses and correlators, I sum over all the
+        # slots and all the amount of trades (averaging values)
+        v_final = np.sum(result, axis=0)
+
+    finally:
+        del cube, mask
+        shared_cube.close()
+        shared_cube.unlink()
+        shared_mask.close()
+        shared_mask.unlink()
+        if (shared_result is not None):
+            del result
+            shared_result.close()
+            shared_result.unlink()
+
+    suffix = f'_policy_{policy}' if policy != 'last' else ''
+    tau_name = taq_data_tools_responses_physical.taq_tau_name(taus)
+    stores = {}
+
+    for (t_i, ticker_i), (t_j, ticker_j) in iprod(enumerate(tickers),
+                                                  repeat=2):
+
+        if (ticker_i == ticker_j):
+            function_names = (
+                'taq_self_response_year_responses_physical_data' + suffix
+                + tau_name,
+                'taq_trade_sign_self_correlator_year_responses_physical_data'
+                + tau_name)
+        else:
+            function_names = (
+                'taq_cross_response_year_responses_physical_data' + suffix
+                + tau_name,
+                'taq_trade_sign_cross_correlator_year_responses_physical'
+                + '_data' + tau_name)
+
+        for name, (val, num) in zip(function_names, v_final[t_i, t_j]):
+            taq_data_tools_responses_physical \
+                .taq_save_data(name, val / num, ticker_i, ticker_j, year,
+                               '', '')
+            stores.setdefault(name, {})[(ticker_i, ticker_j)] = val / num
+
+    for name, values in stores.items():
         taq_data_tools_responses_physical \
-            .taq_save_data(function_name, cross_correlator_val, ticker_i,
-                           ticker_j, year, '', '')
+            .taq_store_save(name, values, year)
+
+    return None
+
+# ----------------------------------------------------------------------------
+
+
+def taq_online_start_responses_physical_data(tickers, taus=None):
+    """Starts the online estimator of the responses and correlators.
+
+    The state of the estimator keeps the midpoint prices and trade signs of
+    the last seconds of the day in ring buffers, as long as the longest time
+    lag, and the running sums of the self- and cross-responses and
+    correlators and the amount of trades of every pair of tickers.
+
+    :param tickers: list of the string abbreviation of the stocks to be
+     analyzed (i.e. ['AAPL', 'MSFT']).
+    :param taus: numpy array with the time lags in seconds, generated with
+     the taq_tau_grid function of the tools. None uses every time lag from 1
+     to 1000 s (default None).
+    :return: dictionary -- The function returns a dictionary with the state
+     of the estimator.
+    """
+
+    tau_name = taq_data_tools_responses_physical.taq_tau_name(taus)
+
+    if (taus is None):
+        taus = range(1, __tau__ + 1)
+
+    taus = np.asarray(taus, dtype=int)
+    tickers_num = len(tickers)
+    size = int(taus.max()) + 1
+
+    state = {
+        'tickers': list(tickers),
+        'taus': taus,
+        'tau_name': tau_name,
+        'date': None,
+        'second': 0,
+        'midpoint': np.full((tickers_num, size), np.nan),
+        'trade_sign': np.zeros((tickers_num, size)),
+        'response': np.zeros((tickers_num, tickers_num, len(taus))),
+        'correlator': np.zeros((tickers_num, tickers_num, len(taus))),
+        'num': np.zeros((tickers_num, tickers_num, len(taus)))
+    }
+
+    return state
+
+# ----------------------------------------------------------------------------
+
+
+def taq_online_update_responses_physical_data(state, date, midpoint,
+                                              trade_sign):
+    """Updates the online estimator with the data of a second.
+
+    The function is called for every second of the day in time order, with
+    the midpoint price and the trade sign of the second, as in the arrays of
+    every second of the taq_midpoint_physical_data and
+    taq_trade_signs_physical_data functions. For every pair of tickers, the
+    responses and correlators of the trade signs of the second tau seconds
+    before are added to the running sums, so every second costs the number
+    of time lags. The time lags do not cross days, and a pair is only used
+    while both tickers have data.
+
+    :param state: dictionary with the state of the estimator, generated with
+     the taq_online_start_responses_physical_data function. It is updated
+     with the second.
+    :param date: string with the date of the second (i.e. '2008-01-02').
+    :param midpoint: dictionary with the midpoint price of the second of
+     every ticker with data.
+    :param trade_sign: dictionary with the trade sign of the second of every
+     ticker with data.
+    :return: None -- The function updates the state and does not return a
+     value.
+    """
+
+    # The ring buffers start again with every day
+    if (date != state['date']):
+        state['date'] = date
+        state['second'] = 0
+
+    second = state['second']
+    size = state['midpoint'].shape[1]
+
+    midpoint_sec = np.array([midpoint.get(ticker, np.nan)
+                             for ticker in state['tickers']])
+    trade_sign_sec = np.array([trade_sign.get(ticker, 0.)
+                               for ticker in state['tickers']])
+
+    state['midpoint'][:, second % size] = midpoint_sec
+    state['trade_sign'][:, second % size] = trade_sign_sec
+    state['second'] = second + 1
+
+    # Time lags inside the day
+    lags = np.flatnonzero(state['taus'] <= second)
+    if (not len(lags)):
+        return None
 
-        return (cross_correlator_val, cross_correlator_avg)
+    past = (second - state['taus'][lags]) % size
+    midpoint_tau = state['midpoint'][:, past]
+    trade_sign_tau = state['trade_sign'][:, past]
+
+    # Pairs of tickers with data and trades of the ticker j tau seconds
+    # before
+    present = ~np.isnan(midpoint_sec)
+    trades = (present[:, None, None] & present[None, :, None]
+              & (trade_sign_tau != 0)[None, :, :])
+
+    # Midpoint price returns
+    log_return_sec = (midpoint_sec[:, None] - midpoint_tau) / midpoint_tau
+
+    state['num'][:, :, lags] += trades
+    state['response'][:, :, lags] += np.where(
+        trades, log_return_sec[:, None, :] * trade_sign_tau[None, :, :], 0)
+    state['correlator'][:, :, lags] += np.where(
+        trades, trade_sign_sec[:, None, None] * trade_sign_tau[None, :, :], 0)
+
+    return None
+
+# ----------------------------------------------------------------------------
+
+
+def taq_online_curves_responses_physical_data(state):
+    """Returns the current responses and correlators of the online estimator.
+
+    The curves are the averages of all the seconds used by the estimator, so
+    they can be obtained at any time of the day without waiting for the
+    results of the year functions.
+
+    :param state: dictionary with the state of the estimator, generated with
+     the taq_online_start_responses_physical_data function.
+    :return: dictionary -- The function returns a dictionary with the
+     averages of every pair of tickers for the name of the year function of
+     every response and correlator.
+    """
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        response = state['response'] / state['num']
+        correlator = state['correlator'] / state['num']
+
+    tau_name = state['tau_name']
+    curves = {}
+
+    for (t_i, ticker_i), (t_j, ticker_j) in iprod(
+            enumerate(state['tickers']), repeat=2):
+
+        if (ticker_i == ticker_j):
+            function_names = (
+                'taq_self_response_year_responses_physical_data' + tau_name,
+                'taq_trade_sign_self_correlator_year_responses_physical_data'
+                + tau_name)
+        else:
+            function_names = (
+                'taq_cross_response_year_responses_physical_data' + tau_name,
+                'taq_trade_sign_cross_correlator_year_responses_physical'
+                + '_data' + tau_name)
+
+        for name, value in zip(function_names,
+                               (response[t_i, t_j], correlator[t_i, t_j])):
+            curves.setdefault(name, {})[(ticker_i, ticker_j)] = value
+
+    return curves
+
+# ----------------------------------------------------------------------------
+
+
+def taq_online_replay_responses_physical_data(tickers, dates):
+    """Replays the midpoint prices and trade signs of days in time order.
+
+    The midpoint prices and trade signs of every second of the days are
+    loaded from the data of the taq_midpoint_physical_data and
+    taq_trade_signs_physical_data functions and given second by second, in
+    the same form used by the taq_online_update_responses_physical_data
+    function. The tickers without data in a day are not given.
+
+    :param tickers: list of the string abbreviation of the stocks to be
+     analyzed (i.e. ['AAPL', 'MSFT']).
+    :param dates: list of strings with the dates of the days to replay (i.e.
+     ['2008-01-02', '2008-01-03']).
+    :return: generator -- The function yields a tuple with the date and
+     dictionaries with the midpoint price and trade sign of every ticker with
+     data for every second.
+    """
+
+    for date in dates:
+
+        midpoint = {}
+        trade_sign = {}
+
+        for ticker in tickers:
+            try:
+                midpoint_day = taq_midpoint_physical_policy_data(ticker, date)
+                trade_sign_day = taq_trade_signs_physical_load_data(ticker,
+                                                                    date)
+                midpoint[ticker] = midpoint_day
+                trade_sign[ticker] = trade_sign_day
+
+            except FileNotFoundError as e:
+                print('No data')
+                print(e)
+                print()
+
+        if (not midpoint):
+            continue
+
+        for second in range(min(len(value) for value in midpoint.values())):
+            yield (date,
+                   {ticker: value[second]
+                    for ticker, value in midpoint.items()},
+                   {ticker: value[second]
+                    for ticker, value in trade_sign.items()})
 
 # ----------------------------------------------------------------------------
 
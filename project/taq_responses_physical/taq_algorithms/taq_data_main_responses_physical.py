@@ -8,11 +8,18 @@ This script requires the following modules:
     * multiprocessing
     * os
     * pandas
+    * sys
     * taq_data_analysis_responses_physical
     * taq_data_plot_responses_physical
+    * taq_data_tools_pool
     * taq_data_tools_responses_physical
 
 The module contains the following functions:
+    * taq_data_generator - generates all the analysis from the TAQ data.
+    * taq_years_data_generator - generates all the analysis of several years
+      from the TAQ data.
+    * taq_plot_generator - generates all the plots from the analysis of the
+      TAQ data.
     * taq_data_plot_generator - generates all the analysis and plots from the
       TAQ data.
     * main - the main function of the script.
@@ -27,91 +34,277 @@ from itertools import product as iprod
 import multiprocessing as mp
 import os
 import pandas as pd
+import sys
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                             '..', '..', 'taq_pool', 'taq_algorithms'))
 import taq_data_analysis_responses_physical
 import taq_data_plot_responses_physical
+import taq_data_tools_pool
 import taq_data_tools_responses_physical
 
 # -----------------------------------------------------------------------------
 
 
-def taq_data_plot_generator(tickers, year):
-    """Generates all the analysis and plots from the TAQ data.
+def taq_data_generator(tickers, year, shared=False, taus=None,
+                       resolution=None, windows=None):
+    """Generates all the analysis from the TAQ data.
 
     :param tickers: list of the string abbreviation of the stocks to be
      analyzed (i.e. ['AAPL', 'MSFT']).
     :param year: string of the year to be analyzed (i.e '2016').
+    :param shared: bool to compute the responses and correlators with the
+     data of the year in shared memory, without resolution and windows. When
+     the data does not fit in the memory budget, the days are computed in
+     the pools (default False).
+    :param taus: numpy array with the time lags in seconds, generated with
+     the taq_tau_grid function of the tools. None uses every time lag from 1
+     to 1000 s (default None).
+    :param resolution: float with the length in seconds of the bins of the
+     day, between 0.001 and 1. The time lags are in bins. None uses the
+     midpoint prices and trade signs of every second (default None).
+    :param windows: numpy array with the start seconds of the time of day
+     windows, generated with the taq_window_grid function of the tools. None
+     uses the whole day (default None).
     :return: None -- The function saves the data in a file and does not return
      a value.
     """
 
-    date_list = taq_data_tools_responses_physical.taq_bussiness_days(year)
+    # The data of the year in shared memory uses the arrays of every second
+    # of the whole day
+    if (shared and (resolution is not None or windows is not None)):
+        raise Exception('The shared memory does not support resolution or'
+                        + ' windows')
 
-    # Parallel computing
-    with mp.Pool(processes=mp.cpu_count()) as pool:
-        # Basic functions
-        pool.starmap(taq_data_analysis_responses_physical
-                     .taq_midpoint_physical_data,
-                     iprod(tickers, date_list))
-    # Parallel computing
-    with mp.Pool(processes=mp.cpu_count()) as pool:
-        # Basic functions
-        pool.starmap(taq_data_analysis_responses_physical
-                     .taq_trade_signs_physical_data,
-                     iprod(tickers, date_list))
+    # Catalog of the tick store, so only the days with data are computed
+    if (taq_data_tools_pool.taq_load_catalog(year) is None):
+        taq_data_analysis_responses_physical.taq_catalog_data(year)
 
-    # Specific functions
-    # Self-response and self-correlator
+    # Basic functions. The days finished in an interrupted run are not
+    # computed again
     for ticker in tickers:
 
         taq_data_analysis_responses_physical \
-            .taq_self_response_year_responses_physical_data(ticker, year)
+            .taq_checkpoint_year_responses_physical_data(
+                'taq_midpoint_physical_data',
+                taq_data_analysis_responses_physical
+                .taq_midpoint_physical_data, ticker, ticker, year, keep=False,
+                data='raw', collect=False)
+        taq_data_analysis_responses_physical \
+            .taq_checkpoint_year_responses_physical_data(
+                'taq_trade_signs_physical_data',
+                taq_data_analysis_responses_physical
+                .taq_trade_signs_physical_data, ticker, ticker, year,
+                keep=False, data='raw', collect=False)
+
+        if (resolution is not None):
+            # Midpoint price changes and trade signs of every bin
+            taq_data_analysis_responses_physical \
+                .taq_checkpoint_year_responses_physical_data(
+                    'taq_events_physical_data'
+                    + taq_data_tools_responses_physical
+                    .taq_resolution_name(resolution),
+                    taq_data_analysis_responses_physical
+                    .taq_events_physical_data, ticker, ticker, year,
+                    (resolution,), keep=False, data='raw', collect=False)
+
+    # The data of the year in shared memory must fit in the memory budget
+    if (shared and not taq_data_analysis_responses_physical
+            .taq_shared_plan_responses_physical_data(tickers, year, taus)[3]):
+        print('The data of the year does not fit in the memory budget, so the'
+              + ' days are computed in the pools')
+        print()
+        shared = False
+
+    # Specific functions
+    if (shared):
+        # Self- and cross-response and correlator with the data of the year
+        # in shared memory
+        taq_data_analysis_responses_physical \
+            .taq_shared_year_responses_physical_data(tickers, year,
+                                                     taus=taus)
+
+    else:
+        # Self-response and self-correlator
+        for ticker in tickers:
+
+            taq_data_analysis_responses_physical \
+                .taq_self_response_year_responses_physical_data(
+                    ticker, year, taus=taus, resolution=resolution,
+                    windows=windows)
+            taq_data_analysis_responses_physical \
+                .taq_trade_sign_self_correlator_year_responses_physical_data(
+                    ticker, year, taus, resolution, windows)
+
+        # Cross-response and cross-correlator. The pairs of a day run in the
+        # same process, so the data of a ticker is loaded once per day
         taq_data_analysis_responses_physical \
-            .taq_trade_sign_self_correlator_year_responses_physical_data(
-                ticker, year)
+            .taq_cross_response_sweep_responses_physical_data(
+                tickers, year, taus=taus, resolution=resolution,
+                windows=windows)
+        taq_data_analysis_responses_physical \
+            .taq_trade_sign_cross_correlator_sweep_responses_physical_data(
+                tickers, year, taus, resolution, windows)
 
-    ticker_prod = iprod(tickers, tickers)
-    # ticker_prod = [('AAPL', 'MSFT'), ('MSFT', 'AAPL'),
-    #                ('GS', 'JPM'), ('JPM', 'GS'),
-    #                ('CVX', 'XOM'), ('XOM', 'CVX'),
-    #                ('GOOG', 'MA'), ('MA', 'GOOG'),
-    #                ('CME', 'GS'), ('GS', 'CME'),
-    #                ('RIG', 'APA'), ('APA', 'RIG')]
+    # The run finished, so the next run computes its tasks again. The
+    # checkpoints of other interrupted runs are kept
+    taq_data_tools_responses_physical.taq_checkpoint_clear(year)
 
-    # Cross-response and cross-correlator
-    for ticks in ticker_prod:
+    return None
 
+# -----------------------------------------------------------------------------
+
+
+def taq_years_data_generator(tickers, years, taus=None, resolution=None,
+                             windows=None):
+    """Generates all the analysis of several years from the TAQ data.
+
+    The tasks of all the years are computed in the same pools and the data of
+    every year is saved in the folders of the year.
+
+    :param tickers: list of the string abbreviation of the stocks to be
+     analyzed (i.e. ['AAPL', 'MSFT']).
+    :param years: list of strings of the years to be analyzed (i.e.
+     ['2008', '2009']).
+    :param taus: numpy array with the time lags in seconds, generated with
+     the taq_tau_grid function of the tools. None uses every time lag from 1
+     to 1000 s (default None).
+    :param resolution: float with the length in seconds of the bins of the
+     day, between 0.001 and 1. The time lags are in bins. None uses the
+     midpoint prices and trade signs of every second (default None).
+    :param windows: numpy array with the start seconds of the time of day
+     windows, generated with the taq_window_grid function of the tools. None
+     uses the whole day (default None).
+    :return: None -- The function saves the data in a file and does not return
+     a value.
+    """
+
+    # Catalogs of the tick store, so only the days with data are computed
+    for year in years:
+        if (taq_data_tools_pool.taq_load_catalog(year) is None):
+            taq_data_analysis_responses_physical.taq_catalog_data(year)
+
+    basic = [('taq_midpoint_physical_data',
+              taq_data_analysis_responses_physical.taq_midpoint_physical_data,
+              ()),
+             ('taq_trade_signs_physical_data',
+              taq_data_analysis_responses_physical
+              .taq_trade_signs_physical_data, ())]
+
+    if (resolution is not None):
+        # Midpoint price changes and trade signs of every bin
+        basic.append(('taq_events_physical_data'
+                      + taq_data_tools_responses_physical
+                      .taq_resolution_name(resolution),
+                      taq_data_analysis_responses_physical
+                      .taq_events_physical_data, (resolution,)))
+
+    # Basic functions of all the tickers and years. The days finished in an
+    # interrupted run are not computed again
+    for function_name, day_function, params in basic:
         taq_data_analysis_responses_physical \
-            .taq_cross_response_year_responses_physical_data(ticks[0],
-                                                             ticks[1], year)
-        taq_data_analysis_responses_physical \
-            .taq_trade_sign_cross_correlator_year_responses_physical_data(
-                ticks[0], ticks[1], year)
+            .taq_checkpoint_pairs_responses_physical_data(
+                function_name, day_function,
+                [(ticker, ticker) for ticker in tickers], years, params,
+                keep=False, data='raw', collect=False)
+
+    # Self- and cross-response and correlator of all the years
+    taq_data_analysis_responses_physical \
+        .taq_years_responses_physical_data(tickers, years, taus=taus,
+                                           resolution=resolution,
+                                           windows=windows)
+
+    # The run finished, so the next run computes its tasks again. The
+    # checkpoints of other interrupted runs are kept
+    for year in years:
+        taq_data_tools_responses_physical.taq_checkpoint_clear(year)
+
+    return None
+
+# -----------------------------------------------------------------------------
+
+
+def taq_plot_generator(tickers, year, taus=None, resolution=None,
+                       windows=None):
+    """Generates all the plots from the analysis of the TAQ data.
+
+    :param tickers: list of the string abbreviation of the stocks to be
+     analyzed (i.e. ['AAPL', 'MSFT']).
+    :param year: string of the year to be analyzed (i.e '2016').
+    :param taus: numpy array with the time lags in seconds, generated with
+     the taq_tau_grid function of the tools. None uses every time lag from 1
+     to 1000 s (default None).
+    :param resolution: float with the length in seconds of the bins of the
+     day, between 0.001 and 1. The time lags are in bins. None uses the
+     midpoint prices and trade signs of every second (default None).
+    :param windows: numpy array with the start seconds of the time of day
+     windows, generated with the taq_window_grid function of the tools. None
+     uses the whole day (default None).
+    :return: None -- The function saves the plots in files and does not
+     return a value.
+    """
+
+    workers = taq_data_tools_pool.taq_workers()
 
     # Parallel computing
-    with mp.Pool(processes=mp.cpu_count()) as pool:
+    with mp.Pool(processes=workers) as pool:
         # Plot
         pool.starmap(taq_data_plot_responses_physical
                      .taq_self_response_year_avg_responses_physical_plot,
-                     iprod(tickers, [year]))
+                     iprod(tickers, [year], [taus], [resolution],
+                           [windows]))
     # Parallel computing
-    with mp.Pool(processes=mp.cpu_count()) as pool:
+    with mp.Pool(processes=workers) as pool:
         # Plot
         pool.starmap(taq_data_plot_responses_physical
                      .taq_cross_response_year_avg_responses_physical_plot,
-                     iprod(tickers, tickers, [year]))
+                     iprod(tickers, tickers, [year], [taus], [resolution],
+                           [windows]))
     # Parallel computing
-    with mp.Pool(processes=mp.cpu_count()) as pool:
+    with mp.Pool(processes=workers) as pool:
         # Plot
         pool.starmap(taq_data_plot_responses_physical
             .taq_trade_sign_self_correlator_year_avg_responses_physical_plot,
-            iprod(tickers, [year]))
+            iprod(tickers, [year], [taus], [resolution], [windows]))
     # Parallel computing
-    with mp.Pool(processes=mp.cpu_count()) as pool:
+    with mp.Pool(processes=workers) as pool:
         # Plot
         pool.starmap(taq_data_plot_responses_physical
             .taq_trade_sign_cross_correlator_year_avg_responses_physical_plot,
-            iprod(tickers, tickers, [year]))
+            iprod(tickers, tickers, [year], [taus], [resolution],
+                  [windows]))
+
+    return None
+
+# -----------------------------------------------------------------------------
+
+
+def taq_data_plot_generator(tickers, year, shared=False, taus=None,
+                            resolution=None, windows=None):
+    """Generates all the analysis and plots from the TAQ data.
+
+    :param tickers: list of the string abbreviation of the stocks to be
+     analyzed (i.e. ['AAPL', 'MSFT']).
+    :param year: string of the year to be analyzed (i.e '2016').
+    :param shared: bool to compute the responses and correlators with the
+     data of the year in shared memory, without resolution and windows. When
+     the data does not fit in the memory budget, the days are computed in
+     the pools (default False).
+    :param taus: numpy array with the time lags in seconds, generated with
+     the taq_tau_grid function of the tools. None uses every time lag from 1
+     to 1000 s (default None).
+    :param resolution: float with the length in seconds of the bins of the
+     day, between 0.001 and 1. The time lags are in bins. None uses the
+     midpoint prices and trade signs of every second (default None).
+    :param windows: numpy array with the start seconds of the time of day
+     windows, generated with the taq_window_grid function of the tools. None
+     uses the whole day (default None).
+    :return: None -- The function saves the data in a file and does not return
+     a value.
+    """
+
+    taq_data_generator(tickers, year, shared, taus, resolution, windows)
+    taq_plot_generator(tickers, year, taus, resolution, windows)
 
     return None
 
@@ -142,9 +335,28 @@ def main():
     taq_data_analysis_responses_physical.taq_build_from_scratch(tickers, year)
     taq_data_analysis_responses_physical.taq_daily_data_extract(tickers, year)
 
-    # Analysis and plot
+    # Analysis and plot. A grid of log-spaced time lags computes long time
+    # lags with less work (i.e. taus=taq_data_tools_responses_physical
+    # .taq_tau_grid(10 ** 4, 50))
     taq_data_plot_generator(tickers, year)
 
+    # Several years are computed together with the function
+    # taq_years_data_generator(tickers, ['2008', '2009']), and the responses
+    # over a range of dates spanning years with the function
+    # taq_data_analysis_responses_physical.taq_range_responses_physical_data
+
+    # The plots show the bootstrap bands of a year when they are computed
+    # with the function taq_data_analysis_responses_physical
+    # .taq_bootstrap_year_responses_physical_data
+
+    # The intraday time of day windows are computed with windows=
+    # taq_data_tools_responses_physical.taq_window_grid(1800)
+
+    # The responses and correlators are followed second by second with the
+    # online estimator of the functions taq_data_analysis_responses_physical
+    # .taq_online_start_responses_physical_data and
+    # taq_online_update_responses_physical_data
+
     print('Ay vamos!!!')
 
     return None
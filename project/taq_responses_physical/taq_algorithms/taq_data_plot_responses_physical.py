@@ -5,7 +5,10 @@ taq_data_analysis_responses_physical module.
 
 This script requires the following modules:
     * matplotlib
+    * os
     * pickle
+    * sys
+    * taq_data_tools_pool
     * taq_data_tools_responses_physical
 
 The module contains the following functions:
@@ -26,19 +29,36 @@ The module contains the following functions:
 # Modules
 
 from matplotlib import pyplot as plt
+import os
 import pickle
+import sys
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                             '..', '..', 'taq_pool', 'taq_algorithms'))
+import taq_data_tools_pool
 import taq_data_tools_responses_physical
 
 # ----------------------------------------------------------------------------
 
 
-def taq_self_response_year_avg_responses_physical_plot(ticker, year):
+def taq_self_response_year_avg_responses_physical_plot(ticker, year,
+                                                       taus=None,
+                                                       resolution=None,
+                                                       windows=None):
     """Plots the self-response average for a year.
 
     :param ticker: string of the abbreviation of the stock to be analyzed
      (i.e. 'AAPL').
     :param year: string of the year to be analyzed (i.e '2008').
+    :param taus: numpy array with the time lags in seconds of the data,
+     generated with the taq_tau_grid function of the tools. None uses every
+     time lag from 1 to 1000 s (default None).
+    :param resolution: float with the length in seconds of the bins of the
+     data. The time lags are in bins. None uses the data of every second
+     (default None).
+    :param windows: numpy array with the start seconds of the time of day
+     windows of the data. Every window is plotted with the whole day. None
+     uses the whole day (default None).
     :return: None -- The function saves the plot in a file and does not return
      a value.
     """
@@ -49,23 +69,45 @@ def taq_self_response_year_avg_responses_physical_plot(ticker, year):
         taq_data_tools_responses_physical \
             .taq_function_header_print_plot(function_name, ticker, ticker,
                                             year, '', '')
+        tau_name = taq_data_tools_responses_physical.taq_tau_name(taus) \
+            + taq_data_tools_responses_physical \
+            .taq_resolution_name(resolution) \
+            + taq_data_tools_responses_physical.taq_window_name(windows)
+        data_name = 'taq_self_response_year_responses_physical_data' \
+            + tau_name
 
         # Load data
         self_ = pickle.load(open(
-                        f'../../taq_data/responses_physical_data_{year}/taq'
-                        + f'_self_response_year_responses_physical_data/taq'
-                        + f'_self_response_year_responses_physical_data_{year}'
-                        + f'_{ticker}.pickle', 'rb'))
+                        f'../../taq_data/responses_physical_data_{year}/'
+                        + f'{data_name}/{data_name}_{year}_{ticker}.pickle',
+                        'rb'))
+        scale = 1 if resolution is None else resolution
+        # The rows after the first one are the time of day windows
+        rows = [] if windows is None else self_[1:]
+        self_ = self_ if windows is None else self_[0]
+        lags = [lag * scale for lag
+                in (range(len(self_)) if taus is None else taus)]
 
         figure = plt.figure(figsize=(16, 9))
-        plt.semilogx(self_, linewidth=5, label=f'{ticker}')
+        for window, row in zip([] if windows is None else windows, rows):
+            hour, minute = divmod(int(window) // 60, 60)
+            plt.semilogx(lags, row, linewidth=2,
+                         label=f'{hour:02d}:{minute:02d}')
+        plt.semilogx(lags, self_, linewidth=5, label=f'{ticker}')
+        # Bootstrap band, when it was computed
+        band = taq_data_tools_pool.taq_store_pickle(
+            f'{data_name}_bootstrap', (ticker, ticker), year)
+        if (len(band)):
+            low, high = band if windows is None \
+                else (band[0][0], band[1][0])
+            plt.fill_between(lags, low, high, alpha=0.3)
         plt.legend(loc='best', fontsize=25)
         plt.title('Self-response', fontsize=40)
         plt.xlabel(r'$\tau \, [s]$', fontsize=35)
         plt.ylabel(r'$R_{ii}(\tau)$', fontsize=35)
         plt.xticks(fontsize=25)
         plt.yticks(fontsize=25)
-        plt.xlim(1, 1000)
+        plt.xlim(scale, (1000 if taus is None else taus[-1]) * scale)
         # plt.ylim(13 * 10 ** -5, 16 * 10 ** -5)
         plt.ticklabel_format(style='sci', axis='y', scilimits=(0, 0))
         plt.grid(True)
@@ -73,7 +115,8 @@ def taq_self_response_year_avg_responses_physical_plot(ticker, year):
 
         # Plotting
         taq_data_tools_responses_physical \
-            .taq_save_plot(function_name, figure, ticker, ticker, year, '')
+            .taq_save_plot(function_name + tau_name, figure, ticker, ticker,
+                           year, '')
 
         return None
 
@@ -87,7 +130,9 @@ def taq_self_response_year_avg_responses_physical_plot(ticker, year):
 
 
 def taq_cross_response_year_avg_responses_physical_plot(ticker_i, ticker_j,
-                                                        year):
+                                                        year, taus=None,
+                                                        resolution=None,
+                                                        windows=None):
     """Plots the cross-response average for a year.
 
     :param ticker_i: string of the abbreviation of the stock to be analyzed
@@ -95,6 +140,15 @@ def taq_cross_response_year_avg_responses_physical_plot(ticker_i, ticker_j,
     :param ticker_j: string of the abbreviation of the stock to be analyzed
      (i.e. 'AAPL')
     :param year: string of the year to be analyzed (i.e '2008')
+    :param taus: numpy array with the time lags in seconds of the data,
+     generated with the taq_tau_grid function of the tools. None uses every
+     time lag from 1 to 1000 s (default None).
+    :param resolution: float with the length in seconds of the bins of the
+     data. The time lags are in bins. None uses the data of every second
+     (default None).
+    :param windows: numpy array with the start seconds of the time of day
+     windows of the data. Every window is plotted with the whole day. None
+     uses the whole day (default None).
     :return: None -- The function saves the plot in a file and does not return
      a value.
     """
@@ -111,23 +165,45 @@ def taq_cross_response_year_avg_responses_physical_plot(ticker_i, ticker_j,
             taq_data_tools_responses_physical \
                 .taq_function_header_print_plot(function_name, ticker_i,
                                                 ticker_j, year, '', '')
+            tau_name = taq_data_tools_responses_physical.taq_tau_name(taus) \
+                + taq_data_tools_responses_physical \
+                .taq_resolution_name(resolution) \
+                + taq_data_tools_responses_physical.taq_window_name(windows)
+            data_name = 'taq_cross_response_year_responses_physical_data' \
+                + tau_name
 
             cross = pickle.load(open(
                             f'../../taq_data/responses_physical_data_{year}/'
-                            + f'taq_cross_response_year_responses_physical'
-                            + f'_data/taq_cross_response_year_responses'
-                            + f'_physical_data_{year}_{ticker_i}i_{ticker_j}j'
-                            + f'.pickle', 'rb'))
+                            + f'{data_name}/{data_name}_{year}_{ticker_i}i'
+                            + f'_{ticker_j}j.pickle', 'rb'))
+            scale = 1 if resolution is None else resolution
+            # The rows after the first one are the time of day windows
+            rows = [] if windows is None else cross[1:]
+            cross = cross if windows is None else cross[0]
+            lags = [lag * scale for lag
+                    in (range(len(cross)) if taus is None else taus)]
 
             figure = plt.figure(figsize=(16, 9))
-            plt.semilogx(cross, linewidth=5, label=f'{ticker_i} - {ticker_j}')
+            for window, row in zip([] if windows is None else windows, rows):
+                hour, minute = divmod(int(window) // 60, 60)
+                plt.semilogx(lags, row, linewidth=2,
+                             label=f'{hour:02d}:{minute:02d}')
+            plt.semilogx(lags, cross, linewidth=5,
+                         label=f'{ticker_i} - {ticker_j}')
+            # Bootstrap band, when it was computed
+            band = taq_data_tools_pool.taq_store_pickle(
+                f'{data_name}_bootstrap', (ticker_i, ticker_j), year)
+            if (len(band)):
+                low, high = band if windows is None \
+                    else (band[0][0], band[1][0])
+                plt.fill_between(lags, low, high, alpha=0.3)
             plt.legend(loc='best', fontsize=25)
             plt.title('Cross-response', fontsize=40)
             plt.xlabel(r'$\tau \, [s]$', fontsize=35)
             plt.ylabel(r'$R_{ij}(\tau)$', fontsize=35)
             plt.xticks(fontsize=25)
             plt.yticks(fontsize=25)
-            plt.xlim(1, 1000)
+            plt.xlim(scale, (1000 if taus is None else taus[-1]) * scale)
             # plt.ylim(4 * 10 ** -5, 9 * 10 ** -5)
             plt.ticklabel_format(style='sci', axis='y', scilimits=(0, 0))
             plt.grid(True)
@@ -135,8 +211,8 @@ def taq_cross_response_year_avg_responses_physical_plot(ticker_i, ticker_j,
 
             # Plotting
             taq_data_tools_responses_physical \
-                .taq_save_plot(function_name, figure, ticker_i, ticker_j,
-                               year, '')
+                .taq_save_plot(function_name + tau_name, figure, ticker_i,
+                               ticker_j, year, '')
 
             return None
 
@@ -149,13 +225,22 @@ def taq_cross_response_year_avg_responses_physical_plot(ticker_i, ticker_j,
 # ----------------------------------------------------------------------------
 
 
-def taq_trade_sign_self_correlator_year_avg_responses_physical_plot(ticker,
-                                                                    year):
+def taq_trade_sign_self_correlator_year_avg_responses_physical_plot(
+        ticker, year, taus=None, resolution=None, windows=None):
     """Plots the trade sign self-correlator average for a year.
 
     :param ticker: string of the abbreviation of the stock to be analyzed
      (i.e. 'AAPL').
     :param year: string of the year to be analyzed (i.e '2008').
+    :param taus: numpy array with the time lags in seconds of the data,
+     generated with the taq_tau_grid function of the tools. None uses every
+     time lag from 1 to 1000 s (default None).
+    :param resolution: float with the length in seconds of the bins of the
+     data. The time lags are in bins. None uses the data of every second
+     (default None).
+    :param windows: numpy array with the start seconds of the time of day
+     windows of the data. Every window is plotted with the whole day. None
+     uses the whole day (default None).
     :return: None -- The function saves the plot in a file and does not return
      a value.
     """
@@ -167,30 +252,52 @@ def taq_trade_sign_self_correlator_year_avg_responses_physical_plot(ticker,
         taq_data_tools_responses_physical \
             .taq_function_header_print_plot(function_name, ticker, ticker,
                                             year, '', '')
+        tau_name = taq_data_tools_responses_physical.taq_tau_name(taus) \
+            + taq_data_tools_responses_physical \
+            .taq_resolution_name(resolution) \
+            + taq_data_tools_responses_physical.taq_window_name(windows)
+        data_name = 'taq_trade_sign_self_correlator_year_responses_physical' \
+            + '_data' + tau_name
 
         t_self = pickle.load(open(
-                        f'../../taq_data/responses_physical_data_{year}/taq'
-                        + f'_trade_sign_self_correlator_year_responses'
-                        + f'_physical_data/taq_trade_sign_self_correlator_year'
-                        + f'_responses_physical_data_{year}_{ticker}.pickle',
+                        f'../../taq_data/responses_physical_data_{year}/'
+                        + f'{data_name}/{data_name}_{year}_{ticker}.pickle',
                         'rb'))
+        scale = 1 if resolution is None else resolution
+        # The rows after the first one are the time of day windows
+        rows = [] if windows is None else t_self[1:]
+        t_self = t_self if windows is None else t_self[0]
+        lags = [lag * scale for lag
+                in (range(len(t_self)) if taus is None else taus)]
 
         figure = plt.figure(figsize=(16, 9))
-        plt.loglog(t_self, linewidth=5, label=f'{ticker}')
+        for window, row in zip([] if windows is None else windows, rows):
+            hour, minute = divmod(int(window) // 60, 60)
+            plt.loglog(lags, row, linewidth=2,
+                       label=f'{hour:02d}:{minute:02d}')
+        plt.loglog(lags, t_self, linewidth=5, label=f'{ticker}')
+        # Bootstrap band, when it was computed
+        band = taq_data_tools_pool.taq_store_pickle(
+            f'{data_name}_bootstrap', (ticker, ticker), year)
+        if (len(band)):
+            low, high = band if windows is None \
+                else (band[0][0], band[1][0])
+            plt.fill_between(lags, low, high, alpha=0.3)
         plt.legend(loc='best', fontsize=25)
         plt.title('Trade sign self-correlator', fontsize=40)
         plt.xlabel(r'$\tau \, [s]$', fontsize=35)
         plt.ylabel(r'$\Theta_{ii}(\tau)$', fontsize=35)
         plt.xticks(fontsize=25)
         plt.yticks(fontsize=25)
-        plt.xlim(1, 1000)
+        plt.xlim(scale, (1000 if taus is None else taus[-1]) * scale)
         plt.ylim(10 ** -6, 1)
         plt.grid(True)
         plt.tight_layout()
 
         # Plotting
         taq_data_tools_responses_physical \
-            .taq_save_plot(function_name, figure, ticker, ticker, year, '')
+            .taq_save_plot(function_name + tau_name, figure, ticker, ticker,
+                           year, '')
 
         return None
 
@@ -203,9 +310,9 @@ def taq_trade_sign_self_correlator_year_avg_responses_physical_plot(ticker,
 # ----------------------------------------------------------------------------
 
 
-def taq_trade_sign_cross_correlator_year_avg_responses_physical_plot(ticker_i,
-                                                                     ticker_j,
-                                                                     year):
+def taq_trade_sign_cross_correlator_year_avg_responses_physical_plot(
+        ticker_i, ticker_j, year, taus=None, resolution=None,
+        windows=None):
     """Plots the trade sign cross-correlator average for a year.
 
     :param ticker_i: string of the abbreviation of the stock to be analyzed
@@ -213,6 +320,15 @@ def taq_trade_sign_cross_correlator_year_avg_responses_physical_plot(ticker_i,
     :param ticker_j: string of the abbreviation of the stock to be analyzed
      (i.e. 'AAPL')
     :param year: string of the year to be analyzed (i.e '2008')
+    :param taus: numpy array with the time lags in seconds of the data,
+     generated with the taq_tau_grid function of the tools. None uses every
+     time lag from 1 to 1000 s (default None).
+    :param resolution: float with the length in seconds of the bins of the
+     data. The time lags are in bins. None uses the data of every second
+     (default None).
+    :param windows: numpy array with the start seconds of the time of day
+     windows of the data. Every window is plotted with the whole day. None
+     uses the whole day (default None).
     :return: None -- The function saves the plot in a file and does not return
      a value.
     """
@@ -230,31 +346,53 @@ def taq_trade_sign_cross_correlator_year_avg_responses_physical_plot(ticker_i,
             taq_data_tools_responses_physical \
                 .taq_function_header_print_plot(function_name, ticker_i,
                                                 ticker_j, year, '', '')
+            tau_name = taq_data_tools_responses_physical.taq_tau_name(taus) \
+                + taq_data_tools_responses_physical \
+                .taq_resolution_name(resolution) \
+                + taq_data_tools_responses_physical.taq_window_name(windows)
+            data_name = 'taq_trade_sign_cross_correlator_year_responses' \
+                + '_physical_data' + tau_name
 
             t_cross = pickle.load(open(
-                        f'../../taq_data/responses_physical_data_{year}/taq'
-                        + f'_trade_sign_cross_correlator_year_responses'
-                        + '_physical_data/taq_trade_sign_cross_correlator_year'
-                        + f'_responses_physical_data_{year}_{ticker_i}i'
+                        f'../../taq_data/responses_physical_data_{year}/'
+                        + f'{data_name}/{data_name}_{year}_{ticker_i}i'
                         + f'_{ticker_j}j.pickle', 'rb'))
+            scale = 1 if resolution is None else resolution
+            # The rows after the first one are the time of day windows
+            rows = [] if windows is None else t_cross[1:]
+            t_cross = t_cross if windows is None else t_cross[0]
+            lags = [lag * scale for lag
+                    in (range(len(t_cross)) if taus is None else taus)]
 
             figure = plt.figure(figsize=(16, 9))
-            plt.loglog(t_cross, linewidth=5, label=f'{ticker_i} - {ticker_j}')
+            for window, row in zip([] if windows is None else windows, rows):
+                hour, minute = divmod(int(window) // 60, 60)
+                plt.loglog(lags, row, linewidth=2,
+                           label=f'{hour:02d}:{minute:02d}')
+            plt.loglog(lags, t_cross, linewidth=5,
+                       label=f'{ticker_i} - {ticker_j}')
+            # Bootstrap band, when it was computed
+            band = taq_data_tools_pool.taq_store_pickle(
+                f'{data_name}_bootstrap', (ticker_i, ticker_j), year)
+            if (len(band)):
+                low, high = band if windows is None \
+                    else (band[0][0], band[1][0])
+                plt.fill_between(lags, low, high, alpha=0.3)
             plt.legend(loc='best', fontsize=25)
             plt.title('Trade sign cross-correlation', fontsize=40)
             plt.xlabel(r'$\tau \, [s]$', fontsize=35)
             plt.ylabel(r'$\Theta_{ij}(\tau)$', fontsize=35)
             plt.xticks(fontsize=25)
             plt.yticks(fontsize=25)
-            plt.xlim(1, 1000)
+            plt.xlim(scale, (1000 if taus is None else taus[-1]) * scale)
             plt.ylim(10 ** -6, 1)
             plt.grid(True)
             plt.tight_layout()
 
             # Plotting
             taq_data_tools_responses_physical \
-                .taq_save_plot(function_name, figure, ticker_i, ticker_j, year,
-                               '')
+                .taq_save_plot(function_name + tau_name, figure, ticker_i,
+                               ticker_j, year, '')
 
             return None
 
@@ -5,20 +5,58 @@ whole implementation. These tools improve the way the tasks are standardized
 in the modules that use them.
 
 This script requires the following modules:
+    * collections
+    * hashlib
     * matplotlib
+    * multiprocessing
+    * numpy
     * os
     * pandas
     * pickle
     * subprocess
+    * sys
+    * taq_data_tools_pool
+    * threading
 
 The module contains the following functions:
     * taq_save_data - saves computed data.
+    * taq_store_save - saves the year results of a function in its store.
+    * taq_partial_save - saves the partial sums of a year of a pair of
+      tickers.
+    * taq_partial_load - loads the partial sums of a year of a pair of
+      tickers.
+    * taq_save_catalog - saves the catalog of the tick store of a year.
+    * taq_checkpoint_save_data - saves the result of a task and records it in
+      the journal.
+    * taq_checkpoint_load_data - loads the result of a finished task.
+    * taq_journal_data - reads the finished tasks of a function.
+    * taq_checkpoint_finished - records the tasks of a function finished in
+      the run.
+    * taq_checkpoint_clear - removes the checkpoints of the tasks of a year
+      finished in the run.
+    * taq_cache_size - sets the memory limit of the cache of day arrays.
+    * taq_cache_data - loads a day array using the cache.
+    * taq_cache_stats - returns the counters of the cache.
+    * taq_cache_thread_stats - returns the counters of the cache of a thread.
+    * taq_cache_clear - removes the arrays of the cache.
+    * taq_shared_create - creates an array in shared memory.
+    * taq_shared_attach - attaches to an array in shared memory.
     * taq_save_plot - saves figures.
+    * taq_chunk_size - computes the number of rows of the extraction chunks.
+    * taq_pool - opens a pool with the executor of the year functions.
     * taq_function_header_print_data - prints info about the function running.
     * taq_function_header_print_plot - prints info about the plot.
     * taq_start_folders - creates folders to save data and plots.
     * taq_initial_message - prints the initial message with basic information.
     * taq_business_days - creates a list of week days for a year.
+    * taq_tau_grid - generates the time lags of the responses and correlators.
+    * taq_tau_name - returns the suffix of the results of a grid of time lags.
+    * taq_resolution_name - returns the suffix of the results of a time
+      resolution.
+    * taq_window_grid - generates the time of day windows of the responses
+      and correlators.
+    * taq_window_name - returns the suffix of the results of time of day
+      windows.
     * taq_decompress - decompress original data format to CSV file.
     * main - the main function of the script.
 
@@ -28,11 +66,40 @@ The module contains the following functions:
 # -----------------------------------------------------------------------------
 # Modules
 
+from collections import OrderedDict
+import hashlib
 from matplotlib import pyplot as plt
+from multiprocessing import shared_memory
+import numpy as np
 import os
 import pandas as pd
 import pickle
 import subprocess
+import sys
+import threading
+
+# The pools of the module use the caches of day arrays of this module
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                             '..', '..', 'taq_pool', 'taq_algorithms'))
+import taq_data_tools_pool
+
+# Cache of the day arrays of a process. The arrays are kept in least recently
+# used order and the oldest are removed when their size is larger than the
+# limit in bytes (TAQ_CACHE_LIMIT environment variable in MB)
+__cache__ = OrderedDict()
+__cache_limit__ = int(os.environ.get('TAQ_CACHE_LIMIT', 256)) * 2 ** 20
+__cache_stats__ = {'hits': 0, 'misses': 0, 'evictions': 0, 'bytes': 0}
+# The threads of a pool share the cache of their process, and every thread
+# has its own counters
+__cache_lock__ = threading.Lock()
+__cache_thread__ = threading.local()
+
+# Estimated peak memory in bytes of a row of the CSV files while they are
+# extracted, with the strings of the dates and conditions
+__csv_row_bytes__ = {'quotes': 192, 'trades': 160}
+
+# Tasks with checkpoints finished in the run of the process, by year
+__finished__ = {}
 
 # -----------------------------------------------------------------------------
 
@@ -72,16 +139,166 @@ def taq_save_data(function_name, data, ticker_i, ticker_j, year, month, day):
     # Cross-response data
     if (ticker_i != ticker_j):
 
-        pickle.dump(data, open(f'../../taq_data/responses_physical_data_{year}'
-                    + f'/{function_name}/{function_name}_{year}{month}{day}'
-                    + f'_{ticker_i}i_{ticker_j}j.pickle', 'wb'))
+        file_name = (f'../../taq_data/responses_physical_data_{year}'
+                     + f'/{function_name}/{function_name}_{year}{month}{day}'
+                     + f'_{ticker_i}i_{ticker_j}j.pickle')
 
     # Self-response data
     else:
 
-        pickle.dump(data, open(f'../../taq_data/responses_physical_data_{year}'
-                    + f'/{function_name}/{function_name}_{year}{month}{day}'
-                    + f'_{ticker_i}.pickle', 'wb'))
+        file_name = (f'../../taq_data/responses_physical_data_{year}'
+                     + f'/{function_name}/{function_name}_{year}{month}{day}'
+                     + f'_{ticker_i}.pickle')
+
+    taq_data_tools_pool.taq_atomic_dump(data, file_name)
+
+    print('Data Saved')
+    print()
+
+    return None
+
+# -----------------------------------------------------------------------------
+
+
+def taq_store_save(function_name, values, year):
+    """Saves the year results of a function in its results store.
+
+    The store of a function and a year is a pickle file with the sorted
+    pairs of tickers (keys), the row of every pair (index) and the results
+    of all the pairs stacked in a 2D array (data), so the results of many
+    tickers are loaded with one read. The results with time of day windows
+    are flattened in their row. The new results are merged with the results
+    already in the store.
+
+    :param function_name: name of the function that generates the data.
+    :param values: dictionary with a numpy array for each tuple (ticker_i,
+     ticker_j).
+    :param year: string of the year to be analyzed (i.e '2016').
+    :return: None -- The function saves the data in a file and does not return
+     a value.
+    """
+
+    store = taq_data_tools_pool.taq_store_load(function_name, year)
+
+    results = {} if store is None else dict(zip(store['keys'], store['data']))
+    results.update(values)
+
+    keys = sorted(results)
+    width = max(np.size(value) for value in results.values())
+    data = np.full((len(keys), width), np.nan)
+    for row, key in enumerate(keys):
+        data[row, :np.size(results[key])] = np.ravel(results[key])
+
+    if (not os.path.isdir(f'../../taq_data/responses_physical_data_{year}/'
+                          + 'taq_store/')):
+
+        try:
+            os.mkdir(f'../../taq_data/responses_physical_data_{year}/'
+                     + 'taq_store/')
+            print('Folder to save data created')
+
+        except FileExistsError:
+            print('Folder exists. The folder was not created')
+
+    taq_data_tools_pool.taq_atomic_dump(
+        {'keys': keys, 'index': {key: row for row, key in enumerate(keys)},
+         'data': data},
+        f'../../taq_data/responses_physical_data_{year}/taq_store/'
+        + f'{function_name}_{year}.pickle')
+
+    return None
+
+# -----------------------------------------------------------------------------
+
+
+def taq_partial_save(function_name, data, ticker_i, ticker_j, year):
+    """Saves the partial sums of a year of a pair of tickers.
+
+    The partial sums are the cumulative sums over the days of the year of
+    the values and the amount of trades of a function, so the sum over any
+    range of days is the difference of two rows.
+
+    :param function_name: name of the function that generates the data.
+    :param data: tuple with the list of the sorted dates of the year and the
+     numpy array with the cumulative sums, with a row of zeros before the
+     first day.
+    :param ticker_i: string of the abbreviation of the stock to be analyzed
+     (i.e. 'AAPL').
+    :param ticker_j: string of the abbreviation of the stock to be analyzed
+     (i.e. 'AAPL').
+    :param year: string of the year to be analyzed (i.e '2016').
+    :return: None -- The function saves the data in a file and does not return
+     a value.
+    """
+
+    folder = f'../../taq_data/responses_physical_data_{year}/taq_partial' \
+        + f'_sums/{function_name}'
+    name = ticker_i if ticker_i == ticker_j else f'{ticker_i}i_{ticker_j}j'
+
+    os.makedirs(folder, exist_ok=True)
+
+    taq_data_tools_pool.taq_atomic_dump(
+        data, f'{folder}/{function_name}_{year}_{name}.pickle')
+
+    return None
+
+# -----------------------------------------------------------------------------
+
+
+def taq_partial_load(function_name, ticker_i, ticker_j, year):
+    """Loads the partial sums of a year of a pair of tickers.
+
+    :param function_name: name of the function that generates the data.
+    :param ticker_i: string of the abbreviation of the stock to be analyzed
+     (i.e. 'AAPL').
+    :param ticker_j: string of the abbreviation of the stock to be analyzed
+     (i.e. 'AAPL').
+    :param year: string of the year to be analyzed (i.e '2016').
+    :return: tuple -- The function returns a tuple with the list of the
+     sorted dates and the numpy array with the cumulative sums, or None if
+     the year does not have partial sums.
+    """
+
+    name = ticker_i if ticker_i == ticker_j else f'{ticker_i}i_{ticker_j}j'
+
+    try:
+        with open(f'../../taq_data/responses_physical_data_{year}/taq_partial'
+                  + f'_sums/{function_name}/{function_name}_{year}_{name}'
+                  + '.pickle', 'rb') as file:
+            return pickle.load(file)
+
+    except FileNotFoundError:
+        return None
+
+# -----------------------------------------------------------------------------
+
+
+def taq_save_catalog(catalog_df, year):
+    """Saves the catalog of the tick store of a year in a CSV file.
+
+    The catalog has a row per file of the tick store and it is used by all
+    the taq_* modules to plan the tasks of a year.
+
+    :param catalog_df: pandas DataFrame with the ticker, date, type, number
+     of rows, size in bytes and first and last second of every file.
+    :param year: string of the year to be analyzed (i.e '2016').
+    :return: None -- The function saves the data in a file and does not return
+     a value.
+    """
+
+    if (not os.path.isdir(f'../../taq_data/catalog_data_{year}/')):
+
+        try:
+            os.mkdir(f'../../taq_data/catalog_data_{year}/')
+            print('Folder to save data created')
+
+        except FileExistsError:
+            print('Folder exists. The folder was not created')
+
+    file_name = f'../../taq_data/catalog_data_{year}/taq_catalog_data' \
+        + f'_{year}.csv'
+
+    taq_data_tools_pool.taq_atomic_dump(catalog_df, file_name, form='csv')
 
     print('Data Saved')
     print()
@@ -91,6 +308,331 @@ def taq_save_data(function_name, data, ticker_i, ticker_j, year, month, day):
 # -----------------------------------------------------------------------------
 
 
+def taq_checkpoint_save_data(function_name, data, ticker_i, ticker_j, date):
+    """Saves the result of a task and records it in the journal.
+
+    The tasks are the computations of a ticker or a pair of tickers in a day
+    or a year. Their results are saved in the taq_checkpoints folder and the
+    journal of the function records the finished tasks, so an interrupted run
+    can continue from the last finished task.
+
+    :param function_name: name of the function that generates the data.
+    :param data: data to be saved. The data can be of different types.
+    :param ticker_i: string of the abbreviation of the stock to be analyzed
+     (i.e. 'AAPL').
+    :param ticker_j: string of the abbreviation of the stock to be analyzed
+     (i.e. 'AAPL').
+    :param date: string with the date (i.e. '2008-01-02') or the year
+     (i.e. '2008') of the task.
+    :return: None -- The function saves the data in a file and does not return
+     a value.
+    """
+
+    year = date[:4]
+    folder = f'../../taq_data/responses_physical_data_{year}/taq_checkpoints' \
+        + f'/{function_name}'
+
+    os.makedirs(folder, exist_ok=True)
+
+    taq_data_tools_pool.taq_atomic_dump(
+        data, f'{folder}/{function_name}_{date.replace("-", "")}'
+        + f'_{ticker_i}i_{ticker_j}j.pickle')
+
+    # The task is recorded after its result is saved
+    with open(f'{folder}/{function_name}_journal.txt', 'a') as journal:
+        journal.write(f'{ticker_i} {ticker_j} {date}\n')
+
+    return None
+
+# -----------------------------------------------------------------------------
+
+
+def taq_checkpoint_load_data(function_name, ticker_i, ticker_j, date):
+    """Loads the result of a finished task.
+
+    :param function_name: name of the function that generates the data.
+    :param ticker_i: string of the abbreviation of the stock to be analyzed
+     (i.e. 'AAPL').
+    :param ticker_j: string of the abbreviation of the stock to be analyzed
+     (i.e. 'AAPL').
+    :param date: string with the date (i.e. '2008-01-02') or the year
+     (i.e. '2008') of the task.
+    :return: The function returns the saved data of the task.
+    """
+
+    year = date[:4]
+
+    with open(f'../../taq_data/responses_physical_data_{year}/taq_checkpoints'
+              + f'/{function_name}/{function_name}_{date.replace("-", "")}'
+              + f'_{ticker_i}i_{ticker_j}j.pickle', 'rb') as file:
+        return pickle.load(file)
+
+# -----------------------------------------------------------------------------
+
+
+def taq_journal_data(function_name, year):
+    """Reads the finished tasks of a function.
+
+    :param function_name: name of the function that generates the data.
+    :param year: string of the year to be analyzed (i.e '2016').
+    :return: set -- The function returns a set of tuples (ticker_i, ticker_j,
+     date) with the finished tasks.
+    """
+
+    try:
+        with open(f'../../taq_data/responses_physical_data_{year}/taq'
+                  + f'_checkpoints/{function_name}/{function_name}_journal'
+                  + '.txt', 'r') as journal:
+            # A line cut by an interrupted run is not a finished task
+            return set(tuple(line.split()) for line in journal
+                       if line.endswith('\n') and len(line.split()) == 3)
+
+    except FileNotFoundError:
+        return set()
+
+# -----------------------------------------------------------------------------
+
+
+def taq_checkpoint_finished(function_name, tasks):
+    """Records the tasks of a function finished in the run.
+
+    :param function_name: name of the function that generates the data.
+    :param tasks: iterable of tuples (ticker_i, ticker_j, date) with the
+     finished tasks. The date is a date (i.e. '2008-01-02') or a year (i.e.
+     '2008').
+    :return: None -- The function records the tasks and does not return a
+     value.
+    """
+
+    for ticker_i, ticker_j, date in tasks:
+        __finished__.setdefault(date[:4], set()) \
+            .add((function_name, ticker_i, ticker_j, date))
+
+    return None
+
+# -----------------------------------------------------------------------------
+
+
+def taq_checkpoint_clear(year):
+    """Removes the checkpoints of the tasks of a year finished in the run.
+
+    When a run finishes, the checkpoints of its tasks are removed and the
+    tasks are taken out of the journals, so the next run computes them
+    again. The checkpoints of the tasks of other runs, like an interrupted
+    run with other tickers or parameters, are kept.
+
+    :param year: string of the year to be analyzed (i.e '2016').
+    :return: None -- The function removes files and does not return a value.
+    """
+
+    finished = __finished__.pop(year, set())
+
+    functions = {}
+    for function_name, ticker_i, ticker_j, date in finished:
+        functions.setdefault(function_name, set()) \
+            .add((ticker_i, ticker_j, date))
+
+    for function_name, tasks in functions.items():
+
+        folder = f'../../taq_data/responses_physical_data_{year}/taq' \
+            + f'_checkpoints/{function_name}'
+
+        for ticker_i, ticker_j, date in tasks:
+            try:
+                os.remove(f'{folder}/{function_name}_{date.replace("-", "")}'
+                          + f'_{ticker_i}i_{ticker_j}j.pickle')
+
+            except FileNotFoundError:
+                pass
+
+        remaining = taq_journal_data(function_name, year) - tasks
+
+        if (remaining):
+            taq_data_tools_pool.taq_atomic_dump(
+                ''.join(f'{ticker_i} {ticker_j} {date}\n'
+                        for ticker_i, ticker_j, date in sorted(remaining)),
+                f'{folder}/{function_name}_journal.txt', form='text')
+
+        else:
+            try:
+                os.remove(f'{folder}/{function_name}_journal.txt')
+                os.rmdir(folder)
+
+            except OSError:
+                pass
+
+    return None
+
+# -----------------------------------------------------------------------------
+
+
+def taq_cache_size(limit):
+    """Sets the memory limit of the cache of day arrays.
+
+    The limit is used by the current process and by the processes created
+    after it, so it must be set before the pools of the analysis start.
+
+    :param limit: integer with the maximum size in bytes of the arrays in the
+     cache (i.e. 2 ** 28). A limit of 0 disables the cache.
+    :return: None -- The function sets the limit and does not return a value.
+    """
+
+    global __cache_limit__
+
+    with __cache_lock__:
+        __cache_limit__ = limit
+
+        while (__cache__ and __cache_stats__['bytes'] > __cache_limit__):
+            _, old = __cache__.popitem(last=False)
+            __cache_stats__['bytes'] -= old.nbytes
+            __cache_stats__['evictions'] += 1
+
+    return None
+
+# -----------------------------------------------------------------------------
+
+
+def taq_cache_data(kind, ticker, date, loader):
+    """Loads a day array using the cache.
+
+    The arrays are identified by the kind of series, the ticker and the date.
+    When the array is not in the cache, it is loaded with the loader function
+    and the least recently used arrays are removed until the arrays fit in
+    the memory limit. The arrays of the cache are read only, and the threads
+    of a pool use the same cache.
+
+    :param kind: string of the kind of series (i.e. 'midpoint_last' or
+     'trade_sign').
+    :param ticker: string of the abbreviation of the stock to be analyzed
+     (i.e. 'AAPL').
+    :param date: string with the date of the data (i.e. '2008-01-02').
+    :param loader: function without parameters that loads the array.
+    :return: numpy array.
+    """
+
+    key = (kind, ticker, date)
+    # Creates the counters of the thread
+    taq_cache_thread_stats()
+
+    with __cache_lock__:
+        if (key in __cache__):
+            __cache_stats__['hits'] += 1
+            __cache_thread__.stats['hits'] += 1
+            __cache__.move_to_end(key)
+            return __cache__[key]
+
+        __cache_stats__['misses'] += 1
+        __cache_thread__.stats['misses'] += 1
+
+    # The file is read outside the lock, so the threads read files at the
+    # same time
+    array = loader()
+    array.setflags(write=False)
+
+    with __cache_lock__:
+        if (key not in __cache__ and array.nbytes <= __cache_limit__):
+            __cache__[key] = array
+            __cache_stats__['bytes'] += array.nbytes
+
+            while (__cache_stats__['bytes'] > __cache_limit__):
+                _, old = __cache__.popitem(last=False)
+                __cache_stats__['bytes'] -= old.nbytes
+                __cache_stats__['evictions'] += 1
+                __cache_thread__.stats['evictions'] += 1
+
+    return array
+
+# -----------------------------------------------------------------------------
+
+
+def taq_cache_stats():
+    """Returns the counters of the cache.
+
+    :return: dictionary -- The function returns a dictionary with the process
+     id, the hits, misses and evictions of the cache and the size in bytes of
+     its arrays.
+    """
+
+    with __cache_lock__:
+        return dict(__cache_stats__, pid=os.getpid())
+
+# -----------------------------------------------------------------------------
+
+
+def taq_cache_thread_stats():
+    """Returns the counters of the cache of a thread.
+
+    The counters only have the hits, misses and evictions of the loads of the
+    current thread, so the tasks of a pool of threads can measure their own
+    use of the cache.
+
+    :return: dictionary -- The function returns a dictionary with the hits,
+     misses and evictions of the cache in the current thread.
+    """
+
+    if (not hasattr(__cache_thread__, 'stats')):
+        __cache_thread__.stats = {'hits': 0, 'misses': 0, 'evictions': 0}
+
+    return dict(__cache_thread__.stats)
+
+# -----------------------------------------------------------------------------
+
+
+def taq_cache_clear():
+    """Removes the arrays of the cache.
+
+    :return: None -- The function removes the arrays and does not return a
+     value.
+    """
+
+    with __cache_lock__:
+        __cache__.clear()
+        __cache_stats__['bytes'] = 0
+
+    return None
+
+# -----------------------------------------------------------------------------
+
+
+def taq_shared_create(shape):
+    """Creates an array in shared memory.
+
+    The array is filled with zeros. The processes attach to the array with
+    its name and shape, so the array is not copied. The process that creates
+    the array must close and unlink the shared memory when it is not used.
+
+    :param shape: tuple with the shape of the array (i.e. (2, 252, 22200)).
+    :return: tuple -- The function returns a tuple with the shared memory
+     block and the numpy array of float64 that uses it.
+    """
+
+    size = int(np.prod(shape)) * np.dtype(float).itemsize
+    shared = shared_memory.SharedMemory(create=True, size=max(size, 1))
+    array = np.ndarray(shape, dtype=float, buffer=shared.buf)
+    array[...] = 0
+
+    return (shared, array)
+
+# -----------------------------------------------------------------------------
+
+
+def taq_shared_attach(name, shape):
+    """Attaches to an array in shared memory.
+
+    :param name: string of the name of the shared memory block.
+    :param shape: tuple with the shape of the array (i.e. (2, 252, 22200)).
+    :return: tuple -- The function returns a tuple with the shared memory
+     block and the numpy array of float64 that uses it.
+    """
+
+    shared = shared_memory.SharedMemory(name=name)
+    array = np.ndarray(shape, dtype=float, buffer=shared.buf)
+
+    return (shared, array)
+
+# -----------------------------------------------------------------------------
+
+
 def taq_save_plot(function_name, figure, ticker_i, ticker_j, year, month):
     """Saves plot in png files.
 
@@ -144,6 +686,47 @@ def taq_save_plot(function_name, figure, ticker_i, ticker_j, year, month):
 # -----------------------------------------------------------------------------
 
 
+def taq_chunk_size(data_type, workers):
+    """Computes the number of rows of the chunks of the extraction.
+
+    The chunks of the CSV files extracted at the same time by the workers
+    use at most the memory limit. The chunks have between 10 ** 5 and
+    10 ** 7 rows.
+
+    :param data_type: string with the type of the data to be extracted
+     (i.e. 'trades' or 'quotes').
+    :param workers: integer with the number of workers extracting files.
+    :return: int -- The function returns the number of rows of a chunk.
+    """
+
+    limit = taq_data_tools_pool.taq_memory_limit()
+
+    if (limit is None):
+        return 10 ** 7
+
+    rows = limit // (workers * __csv_row_bytes__[data_type])
+
+    return min(max(rows, 10 ** 5), 10 ** 7)
+
+# -----------------------------------------------------------------------------
+
+
+def taq_pool(workers=None):
+    """Opens a pool with the executor of the year functions.
+
+    The pool is the pool of the taq_data_tools_pool module, with the caches
+    of day arrays of the workers taken from its memory budget.
+
+    :param workers: integer with the number of processes or threads. None
+     uses the number of workers of the executor (default None).
+    :return: The function returns a context with the pool.
+    """
+
+    return taq_data_tools_pool.taq_pool(workers, __cache_limit__)
+
+# -----------------------------------------------------------------------------
+
+
 def taq_function_header_print_data(function_name, ticker_i, ticker_j, year,
                                    month, day):
     """Prints a header of a function that generates data when it is running.
@@ -278,6 +861,126 @@ def taq_bussiness_days(year):
 # -----------------------------------------------------------------------------
 
 
+def taq_tau_grid(tau_max=1000, points=None, taus=None):
+    """Generates the time lags of the responses and correlators.
+
+    The responses and correlators are plotted in a logarithmic axis, so a
+    few log-spaced time lags describe the curves and make the long time lags
+    affordable. The log-spaced time lags are rounded to seconds, so the grid
+    can have less points than requested.
+
+    :param tau_max: integer with the largest time lag in seconds (default
+     1000).
+    :param points: integer with the number of log-spaced time lags between 1
+     and tau_max. None uses every time lag (default None).
+    :param taus: list of integers with the time lags (i.e. [1, 10, 100]).
+     When it is used, tau_max and points are not used (default None).
+    :return: numpy array -- The function returns an array with the sorted
+     time lags in seconds.
+    """
+
+    if (taus is not None):
+        grid = np.unique(np.asarray(taus, dtype=int))
+    elif (points is None):
+        grid = np.arange(1, tau_max + 1)
+    else:
+        grid = np.unique(np.geomspace(1, tau_max, points).round().astype(int))
+
+    assert len(grid) and grid[0] > 0
+
+    return grid
+
+# -----------------------------------------------------------------------------
+
+
+def taq_tau_name(taus):
+    """Returns the suffix of the results of a grid of time lags.
+
+    The results of a grid of time lags are saved with the suffix in the name
+    of their function, apart from the results of every time lag.
+
+    :param taus: numpy array with the time lags in seconds. None uses every
+     time lag.
+    :return: string -- The function returns the suffix (i.e.
+     '_taus_3f1c2a9b07'), or an empty string for every time lag.
+    """
+
+    if (taus is None):
+        return ''
+
+    digest = hashlib.sha1(np.asarray(taus, dtype=np.int64).tobytes())
+
+    return f'_taus_{digest.hexdigest()[:10]}'
+
+# -----------------------------------------------------------------------------
+
+
+def taq_window_grid(length=1800, windows=None):
+    """Generates the time of day windows of the responses and correlators.
+
+    The windows split the day from 9h40 to 15h50 and every window is given by
+    its start second (i.e. 34800 for 9h40). A trade sign is in the window of
+    its second, and the last window ends at 15h50.
+
+    :param length: integer with the length in seconds of every window
+     (default 1800).
+    :param windows: list of integers with the start seconds of the windows,
+     used instead of the length (i.e. [34800, 36000, 50400, 55800]). Default
+     None.
+    :return: numpy array -- The function returns the sorted start seconds of
+     the windows.
+    """
+
+    if (windows is None):
+        grid = np.arange(34800, 57000, length)
+    else:
+        grid = np.unique(np.asarray(windows, dtype=int))
+
+    assert len(grid) and 34800 <= grid[0] and grid[-1] < 57000
+
+    return grid
+
+# -----------------------------------------------------------------------------
+
+
+def taq_window_name(windows):
+    """Returns the suffix of the results of time of day windows.
+
+    :param windows: numpy array with the start seconds of the windows. None
+     uses the whole day.
+    :return: string -- The function returns the suffix (i.e.
+     '_windows_5e0c1d2f3a'), or an empty string for the whole day.
+    """
+
+    if (windows is None):
+        return ''
+
+    digest = hashlib.sha1(np.asarray(windows, dtype=np.int64).tobytes())
+
+    return f'_windows_{digest.hexdigest()[:10]}'
+
+# -----------------------------------------------------------------------------
+
+
+def taq_resolution_name(resolution):
+    """Returns the suffix of the results of a time resolution.
+
+    :param resolution: float with the length in seconds of the bins of the
+     day. None uses the arrays of every second.
+    :return: string -- The function returns the suffix (i.e.
+     '_resolution_10ms'), or an empty string for the arrays of every second.
+    """
+
+    if (resolution is None):
+        return ''
+
+    assert 0.001 <= resolution <= 1
+
+    return f'_resolution_{resolution * 1000:g}ms'
+
+# -----------------------------------------------------------------------------
+
+
 def taq_decompress(ticker, year, type):
     """Decompress original data format to CSV file.
 
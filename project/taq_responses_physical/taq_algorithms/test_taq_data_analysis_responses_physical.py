@@ -0,0 +1,305 @@
+''' TAQ data analysis tests.
+
+The tests check the kernels of the taq_data_analysis_responses_physical
+module against explicit loops and against each other on synthetic days.
+
+This script requires the following modules:
+    * numpy
+    * os
+    * pytest
+    * sys
+    * taq_data_analysis_responses_physical
+
+The module contains the following functions:
+    * taq_synthetic_day - generates the arrays of a synthetic day.
+    * taq_windows_loop - splits the products of every second of a time lag
+      in the windows.
+    * test_taq_response_kernel_responses_physical_data - checks the response
+      kernel against the loop over the time lags and the seconds.
+    * test_taq_correlator_kernel_responses_physical_data - checks the
+      correlator kernel against the loop over the time lags and the seconds.
+    * test_taq_sparse_kernels_responses_physical_data - checks the sparse
+      kernels at a resolution of 1 s against the dense kernels.
+    * test_taq_bootstrap_kernel_responses_physical_data - checks the
+      bootstrap band against the loop over the same draws.
+    * test_taq_online_responses_physical_data - checks the online estimator
+      against the day kernels.
+
+.. moduleauthor:: Juan Camilo Henao Londono <www.github.com/juanhenao21>
+'''
+
+# ----------------------------------------------------------------------------
+# Modules
+
+import numpy as np
+import os
+import pytest
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import taq_data_analysis_responses_physical as analysis
+
+# ----------------------------------------------------------------------------
+
+
+def taq_synthetic_day(seed, length=22200):
+    """Generates the arrays of a synthetic day.
+
+    The midpoint price changes in about one of every ten seconds and the
+    trade signs are zero in about half of the seconds.
+
+    :param seed: integer used to seed the random generator (i.e. 0).
+    :param length: integer with the number of seconds of the day (default
+     22200).
+    :return: tuple -- The function returns a tuple with numpy arrays with
+     the midpoint price and the trade sign of every second.
+    """
+
+    rng = np.random.default_rng(seed)
+
+    change = rng.normal(0, 0.01, length) * (rng.random(length) < 0.1)
+    midpoint = 100 + np.cumsum(change)
+    trade_sign = rng.choice([-1., 0., 1.], length, p=[0.25, 0.5, 0.25])
+
+    return (midpoint, trade_sign)
+
+# ----------------------------------------------------------------------------
+
+
+def taq_windows_loop(values, trades, windows):
+    """Splits the products of every second of a time lag in the windows.
+
+    :param values: numpy array with the products of the first seconds of the
+     day.
+    :param trades: numpy array with the trade signs of the same seconds.
+    :param windows: numpy array with the start seconds of the windows.
+    :return: tuple -- The function returns a tuple with numpy arrays with
+     the sum and the amount of trades of every window.
+    """
+
+    second = 34801 + np.arange(len(values))
+    ends = np.append(windows[1:], np.inf)
+    window_sum = np.zeros(len(windows))
+    window_num = np.zeros(len(windows))
+
+    for w_idx, (start, end) in enumerate(zip(windows, ends)):
+        condition = (second >= start) & (second < end)
+        window_sum[w_idx] = np.sum(values[condition])
+        window_num[w_idx] = np.sum(trades[condition] != 0)
+
+    return (window_sum, window_num)
+
+# ----------------------------------------------------------------------------
+
+
+@pytest.mark.parametrize('windows', [None, np.array([34800, 36600, 45000])])
+def test_taq_response_kernel_responses_physical_data(windows):
+    """Checks the response kernel against the loop.
+
+    :param windows: numpy array with the start seconds of the windows. None
+     uses the whole day.
+    """
+
+    midpoint, trade_sign = taq_synthetic_day(0)
+    taus = np.array([1, 2, 10, 100, 1000, 30000])
+
+    response, num = analysis.taq_response_kernel_responses_physical_data(
+        midpoint, trade_sign, taus, windows)
+
+    rows = 1 if windows is None else len(windows) + 1
+    expected = np.zeros((rows, len(taus)))
+    expected_num = np.zeros((rows, len(taus)))
+
+    for tau_idx, tau in enumerate(taus):
+        if (tau >= len(midpoint)):
+            continue
+        product = (midpoint[tau:] - midpoint[:-tau]) / midpoint[:-tau] \
+            * trade_sign[:-tau]
+        expected[0, tau_idx] = np.sum(product)
+        expected_num[0, tau_idx] = np.sum(trade_sign[:-tau] != 0)
+        if (windows is not None):
+            expected[1:, tau_idx], expected_num[1:, tau_idx] = \
+                taq_windows_loop(product, trade_sign[:-tau], windows)
+
+    if (windows is None):
+        expected = expected[0]
+        expected_num = expected_num[0]
+
+    assert np.allclose(response, expected, rtol=1e-9, atol=1e-12)
+    assert np.array_equal(num, expected_num)
+
+# ----------------------------------------------------------------------------
+
+
+@pytest.mark.parametrize('windows', [None, np.array([34800, 36600, 45000])])
+def test_taq_correlator_kernel_responses_physical_data(windows):
+    """Checks the correlator kernel against the loop.
+
+    :param windows: numpy array with the start seconds of the windows. None
+     uses the whole day.
+    """
+
+    _, trade_sign_i = taq_synthetic_day(0)
+    _, trade_sign_j = taq_synthetic_day(1)
+    taus = np.array([1, 2, 10, 100, 1000])
+
+    correlator, num = analysis.taq_correlator_kernel_responses_physical_data(
+        trade_sign_i, trade_sign_j, taus, windows)
+
+    rows = 1 if windows is None else len(windows) + 1
+    expected = np.zeros((rows, len(taus)))
+    expected_num = np.zeros((rows, len(taus)))
+
+    for tau_idx, tau in enumerate(taus):
+        product = trade_sign_i[tau:] * trade_sign_j[:-tau]
+        expected[0, tau_idx] = np.sum(product)
+        expected_num[0, tau_idx] = np.sum(trade_sign_j[:-tau] != 0)
+        if (windows is not None):
+            expected[1:, tau_idx], expected_num[1:, tau_idx] = \
+                taq_windows_loop(product, trade_sign_j[:-tau], windows)
+
+    if (windows is None):
+        expected = expected[0]
+        expected_num = expected_num[0]
+
+    assert np.array_equal(correlator, expected)
+    assert np.array_equal(num, expected_num)
+
+# ----------------------------------------------------------------------------
+
+
+@pytest.mark.parametrize('windows', [None, np.array([34800, 36600, 45000])])
+def test_taq_sparse_kernels_responses_physical_data(windows):
+    """Checks the sparse kernels at 1 s against the dense kernels.
+
+    :param windows: numpy array with the start seconds of the windows. None
+     uses the whole day.
+    """
+
+    midpoint, trade_sign_i = taq_synthetic_day(0)
+    _, trade_sign_j = taq_synthetic_day(1)
+    taus = np.array([1, 2, 10, 100, 1000])
+
+    # Events of the day, as in the taq_events_physical_data function
+    change = np.flatnonzero(np.concatenate(([True],
+                                            np.diff(midpoint) != 0)))
+    midpoint_events = np.vstack((change, midpoint[change]))
+    sign_i_events = np.vstack((np.flatnonzero(trade_sign_i),
+                               trade_sign_i[trade_sign_i != 0]))
+    sign_j_events = np.vstack((np.flatnonzero(trade_sign_j),
+                               trade_sign_j[trade_sign_j != 0]))
+
+    dense = analysis.taq_response_kernel_responses_physical_data(
+        midpoint, trade_sign_j, taus, windows)
+    sparse = analysis.taq_sparse_response_kernel_responses_physical_data(
+        midpoint_events, sign_j_events, 1, taus, windows)
+
+    assert np.allclose(sparse[0], dense[0], rtol=1e-9, atol=1e-12)
+    assert np.array_equal(sparse[1], dense[1])
+
+    dense = analysis.taq_correlator_kernel_responses_physical_data(
+        trade_sign_i, trade_sign_j, taus, windows)
+    sparse = analysis.taq_sparse_correlator_kernel_responses_physical_data(
+        sign_i_events, sign_j_events, 1, taus, windows)
+
+    assert np.array_equal(sparse[0], dense[0])
+    assert np.array_equal(sparse[1], dense[1])
+
+# ----------------------------------------------------------------------------
+
+
+@pytest.mark.parametrize('block', [1, 5])
+def test_taq_bootstrap_kernel_responses_physical_data(block):
+    """Checks the bootstrap band against the loop over the same draws.
+
+    :param block: integer with the number of consecutive days of a block.
+    """
+
+    rng = np.random.default_rng(0)
+    days = 23
+    tau = 20
+    resamples = 200
+
+    values = np.stack((rng.normal(0, 1, (days, tau)),
+                       rng.integers(1, 100, (days, tau)).astype(float)),
+                      axis=1)
+    sums = np.concatenate((np.zeros((1, 2, tau)), np.cumsum(values, axis=0)))
+
+    low, high = analysis.taq_bootstrap_kernel_responses_physical_data(
+        sums, resamples, block, 0.95, 7)
+
+    # Same draws of the kernel
+    draws = -(-days // block)
+    starts = np.random.default_rng(7).integers(0, days - block + 1,
+                                               (resamples, draws))
+    avg = np.zeros((resamples, tau))
+    for r_idx in range(resamples):
+        resample = np.zeros((2, tau))
+        for start in starts[r_idx]:
+            resample += np.sum(values[start:start + block], axis=0)
+        avg[r_idx] = resample[0] / resample[1]
+
+    expected_low, expected_high = np.percentile(avg, [2.5, 97.5], axis=0)
+
+    assert np.allclose(low, expected_low, rtol=1e-9, atol=1e-12)
+    assert np.allclose(high, expected_high, rtol=1e-9, atol=1e-12)
+
+# ----------------------------------------------------------------------------
+
+
+def test_taq_online_responses_physical_data():
+    """Checks the online estimator against the day kernels.
+
+    The second ticker has no data in the second day, so only the self-
+    response and self-correlator of the first ticker use that day.
+    """
+
+    tickers = ['AAA', 'BBB']
+    taus = np.array([1, 2, 5, 10, 50])
+    days = {
+        '2008-01-02': {'AAA': taq_synthetic_day(0, 300),
+                       'BBB': taq_synthetic_day(1, 300)},
+        '2008-01-03': {'AAA': taq_synthetic_day(2, 300)},
+    }
+
+    state = analysis.taq_online_start_responses_physical_data(tickers, taus)
+    for date, data in days.items():
+        for second in range(300):
+            analysis.taq_online_update_responses_physical_data(
+                state, date,
+                {ticker: value[0][second] for ticker, value in data.items()},
+                {ticker: value[1][second] for ticker, value in data.items()})
+
+    curves = analysis.taq_online_curves_responses_physical_data(state)
+
+    for ticker_i in tickers:
+        for ticker_j in tickers:
+
+            response = np.zeros((2, len(taus)))
+            correlator = np.zeros((2, len(taus)))
+            for data in days.values():
+                if (ticker_i not in data or ticker_j not in data):
+                    continue
+                response += analysis \
+                    .taq_response_kernel_responses_physical_data(
+                        data[ticker_i][0], data[ticker_j][1], taus)
+                correlator += analysis \
+                    .taq_correlator_kernel_responses_physical_data(
+                        data[ticker_i][1], data[ticker_j][1], taus)
+
+            kind = 'self' if ticker_i == ticker_j else 'cross'
+            tau_name = state['tau_name']
+            online_response = curves[
+                f'taq_{kind}_response_year_responses_physical_data'
+                + tau_name][(ticker_i, ticker_j)]
+            online_correlator = curves[
+                f'taq_trade_sign_{kind}_correlator_year_responses_physical'
+                + '_data' + tau_name][(ticker_i, ticker_j)]
+
+            assert np.allclose(online_response, response[0] / response[1],
+                               rtol=1e-9, atol=1e-12)
+            assert np.allclose(online_correlator,
+                               correlator[0] / correlator[1],
+                               rtol=1e-9, atol=1e-12)
+
+# ----------------------------------------------------------------------------
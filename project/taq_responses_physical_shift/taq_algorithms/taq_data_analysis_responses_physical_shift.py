@@ -5,10 +5,12 @@ computing the self- and cross-response functions.
 
 This script requires the following modules:
     * itertools
-    * multiprocessing
     * numpy
+    * os
     * pandas
     * pickle
+    * sys
+    * taq_data_tools_pool
     * taq_data_tools_responses_physical_shift
 
 The module contains the following functions:
@@ -30,11 +32,15 @@ The module contains the following functions:
 # Modules
 
 from itertools import product as iprod
-import multiprocessing as mp
 import numpy as np
+import os
 import pandas as pd
 import pickle
+import sys
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                             '..', '..', 'taq_pool', 'taq_algorithms'))
+import taq_data_tools_pool
 import taq_data_tools_responses_physical_shift
 
 __tau__ = 1000
@@ -145,16 +151,24 @@ def taq_self_response_year_responses_physical_shift_data(ticker, year, shift):
         .taq_function_header_print_data(function_name, ticker, ticker, year,
                                         '', '')
 
-    dates = taq_data_tools_responses_physical_shift.taq_bussiness_days(year)
+    dates = taq_data_tools_pool \
+        .taq_catalog_dates([ticker], year)
 
     self_values = []
     args_prod = iprod([ticker], dates, [shift])
 
     # Parallel computation of the self-responses. Every result is appended to
     # a list
-    with mp.Pool(processes=mp.cpu_count()) as pool:
+    with taq_data_tools_pool.taq_pool() as pool:
         self_values.append(pool.starmap(
-            taq_self_response_day_responses_physical_shift_data, args_prod))
+            taq_self_response_day_responses_physical_shift_data, args_prod,
+            tickers=(0,), date=1, data='arrays'))
+
+    # A ticker without days with data has no trades, so the averages are NaN as
+    # in the days without data
+    if (not dates):
+        zeros = np.zeros(__tau__)
+        self_values[0].append((zeros, zeros))
 
     # To obtain the total self-response, I sum over all the self-response
     # values and all the amount of trades (averaging values)
@@ -296,18 +310,24 @@ def taq_cross_response_year_responses_physical_shift_data(ticker_i, ticker_j,
             .taq_function_header_print_data(function_name, ticker_i, ticker_j,
                                             year, '', '')
 
-        dates = taq_data_tools_responses_physical_shift \
-            .taq_bussiness_days(year)
+        dates = taq_data_tools_pool \
+            .taq_catalog_dates([ticker_i, ticker_j], year)
 
         cross_values = []
         args_prod = iprod([ticker_i], [ticker_j], dates, [shift])
 
         # Parallel computation of the cross-responses. Every result is appended
         # to a list
-        with mp.Pool(processes=mp.cpu_count()) as pool:
+        with taq_data_tools_pool.taq_pool() as pool:
             cross_values.append(pool.starmap(
                 taq_cross_response_day_responses_physical_shift_data,
-                args_prod))
+                args_prod, tickers=(0, 1), date=2, data='arrays'))
+
+        # A pair of tickers without days with data has no trades, so the
+        # averages are NaN as in the days without data
+        if (not dates):
+            zeros = np.zeros(__tau__)
+            cross_values[0].append((zeros, zeros))
 
         # To obtain the total cross-response, I sum over all the cross-response
         # values and all the amount of trades (averaging values)
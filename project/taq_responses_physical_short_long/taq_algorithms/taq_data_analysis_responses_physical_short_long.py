@@ -5,11 +5,14 @@ computing the self- and cross-response functions.
 
 This script requires the following modules:
     * itertools
-    * multiprocessing
     * numpy
+    * os
     * pandas
     * pickle
+    * sys
+    * taq_data_tools_pool
     * taq_data_tools_responses_physical_short_long
+    * zlib
 
 The module contains the following functions:
     * taq_self_response_day_responses_physical_short_long_data - computes the
@@ -20,6 +23,24 @@ The module contains the following functions:
       cross response of a day.
     * taq_cross_response_year_responses_physical_short_long_data - computes the
       cross response of a year.
+    * taq_response_taus_p_responses_physical_short_long_data - computes the
+      short and long responses of a day for several tau'.
+    * taq_self_response_day_taus_p_responses_physical_short_long_data -
+      computes the self response of a day for several tau'.
+    * taq_self_response_year_taus_p_responses_physical_short_long_data -
+      computes the self response of a year for several tau'.
+    * taq_cross_response_day_taus_p_responses_physical_short_long_data -
+      computes the cross response of a day for several tau'.
+    * taq_cross_response_year_taus_p_responses_physical_short_long_data -
+      computes the cross response of a year for several tau'.
+    * taq_shuffle_rng_responses_physical_short_long_data - creates the
+      random generator of the shuffle responses of a day.
+    * taq_shuffle_response_responses_physical_short_long_data - computes the
+      shuffle responses of a day for several permutations.
+    * taq_shuffle_response_day_responses_physical_short_long_data - computes
+      the shuffle self or cross response of a day.
+    * taq_shuffle_response_year_responses_physical_short_long_data - computes
+      the shuffle self or cross response of a year.
     * main - the main function of the script.
 
 .. moduleauthor:: Juan Camilo Henao Londono <www.github.com/juanhenao21>
@@ -29,23 +50,29 @@ The module contains the following functions:
 # Modules
 
 from itertools import product as iprod
-import multiprocessing as mp
 import numpy as np
+import os
 import pandas as pd
 import pickle
+import sys
+import zlib
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                             '..', '..', 'taq_pool', 'taq_algorithms'))
+import taq_data_tools_pool
 import taq_data_tools_responses_physical_short_long
 
 # ----------------------------------------------------------------------------
 
 
 def taq_self_response_day_responses_physical_short_long_data(ticker, date, tau,
-                                                             tau_p):
+                                                             tau_p, seed=0):
     """Computes the self-response of a day.
 
     Using the midpoint price and trade signs of a ticker computes the self-
     response for a day. There is a constant :math:`\\tau` and :math:`\\tau'`
-    that must be set in the parameters.
+    that must be set in the parameters. The shuffle response is the first
+    permutation of the seeded shuffle ensemble of the day.
 
     :param ticker: string of the abbreviation of the stock to be analyzed
      (i.e. 'AAPL').
@@ -53,6 +80,8 @@ def taq_self_response_day_responses_physical_short_long_data(ticker, date, tau,
      (i.e. '2008-01-02').
     :param tau: integer greater than zero (i.e. 50).
     :param tau_p: integer greater than zero and smaller than tau (i.e. 10).
+    :param seed: integer used to seed the random generator (i.e. 0).
+     Default 0.
     :return: tuple -- The function returns a tuple with numpy arrays.
     """
 
@@ -81,11 +110,9 @@ def taq_self_response_day_responses_physical_short_long_data(ticker, date, tau,
         self_short = np.zeros(tau)
         self_long = np.zeros(tau)
         self_response = np.zeros(tau)
-        self_shuffle = np.zeros(tau)
         num_short = np.zeros(tau)
         num_long = np.zeros(tau)
         num_response = np.zeros(tau)
-        num_shuffle = np.zeros(tau)
 
         # Short response after tau_p
         # Calculating the midpoint price return and the self response function
@@ -112,13 +139,11 @@ def taq_self_response_day_responses_physical_short_long_data(ticker, date, tau,
             if (tau_idx <= tau_p):
                 # Short response
                 trade_sign_tau_short = trade_sign[:-tau_idx - 1]
-                trade_sign_tau_shuffle = 1 * trade_sign_tau_short
                 trade_sign_no_0_len_short = len(trade_sign_tau_short
                                                 [trade_sign_tau_short != 0])
                 num_short[tau_idx] = trade_sign_no_0_len_short
                 num_long[tau_idx] = trade_sign_no_0_len_short
                 num_response[tau_idx] = trade_sign_no_0_len_short
-                num_shuffle[tau_idx] = trade_sign_no_0_len_short
 
                 # Obtain the midpoint price return. Displace the numerator tau
                 # values to the right and compute the return
@@ -130,13 +155,9 @@ def taq_self_response_day_responses_physical_short_long_data(ticker, date, tau,
                 # Obtain the self response value
                 if (trade_sign_no_0_len_short):
                     product_short = log_return_sec_short * trade_sign_tau_short
-                    np.random.shuffle(trade_sign_tau_shuffle)
-                    product_shuffle = log_return_sec_short \
-                        * trade_sign_tau_shuffle
                     self_short[tau_idx] = np.sum(product_short)
                     self_long[tau_idx] = np.sum(product_short)
                     self_response[tau_idx] = np.sum(product_short)
-                    self_shuffle[tau_idx] = np.sum(product_shuffle)
 
             else:
 
@@ -178,16 +199,14 @@ def taq_self_response_day_responses_physical_short_long_data(ticker, date, tau,
                     product = log_return_sec_resp * trade_sign_tau_resp
                     self_response[tau_idx] = np.sum(product)
 
-                # Shuffle response
-                trade_sign_tau_shuffle = 1 * trade_sign_tau_resp
-                num_shuffle[tau_idx] = trade_sign_no_0_len_resp
-
-                # Obtain the self response value
-                if (trade_sign_no_0_len_resp != 0):
-                    np.random.shuffle(trade_sign_tau_shuffle)
-                    product_shuffle = log_return_sec_resp \
-                        * trade_sign_tau_shuffle
-                    self_shuffle[tau_idx] = np.sum(product_shuffle)
+        # Shuffle response
+        shuffle, num = \
+            taq_shuffle_response_responses_physical_short_long_data(
+                midpoint, trade_sign, tau, 1,
+                taq_shuffle_rng_responses_physical_short_long_data(
+                    ticker, ticker, date, seed))
+        self_shuffle = shuffle[0]
+        num_shuffle = num[0]
 
         return (self_short, num_short,
                 self_long, num_long,
@@ -226,18 +245,24 @@ def taq_self_response_year_responses_physical_short_long_data(ticker, year,
         .taq_function_header_print_data(function_name, ticker, ticker, year,
                                         '', '')
 
-    dates = taq_data_tools_responses_physical_short_long \
-        .taq_bussiness_days(year)
+    dates = taq_data_tools_pool \
+        .taq_catalog_dates([ticker], year)
 
     self_values = []
     args_prod = iprod([ticker], dates, [tau], [tau_p])
 
     # Parallel computation of the self-responses. Every result is appended to
     # a list
-    with mp.Pool(processes=mp.cpu_count()) as pool:
+    with taq_data_tools_pool.taq_pool() as pool:
         self_values.append(pool.starmap(
             taq_self_response_day_responses_physical_short_long_data,
-            args_prod))
+            args_prod, tickers=(0,), date=1, data='arrays'))
+
+    # A ticker without days with data has no trades, so the averages are NaN as
+    # in the days without data
+    if (not dates):
+        zeros = np.zeros(tau)
+        self_values[0].append((zeros,) * 8)
 
     # To obtain the total self-response, I sum over all the self-response
     # values and all the amount of trades (averaging values)
@@ -271,12 +296,14 @@ def taq_self_response_year_responses_physical_short_long_data(ticker, year,
 
 def taq_cross_response_day_responses_physical_short_long_data(ticker_i,
                                                               ticker_j, date,
-                                                              tau, tau_p):
+                                                              tau, tau_p,
+                                                              seed=0):
     """Computes the cross-response of a day.
 
     Using the midpoint price of ticker i and trade signs of ticker j computes
     the cross-response for a day. There is a constant :math:`\\tau` and
-    :math:`\\tau'` that must be set in the parameters.
+    :math:`\\tau'` that must be set in the parameters. The shuffle response
+    is the first permutation of the seeded shuffle ensemble of the day.
 
     :param ticker_i: string of the abbreviation of the stock to be analyzed
      (i.e. 'AAPL').
@@ -286,6 +313,8 @@ def taq_cross_response_day_responses_physical_short_long_data(ticker_i,
      (i.e. '2008-01-02').
     :param tau: integer great than zero (i.e. 50).
     :param tau_p: integer greater than zero and smaller than tau (i.e. 10).
+    :param seed: integer used to seed the random generator (i.e. 0).
+     Default 0.
     :return: tuple -- The function returns a tuple with positions.
     """
 
@@ -320,11 +349,9 @@ def taq_cross_response_day_responses_physical_short_long_data(ticker_i,
             cross_short = np.zeros(tau)
             cross_long = np.zeros(tau)
             cross_response = np.zeros(tau)
-            cross_shuffle = np.zeros(tau)
             num_short = np.zeros(tau)
             num_long = np.zeros(tau)
             num_response = np.zeros(tau)
-            num_shuffle = np.zeros(tau)
 
             # Short response after tau_p
 
@@ -353,13 +380,11 @@ def taq_cross_response_day_responses_physical_short_long_data(ticker_i,
                 if (tau_idx <= tau_p):
                     # Short response
                     trade_sign_tau_short = trade_sign_j[:-tau_idx - 1]
-                    trade_sign_tau_shuffle = 1 * trade_sign_tau_short
                     trade_sign_no_0_len_short = \
                         len(trade_sign_tau_short[trade_sign_tau_short != 0])
                     num_short[tau_idx] = trade_sign_no_0_len_short
                     num_long[tau_idx] = trade_sign_no_0_len_short
                     num_response[tau_idx] = trade_sign_no_0_len_short
-                    num_shuffle[tau_idx] = trade_sign_no_0_len_short
 
                     # Obtain the midpoint price return. Displace the numerator
                     # tau values to the right and compute the return
@@ -373,13 +398,9 @@ def taq_cross_response_day_responses_physical_short_long_data(ticker_i,
                     if (trade_sign_no_0_len_short):
                         product_short = log_return_sec_short \
                             * trade_sign_tau_short
-                        np.random.shuffle(trade_sign_tau_shuffle)
-                        product_shuffle = log_return_sec_short \
-                            * trade_sign_tau_shuffle
                         cross_short[tau_idx] = np.sum(product_short)
                         cross_long[tau_idx] = np.sum(product_short)
                         cross_response[tau_idx] = np.sum(product_short)
-                        cross_shuffle[tau_idx] = np.sum(product_shuffle)
 
                 else:
                     # Long response
@@ -418,16 +439,14 @@ def taq_cross_response_day_responses_physical_short_long_data(ticker_i,
                         product = log_return_sec_resp * trade_sign_tau_resp
                         cross_response[tau_idx] = np.sum(product)
 
-                    # Shuffle response
-                    trade_sign_tau_shuffle = 1 * trade_sign_tau_resp
-                    num_shuffle[tau_idx] = trade_sign_no_0_len_resp
-
-                    # Obtain the cross response value
-                    if (trade_sign_no_0_len_resp != 0):
-                        np.random.shuffle(trade_sign_tau_shuffle)
-                        product_shuffle = log_return_sec_resp \
-                            * trade_sign_tau_shuffle
-                        cross_shuffle[tau_idx] = np.sum(product_shuffle)
+            # Shuffle response
+            shuffle, num = \
+                taq_shuffle_response_responses_physical_short_long_data(
+                    midpoint_i, trade_sign_j, tau, 1,
+                    taq_shuffle_rng_responses_physical_short_long_data(
+                        ticker_i, ticker_j, date, seed))
+            cross_shuffle = shuffle[0]
+            num_shuffle = num[0]
 
             return (cross_short, num_short,
                     cross_long, num_long,
@@ -476,18 +495,24 @@ def taq_cross_response_year_responses_physical_short_long_data(ticker_i,
             .taq_function_header_print_data(function_name, ticker_i, ticker_j,
                                             year, '', '')
 
-        dates = taq_data_tools_responses_physical_short_long \
-            .taq_bussiness_days(year)
+        dates = taq_data_tools_pool \
+            .taq_catalog_dates([ticker_i, ticker_j], year)
 
         cross_values = []
         args_prod = iprod([ticker_i], [ticker_j], dates, [tau], [tau_p])
 
         # Parallel computation of the cross-responses. Every result is appended
         # to a list
-        with mp.Pool(processes=mp.cpu_count()) as pool:
+        with taq_data_tools_pool.taq_pool() as pool:
             cross_values.append(pool.starmap(
                 taq_cross_response_day_responses_physical_short_long_data,
-                args_prod))
+                args_prod, tickers=(0, 1), date=2, data='arrays'))
+
+        # A pair of tickers without days with data has no trades, so the
+        # averages are NaN as in the days without data
+        if (not dates):
+            zeros = np.zeros(tau)
+            cross_values[0].append((zeros,) * 8)
 
         # To obtain the total cross-response, I sum over all the cross-response
         # values and all the amount of trades (averaging values)
@@ -519,6 +544,565 @@ def taq_cross_response_year_responses_physical_short_long_data(ticker_i,
 # ----------------------------------------------------------------------------
 
 
+def taq_response_taus_p_responses_physical_short_long_data(midpoint,
+                                                           trade_sign, tau,
+                                                           taus_p, rng):
+    """Computes the short and long responses of a day for several tau'.
+
+    Using the midpoint price and the trade signs computes the normal, shuffle,
+    short and long responses for every :math:`\\tau'` in a list. The return
+    of every time lag is computed once and shared by the normal response and
+    the long responses of all the :math:`\\tau'` values. The shuffle response
+    is the first permutation of the shuffle ensemble drawn with the random
+    generator.
+
+    :param midpoint: numpy array with the midpoint price of every second.
+    :param trade_sign: numpy array with the trade sign of every second.
+    :param tau: integer greater than zero (i.e. 1000).
+    :param taus_p: list of integers greater than zero and smaller than tau
+     (i.e. [10, 20, 50]).
+    :param rng: numpy random Generator used to draw the permutation.
+    :return: numpy array -- The function returns an array with shape
+     (8, len(taus_p), tau) with the short, long, normal and shuffle responses
+     and the number of trade signs of each one.
+    """
+
+    taus_p = np.asarray(taus_p)
+    length = len(trade_sign)
+
+    # Number of trade signs different to zero before every position
+    trade_sign_no_0 = np.concatenate(([0], np.cumsum(trade_sign != 0)))
+
+    response = np.zeros(tau)
+    long = np.zeros((len(taus_p), tau))
+    num_long = np.zeros((len(taus_p), tau))
+
+    # Depending on the time lag of the return
+    for lag in range(1, tau + 1):
+
+        # Midpoint price returns
+        log_return_sec = (midpoint[lag:] - midpoint[:-lag]) / midpoint[:-lag]
+
+        # Normal response (tau_idx = lag - 1)
+        trade_sign_tau = trade_sign[:-lag]
+        response[lag - 1] = np.sum(log_return_sec * trade_sign_tau)
+
+        # Long responses (tau_idx = lag + tau_p). The return between tau_p
+        # and tau_idx is the return of the lag displaced tau_p seconds
+        for p_idx, tau_p in enumerate(taus_p):
+
+            if (lag + tau_p < tau):
+                end = length - lag - 2 * tau_p
+                long[p_idx, lag + tau_p] = \
+                    np.sum(trade_sign[:end]
+                           * log_return_sec[tau_p:tau_p + end])
+                num_long[p_idx, lag + tau_p] = trade_sign_no_0[end]
+
+    num_response = trade_sign_no_0[length - np.arange(1, tau + 1)]
+
+    # Shuffle response
+    shuffle, num_shuffle = \
+        taq_shuffle_response_responses_physical_short_long_data(
+            midpoint, trade_sign, tau, 1, rng)
+
+    short = np.zeros((len(taus_p), tau))
+    num_short = np.zeros((len(taus_p), tau))
+
+    for p_idx, tau_p in enumerate(taus_p):
+
+        # Until tau_p the short and long responses are the normal response
+        short[p_idx, :tau_p + 1] = response[:tau_p + 1]
+        short[p_idx, tau_p + 1:] = response[tau_p]
+        num_short[p_idx, :tau_p + 1] = num_response[:tau_p + 1]
+        num_short[p_idx, tau_p + 1:] = num_response[tau_p]
+        long[p_idx, :tau_p + 1] = response[:tau_p + 1]
+        num_long[p_idx, :tau_p + 1] = num_response[:tau_p + 1]
+
+    ones = np.ones((len(taus_p), 1))
+
+    return np.array((short, num_short,
+                     long, num_long,
+                     ones * response, ones * num_response,
+                     ones * shuffle[0], ones * num_shuffle[0]))
+
+# ----------------------------------------------------------------------------
+
+
+def taq_self_response_day_taus_p_responses_physical_short_long_data(ticker,
+                                                                    date, tau,
+                                                                    taus_p,
+                                                                    seed=0):
+    """Computes the self-response of a day for several tau'.
+
+    Using the midpoint price and trade signs of a ticker computes the short,
+    long, normal and shuffle self-responses for a day for every
+    :math:`\\tau'` in a list, loading the data of the day only once.
+
+    :param ticker: string of the abbreviation of the stock to be analyzed
+     (i.e. 'AAPL').
+    :param date: string with the date of the data to be extracted
+     (i.e. '2008-01-02').
+    :param tau: integer greater than zero (i.e. 1000).
+    :param taus_p: list of integers greater than zero and smaller than tau
+     (i.e. [10, 20, 50]).
+    :param seed: integer used to seed the random generator (i.e. 0).
+     Default 0.
+    :return: numpy array -- The function returns an array with shape
+     (8, len(taus_p), tau).
+    """
+
+    date_sep = date.split('-')
+
+    year = date_sep[0]
+    month = date_sep[1]
+    day = date_sep[2]
+
+    try:
+        # Load data
+        midpoint = pickle.load(open(
+                f'../../taq_data/responses_physical_data_{year}/taq_midpoint'
+                + '_physical_data/taq_midpoint_physical_data_midpoint'
+                + f'_{year}{month}{day}_{ticker}.pickle', 'rb'))
+        _, _, trade_sign = pickle.load(open(
+                f'../../taq_data/responses_physical_data_{year}/taq_trade'
+                + '_signs_physical_data/taq_trade_signs_physical_data'
+                + f'_{year}{month}{day}_{ticker}.pickle', 'rb'))
+
+        assert len(midpoint) == len(trade_sign)
+
+        return taq_response_taus_p_responses_physical_short_long_data(
+            midpoint, trade_sign, tau, taus_p,
+            taq_shuffle_rng_responses_physical_short_long_data(
+                ticker, ticker, date, seed))
+
+    except FileNotFoundError as e:
+        print('No data')
+        print(e)
+        print()
+        return np.zeros((8, len(taus_p), tau))
+
+# ----------------------------------------------------------------------------
+
+
+def taq_self_response_year_taus_p_responses_physical_short_long_data(ticker,
+                                                                     year, tau,
+                                                                     taus_p):
+    """Computes the self-response of a year for several tau'.
+
+    Using the taq_self_response_day_taus_p_responses_physical_short_long_data
+    function computes the self-response functions for a year for every
+    :math:`\\tau'` in a list. The results are saved in the same files as the
+    taq_self_response_year_responses_physical_short_long_data function.
+
+    :param ticker: string of the abbreviation of stock to be analyzed
+     (i.e. 'AAPL').
+    :param year: string of the year to be analyzed (i.e '2016').
+    :param tau: integer greater than zero (i.e. 1000).
+    :param taus_p: list of integers greater than zero and smaller than tau
+     (i.e. [10, 20, 50]).
+    :return: None – The function saves the data in a file and does not return
+     a value.
+    """
+
+    function_name = \
+        taq_self_response_year_taus_p_responses_physical_short_long_data \
+        .__name__
+    taq_data_tools_responses_physical_short_long \
+        .taq_function_header_print_data(function_name, ticker, ticker, year,
+                                        '', '')
+
+    dates = taq_data_tools_pool \
+        .taq_catalog_dates([ticker], year)
+
+    args_prod = iprod([ticker], dates, [tau], [taus_p])
+
+    # Parallel computation of the self-responses
+    with taq_data_tools_pool.taq_pool() as pool:
+        self_values = pool.starmap(
+            taq_self_response_day_taus_p_responses_physical_short_long_data,
+            args_prod, tickers=(0,), date=1, data='arrays')
+
+    # A ticker without days with data has no trades, so the averages are NaN as
+    # in the days without data
+    if (not dates):
+        self_values = [np.zeros((8, len(taus_p), tau))]
+
+    # To obtain the total self-response, I sum over all the self-response
+    # values and all the amount of trades (averaging values)
+    self_v_final = np.sum(self_values, axis=0)
+
+    # Saving data with the name of the function of a single tau'
+    save_name = taq_self_response_year_responses_physical_short_long_data \
+        .__name__
+
+    for p_idx, tau_p in enumerate(taus_p):
+
+        self_v = self_v_final[:, p_idx]
+
+        taq_data_tools_responses_physical_short_long \
+            .taq_save_data(f'{save_name}_tau_{tau}_tau_p_{tau_p}',
+                           (self_v[0] / self_v[1],
+                            self_v[2] / self_v[3],
+                            self_v[4] / self_v[5],
+                            self_v[6] / self_v[7]),
+                           ticker, ticker, year, '', '')
+
+    return None
+
+# ----------------------------------------------------------------------------
+
+
+def taq_cross_response_day_taus_p_responses_physical_short_long_data(
+        ticker_i, ticker_j, date, tau, taus_p, seed=0):
+    """Computes the cross-response of a day for several tau'.
+
+    Using the midpoint price of ticker i and trade signs of ticker j computes
+    the short, long, normal and shuffle cross-responses for a day for every
+    :math:`\\tau'` in a list, loading the data of the day only once.
+
+    :param ticker_i: string of the abbreviation of the stock to be analyzed
+     (i.e. 'AAPL').
+    :param ticker_j: string of the abbreviation of the stock to be analyzed
+     (i.e. 'AAPL').
+    :param date: string with the date of the data to be extracted
+     (i.e. '2008-01-02').
+    :param tau: integer greater than zero (i.e. 1000).
+    :param taus_p: list of integers greater than zero and smaller than tau
+     (i.e. [10, 20, 50]).
+    :param seed: integer used to seed the random generator (i.e. 0).
+     Default 0.
+    :return: numpy array -- The function returns an array with shape
+     (8, len(taus_p), tau).
+    """
+
+    date_sep = date.split('-')
+
+    year = date_sep[0]
+    month = date_sep[1]
+    day = date_sep[2]
+
+    if (ticker_i == ticker_j):
+
+        # Self-response
+        return None
+
+    else:
+        try:
+            # Load data
+            midpoint_i = pickle.load(open(
+                f'../../taq_data/responses_physical_data_{year}/taq_midpoint'
+                + '_physical_data/taq_midpoint_physical_data_midpoint'
+                + f'_{year}{month}{day}_{ticker_i}.pickle', 'rb'))
+            _, _, trade_sign_j = pickle.load(open(
+                f'../../taq_data/responses_physical_data_{year}/taq_trade'
+                + '_signs_physical_data/taq_trade_signs_physical_data'
+                + f'_{year}{month}{day}_{ticker_j}.pickle', 'rb'))
+
+            assert len(midpoint_i) == len(trade_sign_j)
+
+            return taq_response_taus_p_responses_physical_short_long_data(
+                midpoint_i, trade_sign_j, tau, taus_p,
+                taq_shuffle_rng_responses_physical_short_long_data(
+                    ticker_i, ticker_j, date, seed))
+
+        except FileNotFoundError as e:
+            print('No data')
+            print(e)
+            print()
+            return np.zeros((8, len(taus_p), tau))
+
+# ----------------------------------------------------------------------------
+
+
+def taq_cross_response_year_taus_p_responses_physical_short_long_data(
+        ticker_i, ticker_j, year, tau, taus_p):
+    """Computes the cross-response of a year for several tau'.
+
+    Using the taq_cross_response_day_taus_p_responses_physical_short_long_data
+    function computes the cross-response functions for a year for every
+    :math:`\\tau'` in a list. The results are saved in the same files as the
+    taq_cross_response_year_responses_physical_short_long_data function.
+
+    :param ticker_i: string of the abbreviation of the stock to be analyzed
+     (i.e. 'AAPL').
+    :param ticker_j: string of the abbreviation of the stock to be analyzed
+     (i.e. 'AAPL').
+    :param year: string of the year to be analyzed (i.e '2016').
+    :param tau: integer greater than zero (i.e. 1000).
+    :param taus_p: list of integers greater than zero and smaller than tau
+     (i.e. [10, 20, 50]).
+    :return: None – The function saves the data in a file and does not return
+     a value.
+    """
+
+    if (ticker_i == ticker_j):
+
+        # Self-response
+        return None
+
+    else:
+        function_name = \
+            taq_cross_response_year_taus_p_responses_physical_short_long_data \
+            .__name__
+        taq_data_tools_responses_physical_short_long \
+            .taq_function_header_print_data(function_name, ticker_i, ticker_j,
+                                            year, '', '')
+
+        dates = taq_data_tools_pool \
+            .taq_catalog_dates([ticker_i, ticker_j], year)
+
+        args_prod = iprod([ticker_i], [ticker_j], dates, [tau], [taus_p])
+
+        # Parallel computation of the cross-responses
+        day_function = \
+            taq_cross_response_day_taus_p_responses_physical_short_long_data
+        with taq_data_tools_pool.taq_pool() as pool:
+            cross_values = pool.starmap(day_function, args_prod,
+                                        tickers=(0, 1), date=2,
+                                        data='arrays')
+
+        # A pair of tickers without days with data has no trades, so the
+        # averages are NaN as in the days without data
+        if (not dates):
+            cross_values = [np.zeros((8, len(taus_p), tau))]
+
+        # To obtain the total cross-response, I sum over all the cross-response
+        # values and all the amount of trades (averaging values)
+        cross_v_final = np.sum(cross_values, axis=0)
+
+        # Saving data with the name of the function of a single tau'
+        save_name = \
+            taq_cross_response_year_responses_physical_short_long_data \
+            .__name__
+
+        for p_idx, tau_p in enumerate(taus_p):
+
+            cross_v = cross_v_final[:, p_idx]
+
+            taq_data_tools_responses_physical_short_long \
+                .taq_save_data(f'{save_name}_tau_{tau}_tau_p_{tau_p}',
+                               (cross_v[0] / cross_v[1],
+                                cross_v[2] / cross_v[3],
+                                cross_v[4] / cross_v[5],
+                                cross_v[6] / cross_v[7]),
+                               ticker_i, ticker_j, year, '', '')
+
+        return None
+
+# ----------------------------------------------------------------------------
+
+
+def taq_shuffle_rng_responses_physical_short_long_data(ticker_i, ticker_j,
+                                                       date, seed):
+    """Creates the random generator of the shuffle responses of a day.
+
+    The generator is seeded with the seed, the date and the tickers, so the
+    permutations of a day are the same in every run and in every function
+    that computes a shuffle response.
+
+    :param ticker_i: string of the abbreviation of the stock to be analyzed
+     (i.e. 'AAPL').
+    :param ticker_j: string of the abbreviation of the stock to be analyzed
+     (i.e. 'AAPL').
+    :param date: string with the date of the data to be extracted
+     (i.e. '2008-01-02').
+    :param seed: integer used to seed the random generator (i.e. 0).
+    :return: Generator -- The function returns a numpy random Generator.
+    """
+
+    return np.random.default_rng([seed, int(date.replace('-', '')),
+                                  zlib.crc32(ticker_i.encode()),
+                                  zlib.crc32(ticker_j.encode())])
+
+# ----------------------------------------------------------------------------
+
+
+def taq_shuffle_response_responses_physical_short_long_data(midpoint,
+                                                            trade_sign, tau,
+                                                            permutations,
+                                                            rng):
+    """Computes the shuffle responses of a day for several permutations.
+
+    The trade signs are permuted several times and the responses of all the
+    permutations and all the time lags are computed as a matrix product
+    between the permuted trade signs and the midpoint price returns of every
+    time lag. The time lags are processed in blocks to limit the memory used
+    by the returns.
+
+    :param midpoint: numpy array with the midpoint price of every second.
+    :param trade_sign: numpy array with the trade sign of every second.
+    :param tau: integer greater than zero (i.e. 1000).
+    :param permutations: integer greater than zero with the number of
+     permutations of the trade signs (i.e. 100).
+    :param rng: numpy random Generator used to draw the permutations.
+    :return: tuple -- The function returns a tuple with two numpy arrays
+     with shape (permutations, tau) with the shuffle responses and the number
+     of trade signs of every permutation and time lag.
+    """
+
+    length = len(trade_sign)
+
+    # Every row is a permutation of the trade signs
+    order = np.argsort(rng.random((permutations, length)), axis=1)
+    trade_sign_shuffle = trade_sign[order]
+
+    shuffle = np.zeros((permutations, tau))
+    block = 100
+
+    for lag_0 in range(1, tau + 1, block):
+
+        lags = range(lag_0, min(lag_0 + block, tau + 1))
+        # Midpoint price returns of every time lag in the block. The returns
+        # are completed with zeros, so only the first length - lag trade
+        # signs are used for each time lag
+        log_return_sec = np.zeros((len(lags), length))
+        for l_idx, lag in enumerate(lags):
+            log_return_sec[l_idx, :-lag] = \
+                (midpoint[lag:] - midpoint[:-lag]) / midpoint[:-lag]
+
+        shuffle[:, lag_0 - 1:lags[-1]] = \
+            trade_sign_shuffle @ log_return_sec.T
+
+    # Number of trade signs different to zero of every permutation before
+    # every position. The time lag uses the first length - lag trade signs
+    # of the permutation
+    trade_sign_no_0 = np.zeros((permutations, length + 1))
+    trade_sign_no_0[:, 1:] = np.cumsum(trade_sign_shuffle != 0, axis=1)
+    num = trade_sign_no_0[:, length - np.arange(1, tau + 1)]
+
+    return (shuffle, num)
+
+# ----------------------------------------------------------------------------
+
+
+def taq_shuffle_response_day_responses_physical_short_long_data(ticker_i,
+                                                                ticker_j,
+                                                                date, tau,
+                                                                permutations,
+                                                                seed):
+    """Computes the shuffle self- or cross-response of a day.
+
+    Using the midpoint price of ticker i and trade signs of ticker j computes
+    the responses of several seeded permutations of the trade signs for a
+    day. If ticker i and ticker j are the same, the self-response is
+    computed. The random generator is seeded with the
+    taq_shuffle_rng_responses_physical_short_long_data function, so the
+    results are reproducible.
+
+    :param ticker_i: string of the abbreviation of the stock to be analyzed
+     (i.e. 'AAPL').
+    :param ticker_j: string of the abbreviation of the stock to be analyzed
+     (i.e. 'AAPL').
+    :param date: string with the date of the data to be extracted
+     (i.e. '2008-01-02').
+    :param tau: integer greater than zero (i.e. 1000).
+    :param permutations: integer greater than zero with the number of
+     permutations of the trade signs (i.e. 100).
+    :param seed: integer used to seed the random generator (i.e. 0).
+    :return: tuple -- The function returns a tuple with numpy arrays.
+    """
+
+    date_sep = date.split('-')
+
+    year = date_sep[0]
+    month = date_sep[1]
+    day = date_sep[2]
+
+    try:
+        # Load data
+        midpoint_i = pickle.load(open(
+            f'../../taq_data/responses_physical_data_{year}/taq_midpoint'
+            + '_physical_data/taq_midpoint_physical_data_midpoint'
+            + f'_{year}{month}{day}_{ticker_i}.pickle', 'rb'))
+        _, _, trade_sign_j = pickle.load(open(
+            f'../../taq_data/responses_physical_data_{year}/taq_trade'
+            + '_signs_physical_data/taq_trade_signs_physical_data'
+            + f'_{year}{month}{day}_{ticker_j}.pickle', 'rb'))
+
+        assert len(midpoint_i) == len(trade_sign_j)
+
+        return taq_shuffle_response_responses_physical_short_long_data(
+            midpoint_i, trade_sign_j, tau, permutations,
+            taq_shuffle_rng_responses_physical_short_long_data(
+                ticker_i, ticker_j, date, seed))
+
+    except FileNotFoundError as e:
+        print('No data')
+        print(e)
+        print()
+        return (np.zeros((permutations, tau)), np.zeros((permutations, tau)))
+
+# ----------------------------------------------------------------------------
+
+
+def taq_shuffle_response_year_responses_physical_short_long_data(
+        ticker_i, ticker_j, year, tau, permutations=100, seed=0,
+        percentiles=(2.5, 97.5)):
+    """Computes the shuffle self- or cross-response of a year.
+
+    Using the taq_shuffle_response_day_responses_physical_short_long_data
+    function computes the shuffle response of every permutation for a year,
+    and obtains the average and the percentile bands over the permutations.
+
+    :param ticker_i: string of the abbreviation of the stock to be analyzed
+     (i.e. 'AAPL').
+    :param ticker_j: string of the abbreviation of the stock to be analyzed
+     (i.e. 'AAPL').
+    :param year: string of the year to be analyzed (i.e '2016').
+    :param tau: integer greater than zero (i.e. 1000).
+    :param permutations: integer greater than zero with the number of
+     permutations of the trade signs (i.e. 100). Default 100.
+    :param seed: integer used to seed the random generator (i.e. 0).
+     Default 0.
+    :param percentiles: tuple with the percentiles of the bands
+     (i.e. (2.5, 97.5)). Default (2.5, 97.5).
+    :return: tuple -- The function returns a tuple with numpy arrays.
+    """
+
+    function_name = \
+        taq_shuffle_response_year_responses_physical_short_long_data.__name__
+    taq_data_tools_responses_physical_short_long \
+        .taq_function_header_print_data(function_name, ticker_i, ticker_j,
+                                        year, '', '')
+
+    dates = taq_data_tools_pool \
+        .taq_catalog_dates([ticker_i, ticker_j], year)
+
+    args_prod = iprod([ticker_i], [ticker_j], dates, [tau], [permutations],
+                      [seed])
+
+    # Parallel computation of the shuffle responses
+    with taq_data_tools_pool.taq_pool() as pool:
+        shuffle_values = pool.starmap(
+            taq_shuffle_response_day_responses_physical_short_long_data,
+            args_prod, tickers=(0, 1), date=2, data='arrays')
+
+    # A pair of tickers without days with data has no trades, so the averages
+    # are NaN as in the days without data
+    if (not dates):
+        shuffle_values = [(np.zeros((permutations, tau)),
+                           np.zeros((permutations, tau)))]
+
+    # The permutation k of every day is added to the permutation k of the
+    # other days, and averaged with the amount of trades
+    shuffle_sum = np.sum([values[0] for values in shuffle_values], axis=0)
+    num_sum = np.sum([values[1] for values in shuffle_values], axis=0)
+    shuffle_val = shuffle_sum / num_sum
+
+    shuffle_avg = np.mean(shuffle_val, axis=0)
+    shuffle_bands = np.percentile(shuffle_val, percentiles, axis=0)
+
+    # Saving data
+    taq_data_tools_responses_physical_short_long \
+        .taq_save_data(f'{function_name}_tau_{tau}_perm_{permutations}',
+                       (shuffle_avg, shuffle_bands), ticker_i, ticker_j, year,
+                       '', '')
+
+    return (shuffle_avg, shuffle_bands)
+
+# ----------------------------------------------------------------------------
+
+
 def main():
     """The main function of the script.
 
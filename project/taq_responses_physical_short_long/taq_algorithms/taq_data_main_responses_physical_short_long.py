@@ -5,12 +5,18 @@ The functions in the module run the complete analysis and plot of the TAQ data.
 This script requires the following modules:
     * itertools
     * multiprocessing
+    * os
     * pickle
+    * sys
     * taq_data_analysis_responses_physical_short_long
     * taq_data_plot_responses_physical_short_long
+    * taq_data_tools_pool
     * taq_data_tools_responses_physical_short_long
 
 The module contains the following functions:
+    * taq_data_generator - generates all the analysis from the TAQ data.
+    * taq_plot_generator - generates all the plots from the analysis of the
+      TAQ data.
     * taq_data_plot_generator - generates all the analysis and plots from the
       TAQ data.
     * main - the main function of the script.
@@ -23,35 +29,49 @@ The module contains the following functions:
 
 from itertools import product as iprod
 import multiprocessing as mp
+import os
 import pickle
+import sys
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                             '..', '..', 'taq_pool', 'taq_algorithms'))
 import taq_data_analysis_responses_physical_short_long
 import taq_data_plot_responses_physical_short_long
+import taq_data_tools_pool
 import taq_data_tools_responses_physical_short_long
 
 # -----------------------------------------------------------------------------
 
 
-def taq_data_plot_generator(tickers, year, tau, taus_p):
-    """Generates all the analysis and plots from the TAQ data.
+def taq_data_generator(tickers, year, tau, taus_p):
+    """Generates all the analysis from the TAQ data.
 
     :param tickers: list of the string abbreviation of the stocks to be
      analyzed (i.e. ['AAPL', 'MSFT']).
     :param year: string of the year to be analyzed (i.e '2016').
-    :param taus: Integer great than zero (i.e. 1000).
+    :param tau: Integer great than zero (i.e. 1000).
     :param taus_p: list of integers great than zero (i.e. [1, 10, 50]).
     :return: None -- The function saves the data in a file and does not return
      a value.
     """
 
+    # The days of the year functions keep their checkpoints until the
+    # year results are saved
+    taq_data_tools_pool \
+        .taq_checkpoint_tasks(taq_data_analysis_responses_physical_short_long)
+
     # Specific functions
     # Self-response
+    # All the tau' values are computed with a single load of every day
     for ticker in tickers:
-        for tau_p in taus_p:
 
-            taq_data_analysis_responses_physical_short_long \
-                .taq_self_response_year_responses_physical_short_long_data(
-                    ticker, year, tau, tau_p)
+        taq_data_analysis_responses_physical_short_long \
+            .taq_self_response_year_taus_p_responses_physical_short_long_data(
+                ticker, year, tau, taus_p)
+        # Significance bands of the shuffle self-response
+        taq_data_analysis_responses_physical_short_long \
+            .taq_shuffle_response_year_responses_physical_short_long_data(
+                ticker, ticker, year, tau)
 
     ticker_prod = iprod(tickers, tickers)
     # ticker_prod = [('AAPL', 'MSFT'), ('MSFT', 'AAPL'),
@@ -63,20 +83,43 @@ def taq_data_plot_generator(tickers, year, tau, taus_p):
 
     # Cross-response and cross-correlator
     for ticks in ticker_prod:
-        for tau_p in taus_p:
 
+        taq_data_analysis_responses_physical_short_long \
+            .taq_cross_response_year_taus_p_responses_physical_short_long_data(
+                ticks[0], ticks[1], year, tau, taus_p)
+        # Significance bands of the shuffle cross-response
+        if (ticks[0] != ticks[1]):
             taq_data_analysis_responses_physical_short_long \
-                .taq_cross_response_year_responses_physical_short_long_data(
-                    ticks[0], ticks[1], year, tau, tau_p)
+                .taq_shuffle_response_year_responses_physical_short_long_data(
+                    ticks[0], ticks[1], year, tau)
+
+    return None
+
+# -----------------------------------------------------------------------------
+
+
+def taq_plot_generator(tickers, year, tau, taus_p):
+    """Generates all the plots from the analysis of the TAQ data.
+
+    :param tickers: list of the string abbreviation of the stocks to be
+     analyzed (i.e. ['AAPL', 'MSFT']).
+    :param year: string of the year to be analyzed (i.e '2016').
+    :param tau: Integer great than zero (i.e. 1000).
+    :param taus_p: list of integers great than zero (i.e. [1, 10, 50]).
+    :return: None -- The function saves the plots in files and does not
+     return a value.
+    """
+
+    workers = taq_data_tools_pool.taq_workers()
 
     # Parallel computing
-    with mp.Pool(processes=mp.cpu_count()) as pool:
+    with mp.Pool(processes=workers) as pool:
         # Plot
         pool.starmap(taq_data_plot_responses_physical_short_long
             .taq_self_response_year_avg_responses_physical_short_long_plot,
             iprod(tickers, [year], [tau], taus_p))
     # Parallel computing
-    with mp.Pool(processes=mp.cpu_count()) as pool:
+    with mp.Pool(processes=workers) as pool:
         # Plot
         pool.starmap(taq_data_plot_responses_physical_short_long
             .taq_cross_response_year_avg_responses_physical_short_long_plot,
@@ -87,6 +130,26 @@ def taq_data_plot_generator(tickers, year, tau, taus_p):
 # -----------------------------------------------------------------------------
 
 
+def taq_data_plot_generator(tickers, year, tau, taus_p):
+    """Generates all the analysis and plots from the TAQ data.
+
+    :param tickers: list of the string abbreviation of the stocks to be
+     analyzed (i.e. ['AAPL', 'MSFT']).
+    :param year: string of the year to be analyzed (i.e '2016').
+    :param tau: Integer great than zero (i.e. 1000).
+    :param taus_p: list of integers great than zero (i.e. [1, 10, 50]).
+    :return: None -- The function saves the data in a file and does not return
+     a value.
+    """
+
+    taq_data_generator(tickers, year, tau, taus_p)
+    taq_plot_generator(tickers, year, tau, taus_p)
+
+    return None
+
+# -----------------------------------------------------------------------------
+
+
 def main():
     """The main function of the script.
 
@@ -31,15 +31,20 @@ import taq_data_tools_responses_physical_short_long
 # ----------------------------------------------------------------------------
 
 
-def taq_self_response_year_avg_responses_physical_short_long_plot(ticker, year,
-                                                                  tau, tau_p):
+def taq_self_response_year_avg_responses_physical_short_long_plot(
+        ticker, year, tau, tau_p, permutations=100):
     """Plots the self-response average for a year.
 
+    The percentile bands of the shuffle self-response are plotted when they
+    were computed.
+
     :param ticker: string of the abbreviation of the stock to be analyzed
      (i.e. 'AAPL').
     :param year: string of the year to be analyzed (i.e '2008').
     :param tau: integer greater than zero (i.e. 50).
     :param tau_p: integer greater than zero and smaller than tau (i.e. 10).
+    :param permutations: integer greater than zero with the number of
+     permutations of the shuffle bands (i.e. 100). Default 100.
     :return: None -- The function saves the plot in a file and does not return
      a value.
     """
@@ -64,6 +69,18 @@ def taq_self_response_year_avg_responses_physical_short_long_plot(ticker, year,
              + f'_physical_short_long_data_tau_{tau}_tau_p_{tau_p}_{year}'
              + f'_{ticker}.pickle', 'rb'))
 
+        # Percentile bands of the shuffle self-response
+        try:
+            _, shuffle_bands = pickle.load(open(
+                f'../../taq_data/responses_physical_short_long_data_{year}'
+                + '/taq_shuffle_response_year_responses_physical_short_long'
+                + f'_data_tau_{tau}_perm_{permutations}/taq_shuffle_response'
+                + '_year_responses_physical_short_long_data_tau'
+                + f'_{tau}_perm_{permutations}_{year}_{ticker}.pickle', 'rb'))
+
+        except FileNotFoundError:
+            shuffle_bands = None
+
         # Addition of the short and long response signal
         sum = np.zeros(tau)
         sum[:tau_p + 1] = self_short[:tau_p + 1]
@@ -76,6 +93,9 @@ def taq_self_response_year_avg_responses_physical_short_long_plot(ticker, year,
         plt.semilogx(self_response, linewidth=5,
                      label=f'{ticker} - Self-response')
         plt.semilogx(self_shuffle, linewidth=5, label=f'{ticker} - Shuffle')
+        if (shuffle_bands is not None):
+            plt.fill_between(range(tau), shuffle_bands[0], shuffle_bands[1],
+                             alpha=0.3, label=f'{ticker} - Shuffle bands')
         plt.plot((tau_p, tau_p), (0, max(self_short)), '--',
                  label=r"$\tau' $ = {}".format(tau_p))
         plt.legend(loc='best', fontsize=25)
@@ -106,12 +126,13 @@ def taq_self_response_year_avg_responses_physical_short_long_plot(ticker, year,
 # ----------------------------------------------------------------------------
 
 
-def taq_cross_response_year_avg_responses_physical_short_long_plot(ticker_i,
-                                                                   ticker_j,
-                                                                   year, tau,
-                                                                   tau_p):
+def taq_cross_response_year_avg_responses_physical_short_long_plot(
+        ticker_i, ticker_j, year, tau, tau_p, permutations=100):
     """Plots the cross-response average for a year.
 
+    The percentile bands of the shuffle cross-response are plotted when they
+    were computed.
+
     :param ticker_i: string of the abbreviation of the stock to be analyzed
      (i.e. 'AAPL')
     :param ticker_j: string of the abbreviation of the stock to be analyzed
@@ -119,6 +140,8 @@ def taq_cross_response_year_avg_responses_physical_short_long_plot(ticker_i,
     :param year: string of the year to be analyzed (i.e '2008')
     :param tau: integer greater than zero (i.e. 50).
     :param tau_p: integer greater than zero and smaller than tau (i.e. 10).
+    :param permutations: integer greater than zero with the number of
+     permutations of the shuffle bands (i.e. 100). Default 100.
     :return: None -- The function saves the plot in a file and does not return
      a value.
     """
@@ -148,6 +171,19 @@ def taq_cross_response_year_avg_responses_physical_short_long_plot(ticker_i,
                 + f'_physical_short_long_data_tau_{tau}_tau_p_{tau_p}_{year}'
                 + f'_{ticker_i}i_{ticker_j}j.pickle', 'rb'))
 
+            # Percentile bands of the shuffle cross-response
+            try:
+                _, shuffle_bands = pickle.load(open(
+                    '../../taq_data/responses_physical_short_long_data'
+                    + f'_{year}/taq_shuffle_response_year_responses_physical'
+                    + f'_short_long_data_tau_{tau}_perm_{permutations}/taq'
+                    + '_shuffle_response_year_responses_physical_short_long'
+                    + f'_data_tau_{tau}_perm_{permutations}_{year}'
+                    + f'_{ticker_i}i_{ticker_j}j.pickle', 'rb'))
+
+            except FileNotFoundError:
+                shuffle_bands = None
+
             # Addition of the short and long response signal
             sum = np.zeros(tau)
             sum[:tau_p + 1] = cross_short[:tau_p + 1]
@@ -164,6 +200,11 @@ def taq_cross_response_year_avg_responses_physical_short_long_plot(ticker_i,
                          label=f'{ticker_i} - {ticker_j} - Cross-response')
             plt.semilogx(cross_shuffle, linewidth=5,
                          label=f'{ticker_i} - {ticker_j} - Shuffle')
+            if (shuffle_bands is not None):
+                plt.fill_between(range(tau), shuffle_bands[0],
+                                 shuffle_bands[1], alpha=0.3,
+                                 label=f'{ticker_i} - {ticker_j} - Shuffle'
+                                 + ' bands')
             plt.plot((tau_p, tau_p), (0, max(cross_short)), '--',
                      label=r"$\tau' $ = {}".format(tau_p))
             plt.legend(loc='best', fontsize=25)
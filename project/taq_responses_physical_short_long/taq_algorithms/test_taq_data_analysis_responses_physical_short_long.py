@@ -0,0 +1,246 @@
+''' TAQ data analysis tests.
+
+The tests check the batched tau' and shuffle functions of the
+taq_data_analysis_responses_physical_short_long module against the day
+functions of one tau' and against explicit loops on synthetic days.
+
+This script requires the following modules:
+    * numpy
+    * os
+    * pickle
+    * pytest
+    * sys
+    * taq_data_analysis_responses_physical_short_long
+
+The module contains the following functions:
+    * taq_synthetic_day - saves the data of a synthetic day.
+    * taq_folder - runs a test from a folder with the layout of the project.
+    * test_taq_self_response_day_taus_p_responses_physical_short_long_data -
+      checks the batched self-responses against the day function of every
+      tau'.
+    * test_taq_cross_response_day_taus_p_responses_physical_short_long_data -
+      checks the batched cross-responses against the day function of every
+      tau'.
+    * test_taq_shuffle_response_responses_physical_short_long_data - checks
+      the shuffle ensemble against the loop over the same permutations.
+    * test_taq_shuffle_response_day_responses_physical_short_long_data -
+      checks that the shuffle responses of a day are reproducible and shared
+      by the day functions.
+
+.. moduleauthor:: Juan Camilo Henao Londono <www.github.com/juanhenao21>
+'''
+
+# ----------------------------------------------------------------------------
+# Modules
+
+import numpy as np
+import os
+import pickle
+import pytest
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import taq_data_analysis_responses_physical_short_long as analysis
+
+# ----------------------------------------------------------------------------
+
+
+def taq_synthetic_day(path, ticker, date, seed, length=3000):
+    """Saves the data of a synthetic day.
+
+    Saves the midpoint price and trade signs of every second of a day in the
+    folders read by the functions of the module.
+
+    :param path: pathlib path of the folder with the taq_data folder.
+    :param ticker: string of the abbreviation of the stock (i.e. 'AAPL').
+    :param date: string with the date of the day (i.e. '2008-01-02').
+    :param seed: integer used to seed the random generator (i.e. 0).
+    :param length: integer with the number of seconds of the day (default
+     3000).
+    :return: tuple -- The function returns a tuple with numpy arrays with
+     the midpoint price and the trade sign of every second.
+    """
+
+    year, month, day = date.split('-')
+    rng = np.random.default_rng(seed)
+
+    midpoint = 100 + np.cumsum(rng.normal(0, 0.01, length))
+    trade_sign = rng.choice([-1., 0., 1.], length, p=[0.3, 0.4, 0.3])
+
+    folder = path / 'taq_data' / f'responses_physical_data_{year}'
+    (folder / 'taq_midpoint_physical_data').mkdir(parents=True,
+                                                  exist_ok=True)
+    (folder / 'taq_trade_signs_physical_data').mkdir(exist_ok=True)
+
+    pickle.dump(midpoint, open(
+        folder / 'taq_midpoint_physical_data'
+        / f'taq_midpoint_physical_data_midpoint_{year}{month}{day}_{ticker}'
+        '.pickle', 'wb'))
+    pickle.dump((None, None, trade_sign), open(
+        folder / 'taq_trade_signs_physical_data'
+        / f'taq_trade_signs_physical_data_{year}{month}{day}_{ticker}'
+        '.pickle', 'wb'))
+
+    return (midpoint, trade_sign)
+
+# ----------------------------------------------------------------------------
+
+
+@pytest.fixture
+def taq_folder(tmp_path, monkeypatch):
+    """Runs a test from a folder with the layout of the project.
+
+    :param tmp_path: pytest fixture with a temporary folder.
+    :param monkeypatch: pytest fixture to change the working directory.
+    :return: pathlib path -- The function returns the temporary folder.
+    """
+
+    (tmp_path / 'project' / 'taq_algorithms').mkdir(parents=True)
+    monkeypatch.chdir(tmp_path / 'project' / 'taq_algorithms')
+
+    return tmp_path
+
+# ----------------------------------------------------------------------------
+
+
+def test_taq_self_response_day_taus_p_responses_physical_short_long_data(
+        taq_folder):
+    """Checks the batched self-responses against the day function.
+
+    :param taq_folder: fixture with the folder of the synthetic data.
+    """
+
+    taq_synthetic_day(taq_folder, 'AAA', '2008-01-02', 0)
+    tau = 200
+    taus_p = [1, 5, 20, 50]
+
+    batch = analysis \
+        .taq_self_response_day_taus_p_responses_physical_short_long_data(
+            'AAA', '2008-01-02', tau, taus_p, 3)
+
+    for p_idx, tau_p in enumerate(taus_p):
+        day = analysis \
+            .taq_self_response_day_responses_physical_short_long_data(
+                'AAA', '2008-01-02', tau, tau_p, 3)
+
+        assert np.allclose(batch[:, p_idx], day, rtol=1e-9, atol=1e-12)
+
+# ----------------------------------------------------------------------------
+
+
+def test_taq_cross_response_day_taus_p_responses_physical_short_long_data(
+        taq_folder):
+    """Checks the batched cross-responses against the day function.
+
+    :param taq_folder: fixture with the folder of the synthetic data.
+    """
+
+    taq_synthetic_day(taq_folder, 'AAA', '2008-01-02', 0)
+    taq_synthetic_day(taq_folder, 'BBB', '2008-01-02', 1)
+    tau = 200
+    taus_p = [1, 5, 20, 50]
+
+    batch = analysis \
+        .taq_cross_response_day_taus_p_responses_physical_short_long_data(
+            'AAA', 'BBB', '2008-01-02', tau, taus_p)
+
+    for p_idx, tau_p in enumerate(taus_p):
+        day = analysis \
+            .taq_cross_response_day_responses_physical_short_long_data(
+                'AAA', 'BBB', '2008-01-02', tau, tau_p)
+
+        assert np.allclose(batch[:, p_idx], day, rtol=1e-9, atol=1e-12)
+
+# ----------------------------------------------------------------------------
+
+
+def test_taq_shuffle_response_responses_physical_short_long_data():
+    """Checks the shuffle ensemble against the loop.
+
+    The loop draws the same permutations of the trade signs and computes the
+    response of every permutation and time lag.
+    """
+
+    rng = np.random.default_rng(0)
+    length = 1000
+    tau = 250
+    permutations = 5
+
+    midpoint = 100 + np.cumsum(rng.normal(0, 0.01, length))
+    trade_sign = rng.choice([-1., 0., 1.], length, p=[0.3, 0.4, 0.3])
+
+    shuffle, num = analysis \
+        .taq_shuffle_response_responses_physical_short_long_data(
+            midpoint, trade_sign, tau, permutations,
+            np.random.default_rng(1))
+
+    order = np.argsort(np.random.default_rng(1).random((permutations,
+                                                        length)), axis=1)
+    expected = np.zeros((permutations, tau))
+    expected_num = np.zeros((permutations, tau))
+
+    for p_idx in range(permutations):
+        trade_sign_shuffle = trade_sign[order[p_idx]]
+        for tau_idx in range(tau):
+            trade_sign_tau = trade_sign_shuffle[:-tau_idx - 1]
+            log_return_sec = (midpoint[tau_idx + 1:]
+                              - midpoint[:-tau_idx - 1]) \
+                / midpoint[:-tau_idx - 1]
+            expected[p_idx, tau_idx] = np.sum(log_return_sec
+                                              * trade_sign_tau)
+            expected_num[p_idx, tau_idx] = np.sum(trade_sign_tau != 0)
+
+    assert np.allclose(shuffle, expected, rtol=1e-9, atol=1e-12)
+    assert np.array_equal(num, expected_num)
+
+# ----------------------------------------------------------------------------
+
+
+def test_taq_shuffle_response_day_responses_physical_short_long_data(
+        taq_folder):
+    """Checks that the shuffle responses of a day are reproducible.
+
+    The shuffle response of the day functions is the first permutation of
+    the shuffle ensemble of the day with the same seed.
+
+    :param taq_folder: fixture with the folder of the synthetic data.
+    """
+
+    taq_synthetic_day(taq_folder, 'AAA', '2008-01-02', 0)
+    taq_synthetic_day(taq_folder, 'BBB', '2008-01-02', 1)
+    tau = 200
+
+    days = {
+        ('AAA', 'AAA'): (
+            analysis
+            .taq_self_response_day_responses_physical_short_long_data(
+                'AAA', '2008-01-02', tau, 20, 4),
+            analysis
+            .taq_self_response_day_taus_p_responses_physical_short_long_data(
+                'AAA', '2008-01-02', tau, [20], 4)[:, 0]),
+        ('AAA', 'BBB'): (
+            analysis
+            .taq_cross_response_day_responses_physical_short_long_data(
+                'AAA', 'BBB', '2008-01-02', tau, 20, 4),
+            analysis
+            .taq_cross_response_day_taus_p_responses_physical_short_long_data(
+                'AAA', 'BBB', '2008-01-02', tau, [20], 4)[:, 0]),
+    }
+
+    for (ticker_i, ticker_j), (day, batch) in days.items():
+        shuffle, num = analysis \
+            .taq_shuffle_response_day_responses_physical_short_long_data(
+                ticker_i, ticker_j, '2008-01-02', tau, 10, 4)
+        again = analysis \
+            .taq_shuffle_response_day_responses_physical_short_long_data(
+                ticker_i, ticker_j, '2008-01-02', tau, 10, 4)
+
+        assert np.array_equal(shuffle, again[0])
+        assert np.array_equal(num, again[1])
+
+        # The day functions draw only the first permutation
+        for value in (day, batch):
+            assert np.allclose(value[6], shuffle[0], rtol=1e-9, atol=1e-12)
+            assert np.array_equal(value[7], num[0])
+
+# ----------------------------------------------------------------------------
@@ -5,11 +5,11 @@ computing the self- and cross-response functions.
 
 This script requires the following modules:
     * itertools
-    * multiprocessing
     * numpy
     * os
-    * pandas
     * pickle
+    * sys
+    * taq_data_tools_pool
     * taq_data_tools_responses_trade
 
 The module contains the following functions:
@@ -32,12 +32,14 @@ The module contains the following functions:
 # Modules
 
 from itertools import product as iprod
-import multiprocessing as mp
 import numpy as np
 import os
-import pandas as pd
 import pickle
+import sys
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                             '..', '..', 'taq_pool', 'taq_algorithms'))
+import taq_data_tools_pool
 import taq_data_tools_responses_trade
 
 __tau__ = 1000
@@ -80,10 +82,11 @@ def taq_trade_signs_trade_data(ticker, date):
         abs_path = os.path.abspath(__file__).split('/')
         # Take the path from the start to the project folder
         root_path = '/'.join(abs_path[:abs_path.index('project') + 1])
-        data_trades_trade = pd.read_hdf(root_path
-                                        + f'/taq_data/hdf5_daily_data_{year}/'
-                                        + f'taq_{ticker}_trades_{date}.h5',
-                                        key='/trades')
+        data_trades_trade = taq_data_tools_pool \
+            .taq_read_hdf(root_path
+                          + f'/taq_data/hdf5_daily_data_{year}/'
+                          + f'taq_{ticker}_trades_{date}.h5',
+                          key='/trades')
 
         time_t = data_trades_trade['Time'].to_numpy()
         ask_t = data_trades_trade['Ask'].to_numpy()
@@ -233,16 +236,23 @@ def taq_self_response_year_responses_trade_data(ticker, year):
         .taq_function_header_print_data(function_name, ticker, ticker, year,
                                         '', '')
 
-    dates = taq_data_tools_responses_trade.taq_bussiness_days(year)
+    dates = taq_data_tools_pool.taq_catalog_dates([ticker], year)
 
     self_values = []
     args_prod = iprod([ticker], dates)
 
     # Parallel computation of the self-responses. Every result is appended to
     # a list
-    with mp.Pool(processes=mp.cpu_count()) as pool:
+    with taq_data_tools_pool.taq_pool() as pool:
         self_values.append(pool.starmap(
-            taq_self_response_day_responses_trade_data, args_prod))
+            taq_self_response_day_responses_trade_data, args_prod,
+            tickers=(0,), date=1, data='arrays'))
+
+    # A ticker without days with data has no trades, so the averages are NaN as
+    # in the days without data
+    if (not dates):
+        zeros = np.zeros(__tau__)
+        self_values[0].append((zeros, zeros))
 
     # To obtain the total self-response, I sum over all the self-response
     # values and all the amount of trades (averaging values)
@@ -384,16 +394,24 @@ def taq_cross_response_year_responses_trade_data(ticker_i, ticker_j, year):
             .taq_function_header_print_data(function_name, ticker_i, ticker_j,
                                             year, '', '')
 
-        dates = taq_data_tools_responses_trade.taq_bussiness_days(year)
+        dates = taq_data_tools_pool \
+            .taq_catalog_dates([ticker_i, ticker_j], year)
 
         cross_values = []
         args_prod = iprod([ticker_i], [ticker_j], dates)
 
         # Parallel computation of the cross-responses. Every result is appended
         # to a list
-        with mp.Pool(processes=mp.cpu_count()) as pool:
+        with taq_data_tools_pool.taq_pool() as pool:
             cross_values.append(pool.starmap(
-                taq_cross_response_day_responses_trade_data, args_prod))
+                taq_cross_response_day_responses_trade_data, args_prod,
+                tickers=(0, 1), date=2, data='arrays'))
+
+        # A pair of tickers without days with data has no trades, so the
+        # averages are NaN as in the days without data
+        if (not dates):
+            zeros = np.zeros(__tau__)
+            cross_values[0].append((zeros, zeros))
 
         # To obtain the total cross-response, I sum over all the cross-response
         # values and all the amount of trades (averaging values)
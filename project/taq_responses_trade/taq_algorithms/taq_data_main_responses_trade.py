@@ -5,12 +5,18 @@ The functions in the module run the complete analysis and plot of the TAQ data.
 This script requires the following modules:
     * itertools.product
     * multiprocessing
+    * os
     * pandas
+    * sys
     * taq_data_analysis_responses_trade
     * taq_data_plot_responses_trade
+    * taq_data_tools_pool
     * taq_data_tools_responses_trade
 
 The module contains the following functions:
+    * taq_data_generator - generates all the analysis from the TAQ data.
+    * taq_plot_generator - generates all the plots from the analysis of the
+      TAQ data.
     * taq_data_plot_generator - generates all the analysis and plots from the
       TAQ data.
     * main - the main function of the script.
@@ -23,17 +29,22 @@ The module contains the following functions:
 
 from itertools import product as iprod
 import multiprocessing as mp
+import os
 import pandas as pd
+import sys
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                             '..', '..', 'taq_pool', 'taq_algorithms'))
 import taq_data_analysis_responses_trade
 import taq_data_plot_responses_trade
+import taq_data_tools_pool
 import taq_data_tools_responses_trade
 
 # -----------------------------------------------------------------------------
 
 
-def taq_data_plot_generator(tickers, year):
-    """Generates all the analysis and plots from the TAQ data.
+def taq_data_generator(tickers, year):
+    """Generates all the analysis from the TAQ data.
 
     :param tickers: list of the string abbreviation of the stocks to be
      analyzed (i.e. ['AAPL', 'MSFT']).
@@ -42,14 +53,21 @@ def taq_data_plot_generator(tickers, year):
      a value.
     """
 
-    date_list = taq_data_tools_responses_trade.taq_bussiness_days(year)
+    # The days of the year functions keep their checkpoints until the
+    # year results are saved
+    taq_data_tools_pool.taq_checkpoint_tasks(taq_data_analysis_responses_trade)
+
+    # Only the days with data of each ticker
+    args_prod = [(ticker, date) for ticker in tickers
+                 for date in taq_data_tools_pool
+                 .taq_catalog_days(ticker, year)]
 
     # Parallel computing
-    with mp.Pool(processes=mp.cpu_count()) as pool:
+    with taq_data_tools_pool.taq_pool() as pool:
         # Basic functions
         pool.starmap(taq_data_analysis_responses_trade
                      .taq_trade_signs_trade_data,
-                     iprod(tickers, date_list))
+                     args_prod)
 
     # Specific functions
     # Self-response
@@ -73,14 +91,31 @@ def taq_data_plot_generator(tickers, year):
             .taq_cross_response_year_responses_trade_data(ticks[0], ticks[1],
                                                           year)
 
+    return None
+
+# -----------------------------------------------------------------------------
+
+
+def taq_plot_generator(tickers, year):
+    """Generates all the plots from the analysis of the TAQ data.
+
+    :param tickers: list of the string abbreviation of the stocks to be
+     analyzed (i.e. ['AAPL', 'MSFT']).
+    :param year: string of the year to be analyzed (i.e '2016').
+    :return: None -- The function saves the plots in files and does not
+     return a value.
+    """
+
+    workers = taq_data_tools_pool.taq_workers()
+
     # Parallel computing
-    with mp.Pool(processes=mp.cpu_count()) as pool:
+    with mp.Pool(processes=workers) as pool:
         # Plot
         pool.starmap(taq_data_plot_responses_trade
                      .taq_self_response_year_avg_responses_trade_plot,
                      iprod(tickers, [year]))
     # Parallel computing
-    with mp.Pool(processes=mp.cpu_count()) as pool:
+    with mp.Pool(processes=workers) as pool:
         # Plot
         pool.starmap(taq_data_plot_responses_trade
                      .taq_cross_response_year_avg_responses_trade_plot,
@@ -91,6 +126,24 @@ def taq_data_plot_generator(tickers, year):
 # -----------------------------------------------------------------------------
 
 
+def taq_data_plot_generator(tickers, year):
+    """Generates all the analysis and plots from the TAQ data.
+
+    :param tickers: list of the string abbreviation of the stocks to be
+     analyzed (i.e. ['AAPL', 'MSFT']).
+    :param year: string of the year to be analyzed (i.e '2016').
+    :return: None -- The function saves the data in a file and does not return
+     a value.
+    """
+
+    taq_data_generator(tickers, year)
+    taq_plot_generator(tickers, year)
+
+    return None
+
+# -----------------------------------------------------------------------------
+
+
 def main():
     """The main function of the script.
 
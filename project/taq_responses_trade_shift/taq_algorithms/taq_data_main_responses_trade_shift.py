@@ -5,12 +5,18 @@ The functions in the module run the complete analysis and plot of the TAQ data.
 This script requires the following modules:
     * itertools
     * multiprocessing
+    * os
     * pandas
+    * sys
     * taq_data_analysis_responses_trade_shift
     * taq_data_plot_responses_trade_shift
+    * taq_data_tools_pool
     * taq_data_tools_responses_trade_shift
 
 The module contains the following functions:
+    * taq_data_generator - generates all the analysis from the TAQ data.
+    * taq_plot_generator - generates all the plots from the analysis of the
+      TAQ data.
     * taq_data_plot_generator - generates all the analysis and plots from the
       TAQ data.
     * main - the main function of the script.
@@ -23,17 +29,22 @@ The module contains the following functions:
 
 from itertools import product as iprod
 import multiprocessing as mp
+import os
 import pandas as pd
+import sys
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                             '..', '..', 'taq_pool', 'taq_algorithms'))
 import taq_data_analysis_responses_trade_shift
 import taq_data_plot_responses_trade_shift
+import taq_data_tools_pool
 import taq_data_tools_responses_trade_shift
 
 # -----------------------------------------------------------------------------
 
 
-def taq_data_plot_generator(tickers, year, shifts):
-    """Generates all the analysis and plots from the TAQ data.
+def taq_data_generator(tickers, year, shifts):
+    """Generates all the analysis from the TAQ data.
 
     :param tickers: list of the string abbreviation of the stocks to be
      analyzed (i.e. ['AAPL', 'MSFT']).
@@ -43,6 +54,11 @@ def taq_data_plot_generator(tickers, year, shifts):
      a value.
     """
 
+    # The days of the year functions keep their checkpoints until the
+    # year results are saved
+    taq_data_tools_pool \
+        .taq_checkpoint_tasks(taq_data_analysis_responses_trade_shift)
+
     date_list = taq_data_tools_responses_trade_shift.taq_bussiness_days(year)
 
     # Especific functions
@@ -70,14 +86,32 @@ def taq_data_plot_generator(tickers, year, shifts):
                 .taq_cross_response_year_responses_trade_shift_data(
                     ticks[0], ticks[1], year, shift)
 
+    return None
+
+# -----------------------------------------------------------------------------
+
+
+def taq_plot_generator(tickers, year, shifts):
+    """Generates all the plots from the analysis of the TAQ data.
+
+    :param tickers: list of the string abbreviation of the stocks to be
+     analyzed (i.e. ['AAPL', 'MSFT']).
+    :param year: string of the year to be analyzed (i.e '2016').
+    :param shifts: list of integers greater than zero (i.e. [1, 10, 50]).
+    :return: None -- The function saves the plots in files and does not
+     return a value.
+    """
+
+    workers = taq_data_tools_pool.taq_workers()
+
     # Parallel computing
-    with mp.Pool(processes=mp.cpu_count()) as pool:
+    with mp.Pool(processes=workers) as pool:
         # Plot
         pool.starmap(taq_data_plot_responses_trade_shift
                      .taq_self_response_year_avg_responses_trade_shift_plot,
                      iprod(tickers, [year], [shifts]))
     # Parallel computing
-    with mp.Pool(processes=mp.cpu_count()) as pool:
+    with mp.Pool(processes=workers) as pool:
         # Plot
         pool.starmap(taq_data_plot_responses_trade_shift
                      .taq_cross_response_year_avg_responses_trade_shift_plot,
@@ -88,6 +122,25 @@ def taq_data_plot_generator(tickers, year, shifts):
 # -----------------------------------------------------------------------------
 
 
+def taq_data_plot_generator(tickers, year, shifts):
+    """Generates all the analysis and plots from the TAQ data.
+
+    :param tickers: list of the string abbreviation of the stocks to be
+     analyzed (i.e. ['AAPL', 'MSFT']).
+    :param year: string of the year to be analyzed (i.e '2016').
+    :param shifts: list of integers greater than zero (i.e. [1, 10, 50]).
+    :return: None -- The function saves the data in a file and does not return
+     a value.
+    """
+
+    taq_data_generator(tickers, year, shifts)
+    taq_plot_generator(tickers, year, shifts)
+
+    return None
+
+# -----------------------------------------------------------------------------
+
+
 def main():
     """The main function of the script.
 
@@ -8,7 +8,8 @@ This script requires the following modules:
     * matplotlib
     * os
     * pandas
-    * pickle
+    * sys
+    * taq_data_tools_pool
 
 The module contains the following functions:
     * taq_save_data - saves computed data.
@@ -29,7 +30,11 @@ The module contains the following functions:
 from matplotlib import pyplot as plt
 import os
 import pandas as pd
-import pickle
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                             '..', '..', 'taq_pool', 'taq_algorithms'))
+import taq_data_tools_pool
 
 # -----------------------------------------------------------------------------
 
@@ -69,17 +74,19 @@ def taq_save_data(function_name, data, ticker_i, ticker_j, year, month, day):
     # Cross-response data
     if (ticker_i != ticker_j):
 
-        pickle.dump(data, open(
+        file_name = (
             f'../../taq_data/responses_trade_shift_data_{year}/{function_name}'
             + f'/{function_name}_{year}{month}{day}_{ticker_i}i_{ticker_j}j'
-            + f'.pickle', 'wb'))
+            + '.pickle')
 
     # Self-response data
     else:
 
-        pickle.dump(data, open(
+        file_name = (
             f'../../taq_data/responses_trade_shift_data_{year}/{function_name}'
-            + f'/{function_name}_{year}{month}{day}_{ticker_i}.pickle', 'wb'))
+            + f'/{function_name}_{year}{month}{day}_{ticker_i}.pickle')
+
+    taq_data_tools_pool.taq_atomic_dump(data, file_name)
 
     print('Data Saved')
     print()
@@ -5,14 +5,20 @@ market.
 
 This script requires the following modules:
     * itertools
-    * multiprocessing
     * numpy
+    * os
     * pandas
+    * sys
+    * taq_data_tools_pool
     * taq_data_tools_statistics
 
 The module contains the following functions:
-    * taq_quotes_trades_day_statistics_data - statistics of quotes and trades
-      for a day.
+    * taq_midpoint_error_statistics_data - difference between the last and
+      the average midpoint price of every second.
+    * taq_market_day_statistics_data - statistics of quotes, trades and
+      midpoint price for a day.
+    * taq_market_year_statistics_data - statistics of quotes, trades and
+      midpoint price for every day of a year.
     * taq_quotes_trades_year_statistics_data - statistics of quotes and trades
       for a year.
     * taq_midpoint_day_statistics_data - statistics midpoint price day
@@ -26,20 +32,64 @@ The module contains the following functions:
 # Modules
 
 from itertools import product as iprod
-import multiprocessing as mp
 import numpy as np
+import os
 import pandas as pd
+import sys
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                             '..', '..', 'taq_pool', 'taq_algorithms'))
+import taq_data_tools_pool
 import taq_data_tools_statistics
 
 # ----------------------------------------------------------------------------
 
 
-def taq_quotes_trades_day_statistics_data(ticker, date):
-    """Obtain the quotes and trades statistics for a day.
+def taq_midpoint_error_statistics_data(time_q, midpoint):
+    """Obtain the difference between the last and average midpoint price.
 
-    Using the quotes files, obtain the statistics of the average spread, number
-    of quotes and number of trades for a day.
+    Computes the relative difference between the last midpoint price in a
+    second and the average midpoint price of the second, averaged over all the
+    seconds with quotes. The quotes are sorted by time and the values of every
+    second are reduced in a single pass over the quotes.
+
+    :param time_q: numpy array with the time of every quote.
+    :param midpoint: numpy array with the midpoint price of every quote.
+    :return: float -- The function returns the average relative difference.
+    """
+
+    if (not len(time_q)):
+        return np.nan
+
+    # A stable sort keeps the order of the quotes inside every second, so the
+    # last quote of a second is still the last one after sorting
+    order = np.argsort(time_q, kind='stable')
+    time_s = time_q[order]
+    midpoint_s = midpoint[order]
+
+    # Position of the first and last quote of every second
+    start = np.concatenate(([0], np.flatnonzero(np.diff(time_s)) + 1))
+    end = np.append(start[1:], len(time_s))
+
+    midpoint_mean = np.add.reduceat(midpoint_s, start) / (end - start)
+    midpoint_last = midpoint_s[end - 1]
+
+    midpoint_error = np.mean(np.abs(midpoint_mean - midpoint_last)
+                             / midpoint_mean)
+
+    return midpoint_error
+
+# ----------------------------------------------------------------------------
+
+
+def taq_market_day_statistics_data(ticker, date):
+    """Obtain the quotes, trades and midpoint price statistics for a day.
+
+    Using the quotes and trades files, obtain in a single pass over the data
+    of a day the number of quotes and trades, the average, time weighted and
+    median spread, the relative difference between the last midpoint price in
+    a second and the average midpoint price of the second, and the total
+    volumes of the quotes and trades.
 
     :param ticker: string of the abbreviation of the stock to be analyzed
      (i.e. 'AAPL').
@@ -56,33 +106,115 @@ def taq_quotes_trades_day_statistics_data(ticker, date):
 
     try:
         # Load data
-        data_quotes = pd.read_hdf(f'../../taq_data/hdf5_daily_data_{year}/taq'
-                                  + f'_{ticker}_quotes_{date}.h5',
-                                  key='/quotes', columns=['Bid', 'Ask'])
-        data_trades = pd.read_hdf(f'../../taq_data/hdf5_daily_data_{year}/taq'
-                                  + f'_{ticker}_trades_{date}.h5',
-                                  key='/trades', columns=['Ask'])
+        data_quotes = taq_data_tools_pool \
+            .taq_read_hdf(f'../../taq_data/hdf5_daily_data_{year}/taq'
+                          + f'_{ticker}_quotes_{date}.h5',
+                          key='/quotes',
+                          columns=['Time', 'Bid', 'Ask', 'Vol_Bid',
+                                   'Vol_Ask'])
+        data_trades = taq_data_tools_pool \
+            .taq_read_hdf(f'../../taq_data/hdf5_daily_data_{year}/taq'
+                          + f'_{ticker}_trades_{date}.h5',
+                          key='/trades',
+                          columns=['Ask', 'Vol_Ask'])
+
+        time_q = data_quotes['Time'].to_numpy()
+        bid_q = data_quotes['Bid'].to_numpy()
+        ask_q = data_quotes['Ask'].to_numpy()
+        vol_bid_q = data_quotes['Vol_Bid'].to_numpy()
+        vol_ask_q = data_quotes['Vol_Ask'].to_numpy()
+        ask_t = data_trades['Ask'].to_numpy()
+        vol_t = data_trades['Vol_Ask'].to_numpy()
 
         # Some files are corrupted, so there are some zero values that does not
         # have sense
-        condition_quotes = data_quotes['Ask'] != 0
-        data_quotes = data_quotes[condition_quotes]
-        condition_trades = data_trades['Ask'] != 0
-        data_trades = data_trades[condition_trades]
+        condition_quotes = ask_q != 0
+        time_q = time_q[condition_quotes]
+        bid_q = bid_q[condition_quotes]
+        ask_q = ask_q[condition_quotes]
+        vol_bid_q = vol_bid_q[condition_quotes]
+        vol_ask_q = vol_ask_q[condition_quotes]
+        condition_trades = ask_t != 0
+        vol_t = vol_t[condition_trades]
 
-        spread = (data_quotes['Ask'] - data_quotes['Bid']) / 10000
+        num_quotes = len(time_q)
+        num_trades = len(vol_t)
+
+        spread = (ask_q - bid_q) / 10000
+        midpoint = ((ask_q + bid_q) / 2) / 10000
 
-        num_quotes = len(data_quotes)
-        num_trades = len(data_trades)
         avg_spread = np.mean(spread)
+        median_spread = np.median(spread)
+        # Every spread is weighted by the seconds it stays in the book. The
+        # last quote of the day stays until the market closes (16h00)
+        duration = np.append(time_q[1:], 57600) - time_q
+        if (np.sum(duration)):
+            time_weighted_spread = np.average(spread, weights=duration)
+        else:
+            time_weighted_spread = avg_spread
+
+        midpoint_error = taq_midpoint_error_statistics_data(time_q, midpoint)
 
-        return (num_quotes, num_trades, avg_spread)
+        return (num_quotes, num_trades, avg_spread, time_weighted_spread,
+                median_spread, midpoint_error, np.sum(vol_bid_q),
+                np.sum(vol_ask_q), np.sum(vol_t))
 
     except FileNotFoundError as e:
         print('No data')
         print(e)
         print()
-        return (np.NaN, np.NaN, np.NaN)
+        return (np.nan,) * 9
+
+# ----------------------------------------------------------------------------
+
+
+def taq_market_year_statistics_data(tickers, year):
+    """Obtain the quotes, trades and midpoint price statistics for a year.
+
+    Using the taq_market_day_statistics_data function computes the statistics
+    of every ticker and every day in a year, and saves them in a table with a
+    row per ticker and day. The statistics of the taq_statistics and the
+    taq_avg_spread modules are derived from this table.
+
+    :param tickers: list of the string abbreviation of the stocks to be
+     analyzed (i.e. ['AAPL', 'MSFT']).
+    :param year: string of the year to be analyzed (i.e '2016').
+    :return: DataFrame -- The function returns a pandas DataFrame with the
+     statistics of every ticker and day.
+    """
+
+    function_name = taq_market_year_statistics_data.__name__
+
+    stats = []
+
+    for ticker in tickers:
+
+        taq_data_tools_statistics \
+            .taq_function_header_print_data(function_name, ticker, ticker,
+                                            year, '', '')
+
+        dates = taq_data_tools_pool.taq_catalog_dates([ticker], year)
+        args_prod = iprod([ticker], dates)
+
+        # Parallel computation of the statistics
+        with taq_data_tools_pool.taq_pool() as pool:
+            stat = pool.starmap(taq_market_day_statistics_data, args_prod,
+                                tickers=(0,), date=1, data='raw')
+
+        for date, stat_day in zip(dates, stat):
+            stats.append((ticker, date) + tuple(stat_day))
+
+    stats_df = pd.DataFrame(stats, columns=[
+        'Ticker', 'Date', 'Num_Quotes', 'Num_Trades', 'Avg_Spread',
+        'Time_Weighted_Spread', 'Median_Spread', 'Midpoint_Error', 'Vol_Bid',
+        'Vol_Ask', 'Vol_Trades'])
+    # Days without data are not taken into account
+    stats_df.dropna(subset=['Num_Quotes'], inplace=True)
+
+    # Saving data
+    taq_data_tools_statistics.taq_save_market_statistics(stats_df, year)
+
+    return stats_df
 
 # ----------------------------------------------------------------------------
 
@@ -90,9 +222,9 @@ def taq_quotes_trades_day_statistics_data(ticker, date):
 def taq_quotes_trades_year_statistics_data(tickers, year):
     """Obtain the quotes and trades statistics for a year.
 
-    Using the taq_quotes_trades_day_statistics_data function computes the
-    statistics of the average spread, number of quotes and number of trades
-    for a year.
+    Using the table saved by the taq_market_year_statistics_data function
+    obtains the statistics of the average spread, number of quotes and number
+    of trades for a year.
 
     :param tickers: list of the string abbreviation of the stocks to be
      analyzed (i.e. ['AAPL', 'MSFT']).
@@ -102,6 +234,15 @@ def taq_quotes_trades_year_statistics_data(tickers, year):
     """
 
     function_name = taq_quotes_trades_year_statistics_data.__name__
+    taq_data_tools_statistics \
+        .taq_function_header_print_data(function_name, '', '', year, '', '')
+
+    stats_df = taq_data_tools_statistics.taq_load_market_statistics(year)
+
+    # To obtain the average of the year, I average all the days of the
+    # corresponding values (number quotes, trades and avg spread)
+    stats_year = stats_df.groupby('Ticker')[
+        ['Num_Quotes', 'Num_Trades', 'Avg_Spread']].mean()
 
     # Create a file to save the info
     file = open('../taq_quotes_trades_year_statistics_data.csv', 'a+')
@@ -109,30 +250,17 @@ def taq_quotes_trades_year_statistics_data(tickers, year):
 
     for ticker in tickers:
 
-        taq_data_tools_statistics \
-            .taq_function_header_print_data(function_name, ticker, ticker,
-                                            year, '', '')
-
-        dates = taq_data_tools_statistics.taq_bussiness_days(year)
-
-        stat = []
-        args_prod = iprod([ticker], dates)
-
-        # Parallel computation of the statistics. Every result is appended to
-        # a list
-        with mp.Pool(processes=mp.cpu_count()) as pool:
-            stat.append(pool.starmap(taq_quotes_trades_day_statistics_data,
-                        args_prod))
+        if (ticker not in stats_year.index):
+            print(f'No data for the stock {ticker}')
+            continue
 
-        # To obtain the average of the year, I average all the results of the
-        # corresponding values (number quotes, trades and avg spread)
-        stat_year = np.nanmean(stat[0], axis=0)
+        stat_year = stats_year.loc[ticker].to_numpy()
 
         # Write data in file
         file.write(f'{ticker}, {stat_year[0]:.0f}, {stat_year[1]:.0f},'
                    + f' {stat_year[2]:.2f}\n')
 
-    file.close
+    file.close()
 
     return None
 
@@ -161,29 +289,22 @@ def taq_midpoint_day_statistics_data(ticker, date):
 
     try:
         # Load data
-        data_quotes = pd.read_hdf(f'../../taq_data/hdf5_daily_data_{year}/taq'
-                                  + f'_{ticker}_quotes_{date}.h5',
-                                  key='/quotes',
-                                  columns=['Time', 'Bid', 'Ask'])
+        data_quotes = taq_data_tools_pool \
+            .taq_read_hdf(f'../../taq_data/hdf5_daily_data_{year}/taq'
+                          + f'_{ticker}_quotes_{date}.h5',
+                          key='/quotes',
+                          columns=['Time', 'Bid', 'Ask'])
 
         # Some files are corrupted, so there are some zero values that does not
         # have sense
         condition_quotes = data_quotes['Ask'] != 0
         data_quotes = data_quotes[condition_quotes]
 
-        midpoint = ((data_quotes['Ask'] + data_quotes['Bid']) / 2) / 10000
-
-        midpoint_e = 0
-        time_set = set(data_quotes['Time'])
-
-        for t in time_set:
-            condition = data_quotes['Time'] == t
-            midpoint_mean = np.mean(midpoint[condition])
-            midpoint_last = midpoint[condition][-1]
+        time_q = data_quotes['Time'].to_numpy()
+        midpoint = ((data_quotes['Ask'].to_numpy()
+                     + data_quotes['Bid'].to_numpy()) / 2) / 10000
 
-            midpoint_e += np.abs(midpoint_mean - midpoint_last) / midpoint_mean
-
-        midpoint_error = midpoint_e / len(time_set)
+        midpoint_error = taq_midpoint_error_statistics_data(time_q, midpoint)
 
         return midpoint_error
 
@@ -199,9 +320,9 @@ def taq_midpoint_day_statistics_data(ticker, date):
 def taq_midpoint_year_statistics_data(tickers, year):
     """Obtain the midpoint price statistics for a year.
 
-    Using the taq_midpoint_day_statistics_data function computes the
-    statistics of the last midpoint price in a second and the average midpoint
-    of the second for a year.
+    Using the table saved by the taq_market_year_statistics_data function
+    obtains the statistics of the last midpoint price in a second and the
+    average midpoint of the second for a year.
 
     :param tickers: list of the string abbreviation of the stocks to be
      analyzed (i.e. ['AAPL', 'MSFT']).
@@ -210,7 +331,15 @@ def taq_midpoint_year_statistics_data(tickers, year):
      a value.
     """
 
-    function_name = taq_quotes_trades_year_statistics_data.__name__
+    function_name = taq_midpoint_year_statistics_data.__name__
+    taq_data_tools_statistics \
+        .taq_function_header_print_data(function_name, '', '', year, '', '')
+
+    stats_df = taq_data_tools_statistics.taq_load_market_statistics(year)
+
+    # To obtain the average of the year, I average all the days of the
+    # corresponding value
+    stats_year = stats_df.groupby('Ticker')['Midpoint_Error'].mean()
 
     # Create a file to save the info
     file = open('../taq_midpoint_year_statistics_data.csv', 'a+')
@@ -218,29 +347,14 @@ def taq_midpoint_year_statistics_data(tickers, year):
 
     for ticker in tickers:
 
-        taq_data_tools_statistics \
-            .taq_function_header_print_data(function_name, ticker, ticker,
-                                            year, '', '')
-
-        dates = taq_data_tools_statistics.taq_bussiness_days(year)
-
-        stat = []
-        args_prod = iprod([ticker], dates)
-
-        # Parallel computation of the statistics. Every result is appended to
-        # a list
-        with mp.Pool(processes=mp.cpu_count()) as pool:
-            stat.append(pool.starmap(taq_midpoint_day_statistics_data,
-                        args_prod))
-
-        # To obtain the average of the year, I average all the results of the
-        # corresponding value
-        stat_year = np.nanmean(stat[0], axis=0)
+        if (ticker not in stats_year.index):
+            print(f'No data for the stock {ticker}')
+            continue
 
         # Write data in file
-        file.write(f'{ticker}, {stat_year}\n')
+        file.write(f'{ticker}, {stats_year.loc[ticker]}\n')
 
-    file.close
+    file.close()
 
     return None
 
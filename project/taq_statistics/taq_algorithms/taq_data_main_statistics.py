@@ -5,8 +5,11 @@ The functions in the module run the complete analysis of the TAQ data.
 This script requires the following modules:
     * itertools
     * multiprocessing
+    * os
     * pandas
+    * sys
     * taq_data_analysis_statistics
+    * taq_data_tools_pool
     * taq_data_tools_statistics
 
 The module contains the following functions:
@@ -21,9 +24,14 @@ The module contains the following functions:
 
 from itertools import product as iprod
 import multiprocessing as mp
+import os
 import pandas as pd
+import sys
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                             '..', '..', 'taq_pool', 'taq_algorithms'))
 import taq_data_analysis_statistics
+import taq_data_tools_pool
 import taq_data_tools_statistics
 
 # -----------------------------------------------------------------------------
@@ -39,6 +47,13 @@ def taq_data_generator(tickers, year):
      a value.
     """
 
+    # The days of the year functions keep their checkpoints until the
+    # year results are saved
+    taq_data_tools_pool.taq_checkpoint_tasks(taq_data_analysis_statistics)
+
+    # Statistics of every ticker and day
+    taq_data_analysis_statistics \
+        .taq_market_year_statistics_data(tickers, year)
     # Statistics of the quotes and trades
     taq_data_analysis_statistics \
         .taq_quotes_trades_year_statistics_data(tickers, year)
@@ -8,10 +8,13 @@ This script requires the following modules:
     * matplotlib
     * os
     * pandas
-    * pickle
+    * sys
+    * taq_data_tools_pool
 
 The module contains the following functions:
     * taq_save_data - saves computed data.
+    * taq_save_market_statistics - saves the statistics table of a year.
+    * taq_load_market_statistics - loads the statistics table of a year.
     * taq_function_header_print_data - prints info about the function running.
     * taq_start_folders - creates folders to save data and plots.
     * taq_initial_message - prints the initial message with basic information.
@@ -27,7 +30,11 @@ The module contains the following functions:
 from matplotlib import pyplot as plt
 import os
 import pandas as pd
-import pickle
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                             '..', '..', 'taq_pool', 'taq_algorithms'))
+import taq_data_tools_pool
 
 # -----------------------------------------------------------------------------
 
@@ -67,16 +74,53 @@ def taq_save_data(function_name, data, ticker_i, ticker_j, year, month, day):
     # Cross-response data
     if (ticker_i != ticker_j):
 
-        pickle.dump(data, open(f'../../taq_data/statistics_data_{year}'
-                    + f'/{function_name}/{function_name}_{year}{month}{day}'
-                    + f'_{ticker_i}i_{ticker_j}j.pickle', 'wb'))
+        file_name = (f'../../taq_data/statistics_data_{year}'
+                     + f'/{function_name}/{function_name}_{year}{month}{day}'
+                     + f'_{ticker_i}i_{ticker_j}j.pickle')
 
     # Self-response data
     else:
 
-        pickle.dump(data, open(f'../../taq_data/statistics_data_{year}'
-                    + f'/{function_name}/{function_name}_{year}{month}{year}'
-                    + f'_{ticker_i}.pickle', 'wb'))
+        file_name = (f'../../taq_data/statistics_data_{year}'
+                     + f'/{function_name}/{function_name}_{year}{month}{year}'
+                     + f'_{ticker_i}.pickle')
+
+    taq_data_tools_pool.taq_atomic_dump(data, file_name)
+
+    print('Data Saved')
+    print()
+
+    return None
+
+# -----------------------------------------------------------------------------
+
+
+def taq_save_market_statistics(stats_df, year):
+    """Saves the statistics table of a year in a CSV file.
+
+    The table has a row per ticker and day and it is used by the
+    taq_statistics and the taq_avg_spread modules.
+
+    :param stats_df: pandas DataFrame with the statistics of every ticker and
+     day.
+    :param year: string of the year to be analyzed (i.e '2016').
+    :return: None -- The function saves the data in a file and does not return
+     a value.
+    """
+
+    if (not os.path.isdir(f'../../taq_data/statistics_data_{year}/')):
+
+        try:
+            os.mkdir(f'../../taq_data/statistics_data_{year}/')
+            print('Folder to save data created')
+
+        except FileExistsError:
+            print('Folder exists. The folder was not created')
+
+    file_name = f'../../taq_data/statistics_data_{year}/taq_market_year' \
+        + f'_statistics_data_{year}.csv'
+
+    taq_data_tools_pool.taq_atomic_dump(stats_df, file_name, form='csv')
 
     print('Data Saved')
     print()
@@ -86,6 +130,30 @@ def taq_save_data(function_name, data, ticker_i, ticker_j, year, month, day):
 # -----------------------------------------------------------------------------
 
 
+def taq_load_market_statistics(year):
+    """Loads the statistics table of a year from a CSV file.
+
+    :param year: string of the year to be analyzed (i.e '2016').
+    :return: DataFrame -- The function returns a pandas DataFrame with the
+     statistics of every ticker and day.
+    """
+
+    try:
+        stats_df = pd.read_csv(f'../../taq_data/statistics_data_{year}/taq'
+                               + f'_market_year_statistics_data_{year}.csv',
+                               dtype={'Ticker': 'str', 'Date': 'str'})
+
+        return stats_df
+
+    except FileNotFoundError as e:
+        print('No data')
+        print(e)
+        print()
+        raise Exception('Run the taq_market_year_statistics_data function')
+
+# -----------------------------------------------------------------------------
+
+
 def taq_function_header_print_data(function_name, ticker_i, ticker_j, year,
                                    month, day):
     """Prints a header of a function that generates data when it is running.
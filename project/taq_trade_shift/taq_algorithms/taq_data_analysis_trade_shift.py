@@ -5,11 +5,13 @@ computing the self- and cross-response functions.
 
 This script requires the following modules:
     * itertools
-    * multiprocessing
     * numpy
+    * os
     * pandas
-    * tickle
+    * sys
+    * taq_data_tools_pool
     * taq_data_tools_trade_shift
+    * tickle
 
 The module contains the following functions:
     * taq_self_response_day_trade_shift_data - computes the self response of a
@@ -28,11 +30,15 @@ The module contains the following functions:
 # Modules
 
 from itertools import product as iprod
-import multiprocessing as mp
 import numpy as np
+import os
 import pandas as pd
 import pickle
+import sys
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                             '..', '..', 'taq_pool', 'taq_algorithms'))
+import taq_data_tools_pool
 import taq_data_tools_trade_shift
 
 # ----------------------------------------------------------------------------
@@ -161,16 +167,23 @@ def taq_self_response_year_trade_shift_data(ticker, year, tau):
         .taq_function_header_print_data(function_name, ticker, ticker, year,
                                         '', '')
 
-    dates = taq_data_tools_trade_shift.taq_bussiness_days(year)
+    dates = taq_data_tools_pool.taq_catalog_dates([ticker], year)
 
     self_values = []
     args_prod = iprod([ticker], dates, [tau])
 
     # Parallel computation of the self-responses. Every result is appended to
     # a list
-    with mp.Pool(processes=mp.cpu_count()) as pool:
+    with taq_data_tools_pool.taq_pool() as pool:
         self_values.append(pool.starmap(
-            taq_self_response_day_trade_shift_data, args_prod))
+            taq_self_response_day_trade_shift_data, args_prod,
+            tickers=(0,), date=1, data='arrays'))
+
+    # A ticker without days with data has no trades, so the averages are NaN as
+    # in the days without data
+    if (not dates):
+        zeros = np.zeros(len(range(- 10 * tau, 10 * tau, 1)))
+        self_values[0].append((zeros, zeros))
 
     # To obtain the total self-response, I sum over all the self-response
     # values and all the amount of trades (averaging values)
@@ -329,16 +342,24 @@ def taq_cross_response_year_trade_shift_data(ticker_i, ticker_j, year, tau):
             .taq_function_header_print_data(function_name, ticker_i, ticker_j,
                                             year, '', '')
 
-        dates = taq_data_tools_trade_shift.taq_bussiness_days(year)
+        dates = taq_data_tools_pool \
+            .taq_catalog_dates([ticker_i, ticker_j], year)
 
         cross_values = []
         args_prod = iprod([ticker_i], [ticker_j], dates, [tau])
 
         # Parallel computation of the cross-responses. Every result is appended
         # to a list
-        with mp.Pool(processes=mp.cpu_count()) as pool:
+        with taq_data_tools_pool.taq_pool() as pool:
             cross_values.append(pool.starmap(
-                taq_cross_response_day_trade_shift_data, args_prod))
+                taq_cross_response_day_trade_shift_data, args_prod,
+                tickers=(0, 1), date=2, data='arrays'))
+
+        # A pair of tickers without days with data has no trades, so the
+        # averages are NaN as in the days without data
+        if (not dates):
+            zeros = np.zeros(len(range(- 10 * tau, 10 * tau, 1)))
+            cross_values[0].append((zeros, zeros))
 
         # To obtain the total cross-response, I sum over all the cross-response
         # values and all the amount of trades (averaging values)